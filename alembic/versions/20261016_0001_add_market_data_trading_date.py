@@ -0,0 +1,130 @@
+"""add_market_data_trading_date
+
+Revision ID: 20261016_0001
+Revises: 20260123_0001
+Create Date: 2026-10-16 00:01:00.000000+00:00
+
+This migration:
+1. Adds trading_date (DATE) column to market_data - the ET calendar date of
+   timestamp, the same key DataSync and the exporters derive per row today
+2. Backfills it for existing rows
+3. Creates idx_market_data_trading_date on (symbol, timeframe, trading_date)
+
+New rows get trading_date at write time (MarketData model default/validator),
+so date-keyed lookups and duplicate-date checks become index range scans and
+GROUP BYs instead of timezone('America/New_York', timestamp) per row.
+
+Supports both SQLite (development) and PostgreSQL (production).
+"""
+
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision = "20261016_0001"
+down_revision = "20260123_0001"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = 'idx_market_data_trading_date'
+
+# Rows updated per statement when backfilling outside PostgreSQL
+BACKFILL_BATCH_SIZE = 10000
+
+
+def _column_exists(inspector, table_name, column_name):
+    """Check if a column exists in a table."""
+    columns = [col['name'] for col in inspector.get_columns(table_name)]
+    return column_name in columns
+
+
+def _table_exists(inspector, table_name):
+    """Check if a table exists."""
+    return table_name in inspector.get_table_names()
+
+
+def _index_exists(inspector, table_name, index_name):
+    """Check if an index exists on a table."""
+    indexes = inspector.get_indexes(table_name)
+    return any(idx['name'] == index_name for idx in indexes)
+
+
+def _backfill_python(bind):
+    """Backfill in batches, computing the ET date in Python (SQLite)."""
+    et = ZoneInfo('America/New_York')
+    select_batch = sa.text(
+        "SELECT id, timestamp FROM market_data "
+        "WHERE trading_date IS NULL ORDER BY id LIMIT :limit"
+    )
+    update = sa.text("UPDATE market_data SET trading_date = :trading_date WHERE id = :id")
+
+    total = 0
+    while True:
+        rows = bind.execute(select_batch, {'limit': BACKFILL_BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+        params = []
+        for row_id, timestamp in rows:
+            if isinstance(timestamp, str):
+                # SQLite returns stored DATETIME text for raw queries
+                timestamp = datetime.fromisoformat(timestamp)
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            params.append({'id': row_id, 'trading_date': timestamp.astimezone(et).date().isoformat()})
+        bind.execute(update, params)
+        total += len(params)
+    print(f"Backfilled trading_date for {total} market_data rows")
+
+
+def upgrade() -> None:
+    """
+    Add, backfill and index market_data.trading_date.
+
+    Safely checks for existing column/index to be idempotent.
+    """
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    dialect = bind.dialect.name
+
+    if not _table_exists(inspector, 'market_data'):
+        print("Table market_data does not exist, skipping migration")
+        return
+
+    if not _column_exists(inspector, 'market_data', 'trading_date'):
+        op.add_column('market_data', sa.Column('trading_date', sa.Date(), nullable=True))
+        print("Added trading_date column to market_data")
+
+    if dialect == 'postgresql':
+        op.execute("""
+            UPDATE market_data
+            SET trading_date = (timestamp AT TIME ZONE 'America/New_York')::date
+            WHERE trading_date IS NULL
+        """)
+    else:
+        _backfill_python(bind)
+
+    if not _index_exists(inspector, 'market_data', INDEX_NAME):
+        op.create_index(INDEX_NAME, 'market_data', ['symbol', 'timeframe', 'trading_date'])
+        print(f"Created index {INDEX_NAME}")
+
+
+def downgrade() -> None:
+    """
+    Remove trading_date index and column from market_data.
+    """
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, 'market_data'):
+        return
+
+    if _index_exists(inspector, 'market_data', INDEX_NAME):
+        op.drop_index(INDEX_NAME, table_name='market_data')
+
+    if _column_exists(inspector, 'market_data', 'trading_date'):
+        with op.batch_alter_table('market_data') as batch_op:
+            batch_op.drop_column('trading_date')
@@ -40,6 +40,16 @@ class Settings(BaseSettings):
         env="DATABASE_URL"
     )
 
+    # Background jobs (backtests, optimizations)
+    job_workers: int = Field(default=2, env="JOB_WORKERS")
+    job_results_dir: str = Field(default="output/api_jobs", env="JOB_RESULTS_DIR")
+    job_result_ttl_seconds: int = Field(default=86400, env="JOB_RESULT_TTL_SECONDS")
+    # Processes each optimization job may use (0 = CPU cores split across job_workers)
+    optimization_n_jobs: int = Field(default=0, env="OPTIMIZATION_N_JOBS")
+
+    # Identical backtest requests are served from this cache (empty = off)
+    backtest_result_cache_dir: str = Field(default="output/backtest_cache", env="BACKTEST_RESULT_CACHE_DIR")
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -0,0 +1,524 @@
+"""Background job execution for long-running API requests.
+
+Backtests and optimizations run for seconds to hours. Running them inside
+`async def` handlers blocks the event loop (and every other request and
+WebSocket) until they finish. JobManager runs them on a bounded process
+pool instead: submit() returns immediately with a job id, status/progress
+can be polled or streamed, and finished results are persisted to disk and
+evicted after a TTL.
+
+Job functions must be module-level (picklable) callables. They may call
+report_progress() to publish progress while running.
+
+Example:
+    from jutsu_api.jobs import get_job_manager
+
+    manager = get_job_manager()
+    job = manager.submit('backtest', run_backtest_job, request_dict, job_id='bt_...')
+    ...
+    manager.get(job.job_id).status   # 'queued' | 'running' | 'completed' | 'failed'
+    manager.result(job.job_id)       # return value once completed
+"""
+import asyncio
+import json
+import logging
+import multiprocessing
+import pickle
+import queue
+import threading
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+logger = logging.getLogger("API.JOBS")
+
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+TERMINAL_STATUSES = (COMPLETED, FAILED, CANCELLED)
+
+
+@dataclass
+class Job:
+    """
+    Job record (status, progress and summary; the result is stored separately).
+
+    Attributes:
+        job_id: Unique job identifier
+        kind: Job type ('backtest', 'optimization', ...)
+        status: queued, running, completed, failed or cancelled
+        created_at: Submission time
+        started_at: Time a worker picked the job up
+        finished_at: Completion/failure/cancellation time
+        progress: Fraction complete (0.0 - 1.0)
+        message: Latest progress message
+        error: Error message if failed
+        metadata: Caller-supplied context (request, config, ...)
+        summary: Small JSON-able digest of the result for listings
+    """
+
+    job_id: str
+    kind: str
+    status: str = QUEUED
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    progress: float = 0.0
+    message: str = ''
+    error: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    summary: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly representation (datetimes as ISO strings)."""
+        data = asdict(self)
+        for key in ('created_at', 'started_at', 'finished_at'):
+            if data[key] is not None:
+                data[key] = data[key].isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Job':
+        """Rebuild a job persisted with to_dict()."""
+        data = dict(data)
+        for key in ('created_at', 'started_at', 'finished_at'):
+            if data.get(key) is not None:
+                data[key] = datetime.fromisoformat(data[key])
+        return cls(**data)
+
+
+# ----------------------------------------------------------------------
+# Worker-process side
+# ----------------------------------------------------------------------
+
+_progress_queue = None
+_current_job_id: Optional[str] = None
+
+
+def _init_worker(progress_queue) -> None:
+    """Pool initializer: remember the queue progress events go to."""
+    global _progress_queue
+    _progress_queue = progress_queue
+
+
+def report_progress(progress: float, message: str = '') -> None:
+    """
+    Publish progress for the job running in this worker process.
+
+    No-op outside a job worker, so job functions can also be called directly.
+
+    Args:
+        progress: Fraction complete (0.0 - 1.0)
+        message: Short human-readable status
+    """
+    if _progress_queue is None or _current_job_id is None:
+        return
+    _progress_queue.put((_current_job_id, RUNNING, min(max(progress, 0.0), 1.0), message))
+
+
+def _run_job(job_id: str, fn: Callable, args: tuple, kwargs: Dict[str, Any]) -> Any:
+    """Execute a job function in a worker, bracketing it with status events."""
+    global _current_job_id
+    _current_job_id = job_id
+    try:
+        report_progress(0.0, 'started')
+        return fn(*args, **kwargs)
+    finally:
+        _current_job_id = None
+
+
+# ----------------------------------------------------------------------
+# Parent-process side
+# ----------------------------------------------------------------------
+
+class JobManager:
+    """
+    Bounded process-pool job runner with persisted, TTL-evicted results.
+
+    Job records live in memory (and as {job_id}.json next to a
+    {job_id}.pkl result under results_dir, so they survive restarts).
+    Finished jobs older than result_ttl are evicted, files included, on the
+    next access.
+
+    Attributes:
+        max_workers: Maximum jobs executing at once
+        results_dir: Directory for persisted records/results (None = memory only)
+        result_ttl: How long finished jobs are kept
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        results_dir: Optional[str] = None,
+        result_ttl_seconds: int = 86400,
+    ):
+        """
+        Initialize manager (the process pool starts on first submit).
+
+        Args:
+            max_workers: Maximum jobs executing at once (extra jobs queue)
+            results_dir: Directory for persisted records/results (None = memory only)
+            result_ttl_seconds: Seconds finished jobs are kept before eviction
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        self.max_workers = max_workers
+        self.results_dir = Path(results_dir) if results_dir else None
+        self.result_ttl = timedelta(seconds=result_ttl_seconds)
+
+        self._jobs: Dict[str, Job] = {}
+        self._results: Dict[str, Any] = {}
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.RLock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._progress_queue = None
+        self._drain_thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        if self.results_dir is not None:
+            self.results_dir.mkdir(parents=True, exist_ok=True)
+            self._load_persisted()
+
+    # ------------------------------------------------------------------
+    # Pool
+    # ------------------------------------------------------------------
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        """Start the pool (and, once, the progress-drain thread) if not running."""
+        if self._executor is None:
+            # spawn: forking a process that runs an event loop and threads is unsafe
+            context = multiprocessing.get_context('spawn')
+            if self._progress_queue is None:
+                self._progress_queue = context.Queue()
+                self._drain_thread = threading.Thread(
+                    target=self._drain_progress, name='job-progress', daemon=True,
+                )
+                self._drain_thread.start()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self._progress_queue,),
+            )
+            logger.info(f"Job pool started with {self.max_workers} workers")
+        return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        """
+        Drop a broken pool so the next submit() starts a fresh one.
+
+        A worker dying (crash, OOM kill) breaks a ProcessPoolExecutor for good:
+        every later submit() would fail with BrokenProcessPool.
+        """
+        with self._lock:
+            if self._executor is not executor:
+                return  # Already replaced
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.warning("Job pool broken (a worker died); it will be restarted")
+
+    def _drain_progress(self) -> None:
+        """Apply progress events from workers to job records."""
+        while not self._closed:
+            try:
+                job_id, status, progress, message = self._progress_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                return
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None or job.done:
+                    continue
+                if job.status == QUEUED:
+                    job.status = status
+                    job.started_at = datetime.now()
+                job.progress = progress
+                job.message = message
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        kind: str,
+        fn: Callable,
+        *args: Any,
+        job_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        summarize: Optional[Callable[[Any], Dict[str, Any]]] = None,
+        **kwargs: Any,
+    ) -> Job:
+        """
+        Queue fn(*args, **kwargs) on the pool and return its job record.
+
+        Args:
+            kind: Job type used for filtering ('backtest', 'optimization')
+            fn: Module-level callable (must be picklable)
+            *args: Positional arguments for fn (must be picklable)
+            job_id: Identifier to use (default: random)
+            metadata: JSON-able context stored with the job
+            summarize: Called with the result in this process to build
+                       Job.summary (keep it small and JSON-able)
+            **kwargs: Keyword arguments for fn (must be picklable)
+
+        Returns:
+            The queued Job
+
+        Raises:
+            RuntimeError: If the manager has been shut down
+        """
+        if self._closed:
+            raise RuntimeError("JobManager is shut down")
+        self.evict_expired()
+
+        job = Job(job_id=job_id or uuid.uuid4().hex, kind=kind, metadata=metadata or {})
+        with self._lock:
+            self._jobs[job.job_id] = job
+            executor = self._ensure_executor()
+            try:
+                future = executor.submit(_run_job, job.job_id, fn, args, kwargs)
+            except BrokenProcessPool:
+                self._discard_executor(executor)
+                executor = self._ensure_executor()
+                future = executor.submit(_run_job, job.job_id, fn, args, kwargs)
+            self._futures[job.job_id] = future
+        future.add_done_callback(
+            lambda f, job_id=job.job_id, executor=executor: self._finish(
+                job_id, f, summarize, executor
+            )
+        )
+
+        logger.info(f"Queued {kind} job {job.job_id}")
+        return job
+
+    def _finish(
+        self,
+        job_id: str,
+        future: Future,
+        summarize: Optional[Callable],
+        executor: Optional[ProcessPoolExecutor] = None,
+    ) -> None:
+        """Record a job's outcome when its future resolves."""
+        if (
+            executor is not None
+            and not future.cancelled()
+            and isinstance(future.exception(), BrokenProcessPool)
+        ):
+            self._discard_executor(executor)
+        with self._lock:
+            self._futures.pop(job_id, None)
+            job = self._jobs.get(job_id)
+            if job is None:
+                return  # Deleted while running
+            job.finished_at = datetime.now()
+            if future.cancelled():
+                job.status = CANCELLED
+            elif future.exception() is not None:
+                job.status = FAILED
+                job.error = str(future.exception())
+                logger.error(f"Job {job_id} failed: {job.error}")
+            else:
+                result = future.result()
+                job.status = COMPLETED
+                job.progress = 1.0
+                job.message = 'completed'
+                if summarize is not None:
+                    try:
+                        job.summary = summarize(result)
+                    except Exception as e:
+                        logger.warning(f"Could not summarize job {job_id}: {e}")
+                self._store_result(job_id, result)
+                logger.info(f"Job {job_id} completed")
+            self._persist(job)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Job record, or None if unknown or evicted."""
+        self.evict_expired()
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(
+        self,
+        kind: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> List[Job]:
+        """
+        Jobs, most recently created first.
+
+        Args:
+            kind: Only jobs of this type
+            status: Only jobs with this status
+        """
+        self.evict_expired()
+        with self._lock:
+            jobs = [
+                job for job in self._jobs.values()
+                if (kind is None or job.kind == kind) and (status is None or job.status == status)
+            ]
+        return sorted(jobs, key=lambda job: job.created_at, reverse=True)
+
+    def result(self, job_id: str) -> Any:
+        """
+        Return value of a completed job.
+
+        Raises:
+            KeyError: If the job is unknown, evicted or not completed
+        """
+        job = self.get(job_id)
+        if job is None or job.status != COMPLETED:
+            raise KeyError(job_id)
+        with self._lock:
+            if job_id in self._results:
+                return self._results[job_id]
+        path = self._path(job_id, '.pkl')
+        if path is None or not path.exists():
+            raise KeyError(job_id)
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    def delete(self, job_id: str) -> bool:
+        """
+        Cancel (if still queued) and forget a job, including persisted files.
+
+        A job that is already running finishes in its worker, but its
+        result is discarded.
+
+        Returns:
+            True if the job existed
+        """
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+            future = self._futures.pop(job_id, None)
+            self._results.pop(job_id, None)
+        if future is not None:
+            future.cancel()
+        self._remove_files(job_id)
+        return job is not None
+
+    async def stream(self, job_id: str, interval: float = 0.5) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield the job record whenever it changes, until it finishes.
+
+        Args:
+            job_id: Job to follow
+            interval: Seconds between checks
+
+        Yields:
+            Job.to_dict() snapshots (the last one has a terminal status)
+        """
+        last = None
+        while True:
+            job = self.get(job_id)
+            if job is None:
+                return
+            snapshot = job.to_dict()
+            if snapshot != last:
+                last = snapshot
+                yield snapshot
+            if job.done:
+                return
+            await asyncio.sleep(interval)
+
+    def evict_expired(self) -> int:
+        """Drop finished jobs older than the TTL. Returns the number evicted."""
+        cutoff = datetime.now() - self.result_ttl
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.done and job.finished_at is not None and job.finished_at < cutoff
+            ]
+        for job_id in expired:
+            self.delete(job_id)
+        if expired:
+            logger.info(f"Evicted {len(expired)} expired jobs")
+        return len(expired)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the pool; queued jobs are cancelled."""
+        self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+        logger.info("Job manager shut down")
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _path(self, job_id: str, suffix: str) -> Optional[Path]:
+        return None if self.results_dir is None else self.results_dir / f"{job_id}{suffix}"
+
+    def _store_result(self, job_id: str, result: Any) -> None:
+        path = self._path(job_id, '.pkl')
+        if path is None:
+            self._results[job_id] = result
+            return
+        try:
+            with open(path, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Could not persist result of {job_id}, keeping it in memory: {e}")
+            self._results[job_id] = result
+
+    def _persist(self, job: Job) -> None:
+        path = self._path(job.job_id, '.json')
+        if path is None:
+            return
+        try:
+            path.write_text(json.dumps(job.to_dict(), default=str))
+        except Exception as e:
+            logger.warning(f"Could not persist job record {job.job_id}: {e}")
+
+    def _remove_files(self, job_id: str) -> None:
+        for suffix in ('.json', '.pkl'):
+            path = self._path(job_id, suffix)
+            if path is not None and path.exists():
+                path.unlink()
+
+    def _load_persisted(self) -> None:
+        """Index finished jobs persisted by a previous process."""
+        for path in self.results_dir.glob('*.json'):
+            try:
+                job = Job.from_dict(json.loads(path.read_text()))
+            except Exception as e:
+                logger.warning(f"Skipping unreadable job record {path.name}: {e}")
+                continue
+            if job.done:
+                self._jobs[job.job_id] = job
+        self.evict_expired()
+
+
+_job_manager: Optional[JobManager] = None
+
+
+def get_job_manager() -> JobManager:
+    """Get the shared JobManager, configured from API settings."""
+    global _job_manager
+    if _job_manager is None:
+        from jutsu_api.config import get_settings
+
+        settings = get_settings()
+        _job_manager = JobManager(
+            max_workers=settings.job_workers,
+            results_dir=settings.job_results_dir,
+            result_ttl_seconds=settings.job_result_ttl_seconds,
+        )
+    return _job_manager
+
+
+def set_job_manager(manager: Optional[JobManager]) -> None:
+    """Replace the shared JobManager (tests, custom deployments)."""
+    global _job_manager
+    _job_manager = manager
@@ -8,10 +8,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from datetime import datetime
 import logging
 
-from jutsu_api.routers import backtest, data, strategies, optimization
+from jutsu_api.routers import backtest, data, strategies, optimization, jobs
 from jutsu_api.middleware import RateLimitMiddleware
 from jutsu_api.models.schemas import HealthResponse
 from jutsu_api.config import get_settings
+from jutsu_api.jobs import get_job_manager
 
 # Configure logging
 logging.basicConfig(
@@ -77,6 +78,11 @@ app.include_router(
     prefix="/api/v1/optimization",
     tags=["optimization"]
 )
+app.include_router(
+    jobs.router,
+    prefix="/api/v1/jobs",
+    tags=["jobs"]
+)
 
 
 @app.get("/", response_model=HealthResponse)
@@ -137,6 +143,7 @@ async def startup_event():
     logger.info(f"Debug mode: {settings.debug}")
     logger.info(f"Database: {settings.database_url}")
     logger.info(f"Rate limit: {settings.rate_limit_rpm} req/min")
+    logger.info(f"Job workers: {settings.job_workers}")
     logger.info(f"CORS origins: {', '.join(settings.cors_origins)}")
     logger.info("=" * 60)
     logger.info("API documentation available at: /docs")
@@ -154,7 +161,7 @@ async def shutdown_event():
     logger.info("=" * 60)
     logger.info("Jutsu Labs API shutting down...")
     logger.info("Performing cleanup...")
-    # Add cleanup tasks here (close connections, etc.)
+    get_job_manager().shutdown()
     logger.info("Shutdown complete")
     logger.info("=" * 60)
 
@@ -1,5 +1,5 @@
 """API routers for different resource endpoints."""
 
-from jutsu_api.routers import backtest, data, strategies, optimization
+from jutsu_api.routers import backtest, data, strategies, optimization, jobs
 
-__all__ = ["backtest", "data", "strategies", "optimization"]
+__all__ = ["backtest", "data", "strategies", "optimization", "jobs"]
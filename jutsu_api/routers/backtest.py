@@ -1,9 +1,12 @@
 """Backtest endpoints for running and managing backtests.
 
 Provides REST API for executing backtests, retrieving results,
-and managing backtest history.
+and managing backtest history. Backtests run as background jobs
+(see jutsu_api.jobs): POST /run returns the backtest id immediately and
+GET /{backtest_id} reports queued/running/success/failed.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 from datetime import datetime
 from decimal import Decimal
@@ -12,7 +15,9 @@ import logging
 import uuid
 
 from jutsu_api.models.schemas import BacktestRequest, BacktestResponse
+from jutsu_api.config import get_settings
 from jutsu_api.dependencies import get_db
+from jutsu_api.jobs import COMPLETED, FAILED, Job, get_job_manager, report_progress
 from jutsu_engine.application.backtest_runner import BacktestRunner
 from jutsu_engine.strategies.sma_crossover import SMA_Crossover
 
@@ -20,8 +25,7 @@ logger = logging.getLogger("API.BACKTEST")
 
 router = APIRouter()
 
-# In-memory storage for backtest results (replace with database in production)
-_backtest_results: Dict[str, Dict[str, Any]] = {}
+JOB_KIND = 'backtest'
 
 
 def get_strategy_class(strategy_name: str):
@@ -51,23 +55,81 @@ def get_strategy_class(strategy_name: str):
     return strategies[strategy_name]
 
 
+def _backtest_config(request: BacktestRequest) -> Dict[str, Any]:
+    """BacktestRunner configuration for a request."""
+    return {
+        'symbol': request.symbol,
+        'timeframe': request.timeframe,
+        'start_date': request.start_date,
+        'end_date': request.end_date,
+        'initial_capital': request.initial_capital,
+        'commission_per_share': request.commission_per_share,
+        'slippage_percent': request.slippage_percent,
+        'result_cache': get_settings().backtest_result_cache_dir or None,
+    }
+
+
+def execute_backtest(strategy_name: str, parameters: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Job function: run one backtest in a worker process.
+
+    Args:
+        strategy_name: Registered strategy name
+        parameters: Strategy constructor parameters
+        config: BacktestRunner configuration
+
+    Returns:
+        BacktestRunner results
+    """
+    strategy = get_strategy_class(strategy_name)(**parameters)
+    return BacktestRunner(config).run(strategy, progress_callback=report_progress)
+
+
+def _summarize(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Headline metrics kept on the job record for history listings."""
+    return {
+        key: results.get(key)
+        for key in ('strategy_name', 'total_return', 'sharpe_ratio', 'total_trades')
+    }
+
+
+def _response(job: Job) -> BacktestResponse:
+    """BacktestResponse for a job in any state."""
+    config = job.metadata.get('config')
+    if job.status == COMPLETED:
+        return BacktestResponse(
+            backtest_id=job.job_id,
+            status="success",
+            metrics=get_job_manager().result(job.job_id),
+            config=config
+        )
+    if job.status == FAILED:
+        return BacktestResponse(
+            backtest_id=job.job_id, status="failed", error=job.error, config=config
+        )
+    return BacktestResponse(backtest_id=job.job_id, status=job.status, config=config)
+
+
 @router.post("/run", response_model=BacktestResponse, status_code=status.HTTP_201_CREATED)
 async def run_backtest(
     request: BacktestRequest,
     db: Session = Depends(get_db)
 ):
     """
-    Run a backtest with specified strategy and parameters.
+    Submit a backtest with specified strategy and parameters.
+
+    Returns immediately; the backtest runs on the job pool. Poll
+    GET /{backtest_id} or stream GET /api/v1/jobs/{backtest_id}/stream.
 
     Args:
         request: Backtest configuration
         db: Database session
 
     Returns:
-        Backtest results with metrics
+        Backtest id with status "queued"
 
     Raises:
-        HTTPException: 400 if validation fails, 500 if backtest fails
+        HTTPException: 400 if validation fails, 500 if submission fails
 
     Example:
         POST /api/v1/backtest/run
@@ -85,61 +147,46 @@ async def run_backtest(
     """
     try:
         logger.info(
-            f"Starting backtest: {request.strategy_name} on {request.symbol} "
+            f"Submitting backtest: {request.strategy_name} on {request.symbol} "
             f"from {request.start_date.date()} to {request.end_date.date()}"
         )
 
-        # Get strategy class
+        # Validate strategy and parameters before queueing
         strategy_class = get_strategy_class(request.strategy_name)
+        strategy_class(**request.parameters)
 
-        # Create strategy instance with parameters
-        strategy = strategy_class(**request.parameters)
-
-        # Prepare backtest configuration
-        config = {
-            'symbol': request.symbol,
-            'timeframe': request.timeframe,
-            'start_date': request.start_date,
-            'end_date': request.end_date,
-            'initial_capital': request.initial_capital,
-            'commission_per_share': request.commission_per_share,
-            'slippage_percent': request.slippage_percent,
-        }
-
-        # Run backtest
-        runner = BacktestRunner(config)
-        results = runner.run(strategy)
+        config = _backtest_config(request)
 
         # Generate backtest ID
-        backtest_id = f"bt_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{request.symbol}_{request.strategy_name}"
-
-        # Store results
-        _backtest_results[backtest_id] = results
-
-        logger.info(
-            f"Backtest completed: {backtest_id} - "
-            f"Return: {results.get('total_return', 0):.2%}, "
-            f"Sharpe: {results.get('sharpe_ratio', 0):.2f}"
+        backtest_id = (
+            f"bt_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{request.symbol}_"
+            f"{request.strategy_name}_{uuid.uuid4().hex[:8]}"
         )
 
-        return BacktestResponse(
-            backtest_id=backtest_id,
-            status="success",
-            metrics=results,
-            config=config
+        job = get_job_manager().submit(
+            JOB_KIND,
+            execute_backtest,
+            request.strategy_name,
+            request.parameters,
+            config,
+            job_id=backtest_id,
+            metadata={'config': jsonable_encoder(config), 'strategy_name': request.strategy_name},
+            summarize=_summarize,
         )
 
-    except ValueError as e:
+        return _response(job)
+
+    except (ValueError, TypeError) as e:
         logger.warning(f"Validation error: {e}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Backtest failed: {e}", exc_info=True)
+        logger.error(f"Backtest submission failed: {e}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Backtest execution failed: {str(e)}"
+            detail=f"Backtest submission failed: {str(e)}"
         )
 
 
@@ -165,28 +212,26 @@ async def list_backtest_history(
         GET /api/v1/backtest/history?limit=10&offset=0
     """
     try:
-        # Get all backtest IDs, sorted by timestamp (most recent first)
-        sorted_ids = sorted(
-            _backtest_results.keys(),
-            reverse=True
-        )
+        # Most recent first
+        jobs = get_job_manager().list(kind=JOB_KIND)
 
         # Apply pagination
-        paginated_ids = sorted_ids[offset:offset + limit]
+        paginated = jobs[offset:offset + limit]
 
         # Build summary for each backtest
         history = []
-        for backtest_id in paginated_ids:
-            results = _backtest_results[backtest_id]
+        for job in paginated:
+            config = job.metadata.get('config', {})
             history.append({
-                'backtest_id': backtest_id,
-                'strategy_name': results.get('strategy_name'),
-                'symbol': results.get('config', {}).get('symbol'),
-                'start_date': results.get('config', {}).get('start_date'),
-                'end_date': results.get('config', {}).get('end_date'),
-                'total_return': results.get('total_return'),
-                'sharpe_ratio': results.get('sharpe_ratio'),
-                'total_trades': results.get('total_trades'),
+                'backtest_id': job.job_id,
+                'status': job.status,
+                'strategy_name': job.summary.get('strategy_name', job.metadata.get('strategy_name')),
+                'symbol': config.get('symbol'),
+                'start_date': config.get('start_date'),
+                'end_date': config.get('end_date'),
+                'total_return': job.summary.get('total_return'),
+                'sharpe_ratio': job.summary.get('sharpe_ratio'),
+                'total_trades': job.summary.get('total_trades'),
             })
 
         logger.info(f"Retrieved {len(history)} backtest records")
@@ -204,13 +249,13 @@ async def list_backtest_history(
 @router.get("/{backtest_id}", response_model=BacktestResponse)
 async def get_backtest_results(backtest_id: str):
     """
-    Retrieve results for a specific backtest.
+    Retrieve status and results for a specific backtest.
 
     Args:
         backtest_id: Unique backtest identifier
 
     Returns:
-        Backtest results
+        Backtest status; metrics once it succeeded
 
     Raises:
         HTTPException: 404 if backtest not found
@@ -219,23 +264,17 @@ async def get_backtest_results(backtest_id: str):
         GET /api/v1/backtest/bt_20240101_120000_AAPL_SMA_Crossover
     """
     try:
-        if backtest_id not in _backtest_results:
+        job = get_job_manager().get(backtest_id)
+        if job is None or job.kind != JOB_KIND:
             logger.warning(f"Backtest not found: {backtest_id}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Backtest not found: {backtest_id}"
             )
 
-        results = _backtest_results[backtest_id]
+        logger.info(f"Retrieved status for: {backtest_id} ({job.status})")
 
-        logger.info(f"Retrieved results for: {backtest_id}")
-
-        return BacktestResponse(
-            backtest_id=backtest_id,
-            status="success",
-            metrics=results,
-            config=results.get('config')
-        )
+        return _response(job)
 
     except HTTPException:
         raise
@@ -250,7 +289,7 @@ async def get_backtest_results(backtest_id: str):
 @router.delete("/{backtest_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_backtest(backtest_id: str):
     """
-    Delete a backtest and its results.
+    Delete a backtest and its results (cancels it if still queued).
 
     Args:
         backtest_id: Unique backtest identifier
@@ -262,14 +301,16 @@ async def delete_backtest(backtest_id: str):
         DELETE /api/v1/backtest/bt_20240101_120000_AAPL_SMA_Crossover
     """
     try:
-        if backtest_id not in _backtest_results:
+        manager = get_job_manager()
+        job = manager.get(backtest_id)
+        if job is None or job.kind != JOB_KIND:
             logger.warning(f"Backtest not found for deletion: {backtest_id}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Backtest not found: {backtest_id}"
             )
 
-        del _backtest_results[backtest_id]
+        manager.delete(backtest_id)
         logger.info(f"Deleted backtest: {backtest_id}")
 
     except HTTPException:
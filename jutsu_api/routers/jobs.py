@@ -0,0 +1,141 @@
+"""Background job endpoints.
+
+Provides REST API for listing, polling, streaming and deleting the
+background jobs submitted by the backtest and optimization endpoints.
+"""
+from fastapi import APIRouter, HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from typing import Any, Dict, List, Optional
+import json
+import logging
+
+from jutsu_api.jobs import COMPLETED, get_job_manager
+
+logger = logging.getLogger("API.JOBS")
+
+router = APIRouter()
+
+
+def _get_job_or_404(job_id: str):
+    job = get_job_manager().get(job_id)
+    if job is None:
+        logger.warning(f"Job not found: {job_id}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job not found: {job_id}"
+        )
+    return job
+
+
+@router.get("/", response_model=List[Dict[str, Any]])
+async def list_jobs(
+    kind: Optional[str] = None,
+    job_status: Optional[str] = None,
+    limit: int = 100
+):
+    """
+    List background jobs, most recent first.
+
+    Args:
+        kind: Optional job type filter (backtest, optimization)
+        job_status: Optional status filter (queued, running, completed, failed, cancelled)
+        limit: Maximum number of jobs to return (default: 100)
+
+    Returns:
+        List of job records
+
+    Example:
+        GET /api/v1/jobs/?kind=backtest&job_status=running
+    """
+    jobs = get_job_manager().list(kind=kind, status=job_status)[:limit]
+    return [job.to_dict() for job in jobs]
+
+
+@router.get("/{job_id}", response_model=Dict[str, Any])
+async def get_job(job_id: str):
+    """
+    Get status and progress of a job.
+
+    Args:
+        job_id: Job identifier
+
+    Returns:
+        Job record (status, progress, message, timestamps, summary)
+
+    Raises:
+        HTTPException: 404 if job not found
+    """
+    return _get_job_or_404(job_id).to_dict()
+
+
+@router.get("/{job_id}/result")
+async def get_job_result(job_id: str):
+    """
+    Get the full result of a completed job.
+
+    Args:
+        job_id: Job identifier
+
+    Returns:
+        Job result
+
+    Raises:
+        HTTPException: 404 if job not found, 409 if not completed
+    """
+    job = _get_job_or_404(job_id)
+    if job.status != COMPLETED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job not completed yet. Status: {job.status}"
+        )
+    try:
+        result = get_job_manager().result(job_id)
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Result not available for job: {job_id}"
+        )
+    return jsonable_encoder(result)
+
+
+@router.get("/{job_id}/stream")
+async def stream_job(job_id: str, interval: float = 0.5):
+    """
+    Stream job status updates as Server-Sent Events until the job finishes.
+
+    Each event's data is the job record (same shape as GET /{job_id}).
+
+    Args:
+        job_id: Job identifier
+        interval: Seconds between status checks
+
+    Raises:
+        HTTPException: 404 if job not found
+    """
+    _get_job_or_404(job_id)
+
+    async def events():
+        async for snapshot in get_job_manager().stream(job_id, interval=max(interval, 0.1)):
+            yield f"data: {json.dumps(snapshot, default=str)}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_job(job_id: str):
+    """
+    Cancel (if queued) and delete a job and its stored result.
+
+    Args:
+        job_id: Job identifier
+
+    Raises:
+        HTTPException: 404 if job not found
+    """
+    if not get_job_manager().delete(job_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job not found: {job_id}"
+        )
+    logger.info(f"Deleted job: {job_id}")
@@ -1,19 +1,24 @@
 """Parameter optimization endpoints.
 
 Provides REST API for running parameter optimization jobs,
-retrieving results, and monitoring job status.
+retrieving results, and monitoring job status. Optimizations run as
+background jobs (see jutsu_api.jobs): the submit endpoints return the job
+id immediately with status "queued".
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 from datetime import datetime
 from decimal import Decimal
 from typing import Dict, Any, List
 import logging
+import multiprocessing
 import uuid
-import asyncio
 
 from jutsu_api.models.schemas import OptimizationRequest, OptimizationResponse
+from jutsu_api.config import get_settings
 from jutsu_api.dependencies import get_db
+from jutsu_api.jobs import COMPLETED, FAILED, Job, get_job_manager, report_progress
 from jutsu_engine.optimization.grid_search import GridSearchOptimizer
 from jutsu_engine.optimization.genetic import GeneticOptimizer
 from jutsu_engine.strategies.sma_crossover import SMA_Crossover
@@ -22,8 +27,7 @@ logger = logging.getLogger("API.OPTIMIZATION")
 
 router = APIRouter()
 
-# In-memory storage for optimization jobs (replace with database + Celery in production)
-_optimization_jobs: Dict[str, Dict[str, Any]] = {}
+JOB_KIND = 'optimization'
 
 
 def get_strategy_class(strategy_name: str):
@@ -165,94 +169,116 @@ async def run_genetic_optimization(
         )
 
 
-async def _run_optimization(
-    request: OptimizationRequest,
-    db: Session
-) -> OptimizationResponse:
+def optimizer_n_jobs() -> int:
     """
-    Internal function to run optimization (shared by grid search and genetic).
-
-    Args:
-        request: Optimization configuration
-        db: Database session
+    Processes one optimization job may use.
 
-    Returns:
-        Optimization response with job ID
+    Every job worker runs its own optimizer pool, so the CPU cores are split
+    across settings.job_workers unless optimization_n_jobs is set.
     """
-    logger.info(
-        f"Starting {request.optimizer_type} optimization: "
-        f"{request.strategy_name} on {request.symbol}"
-    )
+    settings = get_settings()
+    if settings.optimization_n_jobs > 0:
+        return settings.optimization_n_jobs
+    return max(1, multiprocessing.cpu_count() // settings.job_workers)
 
-    # Generate job ID
-    job_id = f"opt_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{request.symbol}_{request.strategy_name}"
 
-    # Get strategy and optimizer classes
-    strategy_class = get_strategy_class(request.strategy_name)
-    optimizer_class = get_optimizer_class(request.optimizer_type)
+def execute_optimization(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Job function: run one optimization in a worker process.
+
+    Args:
+        request: OptimizationRequest as a dict
 
-    # Create optimizer instance
+    Returns:
+        Optimizer results
+    """
+    optimizer_class = get_optimizer_class(request['optimizer_type'])
     optimizer = optimizer_class(
-        strategy_class=strategy_class,
-        parameter_space=request.parameter_space,
-        objective=request.metric
+        strategy_class=get_strategy_class(request['strategy_name']),
+        parameter_space=request['parameter_space'],
+        objective=request['metric']
+    )
+    return optimizer.optimize(
+        symbol=request['symbol'],
+        timeframe="1D",
+        start_date=request['start_date'],
+        end_date=request['end_date'],
+        initial_capital=request['initial_capital'],
+        result_cache=get_settings().backtest_result_cache_dir or None,
+        parallel=True,
+        n_jobs=optimizer_n_jobs(),
+        progress_callback=report_progress
     )
 
-    # Store job as running
-    _optimization_jobs[job_id] = {
-        'status': 'running',
-        'started_at': datetime.now(),
-        'request': request.dict(),
-        'results': None,
-        'error': None
-    }
-
-    try:
-        # Run optimization (this is synchronous and may take time)
-        # In production, this should be async with Celery or similar
-        results = optimizer.optimize(
-            symbol=request.symbol,
-            timeframe="1D",
-            start_date=request.start_date,
-            end_date=request.end_date,
-            initial_capital=request.initial_capital,
-            parallel=True
-        )
 
-        # Update job status
-        _optimization_jobs[job_id]['status'] = 'completed'
-        _optimization_jobs[job_id]['completed_at'] = datetime.now()
-        _optimization_jobs[job_id]['results'] = results
+def _summarize(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Headline values kept on the job record for listings."""
+    return {
+        'best_value': results['objective_value'],
+        'best_parameters': results['parameters'],
+        'n_evaluated': results.get('n_evaluated'),
+        'execution_mode': results.get('execution_mode', 'sequential'),
+    }
 
-        logger.info(
-            f"Optimization completed: {job_id} - "
-            f"Best {request.metric}: {results['objective_value']:.4f}"
-        )
 
+def _response(job: Job) -> OptimizationResponse:
+    """OptimizationResponse for a job in any state."""
+    if job.status == COMPLETED:
+        summary = job.summary
         return OptimizationResponse(
-            job_id=job_id,
+            job_id=job.job_id,
             status='completed',
-            best_parameters=results['parameters'],
+            best_parameters=summary.get('best_parameters'),
             results={
-                'best_value': results['objective_value'],
-                'n_evaluated': results['n_evaluated'],
-                'execution_mode': results.get('execution_mode', 'sequential')
+                'best_value': summary.get('best_value'),
+                'n_evaluated': summary.get('n_evaluated'),
+                'execution_mode': summary.get('execution_mode', 'sequential')
             }
         )
+    if job.status == FAILED:
+        return OptimizationResponse(job_id=job.job_id, status='failed', error=job.error)
+    return OptimizationResponse(job_id=job.job_id, status=job.status)
 
-    except Exception as e:
-        # Update job status with error
-        _optimization_jobs[job_id]['status'] = 'failed'
-        _optimization_jobs[job_id]['error'] = str(e)
-        _optimization_jobs[job_id]['failed_at'] = datetime.now()
 
-        logger.error(f"Optimization failed: {job_id} - {e}", exc_info=True)
+async def _run_optimization(
+    request: OptimizationRequest,
+    db: Session
+) -> OptimizationResponse:
+    """
+    Internal function to submit an optimization (shared by grid search and genetic).
 
-        return OptimizationResponse(
-            job_id=job_id,
-            status='failed',
-            error=str(e)
-        )
+    Args:
+        request: Optimization configuration
+        db: Database session
+
+    Returns:
+        Optimization response with job ID (status "queued")
+    """
+    logger.info(
+        f"Submitting {request.optimizer_type} optimization: "
+        f"{request.strategy_name} on {request.symbol}"
+    )
+
+    # Generate job ID
+    job_id = (
+        f"opt_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{request.symbol}_"
+        f"{request.strategy_name}_{uuid.uuid4().hex[:8]}"
+    )
+
+    # Validate strategy and optimizer before queueing
+    get_strategy_class(request.strategy_name)
+    get_optimizer_class(request.optimizer_type)
+
+    job = get_job_manager().submit(
+        JOB_KIND,
+        execute_optimization,
+        request.dict(),
+        job_id=job_id,
+        metadata={'request': jsonable_encoder(request.dict())},
+        summarize=_summarize,
+    )
+
+    return _response(job)
 
 
 @router.get("/{job_id}", response_model=OptimizationResponse)
@@ -273,41 +299,17 @@ async def get_optimization_status(job_id: str):
         GET /api/v1/optimization/opt_20240101_120000_AAPL_SMA_Crossover
     """
     try:
-        if job_id not in _optimization_jobs:
+        job = get_job_manager().get(job_id)
+        if job is None or job.kind != JOB_KIND:
             logger.warning(f"Optimization job not found: {job_id}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Optimization job not found: {job_id}"
             )
 
-        job = _optimization_jobs[job_id]
-
         logger.info(f"Retrieved status for optimization: {job_id}")
 
-        # Build response based on status
-        if job['status'] == 'completed':
-            results = job['results']
-            return OptimizationResponse(
-                job_id=job_id,
-                status='completed',
-                best_parameters=results['parameters'],
-                results={
-                    'best_value': results['objective_value'],
-                    'n_evaluated': results['n_evaluated'],
-                    'execution_mode': results.get('execution_mode', 'sequential')
-                }
-            )
-        elif job['status'] == 'failed':
-            return OptimizationResponse(
-                job_id=job_id,
-                status='failed',
-                error=job['error']
-            )
-        else:  # running
-            return OptimizationResponse(
-                job_id=job_id,
-                status='running'
-            )
+        return _response(job)
 
     except HTTPException:
         raise
@@ -337,23 +339,23 @@ async def get_optimization_results(job_id: str):
         GET /api/v1/optimization/opt_20240101_120000_AAPL_SMA_Crossover/results
     """
     try:
-        if job_id not in _optimization_jobs:
+        manager = get_job_manager()
+        job = manager.get(job_id)
+        if job is None or job.kind != JOB_KIND:
             logger.warning(f"Optimization job not found: {job_id}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Optimization job not found: {job_id}"
             )
 
-        job = _optimization_jobs[job_id]
-
-        if job['status'] != 'completed':
+        if job.status != COMPLETED:
             logger.warning(f"Optimization not completed: {job_id}")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Optimization not completed yet. Status: {job['status']}"
+                detail=f"Optimization not completed yet. Status: {job.status}"
             )
 
-        results = job['results']
+        results = manager.result(job_id)
 
         logger.info(f"Retrieved results for optimization: {job_id}")
 
@@ -362,12 +364,12 @@ async def get_optimization_results(job_id: str):
             'status': 'completed',
             'best_parameters': results['parameters'],
             'best_value': results['objective_value'],
-            'n_evaluated': results['n_evaluated'],
+            'n_evaluated': results.get('n_evaluated'),
             'execution_mode': results.get('execution_mode', 'sequential'),
             'all_results': results.get('all_results', [])[:100],  # Limit to 100 results
-            'started_at': job['started_at'],
-            'completed_at': job['completed_at'],
-            'request': job['request']
+            'started_at': job.started_at or job.created_at,
+            'completed_at': job.finished_at,
+            'request': job.metadata['request']
         }
 
     except HTTPException:
@@ -389,7 +391,7 @@ async def list_optimization_jobs(
     List all optimization jobs.
 
     Args:
-        status: Optional status filter (running, completed, failed)
+        status: Optional status filter (queued, running, completed, failed)
         limit: Maximum number of jobs to return (default: 100)
 
     Returns:
@@ -399,34 +401,29 @@ async def list_optimization_jobs(
         GET /api/v1/optimization/jobs/list?status=completed&limit=10
     """
     try:
-        # Filter jobs by status if provided
+        # Filter jobs by status if provided (most recent first)
         jobs = []
-        for job_id, job in _optimization_jobs.items():
-            if status and job['status'] != status:
-                continue
-
+        for job in get_job_manager().list(kind=JOB_KIND, status=status)[:limit]:
+            request = job.metadata['request']
             job_summary = {
-                'job_id': job_id,
-                'status': job['status'],
-                'strategy_name': job['request']['strategy_name'],
-                'symbol': job['request']['symbol'],
-                'optimizer_type': job['request']['optimizer_type'],
-                'started_at': job['started_at']
+                'job_id': job.job_id,
+                'status': job.status,
+                'strategy_name': request['strategy_name'],
+                'symbol': request['symbol'],
+                'optimizer_type': request['optimizer_type'],
+                'started_at': job.started_at or job.created_at,
+                'progress': job.progress,
             }
 
-            if job['status'] == 'completed':
-                job_summary['completed_at'] = job['completed_at']
-                job_summary['best_value'] = job['results']['objective_value']
-            elif job['status'] == 'failed':
-                job_summary['failed_at'] = job['failed_at']
-                job_summary['error'] = job['error']
+            if job.status == COMPLETED:
+                job_summary['completed_at'] = job.finished_at
+                job_summary['best_value'] = job.summary.get('best_value')
+            elif job.status == FAILED:
+                job_summary['failed_at'] = job.finished_at
+                job_summary['error'] = job.error
 
             jobs.append(job_summary)
 
-        # Sort by started_at (most recent first) and limit
-        jobs.sort(key=lambda x: x['started_at'], reverse=True)
-        jobs = jobs[:limit]
-
         logger.info(f"Retrieved {len(jobs)} optimization jobs")
 
         return jobs
@@ -1049,9 +1049,12 @@ def get_strategy_runner():
 
     if _strategy_runner is None:
         try:
-            from jutsu_engine.live.strategy_runner import LiveStrategyRunner
+            from jutsu_engine.live.strategy_runner import DEFAULT_SNAPSHOT_DIR, LiveStrategyRunner
             config_path = get_config_path()
-            _strategy_runner = LiveStrategyRunner(config_path=config_path)
+            # Shares the scheduler's signal snapshots, so warmup only applies new bars
+            _strategy_runner = LiveStrategyRunner(
+                config_path=config_path, snapshot_dir=DEFAULT_SNAPSHOT_DIR
+            )
             logger.info(f"Strategy runner initialized: {_strategy_runner.strategy.name}")
             _strategy_warmed_up = False
         except Exception as e:
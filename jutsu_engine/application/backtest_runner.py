@@ -31,13 +31,14 @@ Example:
     print(f"Sharpe Ratio: {results['sharpe_ratio']:.2f}")
 """
 from decimal import Decimal
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+from datetime import date, datetime
+from typing import Callable, Dict, Any, Optional, List
 from sqlalchemy import create_engine, and_
 from sqlalchemy.orm import sessionmaker
 import yaml
 import inspect
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 from jutsu_engine.core.strategy_base import Strategy
@@ -50,6 +51,9 @@ from jutsu_engine.utils.logging_config import setup_logger
 
 logger = setup_logger('BACKTEST', log_to_console=True)
 
+# 'full': CSV/YAML exports + complete history; 'metrics': summary metrics only
+OUTPUT_MODES = ('full', 'metrics')
+
 
 class BacktestRunner:
     """
@@ -79,6 +83,37 @@ class BacktestRunner:
                 - commission_per_share: Decimal (default: from config)
                 - slippage_percent: Decimal (default: 0.001)
                 - database_url: str (default: from config)
+                - precompute: bool (default: True) - let strategies that
+                  implement precompute() build indicators in one vectorized pass
+                - bulk_load: bool (default: True) - load multi-symbol data with
+                  one query instead of streaming ORM rows
+                - market_data_cache: MarketDataCache or MarketDataCacheHandle
+                  (default: the cache attached to this worker process, if any) -
+                  read bars from a shared panel instead of the database
+                - parquet_store: str | Path | ParquetMarketDataStore (default:
+                  None) - read bars from a partitioned Parquet store instead
+                  of the database (see jutsu sync export-parquet)
+                - preload_intraday: bool (default: True) - when the strategy's
+                  execution_time is not 'close', bulk-load the 15m/5m bars
+                  its intraday price lookups need before the run
+                - parquet_tz_aware: bool (default: True) - emit UTC-aware
+                  timestamps from the Parquet store (False = naive, like SQLite)
+                - output_mode: str (default: 'full') - 'metrics' skips trade
+                  logging, regime analysis, per-bar history and every file
+                  export; run() then returns summary metrics plus an
+                  'equity_curve' numpy array (for optimization campaigns)
+                - history: 'full' | 'none' | int (default: 'full') - how many
+                  bars/signals/orders/daily snapshots the event loop keeps in
+                  memory (fills are always kept). Bounded snapshots mean the
+                  portfolio/dashboard CSVs only cover the retained days.
+                  output_mode='metrics' implies 'none'
+                - history_spill_dir: str (default: None) - stream the complete
+                  event history to Parquet files in this directory (needs pyarrow)
+                - result_cache: str | Path | BacktestResultCache | None
+                  (default: BACKTEST_RESULT_CACHE_DIR setting, unset = off) -
+                  serve identical runs (same strategy source and state,
+                  config and market data fingerprint) from an on-disk cache;
+                  None/False disables it
 
         Example (single symbol):
             config = {
@@ -143,6 +178,12 @@ class BacktestRunner:
         if 'symbol' not in self.config and 'symbols' not in self.config:
             raise ValueError("Must provide either 'symbol' or 'symbols' in config")
 
+        output_mode = self.config.get('output_mode', 'full')
+        if output_mode not in OUTPUT_MODES:
+            raise ValueError(
+                f"Invalid output_mode: {output_mode!r} (expected one of {', '.join(OUTPUT_MODES)})"
+            )
+
     def _generate_default_trade_path(self, strategy_name: str) -> str:
         """
         Generate default trade log path: trades/{strategy_name}_{timestamp}.csv
@@ -285,7 +326,8 @@ class BacktestRunner:
         self,
         strategy: Strategy,
         trades_output_path: Optional[str] = None,
-        output_dir: str = "output"
+        output_dir: str = "output",
+        progress_callback: Optional[Callable[[float, str], None]] = None
     ) -> Dict[str, Any]:
         """
         Run backtest with given strategy.
@@ -302,10 +344,15 @@ class BacktestRunner:
             trades_output_path: Custom path for trade log CSV (default: None)
                 If None, uses output_dir with auto-generated timestamp filename
             output_dir: Output directory for CSV files (default: "output")
+                Ignored when config['output_mode'] is 'metrics'
+            progress_callback: Optional callable(fraction, message), called as
+                the bar loop advances through the trading period (at most once
+                per whole percent; not called on result-cache hits)
 
         Returns:
             Dictionary with comprehensive backtest results
             Always includes 'trades_csv_path' key with path to exported CSV
+            (output_mode 'metrics': no file paths; adds 'equity_curve' array)
 
         Example:
             strategy = SMA_Crossover(short_period=20, long_period=50)
@@ -341,6 +388,20 @@ class BacktestRunner:
         else:
             raise ValueError("Must provide either 'symbols' or 'symbol' in config")
 
+        # Identical runs are served from the result cache (key taken before init() mutates state)
+        result_cache = self._resolve_result_cache()
+        cache_key = None
+        if result_cache is not None:
+            try:
+                cache_key = self._result_cache_key(strategy, symbols)
+            except Exception as e:
+                logger.warning(f"Result cache disabled for this run, could not build key: {e}")
+                cache_key = None
+            if cache_key is not None:
+                cached = self._load_cached_results(result_cache, cache_key, output_dir)
+                if cached is not None:
+                    return cached
+
         # Initialize strategy first to get warmup requirements
         strategy.init()
 
@@ -371,8 +432,43 @@ class BacktestRunner:
             logger.info("No warmup period required")
             warmup_end_date = None
 
-        # Create appropriate data handler (single vs multi-symbol)
-        if len(symbols) == 1:
+        # Shared-memory panel from the parent process, if one covers this run
+        data_handler = None
+        cache = self._resolve_market_data_cache()
+        if cache is not None:
+            from jutsu_engine.data.handlers.shared_memory import SharedMemoryDataHandler
+            try:
+                data_handler = SharedMemoryDataHandler(
+                    cache=cache,
+                    symbols=symbols,
+                    timeframe=self.config['timeframe'],
+                    start_date=self.config['start_date'],
+                    end_date=self.config['end_date'],
+                    warmup_bars=warmup_bars,
+                    session=self.session,  # intraday lookups only
+                )
+            except ValueError as e:
+                logger.info(f"Market data cache not used, reading from database: {e}")
+            else:
+                logger.info("Reading market data from shared market data cache")
+
+        # Parquet market data store (no database connection needed)
+        if data_handler is None and self.config.get('parquet_store') is not None:
+            from jutsu_engine.data.handlers.parquet import ParquetDataHandler
+
+            data_handler = ParquetDataHandler(
+                store=self._resolve_parquet_store(),
+                symbols=symbols,
+                timeframe=self.config['timeframe'],
+                start_date=self.config['start_date'],
+                end_date=self.config['end_date'],
+                warmup_bars=warmup_bars,
+                tz_aware=self.config.get('parquet_tz_aware', True),
+            )
+            logger.info(f"Reading market data from Parquet store {data_handler.store.root}")
+
+        # Otherwise create appropriate database handler (single vs multi-symbol)
+        if data_handler is None and len(symbols) == 1:
             # Single symbol - use existing DatabaseDataHandler
             data_handler = DatabaseDataHandler(
                 session=self.session,
@@ -382,7 +478,7 @@ class BacktestRunner:
                 end_date=self.config['end_date'],
                 warmup_bars=warmup_bars,  # Pass warmup requirements
             )
-        else:
+        elif data_handler is None:
             # Multiple symbols - use new MultiSymbolDataHandler
             data_handler = MultiSymbolDataHandler(
                 session=self.session,
@@ -391,6 +487,7 @@ class BacktestRunner:
                 start_date=self.config['start_date'],
                 end_date=self.config['end_date'],
                 warmup_bars=warmup_bars,  # Pass warmup requirements
+                bulk_load=self.config.get('bulk_load', True),  # One query for all symbols
             )
 
         # Inject data_handler for intraday data access (execution timing feature)
@@ -398,19 +495,38 @@ class BacktestRunner:
             strategy.set_data_handler(data_handler)
             logger.info("Injected data_handler into strategy for intraday data access")
 
-        # ALWAYS create TradeLogger (default behavior)
-        from jutsu_engine.performance.trade_logger import TradeLogger
-        trade_logger = TradeLogger(initial_capital=self.config['initial_capital'])
+        # Execution timing: one bulk intraday load instead of a query per symbol per day
+        if (
+            getattr(strategy, 'execution_time', 'close') != 'close'
+            and self.config.get('preload_intraday', True)
+            and hasattr(data_handler, 'preload_intraday')
+        ):
+            self._preload_intraday(data_handler)
+
+        # Vectorized indicator precompute (opt-in per strategy, disable with precompute: False)
+        if self.config.get('precompute', True) and strategy.supports_precompute():
+            self._run_precompute(strategy, data_handler)
+
+        # Metrics-only runs skip trade logging, regime analysis, history and exports
+        metrics_only = self.config.get('output_mode', 'full') == 'metrics'
+
+        # Create TradeLogger (default behavior, full output only)
+        trade_logger = None
+        if metrics_only:
+            logger.info("Metrics-only output: trade log, regime analysis and CSV exports disabled")
+        else:
+            from jutsu_engine.performance.trade_logger import TradeLogger
+            trade_logger = TradeLogger(initial_capital=self.config['initial_capital'])
 
-        # Generate default path if not provided
-        if trades_output_path is None:
-            trades_output_path = self._generate_default_trade_path(strategy.name)
+            # Generate default path if not provided
+            if trades_output_path is None:
+                trades_output_path = self._generate_default_trade_path(strategy.name)
 
-        logger.info(f"TradeLogger enabled, will export to: {trades_output_path}")
+            logger.info(f"TradeLogger enabled, will export to: {trades_output_path}")
 
         # Create RegimePerformanceAnalyzer if strategy supports regime tracking
         regime_analyzer = None
-        if hasattr(strategy, 'get_current_regime'):
+        if not metrics_only and hasattr(strategy, 'get_current_regime'):
             from jutsu_engine.performance.regime_analyzer import RegimePerformanceAnalyzer
             regime_analyzer = RegimePerformanceAnalyzer(initial_capital=self.config['initial_capital'])
             logger.info("RegimePerformanceAnalyzer enabled for regime-specific analysis")
@@ -442,13 +558,11 @@ class BacktestRunner:
         signal_symbol = getattr(strategy, 'signal_symbol', None)
         signal_prices = None
 
-        if signal_symbol:
+        if signal_symbol and not metrics_only:
             logger.info(f"Buy-and-hold benchmark enabled: {signal_symbol}")
 
-            # Collect signal prices directly from database
+            # Collect signal prices directly from database (or the shared cache)
             try:
-                from jutsu_engine.data.models import MarketData
-
                 # Prepare date boundaries for query
                 # Database stores timestamps as naive TEXT in SQLite, so convert to naive
                 query_start_date = self.config['start_date']
@@ -465,19 +579,8 @@ class BacktestRunner:
                     query_end_date = query_end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
                     logger.debug(f"Buy-and-hold query: end_date set to end of day: {query_end_date}")
 
-                signal_bars = (
-                    self.session.query(MarketData)
-                    .filter(
-                        and_(
-                            MarketData.symbol == signal_symbol,
-                            MarketData.timeframe == self.config['timeframe'],
-                            MarketData.timestamp >= query_start_date,
-                            MarketData.timestamp <= query_end_date,
-                            MarketData.is_valid == True,  # noqa: E712
-                        )
-                    )
-                    .order_by(MarketData.timestamp.asc())
-                    .all()
+                signal_bars = self._load_reference_bars(
+                    signal_symbol, query_start_date, query_end_date
                 )
 
                 signal_prices = {
@@ -490,7 +593,7 @@ class BacktestRunner:
             except Exception as e:
                 logger.warning(f"Failed to collect signal prices for {signal_symbol}: {e}")
                 signal_prices = None
-        else:
+        elif not signal_symbol:
             logger.debug("No signal_symbol found in strategy, skipping buy-and-hold benchmark")
 
         # Create and run event loop
@@ -501,10 +604,22 @@ class BacktestRunner:
             trade_logger=trade_logger,
             regime_analyzer=regime_analyzer,  # Pass regime analyzer (None if not applicable)
             warmup_end_date=warmup_end_date,  # Pass warmup boundary
+            # Counts + fills + daily values only in metrics mode
+            history='none' if metrics_only else self.config.get('history', 'full'),
+            spill_dir=self.config.get('history_spill_dir'),
+            progress_callback=(
+                self._progress_reporter(progress_callback) if progress_callback else None
+            ),
         )
 
         event_loop.run()
 
+        if self.config.get('history', 'full') != 'full' and not metrics_only:
+            logger.warning(
+                f"Event history retention is {self.config['history']!r}: exported "
+                f"CSVs only cover the retained daily snapshots"
+            )
+
         # Analyze performance
         analyzer = PerformanceAnalyzer(
             fills=event_loop.all_fills,
@@ -523,7 +638,7 @@ class BacktestRunner:
             # ALWAYS query database directly for baseline calculation
             # This ensures consistent behavior with grid search baseline calculation
             # and avoids issues with event_loop.all_bars extraction/filtering
-            from jutsu_engine.data.models import MarketData
+            # (a shared market data cache holds the same raw rows)
 
             # Prepare date boundaries for baseline query
             # Database stores timestamps as naive TEXT in SQLite, so convert to naive
@@ -541,19 +656,8 @@ class BacktestRunner:
                 baseline_end_date = baseline_end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
                 logger.debug(f"Baseline query: end_date set to end of day: {baseline_end_date}")
 
-            qqq_db_bars = (
-                self.session.query(MarketData)
-                .filter(
-                    and_(
-                        MarketData.symbol == baseline_symbol,
-                        MarketData.timeframe == self.config['timeframe'],
-                        MarketData.timestamp >= baseline_start_date,
-                        MarketData.timestamp <= baseline_end_date,
-                        MarketData.is_valid == True,  # noqa: E712
-                    )
-                )
-                .order_by(MarketData.timestamp.asc())
-                .all()
+            qqq_db_bars = self._load_reference_bars(
+                baseline_symbol, baseline_start_date, baseline_end_date
             )
 
             if qqq_db_bars:
@@ -645,7 +749,11 @@ class BacktestRunner:
         # Calculate beta vs benchmarks (QQQ and SPY)
         # Beta measures systematic risk relative to market benchmarks
         try:
-            daily_snapshots = portfolio.get_daily_snapshots()
+            # daily_values is complete even when snapshot history is bounded
+            daily_snapshots = [
+                {'timestamp': timestamp, 'total_value': value}
+                for timestamp, value in portfolio.daily_values
+            ]
             if daily_snapshots and len(daily_snapshots) >= 20:
                 beta_results = self._calculate_beta_vs_benchmarks(
                     daily_snapshots=daily_snapshots,
@@ -676,6 +784,24 @@ class BacktestRunner:
             baseline_result['beta_vs_QQQ'] = None
             baseline_result['beta_vs_SPY'] = None
 
+        if metrics_only:
+            results = {**metrics, **event_loop.get_results()}
+            results['equity_curve'] = np.array(
+                [float(value) for _, value in portfolio.get_equity_curve()],
+                dtype=np.float64
+            )
+            results['baseline'] = baseline_result
+            results['config'] = self.config
+            results['strategy_name'] = strategy.name
+            logger.info(
+                f"BACKTEST COMPLETE (metrics only): {strategy.name} "
+                f"final value ${results['final_value']:,.2f}, "
+                f"return {results['total_return']:.2%}, "
+                f"Sharpe {results['sharpe_ratio']:.2f}"
+            )
+            self._store_cached_results(result_cache, cache_key, results, portfolio)
+            return results
+
         # ALWAYS export trades and portfolio CSVs to output directory
         try:
             # Export trades CSV
@@ -881,8 +1007,294 @@ class BacktestRunner:
         )
         results['config_yaml_path'] = config_yaml_path
 
+        self._store_cached_results(result_cache, cache_key, results, portfolio)
         return results
 
+    def _preload_intraday(self, data_handler) -> None:
+        """
+        Preload the intraday bars execution-timing lookups read.
+
+        Strategies read one 15m bar per trading day over the whole run
+        (warmup included); the portfolio reads 5m bars on the last day only.
+        Failures are logged and lookups fall back to per-call queries.
+
+        Args:
+            data_handler: Handler implementing preload_intraday()
+        """
+        end_date = self.config['end_date']
+        try:
+            data_handler.preload_intraday('15m')
+            data_handler.preload_intraday('5m', start_date=end_date, end_date=end_date)
+        except Exception as e:
+            logger.warning(f"Intraday preload failed, querying per lookup: {e}")
+
+    def _resolve_market_data_cache(self):
+        """
+        Find the shared market data cache for this run, if any.
+
+        Uses config['market_data_cache'] (a MarketDataCache or a published
+        handle) or, failing that, the cache a pool initializer attached to
+        this worker process.
+
+        Returns:
+            MarketDataCache or None
+        """
+        from jutsu_engine.data.market_data_cache import (
+            MarketDataCache, attach_shared_cache, get_worker_cache,
+        )
+
+        cache = self.config.get('market_data_cache')
+        if cache is None:
+            return get_worker_cache()
+        if isinstance(cache, MarketDataCache):
+            return cache
+        return attach_shared_cache(cache)
+
+    def _resolve_parquet_store(self):
+        """
+        Build the ParquetMarketDataStore named by config['parquet_store'].
+
+        Returns:
+            ParquetMarketDataStore or None
+        """
+        from jutsu_engine.data.parquet_store import ParquetMarketDataStore
+
+        store = self.config.get('parquet_store')
+        if store is None or isinstance(store, ParquetMarketDataStore):
+            return store
+        store = ParquetMarketDataStore(store)
+        self.config['parquet_store'] = store
+        return store
+
+    def _resolve_result_cache(self):
+        """
+        Build the BacktestResultCache named by config['result_cache'].
+
+        Falls back to the BACKTEST_RESULT_CACHE_DIR setting when the key is
+        absent; None/False (or an empty setting) disables caching.
+
+        Returns:
+            BacktestResultCache or None
+        """
+        from jutsu_engine.application.result_cache import BacktestResultCache
+
+        if 'result_cache' in self.config:
+            cache = self.config['result_cache']
+        else:
+            cache = get_config().get('BACKTEST_RESULT_CACHE_DIR')
+        if not cache:
+            return None
+        if isinstance(cache, BacktestResultCache):
+            return cache
+        # Not written back into config: results['config'] stays plain data
+        return BacktestResultCache(cache)
+
+    def _result_cache_key(self, strategy: Strategy, symbols: List[str]) -> str:
+        """
+        Content hash of everything that determines this run's results.
+
+        Args:
+            strategy: Strategy instance (before init())
+            symbols: Symbols the run replays
+
+        Returns:
+            Cache key
+        """
+        from jutsu_engine.application.result_cache import (
+            RUNTIME_CONFIG_KEYS, BacktestResultCache, database_fingerprint,
+            parquet_fingerprint, source_fingerprint,
+        )
+
+        # Baseline and beta benchmarks read these too
+        data_symbols = set(symbols) | {self.config.get('baseline_symbol', 'QQQ'), 'QQQ', 'SPY'}
+        store = self._resolve_parquet_store()
+        if store is not None:
+            data = parquet_fingerprint(store, data_symbols)
+        else:
+            # DB timestamps are naive UTC
+            data = database_fingerprint(
+                self.session, data_symbols, self.config['timeframe'],
+                self.config['start_date'].replace(tzinfo=None),
+                self.config['end_date'].replace(tzinfo=None),
+            )
+
+        strategy_class = type(strategy)
+        return BacktestResultCache.make_key({
+            'strategy': f"{strategy_class.__module__}.{strategy_class.__qualname__}",
+            'source': source_fingerprint(strategy_class),
+            'state': vars(strategy),
+            'config': {k: v for k, v in self.config.items() if k not in RUNTIME_CONFIG_KEYS},
+            'data': data,
+        })
+
+    def _load_cached_results(self, result_cache, cache_key: str, output_dir: str) -> Optional[Dict[str, Any]]:
+        """
+        Results of an identical earlier run, or None on a miss.
+
+        Full-mode hits re-create the exported files in output_dir.
+        """
+        entry = result_cache.get(cache_key)
+        if entry is None:
+            logger.debug(f"Result cache miss: {cache_key[:12]}")
+            return None
+
+        results = dict(entry['results'])
+        if self.config.get('output_mode', 'full') != 'metrics':
+            results.update(result_cache.restore_artifacts(entry, output_dir))
+        results['config'] = self.config
+
+        logger.info(
+            f"BACKTEST SERVED FROM RESULT CACHE ({cache_key[:12]}): "
+            f"{results.get('strategy_name')} final value ${results['final_value']:,.2f}, "
+            f"return {results['total_return']:.2%}"
+        )
+        return results
+
+    def _store_cached_results(self, result_cache, cache_key: Optional[str], results: Dict[str, Any], portfolio) -> None:
+        """Store a finished run's results (and exported files) in the result cache."""
+        if result_cache is None or cache_key is None:
+            return
+        from jutsu_engine.application.result_cache import ARTIFACT_KEYS
+
+        artifacts = {
+            name: results[name] for name in ARTIFACT_KEYS
+            if results.get(name) and Path(results[name]).exists()
+        }
+        try:
+            result_cache.put(
+                cache_key, results,
+                equity_curve=portfolio.get_equity_curve(), artifacts=artifacts,
+            )
+        except Exception as e:
+            logger.warning(f"Could not store backtest results in the result cache: {e}")
+
+    def _progress_reporter(
+        self, progress_callback: Callable[[float, str], None]
+    ) -> Callable[[date], None]:
+        """
+        Adapt a (fraction, message) callback to EventLoop's per-date callback.
+
+        Progress is the share of the start_date..end_date range reached
+        (0 throughout warmup), reported at most once per whole percent.
+
+        Args:
+            progress_callback: Callable(fraction, message)
+
+        Returns:
+            Callable taking the trading date the loop has reached
+        """
+        start = self.config['start_date'].date()
+        end = self.config['end_date'].date()
+        total_days = max((end - start).days, 1)
+        last_percent = [-1]
+
+        def report(trading_date: date) -> None:
+            fraction = min(max((trading_date - start).days / total_days, 0.0), 1.0)
+            percent = int(fraction * 100)
+            if percent > last_percent[0]:
+                last_percent[0] = percent
+                progress_callback(fraction, f"Backtesting {trading_date.isoformat()}")
+
+        return report
+
+    def _load_reference_bars(self, symbol: str, start_date: datetime, end_date: datetime) -> List[Any]:
+        """
+        Load raw bars (no calendar filtering) for benchmark/baseline prices.
+
+        Served from the shared market data cache when it covers the request,
+        then from the Parquet store if configured, otherwise queried from the
+        database.
+
+        Args:
+            symbol: Benchmark symbol
+            start_date: Naive start of range (inclusive)
+            end_date: Naive end of range (inclusive)
+
+        Returns:
+            Bars with symbol, timestamp and close attributes, oldest first
+        """
+        cache = self._resolve_market_data_cache()
+        if cache is not None and cache.covers([symbol], self.config['timeframe'], start_date, end_date):
+            from jutsu_engine.core.events import MarketDataEvent
+
+            rows = cache.select_rows([symbol], start_date, end_date)
+            return [
+                MarketDataEvent.from_validated(*record, cache.timeframe)
+                for record in cache.rows_to_records(rows)
+            ]
+
+        store = self._resolve_parquet_store()
+        if store is not None:
+            from jutsu_engine.core.events import MarketDataEvent
+
+            cache = store.load_cache(
+                [symbol], self.config['timeframe'], start_date, end_date,
+                tz_aware=self.config.get('parquet_tz_aware', True),
+            )
+            return [
+                MarketDataEvent.from_validated(*record, cache.timeframe)
+                for record in cache.rows_to_records(cache.select_rows([symbol]))
+            ]
+
+        from jutsu_engine.data.models import MarketData
+
+        return (
+            self.session.query(MarketData)
+            .filter(
+                and_(
+                    MarketData.symbol == symbol,
+                    MarketData.timeframe == self.config['timeframe'],
+                    MarketData.timestamp >= start_date,
+                    MarketData.timestamp <= end_date,
+                    MarketData.is_valid == True,  # noqa: E712
+                )
+            )
+            .order_by(MarketData.timestamp.asc())
+            .all()
+        )
+
+    def _run_precompute(self, strategy: Strategy, data_handler) -> None:
+        """
+        Feed the full bar history to strategy.precompute() before the event loop.
+
+        Handlers that already hold their bars in memory hand them over via
+        get_bar_frames(); otherwise the stream is read once through the same
+        data handler (same filtering and ordering the EventLoop will see)
+        and grouped per symbol. Any failure is logged and the strategy falls
+        back to computing indicators live.
+
+        Args:
+            strategy: Strategy that overrides precompute()
+            data_handler: Data handler the EventLoop will consume
+        """
+        from jutsu_engine.core.bar_history import BarHistory
+
+        try:
+            try:
+                frames = data_handler.get_bar_frames()
+            except (AttributeError, NotImplementedError):
+                frames = None
+
+            if frames is None:
+                history = BarHistory()
+                for bar in data_handler.get_next_bar():
+                    history.append(bar)
+                frames = {symbol: history.get(symbol).to_frame() for symbol in history.symbols}
+
+            columns = strategy.precompute(frames)
+            if columns is None:
+                logger.info(f"{strategy.name} declined indicator precompute")
+                return
+
+            strategy._set_precomputed(frames, columns)
+            logger.info(
+                f"Precomputed indicators for {len(columns)} symbol(s) "
+                f"over {sum(len(frame) for frame in frames.values())} bars"
+            )
+        except Exception as e:
+            strategy._precomputed = {}
+            logger.warning(f"Indicator precompute failed, computing live instead: {e}")
+
     def _calculate_beta_vs_benchmarks(
         self,
         daily_snapshots: List[Dict],
@@ -941,24 +1353,11 @@ class BacktestRunner:
             if end_date.hour == 0 and end_date.minute == 0:
                 end_date = end_date.replace(hour=23, minute=59, second=59)
 
-            from jutsu_engine.data.models import MarketData
-
             for benchmark_symbol in benchmark_symbols:
                 try:
                     # Query benchmark data from database
-                    benchmark_bars = (
-                        self.session.query(MarketData)
-                        .filter(
-                            and_(
-                                MarketData.symbol == benchmark_symbol,
-                                MarketData.timeframe == self.config['timeframe'],
-                                MarketData.timestamp >= start_date,
-                                MarketData.timestamp <= end_date,
-                                MarketData.is_valid == True,  # noqa: E712
-                            )
-                        )
-                        .order_by(MarketData.timestamp.asc())
-                        .all()
+                    benchmark_bars = self._load_reference_bars(
+                        benchmark_symbol, start_date, end_date
                     )
 
                     if len(benchmark_bars) < 20:
@@ -25,15 +25,18 @@ Example:
     status = sync.get_sync_status('AAPL', '1D')
     print(f"Last update: {status['last_update']}")
 """
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from decimal import Decimal
-from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any, List
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List, Set, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, func
 
-from jutsu_engine.data.models import MarketData, DataMetadata, DataAuditLog
+from jutsu_engine.data.bulk_operations import upsert_market_data
+from jutsu_engine.data.models import MarketData, DataMetadata, DataAuditLog, trading_date_for
 from jutsu_engine.data.fetchers.base import DataFetcher
 from jutsu_engine.utils.logging_config import get_data_logger
+from jutsu_engine.utils.trading_calendar import get_trading_calendar
 
 logger = get_data_logger('SYNC')
 
@@ -85,6 +88,16 @@ def _is_weekend(timestamp: datetime) -> bool:
     return timestamp.weekday() in (5, 6)  # Saturday=5, Sunday=6
 
 
+def _is_nyse_trading_day(day: date) -> bool:
+    """Check if the NYSE is open on a date (shared TradingCalendar)."""
+    return get_trading_calendar().is_trading_day(day)
+
+
+def _previous_nyse_trading_day(day: date) -> date:
+    """Last NYSE trading day strictly before a date (shared TradingCalendar)."""
+    return get_trading_calendar().previous_trading_day(day)
+
+
 def _is_market_holiday(timestamp: datetime) -> bool:
     """
     Check if timestamp falls on a market holiday (NYSE closed).
@@ -103,8 +116,6 @@ def _is_market_holiday(timestamp: datetime) -> bool:
         True if NYSE is closed for holiday, False otherwise
     """
     import pytz
-    import pandas_market_calendars as mcal
-    from datetime import date, time
 
     # Always convert to Eastern Time to get correct NYSE trading date
     # Example: 2026-01-19 21:00:00 PST = 2026-01-20 00:00:00 ET → trading date Jan 20
@@ -118,24 +129,8 @@ def _is_market_holiday(timestamp: datetime) -> bool:
     if trading_date.weekday() >= 5:
         return False
 
-    # Get NYSE calendar - cache this for efficiency
-    if not hasattr(_is_market_holiday, '_nyse_cache'):
-        _is_market_holiday._nyse_cache = {}
-
-    # Get trading days for the year (cached)
-    year = trading_date.year
-    if year not in _is_market_holiday._nyse_cache:
-        nyse = mcal.get_calendar('NYSE')
-        schedule = nyse.schedule(
-            start_date=date(year, 1, 1),
-            end_date=date(year, 12, 31)
-        )
-        _is_market_holiday._nyse_cache[year] = set(schedule.index.date)
-
-    trading_days = _is_market_holiday._nyse_cache[year]
-
-    # If weekday but not in trading days, it's a holiday
-    return trading_date not in trading_days
+    # If weekday but not a trading day, it's a holiday
+    return not _is_nyse_trading_day(trading_date)
 
 
 def _is_outside_market_hours(timestamp: datetime, timeframe: str) -> bool:
@@ -182,19 +177,30 @@ class DataSync:
 
     Attributes:
         session: SQLAlchemy database session
+        parquet_store: Optional ParquetMarketDataStore kept in step with
+                       every successful sync
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, parquet_store: Optional[Any] = None):
         """
         Initialize data sync manager.
 
         Args:
             session: SQLAlchemy session for database operations
+            parquet_store: Optional ParquetMarketDataStore (or its root
+                           directory) to append synced bars to
 
         Example:
             sync = DataSync(session)
+            sync = DataSync(session, parquet_store='data/parquet')
         """
         self.session = session
+        if parquet_store is not None:
+            from jutsu_engine.data.parquet_store import ParquetMarketDataStore
+
+            if not isinstance(parquet_store, ParquetMarketDataStore):
+                parquet_store = ParquetMarketDataStore(parquet_store)
+        self.parquet_store = parquet_store
         logger.info("DataSync initialized")
 
     def sync_symbol(
@@ -238,6 +244,40 @@ class DataSync:
             )
             print(f"Stored {result['bars_stored']} bars")
         """
+        plan = self._plan_sync(symbol, timeframe, start_date, end_date, force_refresh)
+        if 'result' in plan:
+            return plan['result']
+
+        # Fetch data from external source
+        try:
+            bars = fetcher.fetch_bars(
+                symbol=symbol,
+                timeframe=timeframe,
+                start_date=plan['fetch_start'],
+                end_date=plan['fetch_end'],
+            )
+        except Exception as e:
+            self._record_fetch_error(symbol, timeframe, e)
+            raise
+
+        return self._store_fetched(plan, bars)
+
+    def _plan_sync(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: Optional[datetime],
+        force_refresh: bool,
+    ) -> Dict[str, Any]:
+        """
+        Resolve the date range sync_symbol has to fetch (database reads only).
+
+        Returns:
+            Plan dictionary (symbol, timeframe, start_date, end_date,
+            fetch_start, fetch_end, started). Contains 'result' instead of a
+            fetch range when the data is already up to date.
+        """
         start_time = datetime.now(timezone.utc)
 
         # Defensive: Ensure all input datetimes are timezone-aware (UTC)
@@ -332,14 +372,14 @@ class DataSync:
                                 f"Already up to date: last bar is {last_bar.date()}, "
                                 f"next bar would be {actual_start_date.date()} (future)"
                             )
-                            return {
+                            return {'result': {
                                 'bars_fetched': 0,
                                 'bars_stored': 0,
                                 'bars_updated': 0,
                                 'start_date': start_date,
                                 'end_date': end_date,
                                 'duration_seconds': 0,
-                            }
+                            }}
 
                         logger.info(
                             f"Incremental update: fetching from {actual_start_date.date()}"
@@ -355,24 +395,46 @@ class DataSync:
                         )
                     # else: start_date falls within existing range, will update/fill gaps
 
-        # Fetch data from external source
-        try:
-            bars = fetcher.fetch_bars(
-                symbol=symbol,
-                timeframe=timeframe,
-                start_date=actual_start_date,
-                end_date=actual_end_date,
-            )
-        except Exception as e:
-            logger.error(f"Failed to fetch data: {e}")
-            self._create_audit_log(
-                symbol=symbol,
-                timeframe=timeframe,
-                operation='fetch',
-                status='error',
-                message=str(e),
-            )
-            raise
+        return {
+            'symbol': symbol,
+            'timeframe': timeframe,
+            'start_date': start_date,
+            'end_date': end_date,
+            'fetch_start': actual_start_date,
+            'fetch_end': actual_end_date,
+            'started': start_time,
+        }
+
+    def _record_fetch_error(self, symbol: str, timeframe: str, error: Exception) -> None:
+        """Log and audit a failed fetch."""
+        logger.error(f"Failed to fetch data: {error}")
+        self._create_audit_log(
+            symbol=symbol,
+            timeframe=timeframe,
+            operation='fetch',
+            status='error',
+            message=str(error),
+        )
+
+    def _store_fetched(self, plan: Dict[str, Any], bars: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Filter, store and commit fetched bars, then update metadata and audit log.
+
+        All database writes of a sync happen here, so concurrent syncs can
+        fetch in worker threads and funnel writes through one session.
+
+        Args:
+            plan: Result of _plan_sync
+            bars: Bars returned by the fetcher
+
+        Returns:
+            sync_symbol result dictionary
+        """
+        symbol = plan['symbol']
+        timeframe = plan['timeframe']
+        actual_start_date = plan['fetch_start']
+        end_date = plan['end_date']
+        start_time = plan['started']
 
         bars_fetched = len(bars)
         logger.info(f"Fetched {bars_fetched} bars from external source")
@@ -432,20 +494,12 @@ class DataSync:
                 'duration_seconds': (datetime.now(timezone.utc) - start_time).total_seconds(),
             }
 
-        # Store data in database
-        bars_stored = 0
-        bars_updated = 0
-
-        for bar_data in bars:
-            stored, updated = self._store_bar(
-                symbol=symbol,
-                timeframe=timeframe,
-                bar_data=bar_data,
-            )
-            if stored:
-                bars_stored += 1
-            if updated:
-                bars_updated += 1
+        # Store data in database (set-based: one range query, batched writes)
+        bars_stored, bars_updated = self._store_bars(
+            symbol=symbol,
+            timeframe=timeframe,
+            bars=bars,
+        )
 
         # Commit all changes
         self.session.commit()
@@ -479,6 +533,9 @@ class DataSync:
             total_bars=self._count_bars(symbol, timeframe),
         )
 
+        if self.parquet_store is not None:
+            self._mirror_to_parquet(symbol, timeframe, bars)
+
         # Create audit log
         duration = (datetime.now(timezone.utc) - start_time).total_seconds()
         self._create_audit_log(
@@ -510,130 +567,210 @@ class DataSync:
             'duration_seconds': duration,
         }
 
-    def _store_bar(
-        self,
-        symbol: str,
-        timeframe: str,
-        bar_data: Dict[str, Any],
-    ) -> tuple[bool, bool]:
+    def _mirror_to_parquet(self, symbol: str, timeframe: str, bars: List[Dict[str, Any]]) -> None:
         """
-        Store or update a single bar in database.
+        Append the committed bars to the Parquet store.
 
-        For daily bars, uses trading date (in ET) to find existing bars to prevent
-        duplicates when Schwab returns different timestamps for the same trading day
-        (e.g., 21:00 PST during market hours vs 22:00 PST after close).
+        Re-reads the database from a week before the earliest synced bar
+        (daily bars can be re-stamped across a weekend/holiday when
+        normalized) and replaces that tail of the store. Failures are logged
+        and never fail the sync; `jutsu sync export-parquet` rebuilds the
+        store from scratch.
 
         Args:
             symbol: Stock ticker symbol
             timeframe: Bar timeframe
-            bar_data: Dictionary with bar data (timestamp, open, high, low, close, volume)
+            bars: Bars just stored
+        """
+        first = min(bar['timestamp'] for bar in bars)
+        if first.tzinfo is None:
+            first = first.replace(tzinfo=timezone.utc)
+        try:
+            written = self.parquet_store.sync_from_database(
+                self.session, symbol, timeframe, start_date=first - timedelta(days=7),
+            )
+            logger.debug(f"Mirrored {written} {symbol} {timeframe} bars to Parquet store")
+        except Exception as e:
+            logger.warning(f"Parquet store update failed for {symbol} {timeframe}: {e}")
+
+    def _normalize_bar_timestamp(self, timeframe: str, bar_timestamp: datetime) -> datetime:
+        """
+        Normalize a fetched bar timestamp to canonical UTC.
+
+        Schwab 1D bars have timestamps after market close, typically around
+        midnight-1AM ET the next calendar day. When fetched on weekends or
+        after holidays, the timestamp can shift forward, misidentifying the
+        trading day. Detect and normalize: if the inferred actual trading day
+        (ET date - 1) is not a valid trading day (weekend or holiday),
+        move the timestamp to 01:00 ET on (previous valid trading day + 1).
+
+        Args:
+            timeframe: Bar timeframe
+            bar_timestamp: Timestamp from the fetcher (naive timestamps are UTC)
 
         Returns:
-            Tuple of (stored, updated) booleans
+            Timezone-aware UTC timestamp
         """
         import pytz
-        from sqlalchemy import func
 
-        # Ensure timestamp is timezone-aware (UTC) before database operations
         # Schwab API may return offset-naive datetime
-        bar_timestamp = bar_data['timestamp']
-        if bar_timestamp.tzinfo is None:
-            bar_timestamp = bar_timestamp.replace(tzinfo=timezone.utc)
-
-        logger.debug(f"Storing bar: {symbol} {timeframe} {bar_timestamp} (tzinfo={bar_timestamp.tzinfo})")
+        bar_timestamp = _normalize_to_utc(bar_timestamp)
+        if timeframe != '1D':
+            return bar_timestamp
+
+        et = pytz.timezone('America/New_York')
+        trading_date = bar_timestamp.astimezone(et).date()
+        inferred_actual_day = trading_date - timedelta(days=1)
+        if _is_nyse_trading_day(inferred_actual_day):
+            return bar_timestamp
+
+        correct_trading_day = _previous_nyse_trading_day(trading_date)
+        next_day = correct_trading_day + timedelta(days=1)
+        canonical_et = et.localize(
+            datetime(next_day.year, next_day.month, next_day.day, 1, 0, 0)
+        )
+        logger.debug(
+            f"Normalized weekend-shifted 1D bar: "
+            f"ET date {trading_date} -> trading day {correct_trading_day} "
+            f"(original: {bar_timestamp}, canonical: {canonical_et})"
+        )
+        return canonical_et.astimezone(timezone.utc)
 
-        existing_bar = None
+    def _bar_key(self, timeframe: str, bar_timestamp: datetime):
+        """
+        De-duplication key for a bar.
 
+        Daily bars are keyed by trading date in ET, so a bar stored at
+        21:00 PST matches a re-fetched bar at 22:00 PST for the same
+        trading day. Intraday bars are keyed by exact UTC timestamp.
+        """
         if timeframe == '1D':
-            # For daily bars, find existing bar by trading date (in ET) to prevent duplicates
-            # when timestamps differ (21:00 vs 22:00 PST for same trading day)
-            et = pytz.timezone('America/New_York')
-            bar_et = bar_timestamp.astimezone(et)
-            trading_date = bar_et.date()
-
-            # Schwab 1D bars have timestamps after market close, typically around
-            # midnight-1AM ET the next calendar day. When fetched on weekends or
-            # after holidays, the timestamp can shift forward, misidentifying the
-            # trading day. Detect and normalize: if the inferred actual trading day
-            # (ET date - 1) is not a valid trading day (weekend or holiday),
-            # adjust to the previous valid trading day.
-            from jutsu_engine.live.market_calendar import get_previous_trading_day, is_trading_day
-            inferred_actual_day = trading_date - timedelta(days=1)
-            if not is_trading_day(inferred_actual_day):
-                correct_trading_day = get_previous_trading_day(trading_date)
-                # Normalize timestamp to canonical form: 01:00 ET on (trading_day + 1)
-                next_day = correct_trading_day + timedelta(days=1)
-                canonical_et = et.localize(
-                    datetime(next_day.year, next_day.month, next_day.day, 1, 0, 0)
-                )
-                logger.info(
-                    f"Normalized weekend-shifted 1D bar: "
-                    f"ET date {trading_date} -> trading day {correct_trading_day} "
-                    f"(original: {bar_timestamp}, canonical: {canonical_et})"
-                )
-                bar_timestamp = canonical_et.astimezone(timezone.utc)
-                bar_et = bar_timestamp.astimezone(et)
-                trading_date = bar_et.date()
+            return trading_date_for(bar_timestamp)
+        return bar_timestamp
 
-            # Find any existing bar for this trading date
-            existing_bar = (
-                self.session.query(MarketData)
-                .filter(
-                    and_(
-                        MarketData.symbol == symbol,
-                        MarketData.timeframe == timeframe,
-                        func.date(
-                            func.timezone('America/New_York', MarketData.timestamp)
-                        ) == trading_date,
-                    )
-                )
-                .first()
-            )
-            if existing_bar:
-                logger.debug(f"Found existing daily bar for trading date {trading_date} at {existing_bar.timestamp}")
+    def _load_existing_keys(
+        self,
+        symbol: str,
+        timeframe: str,
+        keys: Set[Any],
+    ) -> Dict[Any, Tuple[int, datetime]]:
+        """
+        Load existing bars matching the given keys with one range query.
+
+        Daily bars are looked up by the persisted trading_date column
+        (idx_market_data_trading_date), intraday bars by a plain timestamp
+        range (idx_market_data_lookup).
+
+        Args:
+            symbol: Stock ticker symbol
+            timeframe: Bar timeframe
+            keys: Keys from _bar_key() for the incoming bars
+
+        Returns:
+            Dict mapping key -> (id, stored timestamp) for existing bars
+        """
+        if timeframe == '1D':
+            key_column = MarketData.trading_date
         else:
-            # For intraday bars, use exact timestamp match
-            existing_bar = (
-                self.session.query(MarketData)
-                .filter(
-                    and_(
-                        MarketData.symbol == symbol,
-                        MarketData.timeframe == timeframe,
-                        MarketData.timestamp == bar_timestamp,
-                    )
+            key_column = MarketData.timestamp
+
+        rows = (
+            self.session.query(MarketData.id, MarketData.timestamp)
+            .filter(
+                and_(
+                    MarketData.symbol == symbol,
+                    MarketData.timeframe == timeframe,
+                    key_column.between(min(keys), max(keys)),
                 )
-                .first()
             )
+            .order_by(MarketData.id)
+            .all()
+        )
 
-        if existing_bar:
-            # Update existing bar - update timestamp too in case it changed (21:00 → 22:00)
-            logger.debug(f"Found existing bar at {existing_bar.timestamp}, updating")
-            existing_bar.timestamp = bar_timestamp  # Update to latest timestamp
-            existing_bar.open = bar_data['open']
-            existing_bar.high = bar_data['high']
-            existing_bar.low = bar_data['low']
-            existing_bar.close = bar_data['close']
-            existing_bar.volume = bar_data['volume']
-            existing_bar.is_valid = True
-            return (False, True)
-        else:
-            # Create new bar
-            logger.debug(f"No existing bar found, creating new bar at {bar_timestamp}")
-            new_bar = MarketData(
-                symbol=symbol,
-                timeframe=timeframe,
-                timestamp=bar_timestamp,
-                open=bar_data['open'],
-                high=bar_data['high'],
-                low=bar_data['low'],
-                close=bar_data['close'],
-                volume=bar_data['volume'],
-                data_source=bar_data.get('data_source', 'schwab'),
-                is_valid=True,
-            )
-            self.session.add(new_bar)
-            logger.debug(f"Added new bar to session: {new_bar}")
-            return (True, False)
+        existing: Dict[Any, Tuple[int, datetime]] = {}
+        for bar_id, stored_timestamp in rows:
+            stored_timestamp = _normalize_to_utc(stored_timestamp)
+            key = self._bar_key(timeframe, stored_timestamp)
+            if key in keys and key not in existing:
+                existing[key] = (bar_id, stored_timestamp)
+        return existing
+
+    def _store_bars(
+        self,
+        symbol: str,
+        timeframe: str,
+        bars: List[Dict[str, Any]],
+    ) -> Tuple[int, int]:
+        """
+        Store or update fetched bars in database (set-based).
+
+        Normalizes all bars in memory, loads matching existing rows with a
+        single range query, then writes in batches: daily bars matched by
+        trading date are updated by id (their timestamp may move, e.g.
+        21:00 -> 22:00 PST), everything else goes through
+        INSERT ... ON CONFLICT DO UPDATE. Bars repeating a key within the
+        batch behave as sequential writes: the first is stored, later ones
+        update it.
+
+        Changes are flushed but not committed.
+
+        Args:
+            symbol: Stock ticker symbol
+            timeframe: Bar timeframe
+            bars: Bar dicts (timestamp, open, high, low, close, volume)
+
+        Returns:
+            Tuple of (bars_stored, bars_updated)
+        """
+        # Collapse to one row per key (last write wins, first data_source kept)
+        rows: Dict[Any, Dict[str, Any]] = {}
+        duplicates = 0
+        for bar_data in bars:
+            bar_timestamp = self._normalize_bar_timestamp(timeframe, bar_data['timestamp'])
+            key = self._bar_key(timeframe, bar_timestamp)
+            row = {
+                'symbol': symbol,
+                'timeframe': timeframe,
+                'timestamp': bar_timestamp,
+                'trading_date': trading_date_for(bar_timestamp),
+                'open': bar_data['open'],
+                'high': bar_data['high'],
+                'low': bar_data['low'],
+                'close': bar_data['close'],
+                'volume': bar_data['volume'],
+                'data_source': bar_data.get('data_source', 'schwab'),
+                'is_valid': True,
+            }
+            if key in rows:
+                duplicates += 1
+                row['data_source'] = rows[key]['data_source']
+            rows[key] = row
+
+        existing = self._load_existing_keys(symbol, timeframe, set(rows))
+        logger.debug(
+            f"Storing {len(rows)} bars for {symbol} {timeframe}: "
+            f"{len(existing)} existing, {duplicates} duplicate(s) in batch"
+        )
+
+        updates = []
+        upserts = []
+        for key, row in rows.items():
+            if timeframe == '1D' and key in existing:
+                update = {k: v for k, v in row.items() if k not in ('symbol', 'timeframe', 'data_source')}
+                update['id'] = existing[key][0]
+                updates.append(update)
+            else:
+                upserts.append(row)
+
+        if updates:
+            self.session.bulk_update_mappings(MarketData, updates)
+        if upserts:
+            upsert_market_data(self.session, upserts)
+        self.session.flush()
+
+        bars_updated = len(existing) + duplicates
+        bars_stored = len(rows) - len(existing)
+        return bars_stored, bars_updated
 
     def _get_metadata(self, symbol: str, timeframe: str) -> Optional[DataMetadata]:
         """Get metadata for symbol and timeframe."""
@@ -813,7 +950,7 @@ class DataSync:
         - Missing bars (gaps in data)
         - Invalid OHLC relationships (high < low, etc.)
         - Zero volume bars
-        - Duplicate timestamps
+        - Duplicate trading dates (daily bars)
 
         Args:
             symbol: Stock ticker symbol
@@ -878,6 +1015,12 @@ class DataSync:
             if bar.volume == 0:
                 issues.append(f"{bar.timestamp}: Zero volume")
 
+        if timeframe == '1D':
+            for trading_date, count in self.find_duplicate_trading_dates(
+                symbol, timeframe, start_date, end_date
+            ):
+                issues.append(f"{trading_date}: {count} bars for one trading date")
+
         self.session.commit()
 
         logger.info(
@@ -892,11 +1035,60 @@ class DataSync:
             'issues': issues,
         }
 
+    def find_duplicate_trading_dates(
+        self,
+        symbol: str,
+        timeframe: str = '1D',
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Tuple[date, int]]:
+        """
+        Find trading dates that have more than one stored bar.
+
+        A GROUP BY on the persisted trading_date column, e.g. to catch $VIX
+        rows stored twice for one date under different intraday timestamps.
+
+        Args:
+            symbol: Stock ticker symbol
+            timeframe: Bar timeframe (normally '1D')
+            start_date: Optional start of range
+            end_date: Optional end of range
+
+        Returns:
+            List of (trading_date, bar_count) tuples, oldest first
+
+        Example:
+            for day, count in sync.find_duplicate_trading_dates('$VIX'):
+                print(f"{day}: {count} bars")
+        """
+        query = self.session.query(
+            MarketData.trading_date, func.count(MarketData.id)
+        ).filter(
+            and_(
+                MarketData.symbol == symbol,
+                MarketData.timeframe == timeframe,
+            )
+        )
+
+        if start_date:
+            query = query.filter(MarketData.trading_date >= trading_date_for(start_date))
+        if end_date:
+            query = query.filter(MarketData.trading_date <= trading_date_for(end_date))
+
+        return [
+            (trading_date, count)
+            for trading_date, count in query.group_by(MarketData.trading_date)
+            .having(func.count(MarketData.id) > 1)
+            .order_by(MarketData.trading_date)
+            .all()
+        ]
+
     def sync_all_symbols(
         self,
         fetcher: DataFetcher,
         end_date: Optional[datetime] = None,
         force: bool = False,
+        max_workers: int = 1,
     ) -> Dict[str, Any]:
         """
         Synchronize all existing symbols to latest date (today).
@@ -905,11 +1097,20 @@ class DataSync:
         each from last_bar_timestamp + 1 day to end_date (default: today).
         Retries failed symbols once before continuing.
 
+        With max_workers > 1, fetches for different symbol/timeframe pairs
+        run concurrently in a thread pool (throttled by the fetcher's own
+        rate limiter, e.g. SchwabDataFetcher's shared 2 req/s bucket) while
+        every database read and write stays on the calling thread: each
+        completed fetch is filtered, upserted and committed by this session
+        as it arrives.
+
         Args:
-            fetcher: DataFetcher implementation (e.g., SchwabDataFetcher)
+            fetcher: DataFetcher implementation (e.g., SchwabDataFetcher).
+                Must be thread-safe when max_workers > 1.
             end_date: End date for sync (default: today)
             force: If True, ignore market hours check and fetch all data
                    (may result in partial bars for current day)
+            max_workers: Concurrent fetch threads (default: 1, sequential)
 
         Returns:
             Dictionary with sync results:
@@ -920,7 +1121,7 @@ class DataSync:
               - For each symbol: {start_date, end_date, bars_added, status, error}
 
         Example:
-            result = sync.sync_all_symbols(fetcher=schwab_fetcher)
+            result = sync.sync_all_symbols(fetcher=schwab_fetcher, max_workers=4)
             print(f"Synced {result['successful_syncs']} symbols")
             for symbol, info in result['results'].items():
                 print(f"{symbol}: {info['bars_added']} bars added")
@@ -951,9 +1152,32 @@ class DataSync:
         successful_syncs = 0
         failed_syncs = 0
         results = {}
+        # (symbol_key, symbol, timeframe, start_date, end_date) still to sync
+        jobs: List[Tuple[str, str, str, datetime, datetime]] = []
 
         logger.info(f"Found {total_symbols} symbol/timeframe combinations")
 
+        # Daily end-date cap depends only on the clock: evaluate the market
+        # calendar once, not per entry
+        daily_end_cap: Optional[Tuple[datetime, date]] = None
+        daily_partial_from: Optional[date] = None
+        if not force and any(m.timeframe == '1D' for m in metadata_entries):
+            from jutsu_engine.live.market_calendar import is_daily_bar_complete, is_trading_day
+            today = datetime.now(timezone.utc).date()
+            if not is_daily_bar_complete(today):
+                # Market is open for today - check if we should cap
+                yesterday = today - timedelta(days=1)
+
+                # Only cap to yesterday if yesterday was a trading day
+                # If yesterday was weekend/holiday, include today to get the most recent data
+                if is_trading_day(yesterday):
+                    daily_end_cap = (
+                        datetime.combine(yesterday, datetime.min.time()).replace(tzinfo=timezone.utc),
+                        yesterday,
+                    )
+                else:
+                    daily_partial_from = yesterday
+
         for metadata in metadata_entries:
             symbol = metadata.symbol
             timeframe = metadata.timeframe
@@ -993,29 +1217,21 @@ class DataSync:
             # unless force=True is specified
             actual_end_date = end_date
             if timeframe == '1D' and not force:
-                from jutsu_engine.live.market_calendar import is_daily_bar_complete, is_trading_day
-                today = datetime.now(timezone.utc).date()
-                if not is_daily_bar_complete(today):
-                    # Market is open for today - check if we should cap
-                    yesterday = today - timedelta(days=1)
-                    
-                    # Only cap to yesterday if yesterday was a trading day
-                    # If yesterday was weekend/holiday, include today to get the most recent data
-                    if is_trading_day(yesterday):
-                        max_end_date = datetime.combine(yesterday, datetime.min.time()).replace(tzinfo=timezone.utc)
-                        if end_date > max_end_date:
-                            actual_end_date = max_end_date
-                            logger.info(
-                                f"⏳ {symbol_key}: Market hours - capping end_date to {yesterday} "
-                                f"(today's bar incomplete)"
-                            )
-                    else:
-                        # Yesterday was not a trading day (weekend/holiday)
-                        # Include today to get the most recent available data
+                if daily_end_cap is not None:
+                    max_end_date, yesterday = daily_end_cap
+                    if end_date > max_end_date:
+                        actual_end_date = max_end_date
                         logger.info(
-                            f"📊 {symbol_key}: Yesterday ({yesterday}) was not a trading day, "
-                            f"including today's partial data"
+                            f"⏳ {symbol_key}: Market hours - capping end_date to {yesterday} "
+                            f"(today's bar incomplete)"
                         )
+                elif daily_partial_from is not None:
+                    # Yesterday was not a trading day (weekend/holiday)
+                    # Include today to get the most recent available data
+                    logger.info(
+                        f"📊 {symbol_key}: Yesterday ({daily_partial_from}) was not a trading day, "
+                        f"including today's partial data"
+                    )
             
             # Check if already up-to-date (only in non-force mode)
             # In force mode, we always sync even if start_date > actual_end_date
@@ -1037,68 +1253,39 @@ class DataSync:
                 f"Syncing {symbol_key}: "
                 f"{start_date.date()} to {actual_end_date.date()}"
             )
+            jobs.append((symbol_key, symbol, timeframe, start_date, actual_end_date))
 
-            # First attempt
-            try:
-                sync_result = self.sync_symbol(
-                    fetcher=fetcher,
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    start_date=start_date,
-                    end_date=actual_end_date,
-                    force_refresh=force,
-                )
+        if max_workers > 1:
+            outcomes = self._sync_jobs_concurrently(fetcher, jobs, force, max_workers)
+        else:
+            outcomes = self._sync_jobs_serially(fetcher, jobs, force)
 
+        for symbol_key, symbol, timeframe, start_date, actual_end_date in jobs:
+            sync_result, attempts, error = outcomes[symbol_key]
+            if error is None:
                 results[symbol_key] = {
                     'start_date': start_date,
                     'end_date': actual_end_date,
                     'bars_added': sync_result['bars_stored'],
-                    'status': 'success',
+                    'status': 'success' if attempts == 1 else 'success_after_retry',
                     'error': None,
                 }
                 successful_syncs += 1
-                logger.info(
-                    f"{symbol_key}: Success - {sync_result['bars_stored']} bars added"
-                )
-
-            except Exception as e:
-                logger.warning(f"{symbol_key}: First attempt failed - {e}")
-
-                # Retry once
-                try:
-                    logger.info(f"{symbol_key}: Retrying...")
-                    sync_result = self.sync_symbol(
-                        fetcher=fetcher,
-                        symbol=symbol,
-                        timeframe=timeframe,
-                        start_date=start_date,
-                        end_date=actual_end_date,
-                        force_refresh=force,
-                    )
-
-                    results[symbol_key] = {
-                        'start_date': start_date,
-                        'end_date': actual_end_date,
-                        'bars_added': sync_result['bars_stored'],
-                        'status': 'success_after_retry',
-                        'error': None,
-                    }
-                    successful_syncs += 1
-                    logger.info(
-                        f"{symbol_key}: Retry successful - "
-                        f"{sync_result['bars_stored']} bars added"
-                    )
+            else:
+                results[symbol_key] = {
+                    'start_date': start_date,
+                    'end_date': end_date,
+                    'bars_added': 0,
+                    'status': 'failed',
+                    'error': str(error),
+                }
+                failed_syncs += 1
 
-                except Exception as retry_error:
-                    logger.error(f"{symbol_key}: Retry failed - {retry_error}")
-                    results[symbol_key] = {
-                        'start_date': start_date,
-                        'end_date': end_date,
-                        'bars_added': 0,
-                        'status': 'failed',
-                        'error': str(retry_error),
-                    }
-                    failed_syncs += 1
+        # Report in metadata order (up-to-date entries were recorded first)
+        results = {
+            f"{metadata.symbol}:{metadata.timeframe}": results[f"{metadata.symbol}:{metadata.timeframe}"]
+            for metadata in metadata_entries
+        }
 
         duration = (datetime.now(timezone.utc) - start_time).total_seconds()
         logger.info(
@@ -1113,6 +1300,135 @@ class DataSync:
             'results': results,
         }
 
+    def _sync_jobs_serially(
+        self,
+        fetcher: DataFetcher,
+        jobs: List[Tuple[str, str, str, datetime, datetime]],
+        force: bool,
+    ) -> Dict[str, Tuple[Optional[Dict[str, Any]], int, Optional[Exception]]]:
+        """
+        Run sync_symbol for each job in turn, retrying a failure once.
+
+        Returns:
+            Dict mapping symbol_key to (sync_result, attempts, error)
+        """
+        outcomes = {}
+        for symbol_key, symbol, timeframe, start_date, end_date in jobs:
+            for attempt in (1, 2):
+                if attempt == 2:
+                    logger.info(f"{symbol_key}: Retrying...")
+                try:
+                    sync_result = self.sync_symbol(
+                        fetcher=fetcher,
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        start_date=start_date,
+                        end_date=end_date,
+                        force_refresh=force,
+                    )
+                except Exception as e:
+                    outcomes[symbol_key] = (None, attempt, e)
+                    self._log_attempt_failure(symbol_key, attempt, e)
+                    continue
+                outcomes[symbol_key] = (sync_result, attempt, None)
+                self._log_attempt_success(symbol_key, attempt, sync_result)
+                break
+        return outcomes
+
+    def _sync_jobs_concurrently(
+        self,
+        fetcher: DataFetcher,
+        jobs: List[Tuple[str, str, str, datetime, datetime]],
+        force: bool,
+        max_workers: int,
+    ) -> Dict[str, Tuple[Optional[Dict[str, Any]], int, Optional[Exception]]]:
+        """
+        Overlap fetches in a thread pool; store results on this thread.
+
+        Planning (metadata reads) and storing (filter, upsert, commit,
+        metadata, audit log) run on the calling thread, so the session is
+        never shared across threads. Only fetcher.fetch_bars runs in workers.
+        A failed plan, fetch or store is re-planned and re-fetched once.
+
+        Returns:
+            Dict mapping symbol_key to (sync_result, attempts, error)
+        """
+        outcomes = {}
+        pending: Dict[Future, Tuple[Tuple, int, Dict[str, Any]]] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='sync-fetch') as pool:
+
+            def submit(job, attempt):
+                symbol_key, symbol, timeframe, start_date, end_date = job
+                try:
+                    plan = self._plan_sync(symbol, timeframe, start_date, end_date, force)
+                except Exception as e:
+                    # Same handling as the serial path: a per-symbol failure, retried once
+                    self.session.rollback()
+                    outcomes[symbol_key] = (None, attempt, e)
+                    self._log_attempt_failure(symbol_key, attempt, e)
+                    if attempt == 1:
+                        logger.info(f"{symbol_key}: Retrying...")
+                        submit(job, 2)
+                    return
+                if 'result' in plan:
+                    outcomes[symbol_key] = (plan['result'], attempt, None)
+                    self._log_attempt_success(symbol_key, attempt, plan['result'])
+                    return
+                future = pool.submit(
+                    fetcher.fetch_bars,
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    start_date=plan['fetch_start'],
+                    end_date=plan['fetch_end'],
+                )
+                pending[future] = (job, attempt, plan)
+
+            for job in jobs:
+                submit(job, 1)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job, attempt, plan = pending.pop(future)
+                    symbol_key = job[0]
+                    try:
+                        try:
+                            bars = future.result()
+                        except Exception as e:
+                            self._record_fetch_error(plan['symbol'], plan['timeframe'], e)
+                            raise
+                        sync_result = self._store_fetched(plan, bars)
+                    except Exception as e:
+                        self.session.rollback()
+                        outcomes[symbol_key] = (None, attempt, e)
+                        self._log_attempt_failure(symbol_key, attempt, e)
+                        if attempt == 1:
+                            logger.info(f"{symbol_key}: Retrying...")
+                            submit(job, 2)
+                        continue
+                    outcomes[symbol_key] = (sync_result, attempt, None)
+                    self._log_attempt_success(symbol_key, attempt, sync_result)
+
+        return outcomes
+
+    def _log_attempt_success(self, symbol_key: str, attempt: int, sync_result: Dict[str, Any]) -> None:
+        """Log a successful sync attempt."""
+        if attempt == 1:
+            logger.info(f"{symbol_key}: Success - {sync_result['bars_stored']} bars added")
+        else:
+            logger.info(
+                f"{symbol_key}: Retry successful - "
+                f"{sync_result['bars_stored']} bars added"
+            )
+
+    def _log_attempt_failure(self, symbol_key: str, attempt: int, error: Exception) -> None:
+        """Log a failed sync attempt."""
+        if attempt == 1:
+            logger.warning(f"{symbol_key}: First attempt failed - {error}")
+        else:
+            logger.error(f"{symbol_key}: Retry failed - {error}")
+
     def get_all_symbols_metadata(self) -> List[Dict[str, Any]]:
         """
         Get metadata for all symbols with date ranges.
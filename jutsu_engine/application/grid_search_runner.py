@@ -28,8 +28,9 @@ from dataclasses import dataclass, asdict
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import itertools
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 
 import yaml
 import pandas as pd
@@ -273,6 +274,70 @@ def _build_strategy_params(strategy_class, symbol_set, optimization_params):
     return strategy_params
 
 
+def _symbols_for_set(symbol_set: "SymbolSet") -> List[str]:
+    """
+    Build the backtest symbol list for a symbol set.
+
+    Args:
+        symbol_set: Symbol grouping for a run
+
+    Returns:
+        Normalized, de-duplicated symbols (signal symbol first)
+    """
+    # Prepare symbols list (conditionally include all optional symbols)
+    symbols = [symbol_set.signal_symbol]
+    if symbol_set.bull_symbol is not None:
+        symbols.append(symbol_set.bull_symbol)
+    if symbol_set.defense_symbol is not None:
+        symbols.append(symbol_set.defense_symbol)
+    if symbol_set.bear_symbol is not None:
+        symbols.append(symbol_set.bear_symbol)
+    if symbol_set.vix_symbol is not None:
+        symbols.append(symbol_set.vix_symbol)
+    if symbol_set.core_long_symbol is not None:
+        symbols.append(symbol_set.core_long_symbol)
+    if symbol_set.leveraged_long_symbol is not None:
+        symbols.append(symbol_set.leveraged_long_symbol)
+    if symbol_set.leveraged_short_symbol is not None:
+        symbols.append(symbol_set.leveraged_short_symbol)
+    if symbol_set.inverse_hedge_symbol is not None:
+        symbols.append(symbol_set.inverse_hedge_symbol)
+    # Treasury Overlay symbols (for Hierarchical_Adaptive_v3_5b and similar)
+    if symbol_set.treasury_trend_symbol is not None:
+        symbols.append(symbol_set.treasury_trend_symbol)
+    if symbol_set.bull_bond_symbol is not None:
+        symbols.append(symbol_set.bull_bond_symbol)
+    if symbol_set.bear_bond_symbol is not None:
+        symbols.append(symbol_set.bear_bond_symbol)
+
+    # Normalize index symbols (add $ prefix for VIX, DJI, etc.)
+    # This ensures YAML config "VIX" matches database "$VIX"
+    symbols = normalize_index_symbols(symbols)
+
+    # Deduplicate while preserving order
+    symbols = list(dict.fromkeys(symbols))
+
+    return symbols
+
+
+def _parse_end_date(end_date: Any) -> datetime:
+    """
+    Parse base_config end_date, extending date strings to end of day.
+
+    Args:
+        end_date: 'YYYY-MM-DD' string or datetime
+
+    Returns:
+        datetime (23:59:59.999999 for date strings, so the last day's bars are included)
+    """
+    if isinstance(end_date, str):
+        # Parse date and set to end of day (23:59:59) to include all bars from that date
+        end_date = datetime.strptime(end_date, '%Y-%m-%d').replace(
+            hour=23, minute=59, second=59, microsecond=999999
+        )
+    return end_date
+
+
 @dataclass
 class SymbolSet:
     """
@@ -343,6 +408,7 @@ class GridSearchConfig:
         parameters: Parameter ranges for grid search
         max_combinations: Warning threshold for total combinations
         checkpoint_interval: Save state every N runs
+        workers: Number of backtests to run in parallel (1 = serial)
     """
     strategy_name: str
     symbol_sets: List[SymbolSet]
@@ -350,6 +416,7 @@ class GridSearchConfig:
     parameters: Dict[str, List[Any]]
     max_combinations: int = 500
     checkpoint_interval: int = 10
+    workers: int = 1
 
 
 @dataclass
@@ -567,6 +634,10 @@ class GridSearchRunner:
             if not values:
                 raise ValueError(f"Parameter '{param}' has empty values list")
 
+        workers = data.get('workers', 1)
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError(f"workers must be a positive integer, got {workers!r}")
+
         logger.info(f"Configuration loaded from: {yaml_path}")
 
         return GridSearchConfig(
@@ -575,7 +646,8 @@ class GridSearchRunner:
             base_config=data['base_config'],
             parameters=data['parameters'],
             max_combinations=data.get('max_combinations', 500),
-            checkpoint_interval=data.get('checkpoint_interval', 10)
+            checkpoint_interval=data.get('checkpoint_interval', 10),
+            workers=workers
         )
 
     def generate_combinations(self) -> List[RunConfig]:
@@ -632,7 +704,8 @@ class GridSearchRunner:
         self,
         output_base: str = "output",
         config_path: Optional[str] = None,
-        generate_plots: bool = True
+        generate_plots: bool = True,
+        workers: Optional[int] = None
     ) -> GridSearchResult:
         """
         Execute full grid search.
@@ -640,15 +713,21 @@ class GridSearchRunner:
         Orchestrates entire grid search workflow:
         1. Generate combinations
         2. Check for checkpoint (resume capability)
-        3. Execute backtests with progress tracking
+        3. Execute backtests with progress tracking (serial or process pool)
         4. Save periodic checkpoints
         5. Generate summary CSVs
         6. Create README with summary statistics
 
+        With workers > 1 each backtest runs in its own process; the parent
+        stays the only writer of checkpoint.json and the summary CSVs, and
+        results are reported in combination order regardless of completion
+        order.
+
         Args:
             output_base: Base output directory (default: "output")
             config_path: Path to config file for copying (optional)
             generate_plots: Generate interactive HTML plots (default: True)
+            workers: Parallel backtests (default: config.workers)
 
         Returns:
             GridSearchResult with all run results and summary
@@ -692,25 +771,31 @@ class GridSearchRunner:
             self.logger.info(f"Resuming: {len(completed_runs)} runs already completed")
 
         # Execute backtests
-        results = []
-        for i, run_config in enumerate(tqdm(combinations, desc="Grid Search")):
-            if run_config.run_id in completed_runs:
-                self.logger.debug(f"Skipping {run_config.run_id} (already completed)")
-                continue
-
-            # Display progress
-            progress_msg = self._format_progress(run_config, i + 1, len(combinations))
-            self.logger.info(progress_msg)
-
-            # Run backtest
-            result = self._run_single_backtest(run_config, output_dir)
-            results.append(result)
-
-            # Checkpoint
-            if (i + 1) % self.config.checkpoint_interval == 0:
-                all_completed = [r.run_config.run_id for r in results]
-                self._save_checkpoint(checkpoint_file, all_completed)
-                self.logger.info(f"Checkpoint saved ({len(all_completed)} runs completed)")
+        workers = workers if workers is not None else self.config.workers
+        if workers > 1:
+            results = self._run_parallel(
+                combinations, completed_runs, output_dir, checkpoint_file, workers
+            )
+        else:
+            results = []
+            for i, run_config in enumerate(tqdm(combinations, desc="Grid Search")):
+                if run_config.run_id in completed_runs:
+                    self.logger.debug(f"Skipping {run_config.run_id} (already completed)")
+                    continue
+
+                # Display progress
+                progress_msg = self._format_progress(run_config, i + 1, len(combinations))
+                self.logger.info(progress_msg)
+
+                # Run backtest
+                result = self._run_single_backtest(run_config, output_dir)
+                results.append(result)
+
+                # Checkpoint
+                if (i + 1) % self.config.checkpoint_interval == 0:
+                    all_completed = [r.run_config.run_id for r in results]
+                    self._save_checkpoint(checkpoint_file, all_completed)
+                    self.logger.info(f"Checkpoint saved ({len(all_completed)} runs completed)")
 
         # Generate summary CSVs
         self._save_run_config_csv(combinations, output_dir)
@@ -762,86 +847,115 @@ class GridSearchRunner:
             summary_df=summary_df
         )
 
-    def _run_single_backtest(self, run_config: RunConfig, output_dir: Path) -> RunResult:
+    def _run_parallel(
+        self,
+        combinations: List[RunConfig],
+        completed_runs: set,
+        output_dir: Path,
+        checkpoint_file: Path,
+        workers: int
+    ) -> List[RunResult]:
         """
-        Execute single backtest using BacktestRunner.
+        Execute pending runs in a process pool.
+
+        Workers only run backtests and write their own run_XXX/ directory;
+        checkpoint.json is written by this (parent) process alone. A run that
+        raises - or whose worker dies - becomes an error RunResult instead of
+        aborting the grid. Workers read bars from a shared-memory market data
+        cache when it can be loaded, otherwise from the database.
 
         Args:
-            run_config: Configuration for this run
+            combinations: All run configurations (defines output order)
+            completed_runs: Run IDs to skip (from checkpoint)
             output_dir: Base output directory
+            checkpoint_file: Path to checkpoint file
+            workers: Number of worker processes
 
         Returns:
-            RunResult with metrics or error
+            List of RunResult in combination order
         """
-        run_dir = output_dir / f"run_{run_config.run_id}"
-        run_dir.mkdir(exist_ok=True)
+        from jutsu_engine.data.market_data_cache import shared_market_data, warmup_start_date
+
+        order = {c.run_id: i for i, c in enumerate(combinations)}
+        todo = [c for c in combinations if c.run_id not in completed_runs]
+        for run_config in combinations:
+            if run_config.run_id in completed_runs:
+                self.logger.debug(f"Skipping {run_config.run_id} (already completed)")
+
+        self.logger.info(f"Running {len(todo)} backtests on {workers} workers")
 
-        # Parse dates from base_config (handle both str and datetime)
+        symbols = list(dict.fromkeys(
+            symbol for symbol_set in self.config.symbol_sets
+            for symbol in _symbols_for_set(symbol_set)
+        ))
+        end_date = _parse_end_date(self.config.base_config['end_date'])
         start_date = self.config.base_config['start_date']
         if isinstance(start_date, str):
             start_date = datetime.strptime(start_date, '%Y-%m-%d')
 
-        end_date = self.config.base_config['end_date']
-        if isinstance(end_date, str):
-            # Parse date and set to end of day (23:59:59) to include all bars from that date
-            end_date = datetime.strptime(end_date, '%Y-%m-%d').replace(
-                hour=23, minute=59, second=59, microsecond=999999
-            )
+        results = []
+        with shared_market_data(
+            symbols,
+            self.config.base_config['timeframe'],
+            end_date,
+            start_date=warmup_start_date(start_date),
+            database_url=self.config.base_config.get('database_url'),
+        ) as pool_kwargs, ProcessPoolExecutor(max_workers=workers, **pool_kwargs) as ex:
+            # Module-level worker + plain dataclass args keep this spawn-safe
+            pending = {
+                ex.submit(
+                    _run_grid_combination, self.config, run_config,
+                    output_dir, self.generate_plots
+                ): run_config
+                for run_config in todo
+            }
+            with tqdm(total=len(todo), desc="Grid Search") as progress:
+                while pending:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        run_config = pending.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            self.logger.error(f"Backtest failed for run {run_config.run_id}: {e}")
+                            result = RunResult(
+                                run_config=run_config,
+                                metrics={},
+                                output_dir=output_dir / f"run_{run_config.run_id}",
+                                error=str(e)
+                            )
+                        results.append(result)
+                        progress.update(1)
+                        self.logger.info(
+                            self._format_progress(run_config, len(results), len(todo))
+                        )
 
-        # Import strategy class dynamically (MUST happen before building strategy_params)
-        import importlib
-        module = importlib.import_module(f"jutsu_engine.strategies.{self.config.strategy_name}")
-        strategy_class = _get_strategy_class_from_module(module)
-
-        # Prepare symbols list (conditionally include all optional symbols)
-        symbols = [run_config.symbol_set.signal_symbol]
-        if run_config.symbol_set.bull_symbol is not None:
-            symbols.append(run_config.symbol_set.bull_symbol)
-        if run_config.symbol_set.defense_symbol is not None:
-            symbols.append(run_config.symbol_set.defense_symbol)
-        if run_config.symbol_set.bear_symbol is not None:
-            symbols.append(run_config.symbol_set.bear_symbol)
-        if run_config.symbol_set.vix_symbol is not None:
-            symbols.append(run_config.symbol_set.vix_symbol)
-        if run_config.symbol_set.core_long_symbol is not None:
-            symbols.append(run_config.symbol_set.core_long_symbol)
-        if run_config.symbol_set.leveraged_long_symbol is not None:
-            symbols.append(run_config.symbol_set.leveraged_long_symbol)
-        if run_config.symbol_set.leveraged_short_symbol is not None:
-            symbols.append(run_config.symbol_set.leveraged_short_symbol)
-        if run_config.symbol_set.inverse_hedge_symbol is not None:
-            symbols.append(run_config.symbol_set.inverse_hedge_symbol)
-        # Treasury Overlay symbols (for Hierarchical_Adaptive_v3_5b and similar)
-        if run_config.symbol_set.treasury_trend_symbol is not None:
-            symbols.append(run_config.symbol_set.treasury_trend_symbol)
-        if run_config.symbol_set.bull_bond_symbol is not None:
-            symbols.append(run_config.symbol_set.bull_bond_symbol)
-        if run_config.symbol_set.bear_bond_symbol is not None:
-            symbols.append(run_config.symbol_set.bear_bond_symbol)
-
-        # Normalize index symbols (add $ prefix for VIX, DJI, etc.)
-        # This ensures YAML config "VIX" matches database "$VIX"
-        symbols = normalize_index_symbols(symbols)
-        
-        # Deduplicate while preserving order
-        symbols = list(dict.fromkeys(symbols))
-
-        # Prepare strategy params using introspection
-        strategy_params = _build_strategy_params(
-            strategy_class,
-            run_config.symbol_set,
-            run_config.parameters
-        )
+                        if len(results) % self.config.checkpoint_interval == 0:
+                            all_completed = [r.run_config.run_id for r in results]
+                            self._save_checkpoint(checkpoint_file, all_completed)
+                            self.logger.info(
+                                f"Checkpoint saved ({len(all_completed)} runs completed)"
+                            )
 
-        # Prepare backtest config
-        config = {
-            **self.config.base_config,
-            'start_date': start_date,  # Override with datetime
-            'end_date': end_date,      # Override with datetime
-            'symbols': symbols,
-            'strategy_name': self.config.strategy_name,
-            'strategy_params': strategy_params,
-        }
+        results.sort(key=lambda r: order[r.run_config.run_id])
+        return results
+
+    def _run_single_backtest(self, run_config: RunConfig, output_dir: Path) -> RunResult:
+        """
+        Execute single backtest using BacktestRunner.
+
+        Args:
+            run_config: Configuration for this run
+            output_dir: Base output directory
+
+        Returns:
+            RunResult with metrics or error
+        """
+        run_dir = output_dir / f"run_{run_config.run_id}"
+        run_dir.mkdir(exist_ok=True)
+
+        # Import strategy and prepare backtest config
+        strategy_class, config = _build_run_backtest_config(self.config, run_config)
 
         try:
             # Run backtest (BacktestRunner handles all complexity)
@@ -853,24 +967,7 @@ class GridSearchRunner:
             result = runner.run(strategy, output_dir=str(run_dir))
 
             # Extract metrics
-            baseline_data = result.get('baseline', {}) or {}
-            metrics = {
-                'final_value': result.get('final_value', 0.0),
-                'total_return_pct': float(result.get('total_return', 0.0) * 100),
-                'annualized_return_pct': float(result.get('annualized_return', 0.0) * 100),
-                'sharpe_ratio': result.get('sharpe_ratio', 0.0),
-                'sortino_ratio': result.get('sortino_ratio', 0.0),
-                'max_drawdown_pct': float(result.get('max_drawdown', 0.0) * 100),
-                'calmar_ratio': result.get('calmar_ratio', 0.0),
-                'win_rate_pct': float(result.get('win_rate', 0.0) * 100),
-                'total_trades': result.get('total_trades', 0),
-                'profit_factor': result.get('profit_factor', 0.0),
-                'avg_win_usd': result.get('avg_win', 0.0),
-                'avg_loss_usd': result.get('avg_loss', 0.0),
-                # Beta metrics (systematic risk vs market benchmarks)
-                'beta_vs_qqq': baseline_data.get('beta_vs_QQQ'),
-                'beta_vs_spy': baseline_data.get('beta_vs_SPY')
-            }
+            metrics = _extract_run_metrics(result)
 
             # Generate plots for this run if requested
             if hasattr(self, 'generate_plots') and self.generate_plots:
@@ -1375,6 +1472,110 @@ Files:
         }
 
 
+def _build_run_backtest_config(
+    config: GridSearchConfig,
+    run_config: RunConfig
+) -> Tuple[type, Dict[str, Any]]:
+    """
+    Resolve the strategy class and BacktestRunner config for one combination.
+
+    Args:
+        config: Grid search configuration (base_config dates as str or datetime)
+        run_config: Combination to run
+
+    Returns:
+        (strategy_class, config) - config['strategy_params'] holds the
+        strategy constructor arguments
+    """
+    # Parse dates from base_config (handle both str and datetime)
+    start_date = config.base_config['start_date']
+    if isinstance(start_date, str):
+        start_date = datetime.strptime(start_date, '%Y-%m-%d')
+
+    end_date = _parse_end_date(config.base_config['end_date'])
+
+    # Import strategy class dynamically (MUST happen before building strategy_params)
+    import importlib
+    module = importlib.import_module(f"jutsu_engine.strategies.{config.strategy_name}")
+    strategy_class = _get_strategy_class_from_module(module)
+
+    symbols = _symbols_for_set(run_config.symbol_set)
+
+    # Prepare strategy params using introspection
+    strategy_params = _build_strategy_params(
+        strategy_class,
+        run_config.symbol_set,
+        run_config.parameters
+    )
+
+    # Prepare backtest config
+    backtest_config = {
+        **config.base_config,
+        'start_date': start_date,  # Override with datetime
+        'end_date': end_date,      # Override with datetime
+        'symbols': symbols,
+        'strategy_name': config.strategy_name,
+        'strategy_params': strategy_params,
+    }
+    return strategy_class, backtest_config
+
+
+def _extract_run_metrics(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Summary metrics of one BacktestRunner result (RunResult.metrics format).
+
+    Args:
+        result: BacktestRunner.run() results
+
+    Returns:
+        Metrics dict (percentages scaled to 0-100)
+    """
+    baseline_data = result.get('baseline', {}) or {}
+    return {
+        'final_value': result.get('final_value', 0.0),
+        'total_return_pct': float(result.get('total_return', 0.0) * 100),
+        'annualized_return_pct': float(result.get('annualized_return', 0.0) * 100),
+        'sharpe_ratio': result.get('sharpe_ratio', 0.0),
+        'sortino_ratio': result.get('sortino_ratio', 0.0),
+        'max_drawdown_pct': float(result.get('max_drawdown', 0.0) * 100),
+        'calmar_ratio': result.get('calmar_ratio', 0.0),
+        'win_rate_pct': float(result.get('win_rate', 0.0) * 100),
+        'total_trades': result.get('total_trades', 0),
+        'profit_factor': result.get('profit_factor', 0.0),
+        'avg_win_usd': result.get('avg_win', 0.0),
+        'avg_loss_usd': result.get('avg_loss', 0.0),
+        # Beta metrics (systematic risk vs market benchmarks)
+        'beta_vs_qqq': baseline_data.get('beta_vs_QQQ'),
+        'beta_vs_spy': baseline_data.get('beta_vs_SPY')
+    }
+
+
+def _run_grid_combination(
+    config: GridSearchConfig,
+    run_config: RunConfig,
+    output_dir: Path,
+    generate_plots: bool
+) -> RunResult:
+    """
+    Process pool entry point: run one grid combination.
+
+    Module-level (picklable) so GridSearchRunner can submit it to a
+    ProcessPoolExecutor under both fork and spawn start methods.
+
+    Args:
+        config: Grid search configuration
+        run_config: Combination to run
+        output_dir: Base output directory
+        generate_plots: Generate per-run plots
+
+    Returns:
+        RunResult with metrics or error
+    """
+    runner = GridSearchRunner(config)
+    runner.generate_plots = generate_plots
+    return runner._run_single_backtest(run_config, output_dir)
+
+
 class GridSearchAnalyzer:
     """
     Robustness analyzer for grid search results.
@@ -8,11 +8,25 @@ Core Philosophy:
     "A strategy's performance depends on trade order - Monte Carlo shuffles to reveal
     if success was skill or luck"
 
+Simulations are batched: each chunk draws an (iterations x trades) index
+matrix and compounds it with NumPy along axis 1, so 100k iterations run in
+seconds. Three resampling schemes are supported:
+
+- 'iid': classic bootstrap, every return drawn independently
+- 'block': circular block bootstrap with fixed block length
+- 'stationary': Politis-Romano stationary bootstrap (geometric block lengths)
+
+Block schemes preserve serial correlation between consecutive returns, which
+matters for regime strategies whose wins and losses cluster.
+
 Author: Jutsu Labs
 Date: 2025-11-10
 """
 
 import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
@@ -27,6 +41,116 @@ from tqdm import tqdm
 
 from jutsu_engine.utils.logging_config import get_logger
 
+BOOTSTRAP_IID = 'iid'
+BOOTSTRAP_BLOCK = 'block'
+BOOTSTRAP_STATIONARY = 'stationary'
+BOOTSTRAP_METHODS = (BOOTSTRAP_IID, BOOTSTRAP_BLOCK, BOOTSTRAP_STATIONARY)
+
+# Target matrix size per chunk (iterations x trades) when chunk_size is not set
+# (~16 MB per float64 array)
+DEFAULT_CHUNK_ELEMENTS = 2_000_000
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+def bootstrap_indices(
+    rng: np.random.Generator,
+    iterations: int,
+    length: int,
+    method: str = BOOTSTRAP_IID,
+    block_size: int = 1,
+) -> np.ndarray:
+    """
+    Draw an (iterations x length) matrix of resampling indices.
+
+    Args:
+        rng: NumPy random generator
+        iterations: Number of synthetic sequences (rows)
+        length: Number of returns per sequence (columns)
+        method: 'iid', 'block' or 'stationary'
+        block_size: Block length ('block') or mean block length ('stationary')
+
+    Returns:
+        Integer array of indices into the original returns
+
+    Raises:
+        ValueError: If method is unknown
+    """
+    if method == BOOTSTRAP_IID:
+        return rng.integers(0, length, size=(iterations, length))
+
+    positions = np.arange(length)
+
+    if method == BOOTSTRAP_BLOCK:
+        # Circular block bootstrap: concatenate random blocks, trim to length
+        num_blocks = math.ceil(length / block_size)
+        starts = rng.integers(0, length, size=(iterations, num_blocks))
+        idx = starts[:, :, None] + np.arange(block_size)
+        return idx.reshape(iterations, num_blocks * block_size)[:, :length] % length
+
+    if method == BOOTSTRAP_STATIONARY:
+        # A new block starts with probability 1/block_size at each position;
+        # otherwise the previous index advances by one (wrapping around)
+        new_block = rng.random((iterations, length)) < 1.0 / block_size
+        new_block[:, 0] = True
+        starts = rng.integers(0, length, size=(iterations, length))
+        block_start = np.maximum.accumulate(np.where(new_block, positions, 0), axis=1)
+        offset = positions - block_start
+        return (np.take_along_axis(starts, block_start, axis=1) + offset) % length
+
+    raise ValueError(
+        f"Unknown bootstrap method: {method!r} (expected one of {BOOTSTRAP_METHODS})"
+    )
+
+
+def simulate_bootstrap_chunk(
+    returns: np.ndarray,
+    initial_capital: float,
+    iterations: int,
+    seed: Any = None,
+    method: str = BOOTSTRAP_IID,
+    block_size: int = 1,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simulate one chunk of bootstrap equity curves.
+
+    Module-level so chunks can be sent to a ProcessPoolExecutor.
+
+    Args:
+        returns: Portfolio returns as decimals (not percentages)
+        initial_capital: Starting equity for every synthetic curve
+        iterations: Number of curves in this chunk
+        seed: Seed or SeedSequence for this chunk's generator
+        method: 'iid', 'block' or 'stationary'
+        block_size: Block length ('block') or mean block length ('stationary')
+
+    Returns:
+        Tuple of (final_equity, annualized_return, max_drawdown) arrays,
+        returns and drawdowns as decimals
+    """
+    length = len(returns)
+    if length == 0:
+        # No returns: every curve stays at initial capital (no return, no drawdown)
+        return (
+            np.full(iterations, float(initial_capital)),
+            np.zeros(iterations),
+            np.zeros(iterations),
+        )
+
+    rng = np.random.default_rng(seed)
+    idx = bootstrap_indices(rng, iterations, length, method, block_size)
+
+    equity = initial_capital * np.cumprod(1.0 + returns[idx], axis=1)
+    peak = np.maximum(np.maximum.accumulate(equity, axis=1), initial_capital)
+    max_drawdown = ((peak - equity) / peak).max(axis=1)
+
+    final_equity = equity[:, -1]
+    # Assuming daily returns, annualize with 252 trading days
+    with np.errstate(invalid='ignore'):
+        annualized_return = (final_equity / initial_capital) ** (TRADING_DAYS_PER_YEAR / length) - 1
+
+    return final_equity, annualized_return, max_drawdown
+
 
 @dataclass
 class MonteCarloConfig:
@@ -46,9 +170,14 @@ class MonteCarloConfig:
     confidence_level: float = 0.95
     risk_thresholds: List[int] = field(default_factory=lambda: [30, 40, 50])
 
+    # Resampling: 'iid', 'block' (circular block) or 'stationary'
+    bootstrap_method: str = BOOTSTRAP_IID
+    block_size: int = 5
+
     # Performance Options
     parallel: bool = False
     num_workers: Optional[int] = None
+    chunk_size: Optional[int] = None
 
     # Visualization Settings
     visualization_enabled: bool = True
@@ -65,9 +194,10 @@ class MonteCarloSimulator:
 
     The simulator performs the following steps:
     1. Loads portfolio returns from WFO output (monte_carlo_input.csv)
-    2. Runs N iterations (default: 10,000) of bootstrap resampling
+    2. Runs N iterations (default: 10,000) of bootstrap resampling in chunks
+       (optionally spread across worker processes)
     3. For each iteration:
-       - Shuffles returns WITH replacement (bootstrap sampling)
+       - Resamples returns WITH replacement (iid, block or stationary bootstrap)
        - Compounds returns to generate synthetic equity curve
        - Tracks max drawdown and final equity
     4. Analyzes distribution:
@@ -106,9 +236,10 @@ class MonteCarloSimulator:
         # Validate configuration
         self._validate_config()
 
-        # Set random seed for reproducibility
+        # Each chunk gets a child of this sequence, so results depend only on
+        # the seed and chunking - not on worker count or completion order
+        self._seed_sequence = np.random.SeedSequence(self.config.random_seed)
         if self.config.random_seed is not None:
-            np.random.seed(self.config.random_seed)
             self.logger.info(f"Random seed set to {self.config.random_seed} for reproducibility")
 
     def _validate_config(self) -> None:
@@ -130,6 +261,20 @@ class MonteCarloSimulator:
         if not all(0 < t < 100 for t in self.config.risk_thresholds):
             raise ValueError(f"Risk thresholds must be between 0 and 100, got {self.config.risk_thresholds}")
 
+        if self.config.bootstrap_method not in BOOTSTRAP_METHODS:
+            raise ValueError(
+                f"Bootstrap method must be one of {BOOTSTRAP_METHODS}, got {self.config.bootstrap_method!r}"
+            )
+
+        if self.config.block_size < 1:
+            raise ValueError(f"Block size must be positive, got {self.config.block_size}")
+
+        if self.config.chunk_size is not None and self.config.chunk_size <= 0:
+            raise ValueError(f"Chunk size must be positive, got {self.config.chunk_size}")
+
+        if self.config.num_workers is not None and self.config.num_workers <= 0:
+            raise ValueError(f"Number of workers must be positive, got {self.config.num_workers}")
+
     def run(self) -> Dict[str, Any]:
         """
         Run complete Monte Carlo simulation.
@@ -265,31 +410,82 @@ class MonteCarloSimulator:
 
         return Decimal(str(equity)), Decimal(str(max_drawdown))
 
-    def _run_simulations(self, returns: np.ndarray) -> pd.DataFrame:
+    def _chunk_sizes(self, num_returns: int) -> List[int]:
         """
-        Run bootstrap simulations.
+        Split iterations into chunks.
 
         Args:
-            returns: Array of portfolio returns (as decimals, not percentages)
+            num_returns: Returns per synthetic sequence
 
         Returns:
-            DataFrame with columns: Run_ID, Final_Equity, Annualized_Return, Max_Drawdown
+            Iterations per chunk (sums to config.iterations)
         """
-        self.logger.info(f"Running {self.config.iterations} bootstrap simulations...")
+        iterations = self.config.iterations
+        chunk = self.config.chunk_size or max(1, DEFAULT_CHUNK_ELEMENTS // max(1, num_returns))
+        chunk = min(chunk, iterations)
+        sizes = [chunk] * (iterations // chunk)
+        if iterations % chunk:
+            sizes.append(iterations % chunk)
+        return sizes
 
-        results = []
+    def _run_simulations(self, returns: np.ndarray) -> pd.DataFrame:
+        """
+        Run bootstrap simulations in vectorized chunks.
 
-        # Use tqdm for progress bar
-        for run_id in tqdm(range(1, self.config.iterations + 1), desc="Simulations"):
-            result = self._simulate_single_run(returns, run_id)
-            results.append(result)
+        Args:
+            returns: Array of portfolio returns (as decimals, not percentages)
 
-        results_df = pd.DataFrame(results)
-        return results_df
+        Returns:
+            DataFrame with columns: Run_ID, Final_Equity, Annualized_Return, Max_Drawdown
+        """
+        sizes = self._chunk_sizes(len(returns))
+        seeds = self._seed_sequence.spawn(len(sizes))
+        returns = np.asarray(returns, dtype=np.float64)
+        capital = float(self.config.initial_capital)
+        method = self.config.bootstrap_method
+        block_size = self.config.block_size
+
+        self.logger.info(
+            f"Running {self.config.iterations} bootstrap simulations "
+            f"({method}, {len(sizes)} chunk(s))..."
+        )
+
+        chunks = []
+        with tqdm(total=self.config.iterations, desc="Simulations") as progress:
+            if self.config.parallel and len(sizes) > 1:
+                workers = self.config.num_workers or max(1, (os.cpu_count() or 2) - 1)
+                self.logger.info(f"Parallel execution with {workers} workers")
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(
+                            simulate_bootstrap_chunk, returns, capital, size, seed, method, block_size
+                        )
+                        for size, seed in zip(sizes, seeds)
+                    ]
+                    for size, future in zip(sizes, futures):
+                        chunks.append(future.result())
+                        progress.update(size)
+            else:
+                for size, seed in zip(sizes, seeds):
+                    chunks.append(
+                        simulate_bootstrap_chunk(returns, capital, size, seed, method, block_size)
+                    )
+                    progress.update(size)
+
+        final_equity, annualized_return, max_drawdown = (
+            np.concatenate(column) for column in zip(*chunks)
+        )
+
+        return pd.DataFrame({
+            'Run_ID': np.arange(1, self.config.iterations + 1),
+            'Final_Equity': np.round(final_equity, 2),
+            'Annualized_Return': np.round(annualized_return * 100, 2),  # Convert to percentage
+            'Max_Drawdown': np.round(max_drawdown * 100, 2)  # Convert to percentage
+        })
 
     def _simulate_single_run(self, returns: np.ndarray, run_id: int) -> Dict[str, Any]:
         """
-        Simulate single run with shuffled returns.
+        Simulate single run with resampled returns.
 
         Args:
             returns: Array of portfolio returns
@@ -298,38 +494,20 @@ class MonteCarloSimulator:
         Returns:
             Dict with Run_ID, Final_Equity, Annualized_Return, Max_Drawdown
         """
-        # Bootstrap sample: resample WITH replacement
-        shuffled_returns = np.random.choice(returns, size=len(returns), replace=True)
-
-        # Compound returns to generate equity curve
-        equity = float(self.config.initial_capital)
-        peak_equity = equity
-        max_drawdown = 0.0
-
-        for ret in shuffled_returns:
-            equity *= (1 + ret)
-
-            # Track peak and drawdown
-            if equity > peak_equity:
-                peak_equity = equity
-
-            drawdown = (peak_equity - equity) / peak_equity
-            if drawdown > max_drawdown:
-                max_drawdown = drawdown
-
-        final_equity = equity
-
-        # Calculate annualized return
-        # Assuming daily returns, annualize with 252 trading days
-        num_periods = len(shuffled_returns)
-        total_return = (final_equity / float(self.config.initial_capital)) - 1
-        annualized_return = (1 + total_return) ** (252 / num_periods) - 1 if num_periods > 0 else 0
+        final_equity, annualized_return, max_drawdown = simulate_bootstrap_chunk(
+            np.asarray(returns, dtype=np.float64),
+            float(self.config.initial_capital),
+            1,
+            self._seed_sequence.spawn(1)[0],
+            self.config.bootstrap_method,
+            self.config.block_size,
+        )
 
         return {
             'Run_ID': run_id,
-            'Final_Equity': round(final_equity, 2),
-            'Annualized_Return': round(annualized_return * 100, 2),  # Convert to percentage
-            'Max_Drawdown': round(max_drawdown * 100, 2)  # Convert to percentage
+            'Final_Equity': round(float(final_equity[0]), 2),
+            'Annualized_Return': round(float(annualized_return[0]) * 100, 2),  # Convert to percentage
+            'Max_Drawdown': round(float(max_drawdown[0]) * 100, 2)  # Convert to percentage
         }
 
     def _analyze_results(self, results_df: pd.DataFrame, original_equity: Optional[Decimal]) -> Dict[str, Any]:
@@ -612,7 +790,11 @@ class MonteCarloSimulator:
             else:
                 f.write(f"Initial capital: ${self.config.initial_capital:,.2f}\n")
 
-            f.write(f"Simulation: {self.config.iterations:,} shuffled trade sequences\n\n")
+            f.write(f"Simulation: {self.config.iterations:,} shuffled trade sequences")
+            if self.config.bootstrap_method == BOOTSTRAP_IID:
+                f.write(" (iid bootstrap)\n\n")
+            else:
+                f.write(f" ({self.config.bootstrap_method} bootstrap, block size {self.config.block_size})\n\n")
 
             # Percentile Analysis
             f.write("Percentile Analysis - Final Equity:\n")
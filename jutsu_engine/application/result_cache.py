@@ -0,0 +1,429 @@
+"""
+Content-addressed cache for BacktestRunner results.
+
+Dashboard users, scripts and grid searches often re-run exactly the same
+backtest. The cache key hashes everything that determines a result:
+
+- the source of every jutsu_engine module (engine, indicators, data
+  handlers, portfolio helpers, strategies, ...) plus the modules of the
+  strategy's class hierarchy that live outside the package
+- the strategy's constructor state (parameters)
+- the run configuration (symbols, dates, capital, costs, output mode, ...)
+- a fingerprint of the market data (row counts and last bar timestamps per
+  symbol/timeframe, plus DataMetadata sync times; or Parquet partition
+  sizes/mtimes when reading from a ParquetMarketDataStore)
+
+Entries are pickled under the cache root: the results, the equity curve as
+numpy arrays and, for full-mode runs, zlib-compressed copies of the exported
+CSV/YAML files (a hit re-creates them in the new output_dir). Entries are
+evicted least-recently-used once the cache exceeds its size or entry limit.
+
+Example:
+    from jutsu_engine.application.result_cache import BacktestResultCache
+
+    config = {..., 'result_cache': 'data/backtest_cache'}
+    results = BacktestRunner(config).run(strategy)   # computed and stored
+    results = BacktestRunner(config).run(strategy)   # served from the cache
+
+Data changed outside DataSync (manual SQL edits) does not always change the
+fingerprint, nor do edits to third-party packages or to helper modules that
+an out-of-package strategy imports; call BacktestResultCache.clear() after
+such edits.
+"""
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import pickle
+import tempfile
+import zlib
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from jutsu_engine.data.models import DataMetadata, MarketData
+from jutsu_engine.utils.logging_config import get_data_logger
+
+logger = get_data_logger('RESULT_CACHE')
+
+# Bump when a change outside the hashed sources alters backtest results
+CACHE_VERSION = 2
+
+# Package whose every source file is part of every key: results depend on
+# far more than the event loop (indicators, data handlers, bar history,
+# portfolio helpers), so any edit inside it invalidates cached results
+ENGINE_PACKAGE = 'jutsu_engine'
+
+# BacktestRunner config keys holding runtime objects/locations, not inputs
+RUNTIME_CONFIG_KEYS = frozenset({
+    'result_cache', 'market_data_cache', 'parquet_store', 'history_spill_dir',
+})
+
+# Result keys naming files a full-mode run exported into its output_dir
+ARTIFACT_KEYS = (
+    'trades_csv_path', 'portfolio_csv_path', 'summary_csv_path', 'dashboard_csv_path',
+    'regime_summary_csv', 'regime_timeseries_csv', 'config_yaml_path',
+)
+
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+# (path, mtime_ns, size) -> sha256 of file contents
+_source_hashes: Dict[Tuple[str, int, int], str] = {}
+
+
+def _normalize(value: Any) -> Any:
+    """
+    JSON-able, stable representation of a key component.
+
+    Objects without a value-based repr (default repr carries the address)
+    collapse to their type name: they are runtime state, not parameters.
+    """
+    if isinstance(value, _PRIMITIVES):
+        return value
+    if isinstance(value, Decimal):
+        return f"D:{value}"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(repr(_normalize(v)) for v in value)
+    text = repr(value)
+    if ' at 0x' in text:
+        return f"<{type(value).__module__}.{type(value).__qualname__}>"
+    return text
+
+
+def _naive_utc(timestamp: datetime) -> datetime:
+    if timestamp.tzinfo is not None:
+        return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+
+def _file_hash(path: str) -> str:
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    digest = _source_hashes.get(key)
+    if digest is None:
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        _source_hashes[key] = digest
+    return digest
+
+
+def engine_fingerprint(package: str = ENGINE_PACKAGE) -> str:
+    """
+    Hash every .py source file under a package directory.
+
+    File hashes are memoized by (path, mtime, size), so repeated calls only
+    stat the files.
+
+    Args:
+        package: Importable package name
+
+    Returns:
+        sha256 over (relative path, file sha256) of every source file
+    """
+    root = Path(importlib.import_module(package).__file__).parent
+    digest = hashlib.sha256()
+    for path in sorted(root.rglob('*.py')):
+        digest.update(f"{path.relative_to(root).as_posix()}:{_file_hash(str(path))}\n".encode())
+    return digest.hexdigest()
+
+
+def source_fingerprint(strategy_class: type) -> Dict[str, str]:
+    """
+    Hash the engine package and the strategy's out-of-package modules.
+
+    Args:
+        strategy_class: Strategy subclass
+
+    Returns:
+        {ENGINE_PACKAGE: engine_fingerprint(), module name: sha256 of its
+        source file for each class-hierarchy module outside the package}
+    """
+    modules = {
+        cls.__module__ for cls in strategy_class.__mro__
+        if cls.__module__ != 'builtins'
+        and cls.__module__.split('.')[0] != ENGINE_PACKAGE
+    }
+
+    hashes = {ENGINE_PACKAGE: engine_fingerprint()}
+    for name in sorted(modules):
+        try:
+            path = inspect.getsourcefile(importlib.import_module(name))
+        except (ImportError, TypeError):
+            path = None
+        hashes[name] = _file_hash(path) if path and os.path.exists(path) else 'unavailable'
+    return hashes
+
+
+def database_fingerprint(
+    session: Session,
+    symbols: Iterable[str],
+    timeframe: str,
+    start_date: datetime,
+    end_date: datetime,
+) -> List[List[Any]]:
+    """
+    Fingerprint the stored bars a backtest reads.
+
+    Uses cheap aggregates (valid row count, first/last timestamp) over the
+    run's timeframe and [start_date, end_date] (an index range scan on
+    idx_market_data_lookup) rather than hashing bars. Warmup bars before
+    start_date and other timeframes (intraday execution bars) are covered by
+    the DataMetadata sync bookkeeping of every timeframe, which changes
+    whenever a sync stores bars.
+
+    Args:
+        session: Database session
+        symbols: Symbols whose data feeds the backtest
+        timeframe: Bar timeframe of the run
+        start_date: Start of the run (naive UTC)
+        end_date: End of the run (naive UTC; the whole end day is included)
+
+    Returns:
+        Sorted [symbol, timeframe, count, first, last] rows followed by sorted
+        [symbol, timeframe, total_bars, last_updated] rows
+    """
+    symbols = sorted(set(symbols))
+    bars = (
+        session.query(
+            MarketData.symbol, func.count(MarketData.id),
+            func.min(MarketData.timestamp), func.max(MarketData.timestamp),
+        )
+        .filter(
+            MarketData.symbol.in_(symbols),
+            MarketData.timeframe == timeframe,
+            MarketData.timestamp >= start_date,
+            MarketData.timestamp < end_date + timedelta(days=1),
+            MarketData.is_valid == True,  # noqa: E712
+        )
+        .group_by(MarketData.symbol)
+        .all()
+    )
+    metadata = session.query(
+        DataMetadata.symbol, DataMetadata.timeframe,
+        DataMetadata.total_bars, DataMetadata.last_updated,
+    ).filter(DataMetadata.symbol.in_(symbols)).all()
+
+    rows = sorted(_normalize([symbol, timeframe, count, first, last])
+                  for symbol, count, first, last in bars)
+    rows += sorted((_normalize(list(row)) for row in metadata), key=lambda row: (row[0], row[1]))
+    return rows
+
+
+def parquet_fingerprint(store, symbols: Iterable[str]) -> List[List[Any]]:
+    """
+    Fingerprint the Parquet partitions of some symbols (all timeframes).
+
+    Args:
+        store: ParquetMarketDataStore
+        symbols: Symbols whose data feeds the backtest
+
+    Returns:
+        Sorted [relative path, size, mtime_ns] rows
+    """
+    wanted = set(symbols)
+    rows = []
+    for symbol, timeframe in store.list_series():
+        if symbol not in wanted:
+            continue
+        for year in store.years(symbol, timeframe):
+            path = store._year_path(symbol, timeframe, year)
+            stat = path.stat()
+            rows.append([str(path.relative_to(store.root)), stat.st_size, stat.st_mtime_ns])
+    return sorted(rows)
+
+
+class BacktestResultCache:
+    """
+    On-disk, LRU-evicted store of backtest results keyed by content hash.
+
+    Each entry is one pickle file ({key}.pkl). Reads refresh the file's
+    mtime, so eviction (oldest mtime first) approximates LRU across
+    processes sharing the directory.
+
+    Attributes:
+        root: Cache directory
+        max_bytes: Total size limit
+        max_entries: Entry count limit
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        max_bytes: int = 1024 ** 3,
+        max_entries: int = 10000,
+    ):
+        """
+        Initialize cache rooted at a directory (created if needed).
+
+        Args:
+            root: Cache directory
+            max_bytes: Evict least-recently-used entries beyond this total size
+            max_entries: Evict least-recently-used entries beyond this count
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+    @staticmethod
+    def make_key(components: Dict[str, Any]) -> str:
+        """
+        Hash key components into a cache key.
+
+        Args:
+            components: Anything that determines the result (normalized
+                        with the same rules as strategy state)
+
+        Returns:
+            Hex sha256 digest
+        """
+        payload = json.dumps(
+            {'version': CACHE_VERSION, **_normalize(components)},
+            sort_keys=True, separators=(',', ':'),
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Entry dict ('results', 'equity_timestamps', 'equity_values',
+            'artifacts', 'created_at') or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            pass
+        return entry
+
+    def put(
+        self,
+        key: str,
+        results: Dict[str, Any],
+        equity_curve: Optional[List[Tuple[datetime, Any]]] = None,
+        artifacts: Optional[Dict[str, Union[str, Path]]] = None,
+    ) -> None:
+        """
+        Store results (without their runtime 'config') and the equity curve.
+
+        Args:
+            key: Cache key
+            results: BacktestRunner.run() results
+            equity_curve: (timestamp, value) pairs from the portfolio
+            artifacts: {result key: exported file}; file contents are stored
+                       zlib-compressed so hits can re-create them anywhere
+        """
+        equity_curve = equity_curve or []
+        entry = {
+            'results': {k: v for k, v in results.items() if k != 'config'},
+            'equity_timestamps': np.array(
+                [np.datetime64(_naive_utc(ts), 'ns') for ts, _ in equity_curve],
+                dtype='datetime64[ns]',
+            ),
+            'equity_values': np.array([float(v) for _, v in equity_curve], dtype=np.float64),
+            'artifacts': {
+                name: (Path(path).name, zlib.compress(Path(path).read_bytes()))
+                for name, path in (artifacts or {}).items()
+            },
+            'created_at': datetime.now(),
+        }
+
+        # Atomic replace: parallel grid-search workers may share the directory
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except Exception:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        self.evict()
+
+    @staticmethod
+    def restore_artifacts(entry: Dict[str, Any], output_dir: Union[str, Path]) -> Dict[str, str]:
+        """
+        Write an entry's exported files into output_dir.
+
+        Args:
+            entry: Entry returned by get()
+            output_dir: Directory to write the files to
+
+        Returns:
+            {result key: path of the re-created file}
+        """
+        output_path = Path(output_dir)
+        restored = {}
+        for name, (filename, data) in entry.get('artifacts', {}).items():
+            output_path.mkdir(parents=True, exist_ok=True)
+            target = output_path / filename
+            target.write_bytes(zlib.decompress(data))
+            restored[name] = str(target)
+        return restored
+
+    def evict(self) -> int:
+        """
+        Remove least-recently-used entries until within the limits.
+
+        Returns:
+            Number of entries removed
+        """
+        entries = []
+        for path in self.root.glob('*.pkl'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        while entries and (total > self.max_bytes or len(entries) > self.max_entries):
+            _, size, path = entries.pop(0)
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        if removed:
+            logger.debug(f"Evicted {removed} backtest cache entries")
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for path in self.root.glob('*.pkl'):
+            path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.root.glob('*.pkl'))
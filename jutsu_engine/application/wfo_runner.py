@@ -13,6 +13,17 @@ Key Algorithm:
     3. Stitch: Combine all OOS trades chronologically
     4. Analyze: Generate equity curve, parameter stability, final metrics
 
+Scheduling:
+    With workers > 1 (top-level config key, as for grid searches) the IS
+    backtests of every window go onto one process pool, and each window's
+    OOS backtest is queued as soon as its IS results are complete. IS
+    backtests only compute metrics (no per-run files). Their results are
+    cached by (combination, IS span) for the run. Setting
+    walk_forward.result_cache (a directory) also persists IS and OOS results
+    through BacktestRunner's result cache, so re-runs never recompute
+    identical backtests. The cache is opt-in: unset, BacktestRunner only
+    uses it when BACKTEST_RESULT_CACHE_DIR is set.
+
 Example:
     from jutsu_engine.application.wfo_runner import WFORunner
 
@@ -30,17 +41,27 @@ import logging
 import json
 import shutil
 import inspect
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 import yaml
 import pandas as pd
 from tqdm import tqdm
 
-from jutsu_engine.application.grid_search_runner import GridSearchRunner, GridSearchConfig
+from jutsu_engine.application.grid_search_runner import (
+    GridSearchRunner,
+    GridSearchConfig,
+    RunConfig,
+    RunResult,
+    SymbolSet,
+    _build_run_backtest_config,
+    _extract_run_metrics,
+    _symbols_for_set,
+)
 from jutsu_engine.application.backtest_runner import BacktestRunner
 from jutsu_engine.performance.analyzer import PerformanceAnalyzer
 from jutsu_engine.utils.logging_config import setup_logger
@@ -285,6 +306,27 @@ class WindowResult:
     oos_metrics: Dict[str, float]
 
 
+def _run_is_combination(config: GridSearchConfig, run_config: RunConfig) -> Dict[str, Any]:
+    """
+    Process pool entry point: metrics of one IS backtest.
+
+    Module-level (picklable) like grid search's worker; runs in 'metrics'
+    output mode, so nothing is written to disk.
+
+    Args:
+        config: Grid search configuration for the IS period
+        run_config: Combination to run
+
+    Returns:
+        Metrics dict (GridSearchRunner RunResult.metrics format)
+    """
+    strategy_class, backtest_config = _build_run_backtest_config(config, run_config)
+    backtest_config['output_mode'] = 'metrics'
+    runner = BacktestRunner(backtest_config)
+    result = runner.run(strategy_class(**backtest_config['strategy_params']))
+    return _extract_run_metrics(result)
+
+
 class WFORunner:
     """
     Walk-Forward Optimization orchestrator.
@@ -323,11 +365,21 @@ class WFORunner:
         self.config = self._load_config()
         self.output_dir = Path(output_dir) if output_dir else self._generate_output_dir()
 
+        # IS metrics by (symbol set, parameters, IS start, IS end)
+        self._is_cache: Dict[Tuple, Dict[str, Any]] = {}
+        self._grid_runner: Optional[GridSearchRunner] = None
+
         logger.info(
             f"WFORunner initialized: {self.config['strategy']}, "
             f"{self.config['walk_forward']['window_size_years']}y windows"
         )
 
+    def __getstate__(self):
+        # OOS tests run in pool workers; they need neither IS state nor the grid runner
+        state = self.__dict__.copy()
+        state.update(_is_cache={}, _grid_runner=None)
+        return state
+
     def _load_config(self) -> Dict[str, Any]:
         """
         Load and validate WFO configuration.
@@ -788,45 +840,35 @@ class WFORunner:
         windows = self.calculate_windows()
         logger.info(f"Total windows: {len(windows)}")
 
-        # Process each window
-        window_results = []
-        for window in tqdm(windows, desc="WFO Windows"):
-            logger.info("=" * 60)
-            logger.info(f"WINDOW {window.window_id}/{len(windows)}")
-            logger.info("=" * 60)
-            logger.info(f"IS Period:  {window.is_start.date()} to {window.is_end.date()}")
-            logger.info(f"OOS Period: {window.oos_start.date()} to {window.oos_end.date()}")
-
-            try:
-                # IS Optimization
-                result = self._run_is_optimization(window)
-
-                # OOS Testing
-                oos_result = self._run_oos_testing(window, result['best_params'])
-
-                # Create window result
-                window_result = WindowResult(
-                    window=window,
-                    best_params=result['best_params'],
-                    metric_value=result['metric_value'],
-                    oos_trades=oos_result['trades_df'],
-                    oos_metrics=oos_result['metrics']
-                )
-
-                window_results.append(window_result)
-
-                logger.info(
-                    f"Window {window.window_id} complete: "
-                    f"{len(oos_result['trades_df'])} OOS trades"
-                )
-
-            except Exception as e:
-                logger.error(
-                    f"Window {window.window_id} failed: {e}",
-                    exc_info=True
-                )
-                # Continue with remaining windows
-                continue
+        # Process windows (serially, or all on one process pool)
+        workers = self.config.get('workers', 1)
+        if workers > 1:
+            window_results = self._run_windows_parallel(windows, workers)
+        else:
+            window_results = []
+            for window in tqdm(windows, desc="WFO Windows"):
+                logger.info("=" * 60)
+                logger.info(f"WINDOW {window.window_id}/{len(windows)}")
+                logger.info("=" * 60)
+                logger.info(f"IS Period:  {window.is_start.date()} to {window.is_end.date()}")
+                logger.info(f"OOS Period: {window.oos_start.date()} to {window.oos_end.date()}")
+
+                try:
+                    # IS Optimization
+                    result = self._run_is_optimization(window)
+
+                    # OOS Testing
+                    oos_result = self._run_oos_testing(window, result['best_params'])
+
+                    window_results.append(self._window_result(window, result, oos_result))
+
+                except Exception as e:
+                    logger.error(
+                        f"Window {window.window_id} failed: {e}",
+                        exc_info=True
+                    )
+                    # Continue with remaining windows
+                    continue
 
         if not window_results:
             raise WFOTestingError("All windows failed. Check logs for details.")
@@ -850,15 +892,154 @@ class WFORunner:
 
         return outputs
 
-    def _run_is_optimization(self, window: WFOWindow) -> Dict[str, Any]:
+    def _window_result(
+        self,
+        window: WFOWindow,
+        is_result: Dict[str, Any],
+        oos_result: Dict[str, Any]
+    ) -> WindowResult:
+        """Combine a window's IS selection and OOS test."""
+        logger.info(
+            f"Window {window.window_id} complete: "
+            f"{len(oos_result['trades_df'])} OOS trades"
+        )
+        return WindowResult(
+            window=window,
+            best_params=is_result['best_params'],
+            metric_value=is_result['metric_value'],
+            oos_trades=oos_result['trades_df'],
+            oos_metrics=oos_result['metrics']
+        )
+
+    def _run_windows_parallel(self, windows: List[WFOWindow], workers: int) -> List[WindowResult]:
         """
-        Run in-sample optimization using GridSearchRunner.
+        Run all windows on one process pool.
+
+        Every IS combination of every window is queued up front (earliest
+        windows first); when a window's last IS result arrives, its
+        parameters are selected here (the parent writes all summary CSVs)
+        and its OOS backtest is queued on the same pool. A failed window is
+        logged and skipped, as in serial runs.
+
+        Args:
+            windows: Windows to process
+            workers: Number of worker processes
+
+        Returns:
+            WindowResults of successful windows, in window order
+        """
+        from jutsu_engine.data.market_data_cache import shared_market_data, warmup_start_date
+
+        combinations = self._get_grid_runner().generate_combinations()
+        is_runs: Dict[int, Dict[str, RunResult]] = {w.window_id: {} for w in windows}
+        waiting: Dict[Tuple, Tuple[RunConfig, List[WFOWindow]]] = {}
+        is_results: Dict[int, Dict[str, Any]] = {}
+        window_results: List[WindowResult] = []
+        pending = {}
+
+        symbols = list(dict.fromkeys(
+            symbol for symbol_set in self._symbol_sets() for symbol in _symbols_for_set(symbol_set)
+        ))
+        total_end = datetime.strptime(self.config['walk_forward']['total_end_date'], '%Y-%m-%d')
+        base_config = self.config['base_config']
+
+        logger.info(
+            f"Running {len(windows)} windows x {len(combinations)} combinations "
+            f"on {workers} workers"
+        )
+
+        with shared_market_data(
+            symbols,
+            base_config['timeframe'],
+            total_end + timedelta(days=1),
+            start_date=warmup_start_date(min(w.is_start for w in windows)),
+            database_url=base_config.get('database_url'),
+        ) as pool_kwargs, ProcessPoolExecutor(max_workers=workers, **pool_kwargs) as ex, \
+                tqdm(total=len(windows), desc="WFO Windows") as progress:
+
+            def add_is_result(window: WFOWindow, run_config: RunConfig, metrics, error=None):
+                runs = is_runs[window.window_id]
+                runs[run_config.run_id] = RunResult(
+                    run_config=run_config,
+                    metrics=metrics,
+                    output_dir=self._window_dir(window),
+                    error=error
+                )
+                if len(runs) < len(combinations):
+                    return
+                try:
+                    is_result = self._run_is_optimization(
+                        window, [runs[c.run_id] for c in combinations]
+                    )
+                except WFOOptimizationError as e:
+                    logger.error(f"Window {window.window_id} failed: {e}")
+                    progress.update(1)
+                    return
+                is_results[window.window_id] = is_result
+                future = ex.submit(self._run_oos_testing, window, is_result['best_params'])
+                pending[future] = ('oos', window)
+
+            for window in windows:
+                is_config = self._is_grid_config(window)
+                for run_config in combinations:
+                    key = self._is_cache_key(window, run_config)
+                    if key in self._is_cache:
+                        add_is_result(window, run_config, self._is_cache[key])
+                    elif key in waiting:
+                        waiting[key][1].append(window)
+                    else:
+                        waiting[key] = (run_config, [window])
+                        future = ex.submit(_run_is_combination, is_config, run_config)
+                        pending[future] = ('is', key)
+
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    kind, item = pending.pop(future)
+                    if kind == 'is':
+                        run_config, waiting_windows = waiting.pop(item)
+                        try:
+                            metrics, error = future.result(), None
+                            self._is_cache[item] = metrics
+                        except Exception as e:
+                            logger.error(f"IS backtest failed for run {run_config.run_id}: {e}")
+                            metrics, error = {}, str(e)
+                        for window in waiting_windows:
+                            add_is_result(window, run_config, metrics, error)
+                    else:
+                        window = item
+                        try:
+                            oos_result = future.result()
+                            window_results.append(
+                                self._window_result(window, is_results[window.window_id], oos_result)
+                            )
+                        except Exception as e:
+                            logger.error(f"Window {window.window_id} failed: {e}")
+                        progress.update(1)
+
+        window_results.sort(key=lambda r: r.window.window_id)
+        return window_results
+
+    def _run_is_optimization(
+        self,
+        window: WFOWindow,
+        run_results: Optional[List[RunResult]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run in-sample optimization over the parameter grid.
+
+        Backtests run in 'metrics' mode (no temp config or per-run files) and
+        are served from the (combination, IS span) cache when possible. The
+        window's summary_comparison.csv is written with GridSearchRunner's
+        format, and parameters are selected from it.
 
         Args:
             window: WFO window definition
+            run_results: Precomputed IS results in combination order (from
+                         the process pool); computed serially if None
 
         Returns:
-            Dict with best_params and metric_value
+            Dict with best_params, metric_value and n_combinations
 
         Raises:
             WFOOptimizationError: If optimization fails
@@ -866,48 +1047,47 @@ class WFORunner:
         logger.info(f"IS Optimization: Running grid search...")
 
         try:
-            # Create grid search config (modify dates for IS period)
-            gs_config = self.config.copy()
-            gs_config['base_config'] = gs_config['base_config'].copy()
-            gs_config['base_config']['start_date'] = window.is_start.strftime('%Y-%m-%d')
-            gs_config['base_config']['end_date'] = window.is_end.strftime('%Y-%m-%d')
-
-            # Save temporary config
-            window_dir = self.output_dir / f"window_{window.window_id:03d}"
-            window_dir.mkdir(exist_ok=True)
-
-            temp_config_path = window_dir / "is_config.yaml"
-            with open(temp_config_path, 'w') as f:
-                yaml.dump(gs_config, f, default_flow_style=False)
-
-            # Load as GridSearchConfig
-            grid_config = GridSearchRunner.load_config(str(temp_config_path))
-
-            # Run grid search
-            grid_runner = GridSearchRunner(grid_config)
-            is_output_dir = window_dir / "is_grid_search"
-
-            grid_result = grid_runner.execute_grid_search(
-                output_base=str(is_output_dir.parent),
-                config_path=str(temp_config_path)
+            grid_runner = self._get_grid_runner()
+
+            if run_results is None:
+                is_config = self._is_grid_config(window)
+                run_results = []
+                for run_config in grid_runner.generate_combinations():
+                    key = self._is_cache_key(window, run_config)
+                    error = None
+                    if key not in self._is_cache:
+                        try:
+                            self._is_cache[key] = _run_is_combination(is_config, run_config)
+                        except Exception as e:
+                            logger.error(f"IS backtest failed for run {run_config.run_id}: {e}")
+                            error = str(e)
+                    run_results.append(RunResult(
+                        run_config=run_config,
+                        metrics=self._is_cache.get(key, {}),
+                        output_dir=self._window_dir(window),
+                        error=error
+                    ))
+
+            summary_df = grid_runner._generate_summary_comparison(
+                run_results, self._window_dir(window)
             )
 
             # Select best parameters
             selection_metric = self.config['walk_forward']['selection_metric']
             best_params, metric_value = self.select_best_parameters(
-                grid_result.summary_df,
+                summary_df,
                 selection_metric
             )
 
             logger.info(
-                f"IS Optimization complete: {len(grid_result.run_results)} combinations tested, "
+                f"IS Optimization complete: {len(run_results)} combinations tested, "
                 f"best {selection_metric}={metric_value:.4f}"
             )
 
             return {
                 'best_params': best_params,
                 'metric_value': metric_value,
-                'grid_output_dir': grid_result.output_dir
+                'n_combinations': len(run_results)
             }
 
         except Exception as e:
@@ -915,6 +1095,62 @@ class WFORunner:
                 f"IS optimization failed for window {window.window_id}: {e}"
             )
 
+    def _symbol_sets(self) -> List[SymbolSet]:
+        """Configured symbol sets as SymbolSet objects."""
+        try:
+            return [SymbolSet(**s) for s in self.config['symbol_sets']]
+        except TypeError as e:
+            raise WFOConfigError(f"Invalid symbol_set structure: {e}")
+
+    def _result_cache_config(self) -> Dict[str, Any]:
+        """BacktestRunner result_cache entry, only if walk_forward sets one (opt-in)."""
+        walk_forward = self.config['walk_forward']
+        return {'result_cache': walk_forward['result_cache']} if 'result_cache' in walk_forward else {}
+
+    def _get_grid_runner(self) -> GridSearchRunner:
+        """GridSearchRunner used to enumerate combinations and format summaries."""
+        if self._grid_runner is None:
+            self._grid_runner = GridSearchRunner(self._is_grid_config(None))
+        return self._grid_runner
+
+    def _is_grid_config(self, window: Optional[WFOWindow]) -> GridSearchConfig:
+        """
+        Grid search configuration for a window's IS period.
+
+        Args:
+            window: WFO window (None: dates left as configured)
+
+        Returns:
+            GridSearchConfig whose base_config covers the IS period
+        """
+        base_config = {**self._result_cache_config(), **self.config['base_config']}
+        if window is not None:
+            base_config['start_date'] = window.is_start.strftime('%Y-%m-%d')
+            base_config['end_date'] = window.is_end.strftime('%Y-%m-%d')
+
+        return GridSearchConfig(
+            strategy_name=self.config['strategy'],
+            symbol_sets=self._symbol_sets(),
+            base_config=base_config,
+            parameters=self.config['parameters'],
+            max_combinations=self.config.get('max_combinations', 500)
+        )
+
+    def _is_cache_key(self, window: WFOWindow, run_config: RunConfig) -> Tuple:
+        """IS cache key: (symbol set, parameters, IS start, IS end)."""
+        return (
+            run_config.symbol_set.name,
+            tuple(run_config.parameters.items()),
+            window.is_start,
+            window.is_end,
+        )
+
+    def _window_dir(self, window: WFOWindow) -> Path:
+        """Create and return a window's output directory."""
+        window_dir = self.output_dir / f"window_{window.window_id:03d}"
+        window_dir.mkdir(parents=True, exist_ok=True)
+        return window_dir
+
     def _run_oos_testing(
         self,
         window: WFOWindow,
@@ -990,6 +1226,7 @@ class WFORunner:
             # Prepare backtest config
             # IMPORTANT: Map commission/slippage keys to BacktestRunner's expected names
             config = {
+                **self._result_cache_config(),
                 **self.config['base_config'],
                 'start_date': window.oos_start,
                 'end_date': window.oos_end,
@@ -21,8 +21,6 @@ import json
 import math
 import os
 import random
-import shutil
-import tempfile
 from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
@@ -512,9 +510,10 @@ def run_one_sample(strategy_id: str, sample: dict, symbols: list[str],
     """Run ONE full-period backtest for a perturbation sample; return a result row.
 
     Picklable (plain args only) so it can run inside a ProcessPoolExecutor worker.
-    Writes ALL CSVs to a throwaway tempdir that is removed afterward, so no per-run
-    regime/portfolio CSVs land in the report directory (spec §6 reduced-output).
-    Reuses BacktestRunner exactly as run_attribution does (attribution.py:234-251).
+    Runs BacktestRunner with output_mode="metrics": no per-run regime/portfolio
+    CSVs are written at all (spec §6 reduced-output) and no per-bar history is
+    kept. Otherwise reuses BacktestRunner as run_attribution does
+    (attribution.py:234-251).
 
     A backtest that raises does NOT crash the campaign: the error is recorded
     LOUDLY as a row with sharpe=None and an `error` string. The analysis layer's
@@ -529,18 +528,16 @@ def run_one_sample(strategy_id: str, sample: dict, symbols: list[str],
         "start_date": datetime(start.year, start.month, start.day, tzinfo=timezone.utc),
         "end_date": datetime(end.year, end.month, end.day, tzinfo=timezone.utc),
         "initial_capital": Decimal(str(initial_capital)),
+        "output_mode": "metrics",
     }
-    tmpdir = tempfile.mkdtemp(prefix="plateau_")
     error = None
     results: dict = {}
     try:
         strategy = build_overridden_strategy(strategy_id, sample["overrides"])
         runner = BacktestRunner(config)
-        results = runner.run(strategy, output_dir=tmpdir)
+        results = runner.run(strategy)
     except Exception as exc:  # noqa: BLE001 — record loudly, never crash the campaign
         error = f"{type(exc).__name__}: {exc}"
-    finally:
-        shutil.rmtree(tmpdir, ignore_errors=True)
 
     return {
         "hash": sample["hash"],
@@ -636,6 +633,7 @@ def run_campaign(strategy_id: str, golden: dict, campaign_file: Path,
                  initial_capital: str = "10000",
                  max_consecutive_errors: int = DEFAULT_MAX_CONSECUTIVE_ERRORS,
                  retry_errors: bool = False,
+                 shared_data: bool = False,
                  progress=lambda msg: None) -> CampaignResult:
     """Run (or resume) a perturbation campaign, checkpointing each result to JSONL.
 
@@ -670,6 +668,11 @@ def run_campaign(strategy_id: str, golden: dict, campaign_file: Path,
         concurrent parallel path's appends safe (no interleaved partial lines from
         competing processes). Moving append_result into a worker would break this.
 
+    Shared market data (shared_data=True, parallel path only):
+      - The parent loads the symbols' daily history once into a shared-memory
+        MarketDataCache and every worker's BacktestRunner reads from it instead of
+        querying the DB per sample. If the load fails, workers use the DB as before.
+
     run_fn injectability & the spawn boundary:
       - run_fn is injectable so the orchestration logic is unit-testable without a
         DB. In the parallel path (workers > 1) the callable is submitted across a
@@ -711,9 +714,16 @@ def run_campaign(strategy_id: str, golden: dict, campaign_file: Path,
             if consecutive_errors >= max_consecutive_errors:
                 raise RuntimeError(breaker_msg)
     else:
-        _run_parallel(strategy_id, todo, campaign_file, run_fn, symbols or [],
-                      start, end, initial_capital, workers,
-                      max_consecutive_errors, breaker_msg, progress)
+        from jutsu_engine.data.market_data_cache import shared_market_data, warmup_start_date
+
+        with shared_market_data(symbols or [], "1D",
+                                datetime(end.year, end.month, end.day),
+                                start_date=warmup_start_date(start),
+                                enabled=shared_data) as pool_kwargs:
+            _run_parallel(strategy_id, todo, campaign_file, run_fn, symbols or [],
+                          start, end, initial_capital, workers,
+                          max_consecutive_errors, breaker_msg, progress,
+                          pool_kwargs=pool_kwargs)
 
     rows = _reload_rows(campaign_file)
     return CampaignResult(strategy_id=strategy_id, seed=seed, samples=samples,
@@ -824,7 +834,7 @@ def run_plateau(strategy_id: str, run_dir: Path,
         strategy_id, golden, campaign_file, joint_n=joint_n, seed=seed,
         workers=workers, oat_only=oat_only, params=params,
         symbols=symbols, start=start, end=end,
-        retry_errors=retry_errors, progress=progress)
+        retry_errors=retry_errors, shared_data=workers > 1, progress=progress)
 
     return summarize_campaign(result, golden_sharpe, golden_metrics)
 
@@ -833,7 +843,7 @@ def _run_parallel(strategy_id: str, todo: list[dict], campaign_file: Path,
                   run_fn, symbols: list[str], start: date, end: date,
                   initial_capital: str, workers: int,
                   max_consecutive_errors: int, breaker_msg: str,
-                  progress) -> None:
+                  progress, pool_kwargs: dict | None = None) -> None:
     """Parallel campaign execution with resume + circuit breaker (parent-only writes).
 
     Uses an explicit wait(FIRST_COMPLETED) loop rather than as_completed so that
@@ -860,7 +870,8 @@ def _run_parallel(strategy_id: str, todo: list[dict], campaign_file: Path,
     consecutive_errors = 0
     done_count = 0
     total = len(todo)
-    with ProcessPoolExecutor(max_workers=workers) as ex:
+    # pool_kwargs (from shared_market_data) attach each worker to the parent's cache
+    with ProcessPoolExecutor(max_workers=workers, **(pool_kwargs or {})) as ex:
         # run_fn is submitted directly (picklable module-level callable, plain-dict
         # args) so it is macOS-spawn-safe. append_result is NOT submitted — the
         # parent is the sole writer.
@@ -380,6 +380,7 @@ def render_wfo_section(summary: dict) -> str:
       drift_table        — DataFrame: per-window winner params
       value_distribution — {param: {value: count}}
       campaign_file      — str
+      single_pass        — warmup_equivalence dict or None (optional)
 
     The report explicitly answers the study question:
       "Adaptive parameter tuning: UNNECESSARY (stable) / JUSTIFIED-INVESTIGATE
@@ -441,6 +442,24 @@ def render_wfo_section(summary: dict) -> str:
         f"- Grid: 31 combos/window (3×3×3 sensitive-param product + 4 quarantine swaps; "
         "6 EXP-003 inert knobs excluded)",
         f"- Campaign file: `{summary['campaign_file']}`",
+    ]
+    sp = summary.get("single_pass")
+    if sp is not None:
+        if sp.get("equivalent"):
+            lines.append(
+                "- Evaluation: **single pass**. One full-history backtest per combo; "
+                "window metrics are sliced from its daily returns. Warmup-equivalent "
+                f"on w{sp.get('probe_window_id')} ({sp.get('compared_days')} days, "
+                f"max |diff| {_fmt(sp.get('max_abs_diff'), '.2e')})")
+        else:
+            lines.append(
+                "- Evaluation: **per-window backtests**. Single pass was rejected: "
+                f"the fresh-start probe on w{sp.get('probe_window_id')} diverged "
+                f"(max |diff| {_fmt(sp.get('max_abs_diff'), '.2e')}, first at "
+                f"{sp.get('first_divergent_date')}; Sharpe "
+                f"{_fmt(sp.get('sharpe_full'), '.4f')} vs "
+                f"{_fmt(sp.get('sharpe_probe'), '.4f')})")
+    lines += [
         "",
         "### Stitched OOS equity curve (headline — spec §5 output 1)",
         "_All metrics computed on the single concatenated OOS daily-return series "
@@ -335,7 +335,8 @@ def _run_serial_returns(strategy_id, todo, campaign_file, run_fn, symbols,
 
 def _run_parallel_returns(strategy_id, todo, campaign_file, run_fn, symbols,
                           start, end, initial_capital, workers,
-                          max_consecutive_errors, progress) -> None:
+                          max_consecutive_errors, progress,
+                          pool_kwargs=None) -> None:
     """Parallel campaign: parent-only writes; wait(FIRST_COMPLETED) drain-then-abort.
 
     Mirrors plateau._run_parallel: on breaker trip we drain the finished batch
@@ -346,7 +347,8 @@ def _run_parallel_returns(strategy_id, todo, campaign_file, run_fn, symbols,
     consecutive = 0
     done_count = 0
     total = len(todo)
-    with ProcessPoolExecutor(max_workers=workers) as ex:
+    # pool_kwargs (from shared_market_data) attach each worker to the parent's cache
+    with ProcessPoolExecutor(max_workers=workers, **(pool_kwargs or {})) as ex:
         pending = {
             ex.submit(run_fn, strategy_id, c, symbols, start, end, initial_capital)
             for c in todo
@@ -377,6 +379,7 @@ def run_returns_campaign(strategy_id: str, combos: list[dict], campaign_file: Pa
                          initial_capital: str = "10000", workers: int = 1,
                          max_consecutive_errors: int = DEFAULT_MAX_CONSECUTIVE_ERRORS,
                          retry_errors: bool = False,
+                         shared_data: bool = False,
                          progress=lambda m: None) -> ReturnsCampaignResult:
     """Run (or resume) the per-combo returns campaign, checkpointing each to JSONL.
 
@@ -388,6 +391,9 @@ def run_returns_campaign(strategy_id: str, combos: list[dict], campaign_file: Pa
     Midnight/multi-day: `end` defaults to date.today() and is not part of combo
     hashes; a campaign spanning midnight extends later backtests by 1 day
     (negligible over a 16-year window; documented and accepted, matches plateau/wfo).
+
+    shared_data (parallel path only): load the daily history once into a
+    shared-memory MarketDataCache that every worker reads instead of the DB.
     """
     campaign_file = Path(campaign_file)
     start = start or ATTRIBUTION_START
@@ -404,9 +410,18 @@ def run_returns_campaign(strategy_id: str, combos: list[dict], campaign_file: Pa
                                 start, end, initial_capital,
                                 max_consecutive_errors, progress)
         else:
-            _run_parallel_returns(strategy_id, todo, campaign_file, run_fn, symbols,
-                                  start, end, initial_capital, workers,
-                                  max_consecutive_errors, progress)
+            from jutsu_engine.data.market_data_cache import (
+                shared_market_data, warmup_start_date,
+            )
+
+            with shared_market_data(symbols, "1D",
+                                    datetime(end.year, end.month, end.day),
+                                    start_date=warmup_start_date(start),
+                                    enabled=shared_data) as pool_kwargs:
+                _run_parallel_returns(strategy_id, todo, campaign_file, run_fn, symbols,
+                                      start, end, initial_capital, workers,
+                                      max_consecutive_errors, progress,
+                                      pool_kwargs=pool_kwargs)
 
     rows = reload_returns_rows(campaign_file)
     return ReturnsCampaignResult(strategy_id=strategy_id, rows=rows,
@@ -832,7 +847,8 @@ def run_dsr(strategy_id: str, run_dir: _Path, workers: int = 1,
         run_returns_campaign(strategy_id, combos, campaign_file,
                              run_fn=run_one_combo,
                              symbols=symbols, start=start, workers=workers,
-                             retry_errors=retry_errors, progress=progress)
+                             retry_errors=retry_errors, shared_data=workers > 1,
+                             progress=progress)
     rows = reload_returns_rows(campaign_file)
     if not rows:
         raise RuntimeError(
@@ -454,6 +454,9 @@ def run_one_backtest(strategy_id: str, combo: dict, symbols: list[str],
     `is_sharpe` stores the per-window Sharpe for both phases: for IS it is the
     selection metric; for OOS it is diagnostic-only (the headline metrics come from
     stitch_oos_metrics over the full oos_rows set, not from per-window Sharpes).
+
+    The single-pass phases ('full', 'probe') capture the daily rows exactly like
+    OOS, over their own longer span.
     """
     from jutsu_engine.application.backtest_runner import BacktestRunner
 
@@ -472,7 +475,7 @@ def run_one_backtest(strategy_id: str, combo: dict, symbols: list[str],
         strategy = build_overridden_strategy(strategy_id, combo["overrides"])
         runner = BacktestRunner(config)
         results = runner.run(strategy, output_dir=tmpdir)
-        if phase == "oos":
+        if phase != "is":
             ts_csv = results.get("regime_timeseries_csv")
             if ts_csv and Path(ts_csv).exists():
                 df = pd.read_csv(ts_csv)
@@ -551,8 +554,8 @@ def is_error_row(row: dict) -> bool:
     """
     if row.get("error") is not None:
         return True
-    # OOS rows: success requires oos_rows (the daily-return list for stitching).
-    if row.get("phase") == "oos":
+    # OOS/full/probe rows: success requires oos_rows (the daily-return list).
+    if row.get("phase") != "is":
         return not row.get("oos_rows")
     # IS rows: success requires a finite is_sharpe.
     return not _is_finite_number(row.get("is_sharpe"))
@@ -686,6 +689,8 @@ class WFOCampaignResult:
         share verdict; parallel to `windows`, includes windows whose combos all
         errored as empty/short lists).
     stitched: stitch_oos_metrics over every committed OOS window.
+    single_pass: the warmup_equivalence dict when single-pass evaluation was
+        requested (its 'equivalent' says whether it was used), else None.
     """
     strategy_id: str
     winners: list
@@ -694,13 +699,17 @@ class WFOCampaignResult:
     drift: "pd.DataFrame"
     value_distribution: dict
     campaign_file: str
+    single_pass: dict | None = None
 
 
 def _span_for(win: WFOWindow, phase: str) -> tuple[date, date]:
-    """[start, end] for a work unit: the IS span for 'is', the OOS span for 'oos'."""
+    """[start, end] for a work unit: the IS span for 'is', the OOS span for 'oos',
+    and the whole IS+OOS span for the single-pass 'full'/'probe' phases."""
     if phase == "is":
         return win.is_start, win.is_end
-    return win.oos_start, win.oos_end
+    if phase == "oos":
+        return win.oos_start, win.oos_end
+    return win.is_start, win.oos_end
 
 
 def _stamp_row(row: dict, win: WFOWindow, combo: dict, phase: str) -> dict:
@@ -741,7 +750,7 @@ def _run_serial(strategy_id, units, campaign_file, run_fn, symbols,
 
 def _run_parallel(strategy_id, units, campaign_file, run_fn, symbols,
                   initial_capital, workers, max_consecutive_errors,
-                  progress) -> None:
+                  progress, pool_kwargs=None) -> None:
     """Parallel unit execution with resume + breaker (parent-only writes).
 
     Mirrors plateau._run_parallel: an explicit wait(FIRST_COMPLETED) loop so a
@@ -759,7 +768,8 @@ def _run_parallel(strategy_id, units, campaign_file, run_fn, symbols,
     consecutive = 0
     done_count = 0
     total = len(units)
-    with ProcessPoolExecutor(max_workers=workers) as ex:
+    # pool_kwargs (from shared_market_data) attach each worker to the parent's cache
+    with ProcessPoolExecutor(max_workers=workers, **(pool_kwargs or {})) as ex:
         # Submit each unit; map its future to (window, combo, phase) so the parent
         # can stamp the returned row. run_fn is submitted directly (picklable,
         # plain-dict args); append_wfo_row is NEVER submitted — parent is sole writer.
@@ -797,16 +807,30 @@ def _run_parallel(strategy_id, units, campaign_file, run_fn, symbols,
 
 
 def _dispatch(strategy_id, units, campaign_file, run_fn, symbols,
-              initial_capital, workers, max_consecutive_errors, progress) -> None:
-    """Route a work-unit batch to the serial or parallel executor by `workers`."""
+              initial_capital, workers, max_consecutive_errors, progress,
+              shared_data=False) -> None:
+    """Route a work-unit batch to the serial or parallel executor by `workers`.
+
+    With shared_data the parallel path loads the symbols' daily history (through
+    the batch's latest end date) once into a shared-memory cache for the pool.
+    """
     if not units:
         return
     if workers <= 1:
         _run_serial(strategy_id, units, campaign_file, run_fn, symbols,
                     initial_capital, max_consecutive_errors, progress)
     else:
-        _run_parallel(strategy_id, units, campaign_file, run_fn, symbols,
-                      initial_capital, workers, max_consecutive_errors, progress)
+        from jutsu_engine.data.market_data_cache import shared_market_data, warmup_start_date
+
+        data_start = min(_span_for(win, phase)[0] for win, _, phase in units)
+        data_end = max(_span_for(win, phase)[1] for win, _, phase in units)
+        with shared_market_data(symbols, "1D",
+                                datetime(data_end.year, data_end.month, data_end.day),
+                                start_date=warmup_start_date(data_start),
+                                enabled=shared_data) as pool_kwargs:
+            _run_parallel(strategy_id, units, campaign_file, run_fn, symbols,
+                          initial_capital, workers, max_consecutive_errors, progress,
+                          pool_kwargs=pool_kwargs)
 
 
 def _select_winners(windows, campaign_file, progress):
@@ -840,6 +864,183 @@ def _select_winners(windows, campaign_file, progress):
     return winners, window_is_rows
 
 
+# ---------------------------------------------------------------------------
+# Single-pass evaluation (one full-history backtest per combo)
+# ---------------------------------------------------------------------------
+FULL_PHASE = "full"
+PROBE_PHASE = "probe"
+
+# Warmup-equivalence tolerances. The standalone probe starts flat, and the
+# full-history run may already hold positions on the probe's first bars, so
+# the first EQUIVALENCE_SETTLE_DAYS days are excluded from the comparison.
+# After that, every daily return must agree within EQUIVALENCE_RETURN_TOL and
+# the span's Sharpe within EQUIVALENCE_SHARPE_TOL. Small drift from rebalance
+# thresholds passes; start-date-dependent state (cumulative counters, entry
+# bookkeeping, path-dependent filters) does not.
+EQUIVALENCE_SETTLE_DAYS = 5
+EQUIVALENCE_RETURN_TOL = 1e-3
+EQUIVALENCE_SHARPE_TOL = 0.02
+
+
+def warmup_equivalence(full_rows: list[dict] | None, probe_rows: list[dict] | None,
+                       start: date, end: date,
+                       settle_days: int = EQUIVALENCE_SETTLE_DAYS,
+                       return_tol: float = EQUIVALENCE_RETURN_TOL,
+                       sharpe_tol: float = EQUIVALENCE_SHARPE_TOL) -> dict:
+    """Check a full-history run against a standalone backtest of [start, end).
+
+    Single-pass evaluation slices ONE full-history daily-return series into
+    every window. That is only valid when the strategy's state after warmup
+    does not depend on where the backtest started. The probe is a backtest
+    that starts at `start` (with its own warmup). Its daily returns must match
+    the full-history run's returns over the same days, after settle_days.
+
+    Returns dict: equivalent, compared_days, max_abs_diff, first_divergent_date,
+    sharpe_full, sharpe_probe. Missing or empty rows are never equivalent.
+    """
+    result = {"equivalent": False, "compared_days": 0, "max_abs_diff": None,
+              "first_divergent_date": None, "sharpe_full": None,
+              "sharpe_probe": None}
+    if not full_rows or not probe_rows:
+        return result
+
+    def _span(rows):
+        frame = filter_oos_frame_to_span(pd.DataFrame(rows), start, end)
+        series = pd.Series(frame["Strategy_Daily_Return"].to_numpy(dtype=float),
+                           index=frame["Date"].astype(str).str[:10])
+        return series[~series.index.duplicated()]
+
+    full, probe = _span(full_rows), _span(probe_rows)
+    days = full.index.intersection(probe.index).sort_values()[settle_days:]
+    if len(days) == 0:
+        return result
+    full, probe = full[days], probe[days]
+    diff = (full - probe).abs()
+    divergent = diff.index[diff > return_tol]
+    sharpe_full, sharpe_probe = _sharpe(full), _sharpe(probe)
+    result.update({
+        "compared_days": int(len(days)),
+        "max_abs_diff": float(diff.max()),
+        "first_divergent_date": divergent[0] if len(divergent) else None,
+        "sharpe_full": sharpe_full,
+        "sharpe_probe": sharpe_probe,
+    })
+    result["equivalent"] = (len(divergent) == 0
+                            and abs(sharpe_full - sharpe_probe) <= sharpe_tol)
+    return result
+
+
+def derive_window_row(full_row: dict, win: WFOWindow, combo: dict, phase: str,
+                      full_frame: pd.DataFrame | None = None) -> dict:
+    """Build one window's IS/OOS row by slicing a combo's full-history row.
+
+    The row has the same shape as run_one_backtest's row, and its row_key is
+    stamped the same way. is_sharpe is computed on the window's own
+    [start, end) slice of the daily returns. That slice is warmup-free, unlike
+    BacktestRunner's run-time Sharpe (see the WARMUP-ZERO NOTE in
+    run_campaign). OOS rows also carry the sliced daily rows for stitching.
+    A failed full-history run, or a slice with no days, gives a LOUD error row.
+    full_frame is the full row's oos_rows as a DataFrame. Callers that derive
+    many windows from the same row pass it in to avoid rebuilding it each time.
+    """
+    start, end = _span_for(win, phase)
+    row = {"hash": combo["hash"], "combo_id": combo["combo_id"],
+           "kind": combo["kind"], "overrides": combo["overrides"],
+           "is_sharpe": None, "oos_rows": None, "error": None}
+    if is_error_row(full_row):
+        row["error"] = f"full-history backtest failed: {full_row.get('error')}"
+        return _stamp_row(row, win, combo, phase)
+    if full_frame is None:
+        full_frame = pd.DataFrame(full_row["oos_rows"])
+    frame = filter_oos_frame_to_span(full_frame, start, end)
+    if frame.empty:
+        row["error"] = f"full-history run has no rows in [{start}, {end})"
+        return _stamp_row(row, win, combo, phase)
+    row["is_sharpe"] = _sharpe(frame["Strategy_Daily_Return"].astype(float))
+    if phase == "oos":
+        row["oos_rows"] = frame[list(_STITCH_REQUIRED_COLUMNS)].to_dict("records")
+    return _stamp_row(row, win, combo, phase)
+
+
+def _run_single_pass(strategy_id, windows, combos, campaign_file, run_fn, symbols,
+                     initial_capital, workers, max_consecutive_errors, retry_errors,
+                     shared_data, progress) -> dict:
+    """Derive every IS row and every OOS-winner row from one backtest per combo.
+
+    Steps (each backtest row checkpoints in the campaign JSONL, so resume works):
+      1. Run the golden combo over the whole campaign span ('full', window_id 0).
+         Alongside it, run a 'probe': the golden combo started fresh at the last
+         window's is_start, the start date furthest from the full run's.
+      2. warmup_equivalence(full, probe) over the probe span. If it fails, stop
+         here. The caller's per-window passes then run as usual (the fallback).
+      3. Run the remaining combos over the full span. Derive every missing IS
+         row, select winners from the committed rows, and derive every missing
+         OOS-winner row.
+
+    This is len(combos) + 1 backtests instead of len(windows) * (len(combos) + 1).
+    Derived rows use the per-window row_keys, so winner selection, stitching,
+    summaries and resume all read them unchanged. Rows that per-window
+    backtests already checkpointed are kept as they are, so start a new
+    campaign file rather than switching modes halfway through one.
+
+    Returns the warmup_equivalence dict plus 'probe_window_id'.
+    """
+    golden, probe_win = combos[0], windows[-1]
+    span = WFOWindow(0, windows[0].is_start, windows[0].is_end,
+                     windows[-1].oos_start, windows[-1].oos_end)
+
+    def _missing(units):
+        done = load_completed_keys(campaign_file, retry_errors=retry_errors)
+        return [u for u in units if row_key(u[0].window_id, u[2], u[1]["hash"]) not in done]
+
+    def _dispatch_units(units):
+        _dispatch(strategy_id, units, campaign_file, run_fn, symbols, initial_capital,
+                  workers, max_consecutive_errors, progress, shared_data=shared_data)
+
+    # ---- 1-2: golden full run + probe, then the equivalence check ----
+    _dispatch_units(_missing([(span, golden, FULL_PHASE), (probe_win, golden, PROBE_PHASE)]))
+    by_key = {r["row_key"]: r for r in reload_wfo_rows(campaign_file)}
+    full_golden = by_key.get(row_key(0, FULL_PHASE, golden["hash"]), {})
+    probe = by_key.get(row_key(probe_win.window_id, PROBE_PHASE, golden["hash"]), {})
+    check = warmup_equivalence(full_golden.get("oos_rows"), probe.get("oos_rows"),
+                               probe_win.is_start, probe_win.oos_end)
+    check["probe_window_id"] = probe_win.window_id
+    if not check["equivalent"]:
+        progress(f"single-pass UNSAFE for {strategy_id}: full-history and fresh-start "
+                 f"(w{probe_win.window_id}) returns diverge "
+                 f"(max |diff|={check['max_abs_diff']}, first at "
+                 f"{check['first_divergent_date']}, Sharpe {check['sharpe_full']} vs "
+                 f"{check['sharpe_probe']}) — falling back to per-window backtests")
+        return check
+    progress(f"single-pass: warmup-equivalent over w{probe_win.window_id} "
+             f"({check['compared_days']} days, max |diff|={check['max_abs_diff']:.2e})")
+
+    # ---- 3: remaining full-history runs, then derive window rows ----
+    _dispatch_units(_missing([(span, c, FULL_PHASE) for c in combos]))
+    full_by_hash = {r["hash"]: r for r in reload_wfo_rows(campaign_file)
+                    if r.get("phase") == FULL_PHASE}
+    frames = {h: pd.DataFrame(r["oos_rows"]) for h, r in full_by_hash.items()
+              if not is_error_row(r)}
+    done = load_completed_keys(campaign_file, retry_errors=retry_errors)
+    for w in windows:
+        for c in combos:
+            if row_key(w.window_id, "is", c["hash"]) not in done:
+                append_wfo_row(campaign_file, derive_window_row(
+                    full_by_hash[c["hash"]], w, c, "is", frames.get(c["hash"])))
+    winners, _ = _select_winners(windows, campaign_file, progress)
+    window_by_id = {w.window_id: w for w in windows}
+    for win in winners:
+        combo = {"hash": win["hash"], "combo_id": win.get("combo_id", -1),
+                 "kind": "oos_winner", "overrides": win["overrides"]}
+        if row_key(win["window_id"], "oos", combo["hash"]) not in done:
+            append_wfo_row(campaign_file, derive_window_row(
+                full_by_hash[combo["hash"]], window_by_id[win["window_id"]], combo, "oos",
+                frames.get(combo["hash"])))
+    progress(f"single-pass: derived {len(windows)} windows from "
+             f"{len(full_by_hash)} full-history backtests")
+    return check
+
+
 def run_campaign(strategy_id: str, campaign_file: Path,
                  windows_limit: int | None = None, workers: int = 1,
                  run_fn=run_one_backtest, symbols: list[str] | None = None,
@@ -847,6 +1048,8 @@ def run_campaign(strategy_id: str, campaign_file: Path,
                  initial_capital: str = "10000",
                  max_consecutive_errors: int = DEFAULT_MAX_CONSECUTIVE_ERRORS,
                  retry_errors: bool = False,
+                 shared_data: bool = False,
+                 single_pass: bool = False,
                  progress=lambda m: None) -> WFOCampaignResult:
     """Run (or resume) the 2-pass WFO campaign; return winners, stitched OOS, drift.
 
@@ -870,6 +1073,17 @@ def run_campaign(strategy_id: str, campaign_file: Path,
     boundary — only computes and RETURNS a row. A single writer is what makes the
     concurrent parallel appends safe (no interleaved partial lines).
 
+    Shared market data: with shared_data=True (and workers > 1) the parent loads
+    the daily history once per pass into a shared-memory MarketDataCache; workers
+    read from it instead of querying the DB per unit (DB fallback if the load
+    fails).
+
+    Single pass: with single_pass=True, _run_single_pass runs each combo once over
+    the whole campaign span and derives every IS row and OOS-winner row from
+    slices of those daily returns. This happens only after a warmup-equivalence
+    probe passes. The two passes below then find nothing left to run. If the
+    probe fails, they run the per-window backtests as usual.
+
     Circuit breaker: `max_consecutive_errors` consecutive errored rows abort with
     an operator-actionable RuntimeError; a single success resets the counter. The
     breaker applies to BOTH passes and both execution paths.
@@ -906,6 +1120,13 @@ def run_campaign(strategy_id: str, campaign_file: Path,
     windows = generate_windows(total_start, total_end, windows_limit=windows_limit)
     combos = expand_grid()
 
+    single_pass_check = None
+    if single_pass and windows:
+        single_pass_check = _run_single_pass(
+            strategy_id, windows, combos, campaign_file, run_fn, symbols,
+            initial_capital, workers, max_consecutive_errors, retry_errors,
+            shared_data, progress)
+
     # ---- Pass 1: all IS combos for all windows (resume-before-submit) ----
     done = load_completed_keys(campaign_file, retry_errors=retry_errors)
     is_units = [(w, c, "is") for w in windows for c in combos
@@ -913,7 +1134,8 @@ def run_campaign(strategy_id: str, campaign_file: Path,
     progress(f"pass 1 (IS): {len(is_units)} of {len(windows) * len(combos)} "
              "units to run")
     _dispatch(strategy_id, is_units, campaign_file, run_fn, symbols,
-              initial_capital, workers, max_consecutive_errors, progress)
+              initial_capital, workers, max_consecutive_errors, progress,
+              shared_data=shared_data)
 
     # ---- Winner selection from committed IS rows (deterministic on resume) ----
     winners, window_is_rows = _select_winners(windows, campaign_file, progress)
@@ -933,7 +1155,8 @@ def run_campaign(strategy_id: str, campaign_file: Path,
         oos_units.append((w, combo, "oos"))
     progress(f"pass 2 (OOS): {len(oos_units)} winner backtests to run")
     _dispatch(strategy_id, oos_units, campaign_file, run_fn, symbols,
-              initial_capital, workers, max_consecutive_errors, progress)
+              initial_capital, workers, max_consecutive_errors, progress,
+              shared_data=shared_data)
 
     # ---- Stitch OOS + build drift table from committed rows ----
     # Each OOS row's CSV includes warmup rows dated BEFORE the window's oos_start
@@ -959,7 +1182,7 @@ def run_campaign(strategy_id: str, campaign_file: Path,
     return WFOCampaignResult(
         strategy_id=strategy_id, winners=winners, window_is_rows=window_is_rows,
         stitched=stitched, drift=drift, value_distribution=vdist,
-        campaign_file=str(campaign_file))
+        campaign_file=str(campaign_file), single_pass=single_pass_check)
 
 
 # ---------------------------------------------------------------------------
@@ -988,6 +1211,7 @@ def summarize_campaign(result: WFOCampaignResult) -> dict:
       drift_table      — DataFrame: per-window winner params (spec §5 output 2)
       value_distribution — {param: {value: count}}
       campaign_file    — str path to the JSONL
+      single_pass      — warmup_equivalence dict, or None when not requested
     """
     # --- Combo-level verdict (spec §10 primary) ---
     golden_hash = expand_grid()[0]["hash"]   # combo 0 is always the golden anchor
@@ -1017,6 +1241,7 @@ def summarize_campaign(result: WFOCampaignResult) -> dict:
         "drift_table": result.drift,
         "value_distribution": {k: dict(v) for k, v in result.value_distribution.items()},
         "campaign_file": result.campaign_file,
+        "single_pass": result.single_pass,
     }
 
 
@@ -1024,6 +1249,7 @@ def run_wfo(strategy_id: str, run_dir: Path,
             windows_limit: int | None = None, workers: int = 1,
             retry_errors: bool = False,
             total_start: date | None = None, total_end: date | None = None,
+            single_pass: bool = False,
             progress=lambda m: None) -> dict:
     """End-to-end Module 1 for one strategy: campaign → summarize → summary dict.
 
@@ -1035,6 +1261,9 @@ def run_wfo(strategy_id: str, run_dir: Path,
     Midnight / multi-day: total_end defaults to date.today() at call time and is
     NOT embedded in row keys; a resume after midnight extends the last window's OOS
     by 1 day (negligible for multi-year windows; documented and accepted).
+
+    single_pass derives all windows from one full-history backtest per combo
+    when the strategy passes the warmup-equivalence probe (see run_campaign).
     """
     run_dir = Path(run_dir)
     campaign_file = run_dir / strategy_id / f"campaign_wfo_{strategy_id}.jsonl"
@@ -1042,5 +1271,6 @@ def run_wfo(strategy_id: str, run_dir: Path,
         strategy_id, campaign_file,
         windows_limit=windows_limit, workers=workers,
         total_start=total_start, total_end=total_end,
-        retry_errors=retry_errors, progress=progress)
+        retry_errors=retry_errors, shared_data=workers > 1,
+        single_pass=single_pass, progress=progress)
     return summarize_campaign(result)
@@ -298,7 +298,13 @@ def _resolve_run_dir_wfo(run_date_str: str | None, strategy_id: str) -> "Path":
               help="Use a specific dated run directory (YYYY-MM-DD) instead of "
                    "auto-detecting an existing campaign. Useful when resuming after "
                    "midnight without accidentally creating a new campaign in today's dir.")
-def wfo_cmd(strategy, workers, windows_limit, retry_errors, run_date):
+@click.option("--single-pass", "single_pass", is_flag=True, default=False,
+              help="Backtest each combo once over the full span and derive every "
+                   "window's IS/OOS metrics from its daily returns (32 backtests "
+                   "instead of ~830). Falls back to per-window backtests if a "
+                   "fresh-start probe shows the strategy's state depends on its "
+                   "start date.")
+def wfo_cmd(strategy, workers, windows_limit, retry_errors, run_date, single_pass):
     """Module 1: WFO parameter-stability study (stitched OOS curve + drift table)."""
     from jutsu_engine.audit import wfo_stability as wfo_mod
 
@@ -309,12 +315,12 @@ def wfo_cmd(strategy, workers, windows_limit, retry_errors, run_date):
             click.echo(
                 f"[{sid}] WFO campaign "
                 f"(windows_limit={windows_limit}, workers={workers}, "
-                f"retry_errors={retry_errors})\n"
+                f"retry_errors={retry_errors}, single_pass={single_pass})\n"
                 f"  campaign file: {campaign_file}"
             )
             summary = wfo_mod.run_wfo(
                 sid, run_dir, windows_limit=windows_limit, workers=workers,
-                retry_errors=retry_errors,
+                retry_errors=retry_errors, single_pass=single_pass,
                 progress=lambda msg: click.echo(click.style(f"  {msg}", fg="cyan")))
             click.echo(click.style(
                 f"  stitched OOS Sharpe={summary['stitched']['sharpe']:.4f} "
@@ -15,6 +15,7 @@ from decimal import Decimal
 from typing import Optional
 
 from jutsu_engine.application.monte_carlo_simulator import (
+    BOOTSTRAP_METHODS,
     MonteCarloSimulator,
     MonteCarloConfig
 )
@@ -49,6 +50,17 @@ logger = setup_logger('CLI.MONTE_CARLO', log_to_console=True)
     type=int,
     help='Override number of iterations (default: 10000)'
 )
+@click.option(
+    '--bootstrap',
+    '-b',
+    type=click.Choice(BOOTSTRAP_METHODS),
+    help='Override resampling method (iid, block, stationary)'
+)
+@click.option(
+    '--block-size',
+    type=click.IntRange(min=1),
+    help='Override block length (mean length for stationary bootstrap)'
+)
 @click.option(
     '--verbose',
     '-v',
@@ -60,6 +72,8 @@ def monte_carlo(
     input: Optional[str],
     output: Optional[str],
     iterations: Optional[int],
+    bootstrap: Optional[str],
+    block_size: Optional[int],
     verbose: bool
 ):
     """
@@ -75,6 +89,9 @@ def monte_carlo(
         # Override iterations
         jutsu monte-carlo -c config.yaml --iterations 5000
 
+        # Stationary bootstrap (preserves serial correlation)
+        jutsu monte-carlo -c config.yaml --bootstrap stationary --block-size 10
+
         # Override input/output
         jutsu monte-carlo -c config.yaml --input wfo_output/monte_carlo_input.csv --output results/
 
@@ -115,10 +132,16 @@ def monte_carlo(
         confidence_level = analysis_config.get('confidence_level', 0.95)
         risk_thresholds = analysis_config.get('risk_of_ruin_thresholds', [30, 40, 50])
 
+        # Resampling configuration
+        bootstrap_config = mc_config.get('bootstrap', {})
+        bootstrap_method = bootstrap or bootstrap_config.get('method', 'iid')
+        bootstrap_block_size = block_size or bootstrap_config.get('block_size', 5)
+
         # Performance configuration
         perf_config = mc_config.get('performance', {})
         parallel = perf_config.get('parallel', False)
         num_workers = perf_config.get('num_workers')
+        chunk_size = perf_config.get('chunk_size')
 
         # Create config object
         simulator_config = MonteCarloConfig(
@@ -130,8 +153,11 @@ def monte_carlo(
             percentiles=percentiles,
             confidence_level=confidence_level,
             risk_thresholds=risk_thresholds,
+            bootstrap_method=bootstrap_method,
+            block_size=bootstrap_block_size,
             parallel=parallel,
-            num_workers=num_workers
+            num_workers=num_workers,
+            chunk_size=chunk_size
         )
 
     except Exception as e:
@@ -143,12 +169,15 @@ def monte_carlo(
     click.echo(f"\nInput File: {simulator_config.input_file}")
     click.echo(f"Output Directory: {simulator_config.output_directory}")
     click.echo(f"Iterations: {simulator_config.iterations:,}")
+    click.echo(f"Bootstrap: {simulator_config.bootstrap_method}"
+               + ("" if simulator_config.bootstrap_method == 'iid'
+                  else f" (block size {simulator_config.block_size})"))
     click.echo(f"Initial Capital: ${simulator_config.initial_capital:,.2f}")
     if simulator_config.random_seed is not None:
         click.echo(f"Random Seed: {simulator_config.random_seed} (reproducible)")
 
-    # Confirm if > 50000 iterations
-    if simulator_config.iterations > 50000:
+    # Confirm if > 1M iterations
+    if simulator_config.iterations > 1_000_000:
         click.echo(f"\n⚠  Warning: {simulator_config.iterations:,} iterations may take several minutes")
         if not click.confirm("Continue?"):
             click.echo("Aborted.")
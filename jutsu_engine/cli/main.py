@@ -229,6 +229,18 @@ def init(db_url: Optional[str]):
     default=None,
     help='Output file for CSV export (used with --list)',
 )
+@click.option(
+    '-w', '--workers',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Concurrent fetches for --all (API rate limit still applies)',
+)
+@click.option(
+    '--parquet-dir',
+    default=None,
+    type=click.Path(file_okay=False),
+    help='Also append synced bars to this Parquet store (see sync export-parquet)',
+)
 def sync(
     ctx: click.Context,
     symbol: Optional[str],
@@ -239,6 +251,8 @@ def sync(
     sync_all: bool,
     list_symbols: bool,
     output: Optional[str],
+    workers: int,
+    parquet_dir: Optional[str],
 ):
     """
     Synchronize market data from Schwab API.
@@ -253,13 +267,20 @@ def sync(
 
         # Sync all symbols to today
         jutsu sync --all
+        jutsu sync --all --workers 4
 
         # Sync single symbol
         jutsu sync --symbol AAPL --timeframe 1D --start 2024-01-01
         jutsu sync --symbol MSFT --timeframe 1H --start 2024-01-01 --end 2024-12-31
 
+        # Keep a Parquet copy in step with the database
+        jutsu sync --all --parquet-dir data/parquet
+
         # Delete symbol data
         jutsu sync delete --symbol TQQQ
+
+        # Export the database to a Parquet store
+        jutsu sync export-parquet --output data/parquet
     """
     # If a subcommand was invoked, skip this function
     if ctx.invoked_subcommand is not None:
@@ -272,7 +293,7 @@ def sync(
         Session = sessionmaker(bind=engine)
         session = Session()
 
-        sync_manager = DataSync(session)
+        sync_manager = DataSync(session, parquet_store=parquet_dir)
 
         # MODE 1: List symbols with date ranges
         if list_symbols:
@@ -367,7 +388,9 @@ def sync(
                 label='Syncing all symbols',
                 show_eta=False,
             ) as bar:
-                result = sync_manager.sync_all_symbols(fetcher=fetcher, force=force)
+                result = sync_manager.sync_all_symbols(
+                    fetcher=fetcher, force=force, max_workers=workers
+                )
                 bar.update(1)
 
             # Display summary
@@ -574,6 +597,72 @@ def delete_data(symbol: str, force: bool):
         raise click.Abort()
 
 
+@sync.command(name='export-parquet')
+@click.option(
+    '-o', '--output',
+    required=True,
+    type=click.Path(file_okay=False),
+    help='Parquet store directory (created if missing)',
+)
+@click.option(
+    '-s', '--symbol',
+    'symbols',
+    multiple=True,
+    help='Symbol to export (repeatable, default: all)',
+)
+@click.option(
+    '-t', '--timeframe',
+    'timeframes',
+    multiple=True,
+    help='Timeframe to export (repeatable, default: all)',
+)
+def export_parquet(output: str, symbols: tuple, timeframes: tuple):
+    """
+    Export market data to a partitioned Parquet store.
+
+    Writes one file per symbol/timeframe/year under OUTPUT, replacing any
+    existing copy of the exported series. Backtests read the store with
+    the 'parquet_store' config key, without a database connection.
+
+    Example:
+        jutsu sync export-parquet --output data/parquet
+        jutsu sync export-parquet -o data/parquet -s QQQ -s TQQQ -t 5m
+    """
+    config = get_config()
+
+    try:
+        from jutsu_engine.data.parquet_store import ParquetMarketDataStore
+
+        store = ParquetMarketDataStore(output)
+
+        engine = create_engine(config.database_url)
+        Session = sessionmaker(bind=engine)
+        session = Session()
+
+        click.echo(f"Exporting market data to {output}...")
+        exported = store.export_from_database(
+            session, symbols=list(symbols) or None, timeframes=list(timeframes) or None,
+        )
+        session.close()
+
+        if not exported:
+            click.echo(click.style("✗ No matching market data found", fg='yellow'))
+            return
+        for key, bars in exported.items():
+            click.echo(f"  {key}: {bars:,} bars")
+        click.echo(click.style(
+            f"✓ Exported {sum(exported.values()):,} bars ({len(exported)} series)", fg='green',
+        ))
+
+    except ImportError as e:
+        click.echo(click.style(f"✗ {e}", fg='red'))
+        raise click.Abort()
+    except Exception as e:
+        click.echo(click.style(f"✗ Export failed: {e}", fg='red'))
+        logger.error(f"Parquet export failed: {e}", exc_info=True)
+        raise click.Abort()
+
+
 def parse_symbols_callback(ctx, param, value):
     """
     Parse symbols from space-separated, comma-separated, or multiple values.
@@ -862,6 +951,18 @@ def _display_comparison_section(results: dict, baseline: dict):
     default=True,
     help='Generate interactive plots (default: enabled)',
 )
+@click.option(
+    '--cache-dir',
+    type=click.Path(file_okay=False),
+    default=None,
+    help='Serve identical runs from this result cache (default from .env: BACKTEST_RESULT_CACHE_DIR)',
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    default=False,
+    help='Always re-run the backtest, bypassing the result cache',
+)
 def backtest(
     symbol: Optional[str],
     symbols: tuple,
@@ -895,6 +996,9 @@ def backtest(
     allocation_defense: Optional[float],
     # Plotting
     plot: bool,
+    # Result cache
+    cache_dir: Optional[str],
+    no_cache: bool,
 ):
     """
     Run a backtest with specified parameters.
@@ -972,6 +1076,10 @@ def backtest(
             'commission_per_share': Decimal(str(final_commission)),
             'slippage_percent': Decimal(str(final_slippage)),
         }
+        if no_cache:
+            config['result_cache'] = None
+        elif cache_dir:
+            config['result_cache'] = cache_dir
 
         # Create strategy - dynamically load from strategies module
         try:
@@ -1406,7 +1514,14 @@ def validate(
     default=True,
     help='Generate interactive plots (default: enabled)',
 )
-def grid_search(config: str, output: str, analyze: bool, plot: bool):
+@click.option(
+    '--workers',
+    '-w',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Parallel backtests (default: workers from config, else 1)',
+)
+def grid_search(config: str, output: str, analyze: bool, plot: bool, workers: Optional[int]):
     """
     Run parameter grid search optimization.
 
@@ -1416,6 +1531,7 @@ def grid_search(config: str, output: str, analyze: bool, plot: bool):
     Example:
         jutsu grid-search --config grid-configs/macd_optimization.yaml
         jutsu grid-search -c grid-configs/macd_optimization.yaml -o results/
+        jutsu grid-search -c grid-configs/macd_optimization.yaml --workers 8
     """
     click.echo("=" * 60)
     click.echo("Grid Search Parameter Optimization")
@@ -1463,7 +1579,8 @@ def grid_search(config: str, output: str, analyze: bool, plot: bool):
         result = runner.execute_grid_search(
             output_base=output,
             config_path=config,
-            generate_plots=plot
+            generate_plots=plot,
+            workers=workers
         )
     except Exception as e:
         click.echo(click.style(f"\n✗ Grid search failed: {e}", fg='red'))
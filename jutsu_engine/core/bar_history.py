@@ -0,0 +1,225 @@
+"""
+Columnar per-symbol bar history for strategies.
+
+Strategy helpers such as get_closes(symbol=...) used to filter the entire
+bar list on every call, which made long multi-symbol backtests O(N²) in bars.
+SymbolBarHistory keeps one growable float64 column per OHLCV field plus the
+original MarketDataEvent objects, so lookback accessors are O(lookback) and
+the float columns can be handed out as zero-copy NumPy views.
+
+Example:
+    history = BarHistory()
+    history.append(bar)
+
+    qqq = history.get('QQQ')
+    closes = qqq.column('close', lookback=20)   # np.ndarray view (float64)
+    bars = qqq.bars(lookback=20)                 # List[MarketDataEvent]
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from jutsu_engine.core.events import MarketDataEvent
+
+PRICE_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+class SymbolBarHistory:
+    """
+    Append-only OHLCV history for a single symbol.
+
+    Float columns are preallocated and doubled on overflow, so append() is
+    amortized O(1) and column() returns a read-only view without copying.
+    Views remain valid after later appends, but may stop sharing memory
+    with the buffer once it has been reallocated.
+
+    Attributes:
+        symbol: Symbol this history belongs to (None for the all-symbol stream)
+    """
+
+    INITIAL_CAPACITY = 256
+
+    def __init__(self, symbol: Optional[str] = None, capacity: int = INITIAL_CAPACITY):
+        """
+        Initialize empty history.
+
+        Args:
+            symbol: Symbol tracked by this buffer
+            capacity: Initial number of rows to preallocate
+        """
+        self.symbol = symbol
+        self._size = 0
+        self._capacity = max(1, capacity)
+        self._columns: Dict[str, np.ndarray] = {
+            field: np.empty(self._capacity, dtype=np.float64) for field in PRICE_FIELDS
+        }
+        self._events: List[MarketDataEvent] = []
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _grow(self) -> None:
+        """Double the capacity of every column."""
+        new_capacity = self._capacity * 2
+        for field, column in self._columns.items():
+            grown = np.empty(new_capacity, dtype=np.float64)
+            grown[:self._size] = column[:self._size]
+            self._columns[field] = grown
+        self._capacity = new_capacity
+
+    def append(self, bar: MarketDataEvent) -> None:
+        """
+        Append a bar to the history.
+
+        Args:
+            bar: Market data bar (any symbol; caller is responsible for routing)
+        """
+        if self._size == self._capacity:
+            self._grow()
+
+        i = self._size
+        self._columns['open'][i] = float(bar.open)
+        self._columns['high'][i] = float(bar.high)
+        self._columns['low'][i] = float(bar.low)
+        self._columns['close'][i] = float(bar.close)
+        self._columns['volume'][i] = float(bar.volume)
+        self._events.append(bar)
+        self._size += 1
+
+    def _start(self, lookback: Optional[int]) -> int:
+        """Index of the first row inside the lookback window (list[-lookback:] semantics)."""
+        if lookback is None:
+            return 0
+        return range(self._size)[-lookback:].start
+
+    def column(self, field: str, lookback: Optional[int] = None) -> np.ndarray:
+        """
+        Get the last `lookback` values of a price column.
+
+        Args:
+            field: One of 'open', 'high', 'low', 'close', 'volume'
+            lookback: Number of rows to return (None for full history)
+
+        Returns:
+            Read-only float64 NumPy view (no copy)
+
+        Raises:
+            ValueError: If field is not a known OHLCV column
+        """
+        if field not in self._columns:
+            raise ValueError(f"Unknown bar field '{field}', expected one of {PRICE_FIELDS}")
+
+        view = self._columns[field][self._start(lookback):self._size]
+        view.flags.writeable = False
+        return view
+
+    def bars(self, lookback: Optional[int] = None) -> List[MarketDataEvent]:
+        """
+        Get the last `lookback` original bars (Decimal precision preserved).
+
+        Args:
+            lookback: Number of bars to return (None for full history)
+
+        Returns:
+            List of MarketDataEvent objects
+        """
+        return self._events[self._start(lookback):]
+
+    def values(self, field: str, lookback: Optional[int] = None) -> list:
+        """
+        Get the last `lookback` values of a field as the original Decimal/int objects.
+
+        Args:
+            field: One of 'open', 'high', 'low', 'close', 'volume'
+            lookback: Number of rows to return (None for full history)
+
+        Returns:
+            List of field values in bar order
+        """
+        if field not in self._columns:
+            raise ValueError(f"Unknown bar field '{field}', expected one of {PRICE_FIELDS}")
+        return [getattr(bar, field) for bar in self.bars(lookback)]
+
+    def timestamps(self, lookback: Optional[int] = None) -> list:
+        """
+        Get the last `lookback` bar timestamps.
+
+        Args:
+            lookback: Number of rows to return (None for full history)
+
+        Returns:
+            List of datetime objects in bar order
+        """
+        return [bar.timestamp for bar in self.bars(lookback)]
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Copy the full history into a DataFrame.
+
+        Returns:
+            DataFrame indexed by bar timestamp with float64 OHLCV columns
+        """
+        return pd.DataFrame(
+            {field: column[:self._size].copy() for field, column in self._columns.items()},
+            index=pd.Index(self.timestamps(), name='timestamp'),
+        )
+
+    @property
+    def last(self) -> Optional[MarketDataEvent]:
+        """Most recent bar, or None if empty."""
+        return self._events[-1] if self._events else None
+
+
+class BarHistory:
+    """
+    Per-symbol bar histories plus the combined bar stream.
+
+    Mirrors a plain list of bars (the Strategy._bars contract) while indexing
+    every bar by symbol. The combined stream is kept as well so that
+    symbol-agnostic lookbacks behave exactly like slicing the raw list.
+    """
+
+    def __init__(self):
+        """Initialize empty history."""
+        self._all = SymbolBarHistory(symbol=None)
+        self._by_symbol: Dict[str, SymbolBarHistory] = {}
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def append(self, bar: MarketDataEvent) -> None:
+        """
+        Route a bar to its symbol buffer and the combined stream.
+
+        Args:
+            bar: Market data bar
+        """
+        history = self._by_symbol.get(bar.symbol)
+        if history is None:
+            history = SymbolBarHistory(symbol=bar.symbol)
+            self._by_symbol[bar.symbol] = history
+        history.append(bar)
+        self._all.append(bar)
+
+    def get(self, symbol: Optional[str] = None) -> SymbolBarHistory:
+        """
+        Get the history for a symbol.
+
+        Args:
+            symbol: Symbol to look up (None for the combined stream)
+
+        Returns:
+            SymbolBarHistory (empty if the symbol has not been seen)
+        """
+        if symbol is None:
+            return self._all
+        history = self._by_symbol.get(symbol)
+        if history is None:
+            return SymbolBarHistory(symbol=symbol, capacity=1)
+        return history
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols seen so far, in first-seen order."""
+        return list(self._by_symbol.keys())
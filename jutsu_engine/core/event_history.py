@@ -0,0 +1,316 @@
+"""
+Bounded event histories for the EventLoop and PortfolioSimulator.
+
+EventLoop.all_bars / all_signals / all_orders / all_fills and
+PortfolioSimulator.daily_snapshots used to be unbounded lists, which for
+multi-year intraday backtests grows to gigabytes. EventHistory keeps the
+same append/len/iterate/index interface with a retention policy:
+
+- 'full': keep every record (default, previous behavior)
+- 'none': keep nothing in memory (len() is 0; total counts every append)
+- N (int): keep only the last N records
+
+Independently of retention, records can be streamed to a Parquet file in
+batches (ParquetSpillWriter) so the complete history is still available
+on disk. Spilling requires pyarrow.
+
+Example:
+    from jutsu_engine.core.event_history import EventHistory, spill_writer
+
+    writer = spill_writer('bars', 'output/history')      # output/history/bars.parquet
+    bars = EventHistory(retention=1000, spill=writer)
+    for bar in data_handler.get_next_bar():
+        bars.append(bar)
+    bars.close()
+
+    recent = list(bars)      # last 1000 bars
+    bars.total               # every bar appended
+"""
+import json
+from collections import deque
+from dataclasses import fields, is_dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union, get_args, get_type_hints
+
+from jutsu_engine.utils.logging_config import get_engine_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = get_engine_logger()
+
+RETENTION_FULL = 'full'
+RETENTION_NONE = 'none'
+
+# Records buffered in memory before a Parquet row group is written
+DEFAULT_SPILL_BATCH_SIZE = 10_000
+
+Retention = Union[str, int]
+
+
+def retention_maxlen(retention: Retention) -> Optional[int]:
+    """
+    Translate a retention policy into a deque maxlen.
+
+    Args:
+        retention: 'full', 'none' or a positive record count
+
+    Returns:
+        None (unbounded), 0 (keep nothing) or N
+
+    Raises:
+        ValueError: If retention is not a recognized policy
+    """
+    if retention == RETENTION_FULL:
+        return None
+    if retention == RETENTION_NONE:
+        return 0
+    if isinstance(retention, int) and not isinstance(retention, bool) and retention > 0:
+        return retention
+    raise ValueError(
+        f"Invalid history retention: {retention!r} "
+        f"(expected '{RETENTION_FULL}', '{RETENTION_NONE}' or a positive int)"
+    )
+
+
+def _utc(value: datetime) -> datetime:
+    """Normalize to aware UTC (naive timestamps are UTC by convention)."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _cell(value: Any) -> Any:
+    """Convert one record field to a Parquet-friendly Python value."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        return _utc(value)
+    if isinstance(value, dict):
+        return json.dumps(value, default=str, sort_keys=True)
+    return value
+
+
+def _arrow_type(value: Any):
+    """Arrow type for a sample value (Decimal -> float64, dict -> JSON string)."""
+    if isinstance(value, bool):
+        return pa.bool_()
+    if isinstance(value, int):
+        return pa.int64()
+    if isinstance(value, (float, Decimal)):
+        return pa.float64()
+    if isinstance(value, datetime):
+        return pa.timestamp('us', tz='UTC')
+    return pa.string()
+
+
+def _annotation_arrow_type(annotation: Any):
+    """Arrow type for a dataclass field annotation (Optional[X] -> nullable X)."""
+    args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    if len(args) == 1:
+        annotation = args[0]
+    if annotation is bool:
+        return pa.bool_()
+    if annotation is int:
+        return pa.int64()
+    if annotation in (float, Decimal):
+        return pa.float64()
+    if annotation is datetime:
+        return pa.timestamp('us', tz='UTC')
+    return pa.string()
+
+
+def _dataclass_schema(record: Any):
+    """Parquet schema from an event dataclass's field annotations."""
+    hints = get_type_hints(type(record))
+    return pa.schema([
+        pa.field(f.name, _annotation_arrow_type(hints.get(f.name, str)))
+        for f in fields(record)
+    ])
+
+
+def _record_to_row(record: Any) -> Dict[str, Any]:
+    """Flatten an event dataclass or snapshot dict into a row dict."""
+    if is_dataclass(record):
+        return {f.name: _cell(getattr(record, f.name)) for f in fields(record)}
+    return {key: _cell(value) for key, value in record.items()}
+
+
+class ParquetSpillWriter:
+    """
+    Streams records to a single Parquet file in row-group batches.
+
+    For event dataclasses the schema comes from the field annotations, so an
+    Optional[Decimal] field that is None for a whole batch is still a nullable
+    float64 column. Plain dict records (daily snapshots) are typed from the
+    first batch; a column with no value in it is a string column, and later
+    values in a string column are written as strings. Decimal values are
+    written as float64, datetimes as UTC microsecond timestamps and dict
+    values as JSON strings.
+
+    Attributes:
+        path: Output Parquet file
+        batch_size: Records buffered before a row group is written
+        rows_written: Records flushed to disk so far
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        batch_size: int = DEFAULT_SPILL_BATCH_SIZE,
+        to_row: Callable[[Any], Dict[str, Any]] = _record_to_row,
+    ):
+        """
+        Initialize writer (the file is created on the first flush).
+
+        Args:
+            path: Output Parquet file path (parent directories are created)
+            batch_size: Records per row group
+            to_row: Converts a record to a flat row dict
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError(
+                "History spill-to-disk requires pyarrow. Install with: pip install pyarrow"
+            )
+        self.path = Path(path)
+        self.batch_size = max(1, batch_size)
+        self.rows_written = 0
+        self._to_row = to_row
+        self._buffer: List[Dict[str, Any]] = []
+        self._schema = None
+        self._writer = None
+
+    def write(self, record: Any) -> None:
+        """Buffer one record, flushing a row group when the batch is full."""
+        if self._schema is None and is_dataclass(record):
+            self._schema = _dataclass_schema(record)
+        self._buffer.append(self._to_row(record))
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def _infer_schema(self, rows: List[Dict[str, Any]]):
+        names = list(dict.fromkeys(name for row in rows for name in row))
+        schema_fields = []
+        for name in names:
+            sample = next((row[name] for row in rows if row.get(name) is not None), None)
+            schema_fields.append(pa.field(name, _arrow_type(sample)))
+        return pa.schema(schema_fields)
+
+    def _conform(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Stringify non-string values in string columns (inferred from None)."""
+        string_columns = [f.name for f in self._schema if pa.types.is_string(f.type)]
+        for row in rows:
+            for name in string_columns:
+                value = row.get(name)
+                if value is not None and not isinstance(value, str):
+                    row[name] = str(value)
+        return rows
+
+    def flush(self) -> None:
+        """Write buffered records as one row group."""
+        if not self._buffer:
+            return
+        if self._writer is None:
+            if self._schema is None:
+                self._schema = self._infer_schema(self._buffer)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(str(self.path), self._schema)
+        table = pa.Table.from_pylist(self._conform(self._buffer), schema=self._schema)
+        self._writer.write_table(table)
+        self.rows_written += len(self._buffer)
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """Flush remaining records and close the file."""
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            logger.debug(f"History spilled: {self.rows_written} records to {self.path}")
+
+
+def spill_writer(
+    name: str,
+    directory: Optional[Union[str, Path]],
+    batch_size: int = DEFAULT_SPILL_BATCH_SIZE,
+) -> Optional[ParquetSpillWriter]:
+    """
+    Create the Parquet writer for one history, or None if spilling is off.
+
+    Args:
+        name: History name (file is {directory}/{name}.parquet)
+        directory: Spill directory (None disables spilling)
+        batch_size: Records per row group
+
+    Returns:
+        ParquetSpillWriter or None
+    """
+    if directory is None:
+        return None
+    return ParquetSpillWriter(Path(directory) / f"{name}.parquet", batch_size=batch_size)
+
+
+class EventHistory(deque):
+    """
+    Append-only record history with a retention policy and optional spill.
+
+    A deque bounded by the retention policy: supports len(), iteration,
+    indexing and comparison with lists like the lists it replaces. Every
+    appended record is also passed to the spill writer, if any.
+
+    Attributes:
+        retention: Retention policy ('full', 'none' or last-N)
+        spill: ParquetSpillWriter receiving every record (or None)
+        total: Number of records appended (retained or not)
+    """
+
+    def __init__(
+        self,
+        retention: Retention = RETENTION_FULL,
+        spill: Optional[ParquetSpillWriter] = None,
+    ):
+        """
+        Initialize empty history.
+
+        Args:
+            retention: 'full', 'none' or number of most recent records to keep
+            spill: Optional writer that receives every record
+
+        Raises:
+            ValueError: If retention is invalid
+        """
+        super().__init__(maxlen=retention_maxlen(retention))
+        self.retention = retention
+        self.spill = spill
+        self.total = 0
+
+    def append(self, record: Any) -> None:
+        self.total += 1
+        if self.spill is not None:
+            self.spill.write(record)
+        super().append(record)
+
+    def extend(self, records: Iterable[Any]) -> None:
+        for record in records:
+            self.append(record)
+
+    def close(self) -> None:
+        """Flush and close the spill writer (records stay available in memory)."""
+        if self.spill is not None:
+            self.spill.close()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, list):
+            return list(self) == other
+        return super().__eq__(other)
+
+    __hash__ = None
@@ -18,20 +18,27 @@ Example:
 
     print(f"Portfolio value: ${portfolio.get_portfolio_value():,.2f}")
 """
-from typing import List, Dict, Optional
+from typing import Callable, Dict, Optional
 from decimal import Decimal
 from datetime import date, datetime, timezone
 
 import pytz
 
 from jutsu_engine.data.handlers.base import DataHandler
+from jutsu_engine.core.event_history import (
+    DEFAULT_SPILL_BATCH_SIZE,
+    RETENTION_FULL,
+    RETENTION_NONE,
+    EventHistory,
+    Retention,
+    spill_writer,
+)
 from jutsu_engine.core.strategy_base import Strategy
 from jutsu_engine.portfolio.simulator import PortfolioSimulator
 from jutsu_engine.core.events import (
     MarketDataEvent,
     SignalEvent,
     OrderEvent,
-    FillEvent,
 )
 from jutsu_engine.utils.logging_config import get_engine_logger
 
@@ -66,6 +73,10 @@ class EventLoop:
         trade_logger: Optional['TradeLogger'] = None,
         regime_analyzer: Optional['RegimePerformanceAnalyzer'] = None,
         warmup_end_date: Optional[datetime] = None,
+        history: Retention = RETENTION_FULL,
+        spill_dir: Optional[str] = None,
+        spill_batch_size: int = DEFAULT_SPILL_BATCH_SIZE,
+        progress_callback: Optional[Callable[[date], None]] = None,
     ):
         """
         Initialize event loop.
@@ -78,6 +89,18 @@ class EventLoop:
             regime_analyzer: Optional RegimePerformanceAnalyzer for regime-specific analysis (default: None)
             warmup_end_date: End of warmup period (start of trading period).
                            If provided, bars before this date are warmup-only (no trades).
+            history: Retention for all_bars, all_signals, all_orders and the
+                    portfolio's daily snapshots: 'full' (default), 'none' or the
+                    last N records. all_fills is always kept in full (performance
+                    metrics need every fill). With 'none' and no spill_dir only
+                    counts, fills and end-of-day portfolio values are kept (no
+                    snapshot dicts or indicator capture).
+            spill_dir: Optional directory; every bar, signal, order, fill and daily
+                      snapshot is also streamed to {spill_dir}/{name}.parquet in
+                      batches (requires pyarrow)
+            spill_batch_size: Records per Parquet row group (default: 10,000)
+            progress_callback: Optional callable invoked with each trading date
+                              (ET) as the loop reaches its first bar
 
         Example:
             loop = EventLoop(
@@ -93,16 +116,31 @@ class EventLoop:
         self.trade_logger = trade_logger
         self.regime_analyzer = regime_analyzer
         self.warmup_end_date = warmup_end_date
+        self.history = history
+        self.spill_dir = spill_dir
+        self.progress_callback = progress_callback
+        # Full daily snapshots (with indicators) are only built if something keeps them
+        self._full_snapshots = history != RETENTION_NONE or spill_dir is not None
 
         # Inject TradeLogger into strategy for context logging
         if self.trade_logger:
             self.strategy._set_trade_logger(self.trade_logger)
 
         # Event tracking
-        self.all_bars: List[MarketDataEvent] = []
-        self.all_signals: List[SignalEvent] = []
-        self.all_orders: List[OrderEvent] = []
-        self.all_fills: List[FillEvent] = []
+        # (EventHistory: list-like, bounded by `history`, optionally spilled to Parquet)
+        self.all_bars = EventHistory(history, spill_writer('bars', spill_dir, spill_batch_size))
+        self.all_signals = EventHistory(history, spill_writer('signals', spill_dir, spill_batch_size))
+        self.all_orders = EventHistory(history, spill_writer('orders', spill_dir, spill_batch_size))
+        self.all_fills = EventHistory(RETENTION_FULL, spill_writer('fills', spill_dir, spill_batch_size))
+        self._histories = [self.all_bars, self.all_signals, self.all_orders, self.all_fills]
+
+        # Daily snapshots follow the same policy ('none' without spill keeps values only)
+        if self._full_snapshots and (history != RETENTION_FULL or spill_dir is not None):
+            snapshots = EventHistory(
+                history, spill_writer('daily_snapshots', spill_dir, spill_batch_size)
+            )
+            self.portfolio.set_snapshot_history(snapshots)
+            self._histories.append(snapshots)
 
         # Current market data (symbol -> latest bar)
         self.current_bars: Dict[str, MarketDataEvent] = {}
@@ -211,6 +249,18 @@ class EventLoop:
             fills = loop.all_fills
             signals = loop.all_signals
         """
+        try:
+            self._run()
+        finally:
+            self.close_history()
+
+    def close_history(self) -> None:
+        """Flush and close any Parquet spill files (safe to call repeatedly)."""
+        for history in self._histories:
+            history.close()
+
+    def _run(self):
+        """Process all bars (see run())."""
         logger.info("Starting event loop...")
 
         if self.warmup_end_date:
@@ -244,10 +294,9 @@ class EventLoop:
             if self._last_snapshot_date is not None and current_date != self._last_snapshot_date:
                 # All bars for previous date are now processed
                 # Record snapshot NOW while portfolio still has previous day's prices
-                self.portfolio.record_daily_snapshot(
-                    self._previous_bar_timestamp,
-                    indicators=self._pending_indicators
-                )
+                self._record_daily_snapshot()
+            if self.progress_callback is not None and current_date != self._last_snapshot_date:
+                self.progress_callback(current_date)
 
             # Step 1: Update portfolio market values
             self.portfolio.update_market_value(self.current_bars)
@@ -264,7 +313,7 @@ class EventLoop:
 
             # Step 3.5: Capture indicator values for CSV export
             # Must happen AFTER on_bar() when indicators are computed
-            if hasattr(self.strategy, 'get_current_indicators'):
+            if self._full_snapshots and hasattr(self.strategy, 'get_current_indicators'):
                 self._pending_indicators = self.strategy.get_current_indicators()
 
             # Step 4: Collect signals from strategy
@@ -347,10 +396,7 @@ class EventLoop:
 
         # Record final daily snapshot (for the last date in the dataset)
         if self._previous_bar_timestamp is not None:
-            self.portfolio.record_daily_snapshot(
-                self._previous_bar_timestamp,
-                indicators=self._pending_indicators
-            )
+            self._record_daily_snapshot()
 
         # Record final regime data (for the last date in the dataset)
         if self.regime_analyzer and self._pending_regime_data is not None:
@@ -361,13 +407,13 @@ class EventLoop:
             logger.info(
                 f"Event loop completed: {bar_count} total bars processed "
                 f"({warmup_bar_count} warmup, {trading_bar_count} trading), "
-                f"{len(self.all_signals)} signals, "
+                f"{self.all_signals.total} signals, "
                 f"{len(self.all_fills)} fills"
             )
         else:
             logger.info(
                 f"Event loop completed: {bar_count} bars processed, "
-                f"{len(self.all_signals)} signals, "
+                f"{self.all_signals.total} signals, "
                 f"{len(self.all_fills)} fills"
             )
 
@@ -380,6 +426,16 @@ class EventLoop:
             f"(Return: {return_pct:+.2f}%)"
         )
 
+    def _record_daily_snapshot(self) -> None:
+        """Record the end-of-day snapshot for the previous bar's trading date."""
+        if self._full_snapshots:
+            self.portfolio.record_daily_snapshot(
+                self._previous_bar_timestamp,
+                indicators=self._pending_indicators
+            )
+        else:
+            self.portfolio.record_daily_value(self._previous_bar_timestamp)
+
     def _convert_signal_to_order(self, signal: SignalEvent) -> Optional[OrderEvent]:
         """
         Convert trading signal to order event.
@@ -430,10 +486,10 @@ class EventLoop:
             print(f"Total signals: {results['total_signals']}")
         """
         return {
-            'total_bars': len(self.all_bars),
-            'total_signals': len(self.all_signals),
-            'total_orders': len(self.all_orders),
-            'total_fills': len(self.all_fills),
+            'total_bars': self.all_bars.total,
+            'total_signals': self.all_signals.total,
+            'total_orders': self.all_orders.total,
+            'total_fills': self.all_fills.total,
             'final_value': self.portfolio.get_portfolio_value(),
             'total_return': self.portfolio.get_total_return(),
             'positions': dict(self.portfolio.positions),
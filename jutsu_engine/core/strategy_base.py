@@ -6,10 +6,12 @@ the required methods. This ensures consistent interface for the EventLoop.
 """
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+import numpy as np
 import pandas as pd
 import logging
 
+from jutsu_engine.core.bar_history import BarHistory
 from jutsu_engine.core.events import MarketDataEvent, SignalEvent
 
 if TYPE_CHECKING:
@@ -66,6 +68,9 @@ class Strategy(ABC):
         """Initialize strategy with default settings."""
         self.name = self.__class__.__name__
         self._bars: List[MarketDataEvent] = []  # Historical bars
+        self._bar_history = BarHistory()  # Per-symbol columnar index of _bars
+        self._bar_history_source: List[MarketDataEvent] = self._bars
+        self._precomputed: Dict[str, Tuple[list, Dict[str, np.ndarray]]] = {}  # See precompute()
         self._signals: List[SignalEvent] = []  # Generated signals
         self._positions: Dict[str, int] = {}  # Current positions (from portfolio)
         self._cash: Decimal = Decimal('0.00')  # Available cash (from portfolio)
@@ -201,6 +206,79 @@ class Strategy(ABC):
         """
         return 0
 
+    def precompute(self, frames: Dict[str, pd.DataFrame]) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Optional: compute indicators for the whole history in one vectorized pass.
+
+        Called by BacktestRunner once, after init() and before the EventLoop
+        starts, with every bar the loop is about to feed. Strategies whose
+        indicators depend only on past prices can override this to build
+        their indicator columns with pandas/NumPy rolling operations, then
+        read them in on_bar() via get_precomputed_row() instead of
+        recomputing over the lookback window on every bar.
+
+        Rows must be causal: row i may only use bars 0..i of that symbol.
+
+        Args:
+            frames: symbol -> DataFrame of that symbol's bars in feed order
+                    (index: bar timestamp; float64 columns open, high, low,
+                    close, volume)
+
+        Returns:
+            symbol -> DataFrame of indicator columns, row-aligned with
+            frames[symbol], or None to decline (default: None)
+
+        Example:
+            def precompute(self, frames):
+                qqq = frames['QQQ']['close']
+                return {'QQQ': pd.DataFrame({
+                    'sma_fast': qqq.rolling(self.sma_fast).mean(),
+                    'sma_slow': qqq.rolling(self.sma_slow).mean(),
+                })}
+        """
+        return None
+
+    def supports_precompute(self) -> bool:
+        """
+        Check whether this strategy overrides precompute().
+
+        Returns:
+            True if a subclass implements precompute()
+        """
+        return type(self).precompute is not Strategy.precompute
+
+    def get_precomputed_row(self, symbol: str) -> Optional[Dict[str, float]]:
+        """
+        Get precomputed indicators for the latest bar of `symbol` seen so far.
+
+        Rows are matched by position (the n-th bar of the symbol) and
+        verified against the bar timestamp, so the lookup has the same
+        as-of semantics as get_closes(symbol=...).
+
+        Args:
+            symbol: Symbol whose latest row to fetch
+
+        Returns:
+            Dict of column -> float, or None if nothing was precomputed for
+            the symbol or the row does not line up with the bar history
+            (callers should then fall back to computing live)
+
+        Example:
+            row = self.get_precomputed_row('QQQ')
+            if row is not None:
+                sma_fast = row['sma_fast']
+        """
+        table = self._precomputed.get(symbol)
+        if table is None:
+            return None
+
+        timestamps, columns = table
+        history = self._get_bar_history().get(symbol)
+        i = len(history) - 1
+        if i < 0 or i >= len(timestamps) or timestamps[i] != history.last.timestamp:
+            return None
+        return {name: values[i] for name, values in columns.items()}
+
     # Helper methods provided to strategies
 
     def buy(
@@ -365,23 +443,15 @@ class Strategy(ABC):
             # Multi-symbol strategy: filter for specific symbol
             qqq_closes = self.get_closes(20, symbol='QQQ')
         """
-        if not self._bars:
-            return pd.Series([], dtype='float64')
-
-        # Filter by symbol if specified (for multi-symbol strategies)
-        bars = self._bars
-        if symbol:
-            bars = [bar for bar in bars if bar.symbol == symbol]
+        return self._get_field_series('close', lookback, symbol)
 
-        closes = [bar.close for bar in bars[-lookback:]]
-        return pd.Series(closes)
-
-    def get_bars(self, lookback: int = 100) -> List[MarketDataEvent]:
+    def get_bars(self, lookback: int = 100, symbol: Optional[str] = None) -> List[MarketDataEvent]:
         """
         Get historical bars.
 
         Args:
             lookback: Number of bars to retrieve
+            symbol: Optional symbol to filter by (for multi-symbol strategies)
 
         Returns:
             List of MarketDataEvent objects
@@ -389,8 +459,43 @@ class Strategy(ABC):
         Example:
             bars = self.get_bars(20)
             highs = [bar.high for bar in bars]
+
+            # Latest TQQQ bar without scanning the full history
+            tqqq_bars = self.get_bars(1, symbol='TQQQ')
+        """
+        if not symbol:
+            return self._bars[-lookback:]
+        return self._get_bar_history().get(symbol).bars(lookback)
+
+    def get_price_array(
+        self,
+        field: str = 'close',
+        lookback: int = 100,
+        symbol: Optional[str] = None
+    ) -> np.ndarray:
+        """
+        Get historical prices as a float64 NumPy array.
+
+        Faster alternative to get_closes()/get_highs()/get_lows() for indicator
+        code that works in floats anyway: returns a read-only view into the
+        per-symbol column buffer, so no list scan or copy is made.
+
+        Args:
+            field: 'open', 'high', 'low', 'close' or 'volume'
+            lookback: Number of bars to retrieve
+            symbol: Optional symbol to filter by (for multi-symbol strategies)
+
+        Returns:
+            Read-only float64 array (oldest first)
+
+        Raises:
+            ValueError: If field is not an OHLCV column
+
+        Example:
+            closes = self.get_price_array('close', 200, symbol='QQQ')
+            sma_200 = closes.mean()
         """
-        return self._bars[-lookback:]
+        return self._get_bar_history().get(symbol).column(field, lookback)
 
     def get_highs(self, lookback: int = 100, symbol: Optional[str] = None) -> pd.Series:
         """
@@ -410,16 +515,7 @@ class Strategy(ABC):
             # Multi-symbol strategy: filter for specific symbol
             qqq_highs = self.get_highs(20, symbol='QQQ')
         """
-        if not self._bars:
-            return pd.Series([], dtype='float64')
-
-        # Filter by symbol if specified (for multi-symbol strategies)
-        bars = self._bars
-        if symbol:
-            bars = [bar for bar in bars if bar.symbol == symbol]
-
-        highs = [bar.high for bar in bars[-lookback:]]
-        return pd.Series(highs)
+        return self._get_field_series('high', lookback, symbol)
 
     def get_lows(self, lookback: int = 100, symbol: Optional[str] = None) -> pd.Series:
         """
@@ -439,16 +535,7 @@ class Strategy(ABC):
             # Multi-symbol strategy: filter for specific symbol
             qqq_lows = self.get_lows(20, symbol='QQQ')
         """
-        if not self._bars:
-            return pd.Series([], dtype='float64')
-
-        # Filter by symbol if specified (for multi-symbol strategies)
-        bars = self._bars
-        if symbol:
-            bars = [bar for bar in bars if bar.symbol == symbol]
-
-        lows = [bar.low for bar in bars[-lookback:]]
-        return pd.Series(lows)
+        return self._get_field_series('low', lookback, symbol)
 
     def has_position(self, symbol: Optional[str] = None) -> bool:
         """
@@ -498,6 +585,42 @@ class Strategy(ABC):
 
     # Internal methods (called by EventLoop/Portfolio)
 
+    def _get_field_series(
+        self,
+        field: str,
+        lookback: int,
+        symbol: Optional[str]
+    ) -> pd.Series:
+        """
+        Internal: Build a Series of Decimal prices for the last `lookback` bars.
+
+        Values keep their original Decimal type so existing strategy math is
+        unchanged; only the lookback window is touched.
+        """
+        if not self._bars:
+            return pd.Series([], dtype='float64')
+        if not symbol:
+            return pd.Series([getattr(bar, field) for bar in self._bars[-lookback:]])
+        return pd.Series(self._get_bar_history().get(symbol).values(field, lookback))
+
+    def _get_bar_history(self) -> BarHistory:
+        """
+        Internal: Return the columnar index, catching up with self._bars.
+
+        Bars are normally indexed by _update_bar(). Code that appends to or
+        replaces self._bars directly (tests, custom strategies) is handled by
+        indexing the missing tail, or rebuilding if the list was replaced.
+        """
+        bars = self._bars
+        history = self._bar_history
+        if bars is not self._bar_history_source or len(bars) < len(history):
+            history = BarHistory()
+            self._bar_history = history
+            self._bar_history_source = bars
+        for i in range(len(history), len(bars)):
+            history.append(bars[i])
+        return history
+
     def _update_bar(self, bar: MarketDataEvent):
         """
         Internal: Add new bar to history.
@@ -505,6 +628,64 @@ class Strategy(ABC):
         Called by EventLoop before on_bar(). Not for strategy use.
         """
         self._bars.append(bar)
+        if self._bars is self._bar_history_source and len(self._bar_history) == len(self._bars) - 1:
+            self._bar_history.append(bar)
+
+    def _trim_history(self, keep: int) -> None:
+        """
+        Internal: Drop all but the last `keep` bars of each symbol.
+
+        Called by LiveStrategyRunner before pickling a signal snapshot, so the
+        state stays proportional to the indicator lookback instead of the
+        whole history. Kept bars stay in feed order. Precomputed rows are
+        positional and are dropped. Not for strategy use.
+
+        Args:
+            keep: Bars to keep per symbol
+        """
+        counts: Dict[str, int] = {}
+        kept = []
+        for bar in reversed(self._bars):
+            seen = counts.get(bar.symbol, 0)
+            if seen < keep:
+                counts[bar.symbol] = seen + 1
+                kept.append(bar)
+        if len(kept) == len(self._bars):
+            return
+
+        kept.reverse()
+        self._bars = kept
+        self._bar_history = BarHistory()
+        self._bar_history_source = kept
+        for bar in kept:
+            self._bar_history.append(bar)
+        self._precomputed = {}
+
+    def _set_precomputed(
+        self,
+        frames: Dict[str, pd.DataFrame],
+        columns: Dict[str, pd.DataFrame]
+    ) -> None:
+        """
+        Internal: Store precompute() output for get_precomputed_row().
+
+        Called by BacktestRunner. Not for strategy use.
+
+        Raises:
+            ValueError: If a column table is not row-aligned with its input frame
+        """
+        self._precomputed = {}
+        for symbol, table in columns.items():
+            frame = frames.get(symbol)
+            if frame is None or len(table) != len(frame):
+                raise ValueError(
+                    f"precompute() output for {symbol} has {len(table)} rows, "
+                    f"expected {0 if frame is None else len(frame)}"
+                )
+            self._precomputed[symbol] = (
+                list(frame.index),
+                {name: table[name].to_numpy(dtype=np.float64) for name in table.columns},
+            )
 
     def _update_portfolio_state(self, positions: Dict[str, int], cash: Decimal):
         """
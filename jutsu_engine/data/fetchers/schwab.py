@@ -28,6 +28,7 @@ Example:
 """
 import json
 import os
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
@@ -56,7 +57,15 @@ class AuthError(Exception):
 
 
 class RateLimiter:
-    """Token bucket rate limiter for API calls."""
+    """
+    Token bucket rate limiter for API calls.
+
+    Thread-safe: one limiter can be shared by concurrent fetch workers
+    (DataSync.sync_all_symbols with max_workers > 1). Each caller reserves
+    the next free slot under the lock and sleeps outside it, so waiting
+    threads do not serialize on the lock and the combined request rate
+    never exceeds max_requests per time_window.
+    """
 
     def __init__(self, max_requests: int = 2, time_window: float = 1.0):
         """
@@ -69,28 +78,31 @@ class RateLimiter:
         self.max_requests = max_requests
         self.time_window = time_window
         self.requests: List[float] = []
+        self._lock = threading.Lock()
 
     def wait_if_needed(self) -> None:
         """Wait if necessary to maintain rate limit."""
-        now = time.time()
-
-        # Remove requests outside time window
-        self.requests = [
-            req_time for req_time in self.requests if now - req_time < self.time_window
-        ]
-
-        # If at limit, wait
-        if len(self.requests) >= self.max_requests:
-            oldest = self.requests[0]
-            wait_time = self.time_window - (now - oldest)
-            if wait_time > 0:
-                logger.debug(f"Rate limit: waiting {wait_time:.2f}s")
-                time.sleep(wait_time)
-                # Re-update now after waiting
-                now = time.time()
+        with self._lock:
+            now = time.time()
+
+            # Remove requests outside time window (reserved future slots stay)
+            self.requests = [
+                req_time for req_time in self.requests if now - req_time < self.time_window
+            ]
 
-        # Record this request
-        self.requests.append(now)
+            # If at limit, reserve the slot freed by the request that is
+            # max_requests back (earlier slots are held by other callers)
+            slot = now
+            if len(self.requests) >= self.max_requests:
+                slot = max(now, self.requests[-self.max_requests] + self.time_window)
+
+            # Record this request
+            self.requests.append(slot)
+
+        wait_time = slot - now
+        if wait_time > 0:
+            logger.debug(f"Rate limit: waiting {wait_time:.2f}s")
+            time.sleep(wait_time)
 
 
 class SchwabDataFetcher(DataFetcher):
@@ -182,6 +194,7 @@ class SchwabDataFetcher(DataFetcher):
 
         # Initialize client as None (lazy initialization)
         self._client: Optional[Client] = None
+        self._client_lock = threading.Lock()
 
         # Initialize rate limiter (2 requests per second)
         self._rate_limiter = RateLimiter(max_requests=2, time_window=1.0)
@@ -230,6 +243,22 @@ class SchwabDataFetcher(DataFetcher):
             return True, False, None
 
     def _get_client(self) -> Client:
+        """
+        Get or create authenticated Schwab client (thread-safe).
+
+        Concurrent fetch workers share one client; the lock ensures only
+        one of them runs the token check / OAuth flow.
+
+        Returns:
+            Authenticated Schwab client
+        """
+        if self._client is not None:
+            return self._client
+
+        with self._client_lock:
+            return self._create_client()
+
+    def _create_client(self) -> Client:
         """
         Get or create authenticated Schwab client.
 
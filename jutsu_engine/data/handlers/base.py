@@ -6,11 +6,40 @@ This allows the EventLoop to work with any data source without modification.
 """
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Iterator, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
 
 from jutsu_engine.core.events import MarketDataEvent
 
 
+def validate_ohlcv_batch(rows: Iterable[Any]) -> List[bool]:
+    """
+    Apply MarketDataEvent's OHLCV checks to a whole batch of rows in one pass.
+
+    Handlers use this to validate rows once per batch and then build events
+    with MarketDataEvent.from_validated(). Works on anything with open, high,
+    low, close and volume attributes (MarketData records, events), in
+    Decimal or float.
+
+    Args:
+        rows: Bar-like records
+
+    Returns:
+        One flag per row, True where the bar passes validation
+
+    Example:
+        valid = validate_ohlcv_batch(db_bars)
+        if not all(valid):
+            ...  # build invalid rows with MarketDataEvent(...) to raise
+    """
+    return [
+        r.low <= r.open <= r.high and r.low <= r.close <= r.high
+        and r.low > 0 and r.volume >= 0
+        for r in rows
+    ]
+
+
 class DataHandler(ABC):
     """
     Abstract base class for data handlers.
@@ -139,6 +168,26 @@ class DataHandler(ABC):
         """
         raise NotImplementedError("get_symbols not implemented for this handler")
 
+    def get_bar_frames(self) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Get every bar get_next_bar() will yield, grouped per symbol.
+
+        Optional method - handlers that already hold their bars in memory
+        implement it so callers (e.g. indicator precompute) do not need a
+        second pass over the stream.
+
+        Returns:
+            symbol -> DataFrame of that symbol's bars in feed order (index:
+            bar timestamp; float64 columns open, high, low, close, volume),
+            or None if the bars are not held in memory
+
+        Example:
+            frames = data_handler.get_bar_frames()
+            if frames is not None:
+                qqq_closes = frames['QQQ']['close']
+        """
+        raise NotImplementedError("get_bar_frames not implemented for this handler")
+
 
 class DataFetcher(ABC):
     """
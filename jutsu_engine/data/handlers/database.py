@@ -25,17 +25,20 @@ Example:
     for bar in handler.get_next_bar():
         print(f"{bar.timestamp}: ${bar.close}")
 """
-from datetime import datetime, timedelta
-from typing import Iterator, List, Optional
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
 from decimal import Decimal
 
+import numpy as np
+import pandas as pd
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 
 from jutsu_engine.core.events import MarketDataEvent
-from jutsu_engine.data.handlers.base import DataHandler
+from jutsu_engine.data.handlers.base import DataHandler, validate_ohlcv_batch
 from jutsu_engine.data.models import MarketData
 from jutsu_engine.utils.logging_config import get_data_logger
+from jutsu_engine.utils.trading_calendar import get_trading_calendar
 
 logger = get_data_logger('DATABASE')
 
@@ -71,8 +74,7 @@ def _is_market_holiday(timestamp: datetime) -> bool:
         True if NYSE is closed for holiday, False otherwise
     """
     import pytz
-    import pandas_market_calendars as mcal
-    from datetime import date, time, timezone
+    from datetime import timezone
 
     # Always convert to Eastern Time to get correct NYSE trading date
     # Example: 2026-01-19 21:00:00 PST = 2026-01-20 00:00:00 ET → trading date Jan 20
@@ -86,21 +88,102 @@ def _is_market_holiday(timestamp: datetime) -> bool:
     if trading_date.weekday() >= 5:
         return False
 
-    # Get NYSE calendar - cache for efficiency
-    if not hasattr(_is_market_holiday, '_nyse_cache'):
-        _is_market_holiday._nyse_cache = {}
+    return not get_trading_calendar().is_trading_day(trading_date)
 
-    year = trading_date.year
-    if year not in _is_market_holiday._nyse_cache:
-        nyse = mcal.get_calendar('NYSE')
-        schedule = nyse.schedule(
-            start_date=date(year, 1, 1),
-            end_date=date(year, 12, 31)
-        )
-        _is_market_holiday._nyse_cache[year] = set(schedule.index.date)
 
-    trading_days = _is_market_holiday._nyse_cache[year]
-    return trading_date not in trading_days
+def _calendar_masks(timestamps: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized _is_weekend / _is_market_holiday over a column of timestamps.
+
+    Same rules as the per-row helpers: the weekend check uses the stored
+    timestamp's weekday, the holiday check uses the Eastern Time trading date
+    (naive timestamps are treated as UTC) and only applies to weekday rows.
+
+    Args:
+        timestamps: Bar timestamps
+
+    Returns:
+        (weekend_mask, holiday_mask) boolean arrays
+    """
+    ts = pd.DatetimeIndex(pd.to_datetime(timestamps, utc=False))
+    weekend = np.asarray(ts.weekday >= 5)
+
+    utc = ts.tz_localize('UTC') if ts.tz is None else ts
+    et_dates = utc.tz_convert('America/New_York').normalize().tz_localize(None)
+
+    if len(et_dates) == 0:
+        return weekend, np.zeros(0, dtype=bool)
+    session_index = pd.DatetimeIndex(
+        get_trading_calendar().sessions_in_range(et_dates.min().date(), et_dates.max().date())
+    )
+
+    holiday = (et_dates.weekday < 5) & ~et_dates.isin(session_index)
+    return weekend, np.asarray(holiday) & ~weekend
+
+
+# Rows fetched per DB round-trip and validated together in get_next_bar()
+BAR_BATCH_SIZE = 1000
+
+
+def _convert_batch_to_events(db_bars: List[MarketData]) -> List[MarketDataEvent]:
+    """
+    Convert a batch of database rows to MarketDataEvents.
+
+    OHLCV relationships are validated once for the whole batch; valid rows
+    skip the per-event __post_init__ checks. Invalid rows go through the
+    regular constructor so they raise the usual ValueError.
+
+    Args:
+        db_bars: MarketData records in feed order
+
+    Returns:
+        MarketDataEvents in the same order
+    """
+    events = []
+    for db_bar, valid in zip(db_bars, validate_ohlcv_batch(db_bars)):
+        build = MarketDataEvent.from_validated if valid else MarketDataEvent
+        events.append(build(
+            db_bar.symbol,
+            db_bar.timestamp,
+            db_bar.open,
+            db_bar.high,
+            db_bar.low,
+            db_bar.close,
+            db_bar.volume,
+            db_bar.timeframe,
+        ))
+    return events
+
+
+def _trading_date_query(
+    session: Session,
+    symbol: str,
+    timeframe: str,
+    start_date: date,
+    end_date: date,
+):
+    """
+    Query valid bars whose trading_date (ET date) falls in [start_date, end_date].
+
+    Served by idx_market_data_trading_date; no timezone math in SQL.
+    """
+    if isinstance(start_date, datetime):
+        start_date = start_date.date()
+    if isinstance(end_date, datetime):
+        end_date = end_date.date()
+    return (
+        session.query(MarketData)
+        .filter(
+            and_(
+                MarketData.symbol == symbol,
+                MarketData.timeframe == timeframe,
+                MarketData.trading_date >= start_date,
+                MarketData.trading_date <= end_date,
+                MarketData.is_valid == True,  # noqa: E712
+            )
+        )
+        .order_by(MarketData.timestamp.asc())
+    )
 
 
 class DatabaseDataHandler(DataHandler):
@@ -237,10 +320,8 @@ class DatabaseDataHandler(DataHandler):
             )
             # Returns date ~243 trading days before (221 * 1.1)
         """
-        import pandas_market_calendars as mcal
-
-        # Get NYSE calendar
-        nyse = mcal.get_calendar('NYSE')
+        # Shared NYSE session calendar
+        calendar = get_trading_calendar()
 
         # Convert start_date to date for calendar operations
         if isinstance(start_date, datetime):
@@ -255,16 +336,13 @@ class DatabaseDataHandler(DataHandler):
             # Get trading schedule going back far enough
             # Use 2× warmup_with_buffer as calendar days to ensure we have enough history
             search_start = start_dt - timedelta(days=warmup_with_buffer * 2)
-            schedule = nyse.schedule(start_date=search_start, end_date=start_dt - timedelta(days=1))
-
             # Get trading days STRICTLY BEFORE start_date
-            trading_days = schedule.index.date.tolist()
+            trading_days = calendar.sessions_in_range(search_start, start_dt - timedelta(days=1))
 
             if len(trading_days) < warmup_with_buffer:
                 # Need to look back further - extend search
                 search_start = start_dt - timedelta(days=warmup_with_buffer * 3)
-                schedule = nyse.schedule(start_date=search_start, end_date=start_dt - timedelta(days=1))
-                trading_days = schedule.index.date.tolist()
+                trading_days = calendar.sessions_in_range(search_start, start_dt - timedelta(days=1))
 
             if len(trading_days) < warmup_with_buffer:
                 logger.warning(
@@ -350,7 +428,8 @@ class DatabaseDataHandler(DataHandler):
         weekend_skip_count = 0
         holiday_skip_count = 0
 
-        for db_bar in query.yield_per(1000):
+        batch: List[MarketData] = []
+        for db_bar in query.yield_per(BAR_BATCH_SIZE):
             # Filter out weekend dates (data quality issue)
             if _is_weekend(db_bar.timestamp):
                 weekend_skip_count += 1
@@ -361,9 +440,13 @@ class DatabaseDataHandler(DataHandler):
                 holiday_skip_count += 1
                 continue
 
-            event = self._convert_to_event(db_bar)
-            self._latest_bar = event
-            yield event
+            batch.append(db_bar)
+            if len(batch) == BAR_BATCH_SIZE:
+                yield from self._emit_batch(batch)
+                batch = []
+
+        if batch:
+            yield from self._emit_batch(batch)
 
         # Log summary of skipped bars
         if weekend_skip_count > 0 or holiday_skip_count > 0:
@@ -372,6 +455,12 @@ class DatabaseDataHandler(DataHandler):
                 f"bars for {self.symbol} (data quality issue)"
             )
 
+    def _emit_batch(self, db_bars: List[MarketData]) -> Iterator[MarketDataEvent]:
+        """Convert a validated batch and yield it, tracking the latest bar."""
+        for event in _convert_batch_to_events(db_bars):
+            self._latest_bar = event
+            yield event
+
     def get_latest_bar(self, symbol: str) -> Optional[MarketDataEvent]:
         """
         Get the most recent bar for a symbol.
@@ -542,6 +631,63 @@ class DatabaseDataHandler(DataHandler):
         return [self.symbol]
 
 
+class IntradayPriceIndex:
+    """
+    Preloaded intraday bars for one interval, indexed for time-window lookups.
+
+    Per symbol, a sorted int64 array of naive-UTC nanosecond timestamps points
+    into the bar records, so a (symbol, trading date, time-of-day window)
+    lookup is two searchsorted calls instead of a database query.
+
+    Attributes:
+        interval: Bar interval ('5m' or '15m')
+        start: Naive UTC start of the loaded range
+        end: Naive UTC end of the loaded range
+        n_bars: Number of bars loaded
+    """
+
+    def __init__(self, interval: str, start: datetime, end: datetime, records: List[Tuple]):
+        """
+        Build the index.
+
+        Args:
+            interval: Bar interval
+            start: Naive UTC start of the loaded range
+            end: Naive UTC end of the loaded range
+            records: (symbol, timestamp, open, high, low, close, volume) tuples
+        """
+        self.interval = interval
+        self.start = start
+        self.end = end
+        self.n_bars = len(records)
+
+        grouped: Dict[str, List[Tuple]] = {}
+        for record in records:
+            grouped.setdefault(record[0], []).append(record)
+
+        self._timestamps: Dict[str, np.ndarray] = {}
+        self._records: Dict[str, List[Tuple]] = {}
+        for symbol, rows in grouped.items():
+            # Naive timestamps are UTC by convention; aware ones are converted
+            ts = pd.DatetimeIndex(pd.to_datetime([r[1] for r in rows], utc=True)).tz_localize(None)
+            order = np.argsort(ts.asi8, kind='stable')
+            self._timestamps[symbol] = ts.asi8[order]
+            self._records[symbol] = [rows[i] for i in order]
+
+    def covers(self, start: datetime, end: datetime) -> bool:
+        """Whether the naive UTC window [start, end] lies inside the loaded range."""
+        return self.start <= start and end <= self.end
+
+    def window(self, symbol: str, start: datetime, end: datetime) -> List[Tuple]:
+        """Records for symbol with naive UTC timestamp in [start, end], oldest first."""
+        timestamps = self._timestamps.get(symbol)
+        if timestamps is None:
+            return []
+        lo = np.searchsorted(timestamps, pd.Timestamp(start).value, side='left')
+        hi = np.searchsorted(timestamps, pd.Timestamp(end).value, side='right')
+        return self._records[symbol][lo:hi]
+
+
 class MultiSymbolDataHandler(DataHandler):
     """
     Reads historical market data for multiple symbols from database.
@@ -566,6 +712,7 @@ class MultiSymbolDataHandler(DataHandler):
         start_date: datetime,
         end_date: datetime,
         warmup_bars: int = 0,
+        bulk_load: bool = False,
     ):
         """
         Initialize multi-symbol database data handler.
@@ -577,6 +724,10 @@ class MultiSymbolDataHandler(DataHandler):
             start_date: Start of TRADING period
             end_date: End of trading period
             warmup_bars: Number of bars to fetch BEFORE start_date for indicator warmup
+            bulk_load: Load all symbols with one Core select into memory up front
+                       (no ORM hydration, vectorized calendar filtering). Bars are
+                       identical to the streaming path; repeated get_next_bar()
+                       calls replay the loaded frame without re-querying.
 
         Notes:
             - If warmup_bars > 0, fetches data from approximately (start_date - warmup_bars trading days)
@@ -629,10 +780,21 @@ class MultiSymbolDataHandler(DataHandler):
             symbol: None for symbol in symbols
         }
 
+        # Preloaded intraday bars per interval (execution timing lookups)
+        self._intraday_index: Dict[str, IntradayPriceIndex] = {}
+
+        # Bulk mode: one query for all symbols, counts come from the loaded frame
+        self.bulk_load = bulk_load
+        self._bulk_frame: Optional[pd.DataFrame] = None
+        self._bulk_skips: Dict[str, int] = {'weekend': 0, 'holiday': 0}
+        raw_counts: Dict[str, int] = {}
+        if bulk_load:
+            raw_counts = self._load_bulk_frame()
+
         # Validate data exists for each symbol
         total_bars = 0
         for symbol in symbols:
-            count = self._get_bar_count(symbol)
+            count = raw_counts.get(symbol, 0) if bulk_load else self._get_bar_count(symbol)
             total_bars += count
             logger.info(
                 f"MultiSymbolDataHandler: {symbol} {timeframe} "
@@ -665,6 +827,123 @@ class MultiSymbolDataHandler(DataHandler):
             .count()
         )
 
+    def _load_bulk_frame(self) -> Dict[str, int]:
+        """
+        Load every bar for all symbols with a single Core select.
+
+        Rows are kept in feed order (timestamp, symbol) with their original
+        Decimal prices; weekend and holiday rows are dropped with vectorized
+        masks. The result is stored in self._bulk_frame.
+
+        Returns:
+            Raw row count per symbol (before calendar filtering), matching
+            _get_bar_count()
+        """
+        table = MarketData.__table__
+        stmt = (
+            select(
+                table.c.symbol, table.c.timestamp, table.c.open, table.c.high,
+                table.c.low, table.c.close, table.c.volume, table.c.timeframe,
+            )
+            .where(
+                and_(
+                    table.c.symbol.in_(self.symbols),
+                    table.c.timeframe == self.timeframe,
+                    table.c.timestamp >= self.start_date,
+                    table.c.timestamp <= self.end_date,
+                    table.c.is_valid == True,  # noqa: E712
+                )
+            )
+            .order_by(table.c.timestamp.asc(), table.c.symbol.asc())
+        )
+        columns = ['symbol', 'timestamp', 'open', 'high', 'low', 'close', 'volume', 'timeframe']
+        rows = self.session.execute(stmt).all()
+        # object dtype keeps the driver's datetime/Decimal values exactly as the ORM path yields them
+        frame = pd.DataFrame(
+            {name: pd.Series(values, dtype=object) for name, values in zip(columns, zip(*rows))}
+            if rows else {name: pd.Series(dtype=object) for name in columns}
+        )
+        raw_counts = frame['symbol'].value_counts().to_dict()
+
+        if len(frame) > 0:
+            weekend, holiday = _calendar_masks(frame['timestamp'])
+            self._bulk_skips = {'weekend': int(weekend.sum()), 'holiday': int(holiday.sum())}
+            frame = frame[~(weekend | holiday)].reset_index(drop=True)
+
+        self._bulk_frame = frame
+        logger.info(f"Bulk-loaded {len(frame)} bars for {len(self.symbols)} symbols in one query")
+        return raw_counts
+
+    def _iter_bulk(self) -> Iterator[MarketDataEvent]:
+        """Yield events from the bulk-loaded frame in feed order."""
+        frame = self._bulk_frame
+        for start in range(0, len(frame), BAR_BATCH_SIZE):
+            chunk = frame.iloc[start:start + BAR_BATCH_SIZE]
+            rows = list(chunk.itertuples(index=False))
+            yield from self._emit_batch(rows)
+
+        if self._bulk_skips['weekend'] > 0 or self._bulk_skips['holiday'] > 0:
+            logger.warning(
+                f"Skipped {self._bulk_skips['weekend']} weekend, {self._bulk_skips['holiday']} "
+                f"holiday bars across symbols (data quality issue)"
+            )
+
+    def get_aligned_prices(self, field: str = 'close') -> pd.DataFrame:
+        """
+        Pivot one price field into a timestamp × symbol float64 panel.
+
+        Requires bulk_load=True. Missing bars (symbol not trading at that
+        timestamp) are NaN.
+
+        Args:
+            field: One of 'open', 'high', 'low', 'close', 'volume'
+
+        Returns:
+            DataFrame indexed by timestamp with one column per symbol
+
+        Raises:
+            ValueError: If the handler was not created with bulk_load=True
+
+        Example:
+            closes = handler.get_aligned_prices('close')
+            qqq = closes['QQQ'].to_numpy()
+        """
+        if self._bulk_frame is None:
+            raise ValueError("get_aligned_prices() requires bulk_load=True")
+        if field not in ('open', 'high', 'low', 'close', 'volume'):
+            raise ValueError(f"Unknown bar field '{field}'")
+
+        frame = self._bulk_frame
+        panel = pd.DataFrame({
+            'timestamp': frame['timestamp'],
+            'symbol': frame['symbol'],
+            field: frame[field].to_numpy(dtype=np.float64),
+        }).pivot(index='timestamp', columns='symbol', values=field)
+        return panel.reindex(columns=[s for s in self.symbols if s in panel.columns])
+
+    def get_bar_frames(self) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Split the bulk-loaded frame into per-symbol OHLCV frames.
+
+        Rows are exactly the bars get_next_bar() yields, so callers get the
+        whole stream without iterating it.
+
+        Returns:
+            symbol -> DataFrame indexed by timestamp with float64 OHLCV
+            columns, or None if the handler was not created with bulk_load=True
+        """
+        if self._bulk_frame is None:
+            return None
+
+        frames = {}
+        for symbol, group in self._bulk_frame.groupby('symbol', sort=False):
+            frames[symbol] = pd.DataFrame(
+                {field: group[field].to_numpy(dtype=np.float64)
+                 for field in ('open', 'high', 'low', 'close', 'volume')},
+                index=pd.Index(list(group['timestamp']), name='timestamp'),
+            )
+        return frames
+
     def _calculate_warmup_start_date(self, start_date: datetime, warmup_bars: int) -> datetime:
         """
         Calculate start date to fetch warmup bars using NYSE market calendar.
@@ -694,10 +973,8 @@ class MultiSymbolDataHandler(DataHandler):
             - 10% buffer: ~197 QQQ bars (deficit → 30 trading days late)
             - 50% buffer: ~296 QQQ bars (surplus → starts on time)
         """
-        import pandas_market_calendars as mcal
-
-        # Get NYSE calendar
-        nyse = mcal.get_calendar('NYSE')
+        # Shared NYSE session calendar
+        calendar = get_trading_calendar()
 
         # Convert start_date to date for calendar operations
         if isinstance(start_date, datetime):
@@ -726,16 +1003,13 @@ class MultiSymbolDataHandler(DataHandler):
             # Get trading schedule going back far enough
             # Use 2× warmup_with_buffer as calendar days to ensure we have enough history
             search_start = start_dt - timedelta(days=warmup_with_buffer * 2)
-            schedule = nyse.schedule(start_date=search_start, end_date=start_dt - timedelta(days=1))
-
             # Get trading days STRICTLY BEFORE start_date
-            trading_days = schedule.index.date.tolist()
+            trading_days = calendar.sessions_in_range(search_start, start_dt - timedelta(days=1))
 
             if len(trading_days) < warmup_with_buffer:
                 # Need to look back further - extend search
                 search_start = start_dt - timedelta(days=warmup_with_buffer * 3)
-                schedule = nyse.schedule(start_date=search_start, end_date=start_dt - timedelta(days=1))
-                trading_days = schedule.index.date.tolist()
+                trading_days = calendar.sessions_in_range(search_start, start_dt - timedelta(days=1))
 
             if len(trading_days) < warmup_with_buffer:
                 logger.warning(
@@ -805,6 +1079,10 @@ class MultiSymbolDataHandler(DataHandler):
             for bar in data_handler.get_next_bar():
                 strategy.on_bar(bar)  # Will receive bars from all symbols
         """
+        if self.bulk_load:
+            yield from self._iter_bulk()
+            return
+
         # Query bars for ALL symbols in chronological order
         # CRITICAL: Order by timestamp first, then symbol for deterministic ordering
         query = (
@@ -829,7 +1107,8 @@ class MultiSymbolDataHandler(DataHandler):
         weekend_skip_counts = {symbol: 0 for symbol in self.symbols}
         holiday_skip_counts = {symbol: 0 for symbol in self.symbols}
 
-        for db_bar in query.yield_per(1000):
+        batch: List[MarketData] = []
+        for db_bar in query.yield_per(BAR_BATCH_SIZE):
             # Filter out weekend dates (data quality issue)
             if _is_weekend(db_bar.timestamp):
                 weekend_skip_counts[db_bar.symbol] += 1
@@ -840,9 +1119,13 @@ class MultiSymbolDataHandler(DataHandler):
                 holiday_skip_counts[db_bar.symbol] += 1
                 continue
 
-            event = self._convert_to_event(db_bar)
-            self._latest_bars[event.symbol] = event
-            yield event
+            batch.append(db_bar)
+            if len(batch) == BAR_BATCH_SIZE:
+                yield from self._emit_batch(batch)
+                batch = []
+
+        if batch:
+            yield from self._emit_batch(batch)
 
         # Log summary of skipped bars
         total_weekend = sum(weekend_skip_counts.values())
@@ -853,6 +1136,12 @@ class MultiSymbolDataHandler(DataHandler):
                 f"across symbols (data quality issue)"
             )
 
+    def _emit_batch(self, db_bars: List[MarketData]) -> Iterator[MarketDataEvent]:
+        """Convert a validated batch and yield it, tracking the latest bar per symbol."""
+        for event in _convert_batch_to_events(db_bars):
+            self._latest_bars[event.symbol] = event
+            yield event
+
     def get_latest_bar(self, symbol: str) -> Optional[MarketDataEvent]:
         """
         Get the most recent bar for a symbol.
@@ -1103,6 +1392,20 @@ class MultiSymbolDataHandler(DataHandler):
         start_datetime_utc_naive = start_datetime_utc.replace(tzinfo=None)
         end_datetime_utc_naive = end_datetime_utc.replace(tzinfo=None)
 
+        # Preloaded index: array lookup, no query
+        index = self._intraday_index.get(interval)
+        if index is not None and index.covers(start_datetime_utc_naive, end_datetime_utc_naive):
+            return [
+                MarketDataEvent(*record, timeframe=interval)
+                for record in index.window(symbol, start_datetime_utc_naive, end_datetime_utc_naive)
+            ]
+
+        if self.session is None:
+            raise ValueError(
+                f"{type(self).__name__} needs a database session for intraday bars "
+                f"outside the preloaded range ({symbol} {interval} {date.date()})"
+            )
+
         logger.debug(
             f"Fetching {symbol} {interval} bars for {date.date()} "
             f"ET {start_time}-{end_time} "
@@ -1132,9 +1435,95 @@ class MultiSymbolDataHandler(DataHandler):
                 f"between {start_time} and {end_time} ET"
             )
         else:
-            logger.info(
+            logger.debug(
                 f"Retrieved {len(bars)} {interval} bars for {symbol} "
                 f"on {date.date()} ET {start_time}-{end_time}"
             )
 
         return bars
+
+    def preload_intraday(
+        self,
+        interval: str = '15m',
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> int:
+        """
+        Bulk-load intraday bars so time-window lookups skip the database.
+
+        Loads every bar of `interval` for the handler's symbols over the ET
+        trading dates start_date..end_date with one query and indexes them.
+        get_intraday_bars_for_time_window() then serves any window inside
+        that range from memory (same events as the query path); windows
+        outside it still query the database. A later call for the same
+        interval replaces the index.
+
+        Args:
+            interval: Bar interval ('5m' or '15m')
+            start_date: First trading date to load (default: handler start, incl. warmup)
+            end_date: Last trading date to load (default: handler end)
+
+        Returns:
+            Number of bars loaded
+
+        Raises:
+            ValueError: If interval is not '5m' or '15m'
+
+        Example:
+            handler.preload_intraday('15m')
+            handler.preload_intraday('5m', start_date=end, end_date=end)
+        """
+        from zoneinfo import ZoneInfo
+
+        if interval not in ['5m', '15m']:
+            raise ValueError(f"Interval must be '5m' or '15m', got: {interval}")
+
+        first_day = (start_date or self.start_date).date()
+        last_day = (end_date or self.end_date).date()
+
+        # Whole ET trading days, as naive UTC bounds
+        et_tz = ZoneInfo('America/New_York')
+        utc = ZoneInfo('UTC')
+        start = datetime.combine(first_day, datetime.min.time(), tzinfo=et_tz)
+        end = datetime.combine(last_day + timedelta(days=1), datetime.min.time(), tzinfo=et_tz)
+        start = start.astimezone(utc).replace(tzinfo=None)
+        end = end.astimezone(utc).replace(tzinfo=None) - timedelta(microseconds=1)
+
+        records = self._query_intraday_records(interval, start, end)
+        self._intraday_index[interval] = IntradayPriceIndex(interval, start, end, records)
+        logger.info(
+            f"Preloaded {len(records)} {interval} bars for {len(self.symbols)} symbols "
+            f"({first_day} to {last_day})"
+        )
+        return len(records)
+
+    def _query_intraday_records(self, interval: str, start: datetime, end: datetime) -> List[Tuple]:
+        """
+        Load intraday bar records for all handler symbols in [start, end].
+
+        Args:
+            interval: Bar interval
+            start: Naive UTC start (inclusive)
+            end: Naive UTC end (inclusive)
+
+        Returns:
+            (symbol, timestamp, open, high, low, close, volume) tuples
+        """
+        table = MarketData.__table__
+        stmt = (
+            select(
+                table.c.symbol, table.c.timestamp, table.c.open, table.c.high,
+                table.c.low, table.c.close, table.c.volume,
+            )
+            .where(
+                and_(
+                    table.c.symbol.in_(self.symbols),
+                    table.c.timeframe == interval,
+                    table.c.timestamp >= start,
+                    table.c.timestamp <= end,
+                    table.c.is_valid == True,  # noqa: E712
+                )
+            )
+            .order_by(table.c.timestamp.asc(), table.c.symbol.asc())
+        )
+        return [tuple(row) for row in self.session.execute(stmt)]
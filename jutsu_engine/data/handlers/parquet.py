@@ -0,0 +1,104 @@
+"""
+Data handler that reads bars from a partitioned Parquet market data store.
+
+Research workers replay the same history as MultiSymbolDataHandler without a
+database connection: the handler loads only the year partitions covering
+the run (including warmup) from a ParquetMarketDataStore into an in-process
+MarketDataCache and replays it through SharedMemoryDataHandler. Emitted
+events are identical to the database path (same order, Decimal prices,
+weekend/holiday rows skipped).
+
+Example:
+    from jutsu_engine.data.handlers.parquet import ParquetDataHandler
+
+    handler = ParquetDataHandler(
+        store='data/parquet',
+        symbols=['QQQ', 'TQQQ'],
+        timeframe='5m',
+        start_date=datetime(2015, 1, 1),
+        end_date=datetime(2024, 12, 31),
+        warmup_bars=200,
+    )
+"""
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from sqlalchemy.orm import Session
+
+from jutsu_engine.data.handlers.shared_memory import SharedMemoryDataHandler, _end_of_day
+from jutsu_engine.data.parquet_store import ParquetMarketDataStore
+
+
+class ParquetDataHandler(SharedMemoryDataHandler):
+    """
+    Multi-symbol handler backed by a ParquetMarketDataStore.
+
+    Attributes:
+        store: ParquetMarketDataStore the bars were loaded from
+        cache: In-process MarketDataCache holding the loaded range
+        symbols: List of stock ticker symbols
+        timeframe: Bar timeframe
+        start_date: Start of data range (including warmup)
+        end_date: End of data range
+    """
+
+    def __init__(
+        self,
+        store: Union[ParquetMarketDataStore, str, Path],
+        symbols: List[str],
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        warmup_bars: int = 0,
+        tz_aware: bool = True,
+        session: Optional[Session] = None,
+    ):
+        """
+        Initialize handler over a Parquet store.
+
+        Args:
+            store: ParquetMarketDataStore or its root directory
+            symbols: Stock ticker symbols to replay
+            timeframe: Bar timeframe
+            start_date: Start of TRADING period
+            end_date: End of trading period
+            warmup_bars: Number of bars to replay BEFORE start_date for indicator warmup
+            tz_aware: Emit UTC-aware timestamps (PostgreSQL behaviour);
+                      False emits naive UTC like SQLite
+            session: Optional session, only used for intraday window lookups
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not isinstance(store, ParquetMarketDataStore):
+            store = ParquetMarketDataStore(store)
+        self.store = store
+
+        naive_start = start_date.replace(tzinfo=None) if start_date.tzinfo else start_date
+        naive_end = end_date.replace(tzinfo=None) if end_date.tzinfo else end_date
+
+        # Same warmup extension SharedMemoryDataHandler applies, so the cache covers it
+        self.symbols = symbols
+        load_start = (
+            self._calculate_warmup_start_date(naive_start, warmup_bars)
+            if warmup_bars > 0 else naive_start
+        )
+        cache = store.load_cache(
+            symbols, timeframe, load_start, _end_of_day(naive_end), tz_aware=tz_aware,
+        )
+
+        super().__init__(
+            cache=cache,
+            symbols=symbols,
+            timeframe=timeframe,
+            start_date=start_date,
+            end_date=end_date,
+            warmup_bars=warmup_bars,
+            session=session,
+        )
+
+    def _query_intraday_records(self, interval: str, start: datetime, end: datetime) -> List[Tuple]:
+        """Load intraday bar records for preload_intraday() from the store."""
+        cache = self.store.load_cache(self.symbols, interval, start, end, tz_aware=self.cache.tz_aware)
+        return cache.rows_to_records(cache.select_rows(self.symbols))
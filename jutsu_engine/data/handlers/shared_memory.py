@@ -0,0 +1,269 @@
+"""
+Data handler that serves bars from a MarketDataCache.
+
+Drop-in replacement for MultiSymbolDataHandler (and DatabaseDataHandler for
+single-symbol runs) inside parallel backtest workers: bars are read from the
+shared-memory panel published by the parent, so no per-run database queries
+are issued. Emitted events are identical to the database path (same order,
+Decimal prices, weekend/holiday rows skipped).
+
+Example:
+    from jutsu_engine.data.market_data_cache import PRICE_SCALE, MarketDataCache
+    from jutsu_engine.data.handlers.shared_memory import SharedMemoryDataHandler
+
+    cache = MarketDataCache.attach(handle)
+    handler = SharedMemoryDataHandler(
+        cache=cache,
+        symbols=['QQQ', 'TQQQ'],
+        timeframe='1D',
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 12, 31),
+        warmup_bars=147,
+    )
+"""
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from jutsu_engine.core.events import MarketDataEvent
+from jutsu_engine.data.handlers.database import BAR_BATCH_SIZE, MultiSymbolDataHandler
+from jutsu_engine.data.market_data_cache import PRICE_SCALE, MarketDataCache
+from jutsu_engine.utils.logging_config import get_data_logger
+
+logger = get_data_logger('CACHE')
+
+
+def _end_of_day(end_date: datetime) -> datetime:
+    """Extend a midnight (date-only) end_date to the end of that day."""
+    if end_date.hour == 0 and end_date.minute == 0 and end_date.second == 0:
+        return end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
+    return end_date
+
+
+class SharedMemoryDataHandler(MultiSymbolDataHandler):
+    """
+    Multi-symbol handler backed by a MarketDataCache instead of a session.
+
+    Reuses MultiSymbolDataHandler's warmup calculation and latest-bar
+    tracking; every read comes from the cache. get_bars_lookback() only sees
+    history inside the cached range. Intraday window lookups (execution
+    timing) need a database session unless preload_intraday() covers them.
+
+    Attributes:
+        cache: MarketDataCache the bars are read from
+        symbols: List of stock ticker symbols
+        timeframe: Bar timeframe
+        start_date: Start of data range (including warmup)
+        end_date: End of data range
+    """
+
+    def __init__(
+        self,
+        cache: MarketDataCache,
+        symbols: List[str],
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        warmup_bars: int = 0,
+        session: Optional[Session] = None,
+    ):
+        """
+        Initialize handler over a cached panel.
+
+        Args:
+            cache: Loaded or attached MarketDataCache
+            symbols: Stock ticker symbols to replay
+            timeframe: Bar timeframe (must match the cache)
+            start_date: Start of TRADING period
+            end_date: End of trading period
+            warmup_bars: Number of bars to replay BEFORE start_date for indicator warmup
+            session: Optional session, only used for intraday window lookups
+
+        Raises:
+            ValueError: If the cache does not cover the symbols, timeframe or
+                        date range (including warmup)
+        """
+        # Deliberately not calling MultiSymbolDataHandler.__init__: it queries the DB
+        self.cache = cache
+        self.session = session
+        self.symbols = symbols
+        self.timeframe = timeframe
+        self.warmup_bars = warmup_bars
+        self.bulk_load = False
+        self._bulk_frame = None
+
+        if start_date.tzinfo is not None:
+            start_date = start_date.replace(tzinfo=None)
+        if end_date.tzinfo is not None:
+            end_date = end_date.replace(tzinfo=None)
+        end_date = _end_of_day(end_date)
+
+        if warmup_bars > 0:
+            self.start_date = self._calculate_warmup_start_date(start_date, warmup_bars)
+        else:
+            self.start_date = start_date
+        self.end_date = end_date
+
+        if not cache.covers(symbols, timeframe, self.start_date, self.end_date):
+            raise ValueError(
+                f"MarketDataCache ({cache.timeframe}, {cache.start_date} to {cache.end_date}, "
+                f"{len(cache.symbols)} symbols) does not cover {symbols} {timeframe} "
+                f"from {self.start_date} to {self.end_date}"
+            )
+
+        self._latest_bars: dict[str, Optional[MarketDataEvent]] = {
+            symbol: None for symbol in symbols
+        }
+        self._intraday_index = {}
+        self._rows = cache.select_rows(symbols, self.start_date, self.end_date, calendar_only=True)
+
+        logger.info(
+            f"SharedMemoryDataHandler initialized: {len(symbols)} symbols, "
+            f"{len(self._rows)} bars from cache ({self.start_date.date()} to {end_date.date()})"
+        )
+
+    def _to_events(self, rows: np.ndarray) -> List[MarketDataEvent]:
+        """Rebuild events for cache rows, validating the batch once."""
+        cols = self.cache.columns
+        o, h, l, c = (cols[name][rows] for name in ('open', 'high', 'low', 'close'))
+        valid = (l <= o) & (o <= h) & (l <= c) & (c <= h) & (l > 0) & (cols['volume'][rows] >= 0)
+
+        events = []
+        for record, ok in zip(self.cache.rows_to_records(rows), valid):
+            build = MarketDataEvent.from_validated if ok else MarketDataEvent
+            events.append(build(*record, self.cache.timeframe))
+        return events
+
+    def get_next_bar(self) -> Iterator[MarketDataEvent]:
+        """
+        Yield cached bars in chronological order across all symbols.
+
+        Yields:
+            MarketDataEvent objects, identical to MultiSymbolDataHandler's
+        """
+        for start in range(0, len(self._rows), BAR_BATCH_SIZE):
+            for event in self._to_events(self._rows[start:start + BAR_BATCH_SIZE]):
+                self._latest_bars[event.symbol] = event
+                yield event
+
+        skipped = len(self.cache.select_rows(self.symbols, self.start_date, self.end_date)) - len(self._rows)
+        if skipped > 0:
+            logger.warning(
+                f"Skipped {skipped} weekend/holiday bars across symbols (data quality issue)"
+            )
+
+    def get_bar_frames(self) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Build per-symbol OHLCV frames straight from the cached columns.
+
+        Covers exactly the rows get_next_bar() replays, without rebuilding
+        an event per bar.
+
+        Returns:
+            symbol -> DataFrame indexed by timestamp with float64 OHLCV columns
+        """
+        cols = self.cache.columns
+        codes = cols['symbol'][self._rows]
+        frames = {}
+        for code in pd.unique(codes):
+            rows = self._rows[codes == code]
+            stamps = pd.to_datetime(cols['timestamp'][rows])
+            if self.cache.tz_aware:
+                stamps = stamps.tz_localize('UTC')
+            data = {
+                name: cols[name][rows] / 10 ** PRICE_SCALE
+                for name in ('open', 'high', 'low', 'close')
+            }
+            data['volume'] = cols['volume'][rows].astype(np.float64)
+            frames[self.cache.symbols[code]] = pd.DataFrame(
+                data, index=pd.Index(stamps, name='timestamp')
+            )
+        return frames
+
+    def get_bars(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None,
+        warmup_bars: int = 0
+    ) -> List[MarketDataEvent]:
+        """
+        Get cached bars for a date range for one symbol.
+
+        Same semantics as MultiSymbolDataHandler.get_bars (no calendar
+        filtering, optional warmup extension).
+
+        Args:
+            symbol: Stock ticker symbol
+            start_date: Start of TRADING period
+            end_date: End of trading period
+            limit: Optional max number of bars to return
+            warmup_bars: Number of bars to fetch BEFORE start_date
+
+        Returns:
+            List of MarketDataEvent objects in chronological order
+        """
+        if symbol not in self.symbols:
+            logger.warning(
+                f"Requested symbol {symbol} not in handler symbols {self.symbols}"
+            )
+            return []
+
+        if start_date.tzinfo is not None:
+            start_date = start_date.replace(tzinfo=None)
+        if end_date.tzinfo is not None:
+            end_date = end_date.replace(tzinfo=None)
+        end_date = _end_of_day(end_date)
+
+        query_start = start_date
+        if warmup_bars > 0:
+            query_start = self._calculate_warmup_start_date(start_date, warmup_bars)
+
+        rows = self.cache.select_rows([symbol], query_start, end_date)
+        if limit:
+            rows = rows[:limit]
+        return self._to_events(rows)
+
+    def get_bars_lookback(self, symbol: str, lookback: int) -> List[MarketDataEvent]:
+        """
+        Get last N cached bars for a symbol up to the current position.
+
+        Args:
+            symbol: Stock ticker symbol
+            lookback: Number of bars to retrieve
+
+        Returns:
+            List of MarketDataEvent objects (oldest first)
+        """
+        if symbol not in self.symbols:
+            logger.warning(
+                f"Requested symbol {symbol} not in handler symbols {self.symbols}"
+            )
+            return []
+
+        latest_bar = self._latest_bars.get(symbol)
+        if not latest_bar:
+            return []
+
+        rows = self.cache.select_rows([symbol], end_date=latest_bar.timestamp)
+        return self._to_events(rows[-lookback:]) if lookback > 0 else []
+
+    def get_intraday_bars_for_time_window(self, symbol, date, start_time, end_time, interval='5m'):
+        """
+        Intraday window lookup from the preloaded index or the database session.
+
+        Raises:
+            ValueError: If the handler was created without a session and
+                        nothing was preloaded for interval
+        """
+        if self.session is None and interval not in self._intraday_index:
+            raise ValueError(
+                "SharedMemoryDataHandler needs a database session for intraday bars"
+            )
+        return super().get_intraday_bars_for_time_window(
+            symbol, date, start_time, end_time, interval
+        )
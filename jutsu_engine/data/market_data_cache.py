@@ -0,0 +1,545 @@
+"""
+Shared-memory market data cache for parallel backtest workers.
+
+Grid search, plateau, WFO-stability and DSR campaigns spawn many
+BacktestRunner instances that each re-query the same daily history. A
+MarketDataCache loads a (symbols × timeframe × date range) panel ONCE in the
+parent process and publishes it as a single multiprocessing.shared_memory
+block. Workers attach by name and read the columns as zero-copy NumPy views
+through SharedMemoryDataHandler, so the database is no longer hit per run.
+
+Storage layout (struct-of-arrays, one row per bar, feed order = timestamp,
+symbol — the same order MultiSymbolDataHandler yields):
+    symbol      int64  index into handle.symbols
+    timestamp   int64  nanoseconds since epoch (naive UTC)
+    open/high/low/close  int64  price × 10^6 (exact for Numeric(18, 6))
+    volume      int64
+    calendar_ok bool   False for weekend / NYSE-holiday rows (skipped by
+                       get_next_bar, kept for raw range lookups)
+
+Example:
+    from concurrent.futures import ProcessPoolExecutor
+    from jutsu_engine.data.market_data_cache import shared_market_data, warmup_start_date
+
+    with shared_market_data(['QQQ', 'TQQQ', 'TLT'], '1D', end_date,
+                            start_date=warmup_start_date(start_date)) as pool_kwargs:
+        with ProcessPoolExecutor(max_workers=16, **pool_kwargs) as ex:
+            ...  # BacktestRunner in each worker reads from the shared panel
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_, select
+from sqlalchemy.orm import Session
+
+from jutsu_engine.data.handlers.database import _calendar_masks
+from jutsu_engine.data.models import MarketData
+from jutsu_engine.utils.logging_config import get_data_logger
+
+logger = get_data_logger('CACHE')
+
+# Numeric(18, 6) prices are stored as exact integer micro-units
+PRICE_SCALE = 6
+
+_INT_COLUMNS = ('symbol', 'timestamp', 'open', 'high', 'low', 'close', 'volume')
+_PRICE_COLUMNS = ('open', 'high', 'low', 'close')
+
+# Calendar days loaded before a pool's earliest start_date for strategy warmup
+# (~250 warmup bars plus MultiSymbolDataHandler's 50% buffer). Runs needing
+# more history still work: SharedMemoryDataHandler declines and the DB is read.
+WARMUP_LOOKBACK_DAYS = 550
+
+
+@dataclass(frozen=True)
+class MarketDataCacheHandle:
+    """
+    Picklable reference to a published cache.
+
+    Pass it to worker processes (pool initializer or a BacktestRunner config
+    key) and attach with MarketDataCache.attach().
+
+    Attributes:
+        shm_name: Name of the shared memory block
+        n_rows: Number of bars in the panel
+        symbols: Symbols in the panel (index = symbol code)
+        timeframe: Bar timeframe of every row
+        start_date: Earliest timestamp requested at load (None = all history)
+        end_date: Latest timestamp requested at load
+        tz_aware: Whether the database returned timezone-aware timestamps
+    """
+
+    shm_name: str
+    n_rows: int
+    symbols: Tuple[str, ...]
+    timeframe: str
+    start_date: Optional[datetime]
+    end_date: datetime
+    tz_aware: bool = False
+
+
+def _to_naive(dt: Optional[datetime]) -> Optional[datetime]:
+    """Drop tzinfo the way the DB handlers do (database stores naive UTC)."""
+    if dt is None or dt.tzinfo is None:
+        return dt
+    return dt.replace(tzinfo=None)
+
+
+def warmup_start_date(start_date: date, lookback_days: int = WARMUP_LOOKBACK_DAYS) -> datetime:
+    """
+    First timestamp to load for runs whose trading periods start at start_date.
+
+    Args:
+        start_date: Earliest run start (date or datetime)
+        lookback_days: Calendar days to include before it for warmup
+
+    Returns:
+        Naive (UTC) datetime lookback_days before start_date
+    """
+    if not isinstance(start_date, datetime):
+        start_date = datetime(start_date.year, start_date.month, start_date.day)
+    return _to_naive(start_date) - timedelta(days=lookback_days)
+
+
+def _to_ns(dt: datetime) -> int:
+    """Naive UTC datetime → int64 nanoseconds since epoch."""
+    return pd.Timestamp(_to_naive(dt)).value
+
+
+def _to_micro(price: Any) -> int:
+    """Database price (Decimal, or float on some drivers) → integer micro-units."""
+    if not isinstance(price, Decimal):
+        price = Decimal(str(price))
+    return int(price.scaleb(PRICE_SCALE).to_integral_value())
+
+
+class MarketDataCache:
+    """
+    Columnar OHLCV panel that can live in process memory or in shared memory.
+
+    Build with load() in the parent, publish() to share it, attach() in
+    workers. Columns are read-only NumPy arrays; rows are sorted by
+    (timestamp, symbol).
+
+    Example:
+        cache = MarketDataCache.load(session, ['QQQ', 'TLT'], '1D', end_date=end)
+        handle = cache.publish()
+        ...
+        cache.unlink()
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, np.ndarray],
+        symbols: Sequence[str],
+        timeframe: str,
+        start_date: Optional[datetime],
+        end_date: datetime,
+        tz_aware: bool = False,
+    ):
+        """
+        Wrap already-built columns (use load() or attach() instead).
+
+        Args:
+            columns: Arrays for every name in _INT_COLUMNS plus 'calendar_ok'
+            symbols: Symbol list indexed by the 'symbol' column codes
+            timeframe: Bar timeframe
+            start_date: Earliest timestamp requested at load (None = all history)
+            end_date: Latest timestamp requested at load
+            tz_aware: Rebuild event timestamps as UTC-aware datetimes
+        """
+        self.symbols: Tuple[str, ...] = tuple(symbols)
+        self.timeframe = timeframe
+        self.start_date = _to_naive(start_date)
+        self.end_date = _to_naive(end_date)
+        self.tz_aware = tz_aware
+        self._codes = {symbol: code for code, symbol in enumerate(self.symbols)}
+        self._set_columns(columns)
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._owner = False
+
+    def _set_columns(self, columns: Dict[str, np.ndarray]) -> None:
+        for name, array in columns.items():
+            array.flags.writeable = False
+        self.columns = columns
+        self.n_rows = len(columns['timestamp'])
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def load(
+        cls,
+        session: Session,
+        symbols: Sequence[str],
+        timeframe: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> 'MarketDataCache':
+        """
+        Load a panel from the database with one Core select.
+
+        start_date must reach back far enough to cover every worker's warmup;
+        None loads all available history (cheap for daily bars).
+
+        Args:
+            session: SQLAlchemy session
+            symbols: Symbols to load (duplicates ignored)
+            timeframe: Bar timeframe ('1D', '5m', ...)
+            start_date: First timestamp to load (None = all history)
+            end_date: Last timestamp to load (None = now). A midnight end_date
+                      is extended to the end of that day, like the DB handlers.
+
+        Returns:
+            In-process MarketDataCache (call publish() to share it)
+        """
+        symbols = list(dict.fromkeys(symbols))
+        start_date = _to_naive(start_date)
+        end_date = _to_naive(end_date) or datetime.utcnow()
+        if end_date.hour == 0 and end_date.minute == 0 and end_date.second == 0:
+            end_date = end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+        table = MarketData.__table__
+        conditions = [
+            table.c.symbol.in_(symbols),
+            table.c.timeframe == timeframe,
+            table.c.timestamp <= end_date,
+            table.c.is_valid == True,  # noqa: E712
+        ]
+        if start_date is not None:
+            conditions.append(table.c.timestamp >= start_date)
+        stmt = (
+            select(
+                table.c.symbol, table.c.timestamp, table.c.open, table.c.high,
+                table.c.low, table.c.close, table.c.volume,
+            )
+            .where(and_(*conditions))
+            .order_by(table.c.timestamp.asc(), table.c.symbol.asc())
+        )
+        rows = session.execute(stmt).all()
+
+        codes = {symbol: code for code, symbol in enumerate(symbols)}
+        tz_aware = bool(rows) and rows[0].timestamp.tzinfo is not None
+        if rows:
+            raw_ts = pd.DatetimeIndex(pd.to_datetime([r.timestamp for r in rows], utc=tz_aware))
+            if tz_aware:
+                raw_ts = raw_ts.tz_convert('UTC').tz_localize(None)
+        else:
+            raw_ts = pd.DatetimeIndex([], dtype='datetime64[ns]')
+
+        columns = {
+            'symbol': np.fromiter((codes[r.symbol] for r in rows), dtype=np.int64, count=len(rows)),
+            'timestamp': raw_ts.asi8.astype(np.int64),
+            'volume': np.fromiter((int(r.volume) for r in rows), dtype=np.int64, count=len(rows)),
+        }
+        for name in _PRICE_COLUMNS:
+            columns[name] = np.fromiter(
+                (_to_micro(getattr(r, name)) for r in rows),
+                dtype=np.int64, count=len(rows),
+            )
+        if rows:
+            weekend, holiday = _calendar_masks(pd.Series(raw_ts))
+            columns['calendar_ok'] = ~(weekend | holiday)
+        else:
+            columns['calendar_ok'] = np.zeros(0, dtype=bool)
+
+        cache = cls(columns, symbols, timeframe, start_date, end_date, tz_aware=tz_aware)
+        logger.info(
+            f"MarketDataCache loaded {cache.n_rows} {timeframe} bars for "
+            f"{len(symbols)} symbols ({cache.nbytes / 1e6:.1f} MB)"
+        )
+        return cache
+
+    def publish(self) -> MarketDataCacheHandle:
+        """
+        Copy the panel into a new shared memory block and return its handle.
+
+        The cache becomes the block's owner: call unlink() (or use it as a
+        context manager) once all workers are done. Publishing twice returns
+        the existing handle.
+
+        Returns:
+            Picklable MarketDataCacheHandle for workers
+        """
+        if self._shm is None:
+            size = max(self._block_size(self.n_rows), 1)
+            shm = shared_memory.SharedMemory(create=True, size=size)
+            views = self._views(shm.buf, self.n_rows)
+            for name, view in views.items():
+                view[:] = self.columns[name]
+            self._shm = shm
+            self._owner = True
+            self._set_columns(views)
+            logger.info(f"MarketDataCache published to shared memory '{shm.name}' ({size} bytes)")
+        return self.handle
+
+    @classmethod
+    def attach(cls, handle: MarketDataCacheHandle) -> 'MarketDataCache':
+        """
+        Map a published cache into this process without copying.
+
+        Args:
+            handle: Handle returned by publish() in the parent
+
+        Returns:
+            MarketDataCache whose columns are views onto the shared block
+        """
+        shm = shared_memory.SharedMemory(name=handle.shm_name)
+        cache = cls(
+            cls._views(shm.buf, handle.n_rows),
+            handle.symbols,
+            handle.timeframe,
+            handle.start_date,
+            handle.end_date,
+            tz_aware=handle.tz_aware,
+        )
+        cache._shm = shm
+        return cache
+
+    @property
+    def handle(self) -> MarketDataCacheHandle:
+        """Handle for the published block (raises if not published)."""
+        if self._shm is None:
+            raise ValueError("MarketDataCache is not published; call publish() first")
+        return MarketDataCacheHandle(
+            shm_name=self._shm.name,
+            n_rows=self.n_rows,
+            symbols=self.symbols,
+            timeframe=self.timeframe,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            tz_aware=self.tz_aware,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the column data in bytes."""
+        return self._block_size(self.n_rows)
+
+    @staticmethod
+    def _block_size(n_rows: int) -> int:
+        return n_rows * (8 * len(_INT_COLUMNS) + 1)
+
+    @staticmethod
+    def _views(buf: Any, n_rows: int) -> Dict[str, np.ndarray]:
+        """Slice a raw buffer into the fixed column layout."""
+        views = {}
+        offset = 0
+        for name in _INT_COLUMNS:
+            views[name] = np.ndarray((n_rows,), dtype=np.int64, buffer=buf, offset=offset)
+            offset += 8 * n_rows
+        views['calendar_ok'] = np.ndarray((n_rows,), dtype=np.bool_, buffer=buf, offset=offset)
+        return views
+
+    def close(self) -> None:
+        """Detach from the shared block (views become unusable)."""
+        if self._shm is not None:
+            self.columns = {}
+            self._shm.close()
+
+    def unlink(self) -> None:
+        """Close and destroy the shared block (owner only)."""
+        if self._shm is not None:
+            self.close()
+            if self._owner:
+                self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> 'MarketDataCache':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.unlink()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def covers(
+        self,
+        symbols: Sequence[str],
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> bool:
+        """
+        Check whether a request can be served entirely from this cache.
+
+        Args:
+            symbols: Requested symbols
+            timeframe: Requested timeframe
+            start_date: First timestamp needed (including warmup)
+            end_date: Last timestamp needed
+
+        Returns:
+            True if symbols, timeframe and the date range are all cached
+        """
+        if timeframe != self.timeframe:
+            return False
+        if any(symbol not in self._codes for symbol in symbols):
+            return False
+        if self.start_date is not None and _to_naive(start_date) < self.start_date:
+            return False
+        return _to_naive(end_date) <= self.end_date
+
+    def select_rows(
+        self,
+        symbols: Sequence[str],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        calendar_only: bool = False,
+    ) -> np.ndarray:
+        """
+        Row indices for symbols in [start_date, end_date], in feed order.
+
+        Args:
+            symbols: Symbols to include
+            start_date: Inclusive lower bound (None = first cached row)
+            end_date: Inclusive upper bound (None = last cached row)
+            calendar_only: Drop weekend / NYSE-holiday rows
+
+        Returns:
+            int64 array of row indices
+        """
+        timestamps = self.columns['timestamp']
+        lo = 0 if start_date is None else int(np.searchsorted(timestamps, _to_ns(start_date), 'left'))
+        hi = self.n_rows if end_date is None else int(np.searchsorted(timestamps, _to_ns(end_date), 'right'))
+
+        codes = [self._codes[s] for s in symbols if s in self._codes]
+        mask = np.isin(self.columns['symbol'][lo:hi], codes)
+        if calendar_only:
+            mask &= self.columns['calendar_ok'][lo:hi]
+        return np.flatnonzero(mask) + lo
+
+    def rows_to_records(self, rows: np.ndarray) -> List[Tuple]:
+        """
+        Rebuild (symbol, timestamp, open, high, low, close, volume) tuples.
+
+        Prices come back as Decimal with 6 decimal places and timestamps as
+        datetimes, exactly as the database returns them.
+
+        Args:
+            rows: Row indices from select_rows()
+
+        Returns:
+            List of tuples in the order of rows
+        """
+        cols = self.columns
+        stamps = pd.to_datetime(cols['timestamp'][rows]).to_pydatetime()
+        if self.tz_aware:
+            stamps = [ts.replace(tzinfo=timezone.utc) for ts in stamps]
+        prices = [
+            [Decimal(int(v)).scaleb(-PRICE_SCALE) for v in cols[name][rows]]
+            for name in _PRICE_COLUMNS
+        ]
+        return list(zip(
+            [self.symbols[c] for c in cols['symbol'][rows]],
+            stamps,
+            *prices,
+            [int(v) for v in cols['volume'][rows]],
+        ))
+
+
+# ----------------------------------------------------------------------
+# Worker-process plumbing
+# ----------------------------------------------------------------------
+
+_attached: Dict[str, MarketDataCache] = {}
+_worker_cache: Optional[MarketDataCache] = None
+
+
+def attach_shared_cache(handle: MarketDataCacheHandle) -> MarketDataCache:
+    """
+    Attach to a published cache once per process and remember it.
+
+    Safe to use as a ProcessPoolExecutor initializer: it also becomes the
+    process default returned by get_worker_cache(), which BacktestRunner
+    picks up automatically.
+
+    Args:
+        handle: Handle from MarketDataCache.publish()
+
+    Returns:
+        The attached cache
+    """
+    global _worker_cache
+    cache = _attached.get(handle.shm_name)
+    if cache is None:
+        cache = MarketDataCache.attach(handle)
+        _attached[handle.shm_name] = cache
+    _worker_cache = cache
+    return cache
+
+
+def get_worker_cache() -> Optional[MarketDataCache]:
+    """Cache installed by attach_shared_cache() in this process, if any."""
+    return _worker_cache
+
+
+@contextmanager
+def shared_market_data(
+    symbols: Sequence[str],
+    timeframe: str,
+    end_date: datetime,
+    start_date: Optional[datetime] = None,
+    database_url: Optional[str] = None,
+    enabled: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Load, publish and clean up a cache around a process pool.
+
+    Yields keyword arguments for ProcessPoolExecutor that attach every worker
+    to the panel. QQQ and SPY are always included so BacktestRunner's baseline
+    and beta lookups are served from the cache too. If loading fails (or
+    enabled is False) it yields {} and workers fall back to the database.
+
+    Args:
+        symbols: Symbols the workers backtest
+        timeframe: Bar timeframe
+        end_date: Last timestamp any worker needs
+        start_date: First timestamp any worker needs incl. warmup, usually
+            warmup_start_date(earliest run start) (None = all history)
+        database_url: Database to load from (default: from config)
+        enabled: Set False to skip caching (yields {})
+
+    Yields:
+        {'initializer': attach_shared_cache, 'initargs': (handle,)} or {}
+    """
+    if not enabled:
+        yield {}
+        return
+
+    cache = None
+    try:
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from jutsu_engine.utils.config import get_config
+
+        engine = create_engine(database_url or get_config().database_url)
+        session = sessionmaker(bind=engine)()
+        try:
+            cache = MarketDataCache.load(
+                session, list(symbols) + ['QQQ', 'SPY'], timeframe,
+                start_date=start_date, end_date=end_date,
+            )
+        finally:
+            session.close()
+            engine.dispose()
+        handle = cache.publish()
+    except Exception as e:  # noqa: BLE001 - workers can still read the DB
+        logger.warning(f"Shared market data cache unavailable, workers will query the database: {e}")
+        if cache is not None:
+            cache.unlink()
+        yield {}
+        return
+
+    try:
+        yield {'initializer': attach_shared_cache, 'initargs': (handle,)}
+    finally:
+        cache.unlink()
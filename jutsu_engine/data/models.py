@@ -3,11 +3,13 @@ SQLAlchemy database models for market data storage.
 
 Defines the schema for storing OHLCV data and metadata for incremental updates.
 """
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
 from sqlalchemy import (
     Column,
     Integer,
     String,
+    Date,
     DateTime,
     Numeric,
     BigInteger,
@@ -22,11 +24,37 @@ from sqlalchemy import (
     func,
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 import enum
 
 Base = declarative_base()
 
+MARKET_TZ = ZoneInfo('America/New_York')
+
+
+def trading_date_for(timestamp: datetime) -> date:
+    """
+    Trading date key for a bar timestamp: its calendar date in Eastern Time.
+
+    Same convention as DataSync's daily de-duplication and the exporters'
+    _get_trading_date(). Naive timestamps are treated as UTC.
+
+    Args:
+        timestamp: Bar timestamp
+
+    Returns:
+        ET calendar date
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(MARKET_TZ).date()
+
+
+def _default_trading_date(context):
+    """Column default: derive trading_date from the inserted timestamp."""
+    timestamp = context.get_current_parameters().get('timestamp')
+    return trading_date_for(timestamp) if timestamp is not None else None
+
 
 class UserRole(str, enum.Enum):
     """
@@ -53,8 +81,13 @@ class MarketData(Base):
     Stores individual bars (candles) with source tracking and timestamps.
     Unique constraint prevents duplicate bars.
 
+    trading_date is the ET calendar date of timestamp, persisted at write time
+    (ORM assignment or Core insert default) so date-keyed lookups and
+    duplicate-date checks are index scans instead of per-row timezone math.
+
     Indexes:
         - (symbol, timeframe, timestamp) for fast queries
+        - (symbol, timeframe, trading_date) for date-keyed queries
         - timestamp for date range queries
     """
 
@@ -64,6 +97,7 @@ class MarketData(Base):
     symbol = Column(String(10), nullable=False, index=True)
     timeframe = Column(String(10), nullable=False)  # '1D', '1H', '5m', etc.
     timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
+    trading_date = Column(Date, nullable=True, default=_default_trading_date)  # ET date of timestamp
 
     # OHLCV data - use Numeric for financial precision
     open = Column(Numeric(18, 6), nullable=False)
@@ -81,8 +115,16 @@ class MarketData(Base):
     __table_args__ = (
         UniqueConstraint('symbol', 'timeframe', 'timestamp', name='uix_symbol_tf_ts'),
         Index('idx_market_data_lookup', 'symbol', 'timeframe', 'timestamp'),
+        Index('idx_market_data_trading_date', 'symbol', 'timeframe', 'trading_date'),
     )
 
+    @validates('timestamp')
+    def _sync_trading_date(self, key, value):
+        """Keep trading_date in step with timestamp on ORM assignment."""
+        if value is not None:
+            self.trading_date = trading_date_for(value)
+        return value
+
     def __repr__(self):
         return (
             f"<MarketData(symbol={self.symbol}, timeframe={self.timeframe}, "
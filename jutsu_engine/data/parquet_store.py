@@ -0,0 +1,436 @@
+"""
+Partitioned Parquet market data store.
+
+A file-based mirror of the market_data table that research workers can read
+without a database connection. Bars are partitioned by symbol, timeframe and
+UTC year (hive-style directory names, so pyarrow.dataset / DuckDB / Polars can
+scan the tree directly):
+
+    {root}/symbol=QQQ/timeframe=1D/year=2024/data.parquet
+    {root}/symbol=%24VIX/timeframe=1D/year=2024/data.parquet   ($VIX, URI-encoded)
+
+Each file holds one symbol/timeframe/year sorted by timestamp:
+    timestamp  timestamp[us, UTC]
+    open/high/low/close  float64 (Numeric(18, 6) values round-trip exactly
+                         through the micro-unit conversion in load_cache())
+    volume     int64
+
+Reads open only the year files overlapping the requested range (partition
+pruning), push the timestamp range down to row-group statistics and
+memory-map the files. load_cache() returns a MarketDataCache panel, which
+ParquetDataHandler replays exactly like the database handlers. Requires
+pyarrow.
+
+Example:
+    from jutsu_engine.data.parquet_store import ParquetMarketDataStore
+
+    store = ParquetMarketDataStore('data/parquet')
+    store.export_from_database(session)                  # full export
+    store.sync_from_database(session, 'QQQ', '5m',       # incremental tail
+                             start_date=datetime(2025, 1, 1))
+
+    cache = store.load_cache(['QQQ', 'TQQQ'], '5m',
+                             datetime(2015, 1, 1), datetime(2024, 12, 31))
+"""
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import quote, unquote
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_, select
+from sqlalchemy.orm import Session
+
+from jutsu_engine.data.handlers.database import _calendar_masks
+from jutsu_engine.data.handlers.shared_memory import _end_of_day
+from jutsu_engine.data.market_data_cache import PRICE_SCALE, MarketDataCache, _to_naive
+from jutsu_engine.data.models import MarketData
+from jutsu_engine.utils.logging_config import get_data_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = get_data_logger('PARQUET')
+
+# Rows per Parquet row group; small enough for useful min/max pruning on 5m data
+ROW_GROUP_SIZE = 50_000
+
+_PRICE_COLUMNS = ('open', 'high', 'low', 'close')
+_FILE_NAME = 'data.parquet'
+
+
+def _schema():
+    return pa.schema([
+        pa.field('timestamp', pa.timestamp('us', tz='UTC')),
+        pa.field('open', pa.float64()),
+        pa.field('high', pa.float64()),
+        pa.field('low', pa.float64()),
+        pa.field('close', pa.float64()),
+        pa.field('volume', pa.int64()),
+    ])
+
+
+def _to_utc(dt: datetime) -> pd.Timestamp:
+    """Naive timestamps are UTC by convention (database stores naive UTC)."""
+    ts = pd.Timestamp(dt)
+    return ts.tz_localize('UTC') if ts.tzinfo is None else ts.tz_convert('UTC')
+
+
+class ParquetMarketDataStore:
+    """
+    Symbol/timeframe/year partitioned Parquet copy of market_data.
+
+    Writes replace whole year files atomically (write to a temp file, then
+    os.replace), so readers never see a partially written partition.
+
+    Attributes:
+        root: Store root directory
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        """
+        Initialize store (the directory is created on first write).
+
+        Args:
+            root: Store root directory
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError(
+                "Parquet market data store requires pyarrow. Install with: pip install pyarrow"
+            )
+        self.root = Path(root)
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+
+    def _series_dir(self, symbol: str, timeframe: str) -> Path:
+        return self.root / f"symbol={quote(symbol, safe='')}" / f"timeframe={quote(timeframe, safe='')}"
+
+    def _year_path(self, symbol: str, timeframe: str, year: int) -> Path:
+        return self._series_dir(symbol, timeframe) / f"year={year}" / _FILE_NAME
+
+    def years(self, symbol: str, timeframe: str) -> List[int]:
+        """Years with a partition file for symbol/timeframe, ascending."""
+        series = self._series_dir(symbol, timeframe)
+        if not series.is_dir():
+            return []
+        return sorted(
+            int(part.name.split('=', 1)[1])
+            for part in series.iterdir()
+            if part.name.startswith('year=') and (part / _FILE_NAME).exists()
+        )
+
+    def list_series(self) -> List[Tuple[str, str]]:
+        """All (symbol, timeframe) pairs in the store."""
+        if not self.root.is_dir():
+            return []
+        series = []
+        for symbol_dir in sorted(self.root.glob('symbol=*')):
+            for timeframe_dir in sorted(symbol_dir.glob('timeframe=*')):
+                series.append((
+                    unquote(symbol_dir.name.split('=', 1)[1]),
+                    unquote(timeframe_dir.name.split('=', 1)[1]),
+                ))
+        return series
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _read_year(self, symbol: str, timeframe: str, year: int) -> Optional[pd.DataFrame]:
+        path = self._year_path(symbol, timeframe, year)
+        if not path.exists():
+            return None
+        return pq.read_table(path, memory_map=True).to_pandas()
+
+    def _write_year(self, symbol: str, timeframe: str, year: int, frame: pd.DataFrame) -> None:
+        path = self._year_path(symbol, timeframe, year)
+        if frame.empty:
+            if path.exists():
+                path.unlink()
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(frame, schema=_schema(), preserve_index=False)
+        tmp = path.with_suffix(f'.tmp{os.getpid()}')
+        pq.write_table(table, tmp, row_group_size=ROW_GROUP_SIZE)
+        os.replace(tmp, path)
+
+    def write_bars(
+        self,
+        symbol: str,
+        timeframe: str,
+        bars: Union[pd.DataFrame, Sequence[Dict[str, Any]]],
+        replace_from: Optional[datetime] = None,
+        replace_all: bool = False,
+    ) -> int:
+        """
+        Upsert bars into the year partitions for symbol/timeframe.
+
+        Bars with a timestamp already in the store overwrite it. With
+        replace_from, every stored bar at or after that timestamp is dropped
+        first (used to mirror a re-read database range exactly); replace_all
+        drops the whole series.
+
+        Args:
+            symbol: Stock ticker symbol
+            timeframe: Bar timeframe
+            bars: DataFrame or dicts with timestamp, open, high, low, close, volume
+            replace_from: Drop stored bars at/after this timestamp before merging
+            replace_all: Drop every stored bar for symbol/timeframe before merging
+
+        Returns:
+            Number of bars written from `bars`
+        """
+        frame = pd.DataFrame(bars, columns=['timestamp', *_PRICE_COLUMNS, 'volume'])
+        if not frame.empty:
+            frame['timestamp'] = pd.to_datetime(frame['timestamp'], utc=True)
+            for name in _PRICE_COLUMNS:
+                frame[name] = frame[name].astype(float)
+            frame['volume'] = frame['volume'].astype('int64')
+
+        cutoff = None
+        if replace_all:
+            cutoff = pd.Timestamp.min.tz_localize('UTC')
+        elif replace_from is not None:
+            cutoff = _to_utc(replace_from)
+
+        new_by_year = {year: part for year, part in frame.groupby(frame['timestamp'].dt.year)} if not frame.empty else {}
+        touched = set(new_by_year)
+        if cutoff is not None:
+            touched |= {year for year in self.years(symbol, timeframe) if year >= cutoff.year}
+
+        for year in sorted(touched):
+            existing = self._read_year(symbol, timeframe, year)
+            parts = []
+            if existing is not None:
+                if cutoff is not None:
+                    existing = existing[existing['timestamp'] < cutoff]
+                parts.append(existing)
+            if year in new_by_year:
+                parts.append(new_by_year[year])
+            merged = pd.concat(parts, ignore_index=True) if parts else frame.iloc[0:0]
+            merged = (
+                merged.drop_duplicates('timestamp', keep='last')
+                .sort_values('timestamp', kind='stable')
+                .reset_index(drop=True)
+            )
+            self._write_year(symbol, timeframe, int(year), merged)
+
+        return len(frame)
+
+    def sync_from_database(
+        self,
+        session: Session,
+        symbol: str,
+        timeframe: str,
+        start_date: Optional[datetime] = None,
+    ) -> int:
+        """
+        Mirror market_data rows for symbol/timeframe into the store.
+
+        Re-reads valid database rows at/after start_date (all rows if None)
+        and replaces the stored bars in that range, so updates and deletions
+        in the database carry over too.
+
+        Args:
+            session: SQLAlchemy session
+            symbol: Stock ticker symbol
+            timeframe: Bar timeframe
+            start_date: First timestamp to refresh (None = full rewrite)
+
+        Returns:
+            Number of bars written
+        """
+        table = MarketData.__table__
+        conditions = [
+            table.c.symbol == symbol,
+            table.c.timeframe == timeframe,
+            table.c.is_valid == True,  # noqa: E712
+        ]
+        if start_date is not None:
+            conditions.append(table.c.timestamp >= _to_naive(_to_utc(start_date).to_pydatetime()))
+        stmt = (
+            select(
+                table.c.timestamp, table.c.open, table.c.high,
+                table.c.low, table.c.close, table.c.volume,
+            )
+            .where(and_(*conditions))
+            .order_by(table.c.timestamp.asc())
+        )
+        rows = session.execute(stmt).all()
+        frame = pd.DataFrame(rows, columns=['timestamp', *_PRICE_COLUMNS, 'volume'])
+
+        written = self.write_bars(
+            symbol, timeframe, frame,
+            replace_from=start_date,
+            replace_all=start_date is None,
+        )
+        logger.debug(f"Parquet mirror: {symbol} {timeframe} {written} bars from {start_date or 'start'}")
+        return written
+
+    def export_from_database(
+        self,
+        session: Session,
+        symbols: Optional[Sequence[str]] = None,
+        timeframes: Optional[Sequence[str]] = None,
+    ) -> Dict[str, int]:
+        """
+        Export market_data into the store (full rewrite per symbol/timeframe).
+
+        Args:
+            session: SQLAlchemy session
+            symbols: Symbols to export (default: all)
+            timeframes: Timeframes to export (default: all)
+
+        Returns:
+            Dict mapping 'SYMBOL:TIMEFRAME' to bars written
+        """
+        table = MarketData.__table__
+        stmt = select(table.c.symbol, table.c.timeframe).distinct()
+        if symbols:
+            stmt = stmt.where(table.c.symbol.in_(list(symbols)))
+        if timeframes:
+            stmt = stmt.where(table.c.timeframe.in_(list(timeframes)))
+
+        exported = {}
+        for symbol, timeframe in sorted(session.execute(stmt).all()):
+            exported[f"{symbol}:{timeframe}"] = self.sync_from_database(session, symbol, timeframe)
+        logger.info(
+            f"Exported {sum(exported.values())} bars ({len(exported)} series) to {self.root}"
+        )
+        return exported
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def read_table(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> 'pa.Table':
+        """
+        Read bars for symbol/timeframe in [start_date, end_date] as an Arrow table.
+
+        Only year files overlapping the range are opened; the timestamp
+        range is pushed down to row-group statistics; files are memory-mapped.
+
+        Args:
+            symbol: Stock ticker symbol
+            timeframe: Bar timeframe
+            start_date: Inclusive lower bound (None = first stored bar)
+            end_date: Inclusive upper bound (None = last stored bar)
+
+        Returns:
+            pyarrow.Table sorted by timestamp (empty if nothing stored)
+        """
+        start = None if start_date is None else _to_utc(start_date)
+        end = None if end_date is None else _to_utc(end_date)
+
+        years = [
+            year for year in self.years(symbol, timeframe)
+            if (start is None or year >= start.year) and (end is None or year <= end.year)
+        ]
+        if not years:
+            return _schema().empty_table()
+
+        ts_type = pa.timestamp('us', tz='UTC')
+        condition = None
+        if start is not None:
+            condition = pc.field('timestamp') >= pa.scalar(start.to_pydatetime(), ts_type)
+        if end is not None:
+            upper = pc.field('timestamp') <= pa.scalar(end.to_pydatetime(), ts_type)
+            condition = upper if condition is None else condition & upper
+
+        tables = [
+            pq.read_table(
+                self._year_path(symbol, timeframe, year),
+                filters=condition,
+                memory_map=True,
+            )
+            for year in years
+        ]
+        return pa.concat_tables(tables)
+
+    def load_cache(
+        self,
+        symbols: Sequence[str],
+        timeframe: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        tz_aware: bool = True,
+    ) -> MarketDataCache:
+        """
+        Load a (symbols × timeframe × range) panel as a MarketDataCache.
+
+        Rows come out in the same (timestamp, symbol) feed order and with the
+        same weekend/holiday flags as MarketDataCache.load() from the database.
+
+        Args:
+            symbols: Symbols to load (duplicates ignored)
+            timeframe: Bar timeframe
+            start_date: First timestamp to load (None = all history)
+            end_date: Last timestamp to load (None = now); a midnight
+                      end_date is extended to the end of that day
+            tz_aware: Rebuild event timestamps as UTC-aware datetimes
+                      (False gives naive UTC, like SQLite)
+
+        Returns:
+            In-process MarketDataCache (publish() it to share with workers)
+        """
+        symbols = list(dict.fromkeys(symbols))
+        start_date = _to_naive(start_date)
+        end_date = _end_of_day(_to_naive(end_date) or datetime.utcnow())
+
+        timestamps, codes, volumes = [], [], []
+        prices = {name: [] for name in _PRICE_COLUMNS}
+        for code, symbol in enumerate(symbols):
+            table = self.read_table(symbol, timeframe, start_date, end_date)
+            ts = table.column('timestamp').cast(pa.timestamp('ns', tz='UTC')).to_numpy()
+            timestamps.append(ts.view(np.int64))
+            codes.append(np.full(len(ts), code, dtype=np.int64))
+            volumes.append(table.column('volume').to_numpy().astype(np.int64))
+            for name in _PRICE_COLUMNS:
+                prices[name].append(table.column(name).to_numpy())
+
+        timestamp = np.concatenate(timestamps) if timestamps else np.zeros(0, dtype=np.int64)
+        symbol_codes = np.concatenate(codes) if codes else np.zeros(0, dtype=np.int64)
+
+        # Feed order = (timestamp, symbol name), as the database ORDER BY
+        name_rank = np.argsort(np.argsort(symbols, kind='stable'))
+        order = np.lexsort((name_rank[symbol_codes], timestamp)) if len(timestamp) else timestamp
+
+        scale = 10 ** PRICE_SCALE
+        columns = {
+            'symbol': symbol_codes[order],
+            'timestamp': timestamp[order],
+            'volume': (np.concatenate(volumes) if volumes else np.zeros(0, dtype=np.int64))[order],
+        }
+        for name in _PRICE_COLUMNS:
+            values = np.concatenate(prices[name]) if prices[name] else np.zeros(0)
+            columns[name] = np.rint(values[order] * scale).astype(np.int64)
+        if len(timestamp):
+            weekend, holiday = _calendar_masks(pd.Series(pd.to_datetime(columns['timestamp'])))
+            columns['calendar_ok'] = ~(weekend | holiday)
+        else:
+            columns['calendar_ok'] = np.zeros(0, dtype=bool)
+
+        cache = MarketDataCache(columns, symbols, timeframe, start_date, end_date, tz_aware=tz_aware)
+        logger.info(
+            f"Parquet store loaded {cache.n_rows} {timeframe} bars for "
+            f"{len(symbols)} symbols ({cache.nbytes / 1e6:.1f} MB)"
+        )
+        return cache
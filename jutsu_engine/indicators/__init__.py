@@ -14,6 +14,10 @@ Stateless Indicators (technical.py):
 
 Stateful Indicators (kalman.py):
     - AdaptiveKalmanFilter: Kalman filter with trend strength
+
+Streaming Indicators (streaming.py):
+    - O(1)-per-bar counterparts of sma, ema, rsi, atr, adx, annualized_volatility
+    - Rolling helpers: RollingStd, RollingMin, RollingMax
 """
 
 # Stateless indicators
@@ -36,6 +40,19 @@ from jutsu_engine.indicators.kalman import (
     KalmanFilterModel,
 )
 
+# Streaming indicators
+from jutsu_engine.indicators.streaming import (
+    StreamingSMA,
+    StreamingEMA,
+    StreamingRSI,
+    StreamingATR,
+    StreamingADX,
+    StreamingRealizedVolatility,
+    RollingStd,
+    RollingMin,
+    RollingMax,
+)
+
 __all__ = [
     # Stateless
     'sma',
@@ -51,4 +68,14 @@ __all__ = [
     # Stateful
     'AdaptiveKalmanFilter',
     'KalmanFilterModel',
+    # Streaming
+    'StreamingSMA',
+    'StreamingEMA',
+    'StreamingRSI',
+    'StreamingATR',
+    'StreamingADX',
+    'StreamingRealizedVolatility',
+    'RollingStd',
+    'RollingMin',
+    'RollingMax',
 ]
@@ -0,0 +1,567 @@
+"""
+Streaming (online) indicators with O(1) update per bar.
+
+The functions in technical.py recompute an indicator over the whole lookback
+window on every bar. The classes here keep running state instead and are
+meant to be created once in Strategy.init() and fed one bar at a time from
+on_bar(). Each class reproduces the batch function of the same name when fed
+the same series from its first element:
+
+    StreamingSMA                 -> sma()                    (running Kahan sum)
+    StreamingEMA                 -> ema()                    (pandas ewm(adjust=False) recurrence)
+    StreamingRSI                 -> rsi()
+    StreamingATR                 -> atr()
+    StreamingADX                 -> adx()
+    StreamingRealizedVolatility  -> annualized_volatility()  (Welford rolling variance)
+    RollingStd                   -> Series.rolling(window).std()/.mean()
+    RollingMin / RollingMax      -> Series.rolling(window).min()/.max() (monotonic deques)
+
+EWM-based indicators (EMA, RSI, ATR, ADX) depend on where the series starts;
+they match the batch function applied to the same full history, not to a
+truncated lookback slice. Values are floats and NaN until enough data has
+been seen, exactly like the batch output.
+
+Example:
+    from jutsu_engine.indicators.streaming import StreamingSMA, StreamingRealizedVolatility
+
+    class MyStrategy(Strategy):
+        def init(self):
+            self.sma_200 = StreamingSMA(200)
+            self.vol_21 = StreamingRealizedVolatility(21)
+
+        def on_bar(self, bar):
+            if bar.symbol != 'QQQ':
+                return
+            sma = self.sma_200.update(bar.close)
+            vol = self.vol_21.update(bar.close)
+            if not self.sma_200.ready:
+                return
+"""
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Optional, Tuple, Union
+import math
+
+import numpy as np
+
+Number = Union[Decimal, float, int]
+
+NAN = float('nan')
+
+
+def _f(value: Number) -> float:
+    """Convert Decimal/int/float input to float."""
+    return float(value)
+
+
+def _div(numerator: float, denominator: float) -> float:
+    """Divide with NumPy semantics (x/0 -> ±inf, 0/0 -> NaN) like the pandas batch code."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return float(np.float64(numerator) / np.float64(denominator))
+
+
+class _EWMState:
+    """
+    Exponentially weighted mean matching pandas ewm(span=..., adjust=False).mean().
+
+    Follows pandas' recurrence exactly, including seeding on the first
+    observation and decaying the old weight across NaN inputs.
+    """
+
+    def __init__(self, span: int):
+        self.alpha = 2.0 / (span + 1.0)
+        self._old_wt_factor = 1.0 - self.alpha
+        self._old_wt = 1.0
+        self._weighted = NAN
+        self._seen = False
+
+    def update(self, value: float) -> float:
+        is_observation = value == value
+        if not self._seen:
+            self._weighted = value
+            self._seen = True
+        elif self._weighted == self._weighted:
+            self._old_wt *= self._old_wt_factor
+            if is_observation:
+                if self._weighted != value:
+                    weighted = self._old_wt * self._weighted + self.alpha * value
+                    self._weighted = weighted / (self._old_wt + self.alpha)
+                self._old_wt = 1.0
+        elif is_observation:
+            self._weighted = value
+        return self._weighted
+
+    @property
+    def value(self) -> float:
+        return self._weighted
+
+
+class StreamingSMA:
+    """
+    Simple moving average over a fixed window.
+
+    Keeps a compensated (Kahan) running sum, so each update is O(1)
+    regardless of period.
+
+    Attributes:
+        period: Window length
+        value: Latest SMA (NaN until `period` values have been seen)
+    """
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError(f"period must be >= 1, got {period}")
+        self.period = period
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all state."""
+        self._window: Deque[float] = deque()
+        self._sum = 0.0
+        self._compensation = 0.0
+        self.value = NAN
+
+    def _add(self, x: float) -> None:
+        y = x - self._compensation
+        t = self._sum + y
+        self._compensation = (t - self._sum) - y
+        self._sum = t
+
+    def update(self, price: Number) -> float:
+        """
+        Add one value and return the current SMA.
+
+        Args:
+            price: Latest value (Decimal, float or int)
+
+        Returns:
+            SMA over the last `period` values, NaN during warmup
+        """
+        x = _f(price)
+        self._window.append(x)
+        self._add(x)
+        if len(self._window) > self.period:
+            self._add(-self._window.popleft())
+
+        self.value = self._sum / self.period if len(self._window) == self.period else NAN
+        return self.value
+
+    @property
+    def ready(self) -> bool:
+        return len(self._window) == self.period
+
+
+class StreamingEMA:
+    """
+    Exponential moving average (span-based, adjust=False).
+
+    Attributes:
+        period: EMA span
+        value: Latest EMA (first input seeds the average)
+    """
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError(f"period must be >= 1, got {period}")
+        self.period = period
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all state."""
+        self._ewm = _EWMState(self.period)
+        self.count = 0
+
+    def update(self, price: Number) -> float:
+        """
+        Add one value and return the current EMA.
+
+        Args:
+            price: Latest value
+
+        Returns:
+            Current EMA
+        """
+        self.count += 1
+        return self._ewm.update(_f(price))
+
+    @property
+    def value(self) -> float:
+        return self._ewm.value
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= self.period
+
+
+class StreamingRSI:
+    """
+    Relative Strength Index matching technical.rsi().
+
+    Attributes:
+        period: Smoothing span for average gain/loss
+        value: Latest RSI on a 0-100 scale (NaN until a gain or loss is seen)
+    """
+
+    def __init__(self, period: int = 14):
+        if period < 1:
+            raise ValueError(f"period must be >= 1, got {period}")
+        self.period = period
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all state."""
+        self._prev: Optional[float] = None
+        self._avg_gain = _EWMState(self.period)
+        self._avg_loss = _EWMState(self.period)
+        self.count = 0
+        self.value = NAN
+
+    def update(self, price: Number) -> float:
+        """
+        Add one close and return the current RSI.
+
+        Args:
+            price: Latest close
+
+        Returns:
+            Current RSI
+        """
+        x = _f(price)
+        self.count += 1
+        if self._prev is None:
+            gain, loss = 0.0, -0.0
+        else:
+            delta = x - self._prev
+            gain = delta if delta > 0 else 0.0
+            loss = -(delta if delta < 0 else 0.0)
+        self._prev = x
+
+        avg_gain = self._avg_gain.update(gain)
+        avg_loss = self._avg_loss.update(loss)
+        rs = _div(avg_gain, avg_loss)
+        self.value = 100 - _div(100, 1 + rs)
+        return self.value
+
+    @property
+    def ready(self) -> bool:
+        return self.count > self.period
+
+
+class _TrueRange:
+    """True range of a bar given the previous close."""
+
+    def __init__(self):
+        self.prev_close: Optional[float] = None
+
+    def update(self, high: float, low: float, close: float) -> float:
+        tr = high - low
+        if self.prev_close is not None:
+            tr = max(tr, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = close
+        return tr
+
+
+class StreamingATR:
+    """
+    Average True Range matching technical.atr() (EMA of true range).
+
+    Attributes:
+        period: Smoothing span
+        value: Latest ATR
+    """
+
+    def __init__(self, period: int = 14):
+        if period < 1:
+            raise ValueError(f"period must be >= 1, got {period}")
+        self.period = period
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all state."""
+        self._tr = _TrueRange()
+        self._ewm = _EWMState(self.period)
+        self.count = 0
+
+    def update(self, high: Number, low: Number, close: Number) -> float:
+        """
+        Add one bar and return the current ATR.
+
+        Args:
+            high: Bar high
+            low: Bar low
+            close: Bar close
+
+        Returns:
+            Current ATR
+        """
+        self.count += 1
+        return self._ewm.update(self._tr.update(_f(high), _f(low), _f(close)))
+
+    @property
+    def value(self) -> float:
+        return self._ewm.value
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= self.period
+
+
+class StreamingADX:
+    """
+    Average Directional Index matching technical.adx().
+
+    Attributes:
+        period: Smoothing span for TR, ±DM and DX
+        value: Latest ADX (0-100, NaN until directional movement appears)
+        plus_di: Latest +DI
+        minus_di: Latest -DI
+    """
+
+    def __init__(self, period: int = 14):
+        if period < 1:
+            raise ValueError(f"period must be >= 1, got {period}")
+        self.period = period
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all state."""
+        self._tr = _TrueRange()
+        self._prev_high: Optional[float] = None
+        self._prev_low: Optional[float] = None
+        self._smooth_tr = _EWMState(self.period)
+        self._smooth_plus_dm = _EWMState(self.period)
+        self._smooth_minus_dm = _EWMState(self.period)
+        self._adx = _EWMState(self.period)
+        self.plus_di = NAN
+        self.minus_di = NAN
+        self.count = 0
+
+    def update(self, high: Number, low: Number, close: Number) -> float:
+        """
+        Add one bar and return the current ADX.
+
+        Args:
+            high: Bar high
+            low: Bar low
+            close: Bar close
+
+        Returns:
+            Current ADX
+        """
+        h, l, c = _f(high), _f(low), _f(close)
+        self.count += 1
+
+        true_range = self._tr.update(h, l, c)
+        plus_dm = minus_dm = 0.0
+        if self._prev_high is not None:
+            high_diff = h - self._prev_high
+            low_diff = -(l - self._prev_low)
+            if high_diff > low_diff and high_diff > 0:
+                plus_dm = high_diff
+            if low_diff > high_diff and low_diff > 0:
+                minus_dm = low_diff
+        self._prev_high, self._prev_low = h, l
+
+        smooth_tr = self._smooth_tr.update(true_range)
+        self.plus_di = 100 * _div(self._smooth_plus_dm.update(plus_dm), smooth_tr)
+        self.minus_di = 100 * _div(self._smooth_minus_dm.update(minus_dm), smooth_tr)
+
+        di_sum = self.plus_di + self.minus_di
+        di_diff = abs(self.plus_di - self.minus_di)
+        dx = 100 * _div(di_diff, di_sum) if di_sum != 0 else NAN
+        return self._adx.update(dx)
+
+    @property
+    def value(self) -> float:
+        return self._adx.value
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= 2 * self.period
+
+
+class RollingStd:
+    """
+    Rolling mean and sample standard deviation over a fixed window.
+
+    Uses Welford's add/remove updates (the same scheme pandas uses for
+    rolling var), so each update is O(1).
+
+    Attributes:
+        window: Window length
+        ddof: Delta degrees of freedom (default 1, like pandas)
+        mean: Latest rolling mean (NaN until the window is full)
+        value: Latest rolling std (NaN until the window is full)
+    """
+
+    def __init__(self, window: int, ddof: int = 1):
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        self.window = window
+        self.ddof = ddof
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all state."""
+        self._values: Deque[float] = deque()
+        self._nobs = 0
+        self._mean = 0.0
+        self._ssqdm = 0.0
+        self.mean = NAN
+        self.value = NAN
+
+    def _add(self, x: float) -> None:
+        self._nobs += 1
+        delta = x - self._mean
+        self._mean += delta / self._nobs
+        self._ssqdm += ((self._nobs - 1) * delta * delta) / self._nobs
+
+    def _remove(self, x: float) -> None:
+        self._nobs -= 1
+        if self._nobs:
+            delta = x - self._mean
+            self._mean -= delta / self._nobs
+            self._ssqdm -= ((self._nobs + 1) * delta * delta) / self._nobs
+        else:
+            self._mean = 0.0
+            self._ssqdm = 0.0
+
+    def update(self, value: Number) -> float:
+        """
+        Add one value and return the current rolling std.
+
+        NaN inputs are held in the window (so alignment with the batch
+        version is preserved) but excluded from the statistics.
+
+        Args:
+            value: Latest value
+
+        Returns:
+            Rolling std, NaN until the window holds `window` valid values
+        """
+        x = _f(value)
+        self._values.append(x)
+        if x == x:
+            self._add(x)
+        if len(self._values) > self.window:
+            old = self._values.popleft()
+            if old == old:
+                self._remove(old)
+
+        if self._nobs < self.window:
+            self.mean = NAN
+            self.value = NAN
+        else:
+            self.mean = self._mean
+            divisor = self._nobs - self.ddof
+            variance = self._ssqdm / divisor if divisor > 0 else NAN
+            self.value = math.sqrt(max(variance, 0.0)) if variance == variance else NAN
+        return self.value
+
+    @property
+    def ready(self) -> bool:
+        return self._nobs == self.window
+
+
+class StreamingRealizedVolatility:
+    """
+    Annualized realized volatility matching technical.annualized_volatility().
+
+    Attributes:
+        lookback: Window of log returns
+        trading_days_per_year: Annualization factor
+        value: Latest annualized volatility (NaN until `lookback` returns exist)
+    """
+
+    def __init__(self, lookback: int = 20, trading_days_per_year: int = 252):
+        self.lookback = lookback
+        self.trading_days_per_year = trading_days_per_year
+        self._annualize = np.sqrt(trading_days_per_year)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all state."""
+        self._prev: Optional[float] = None
+        self._std = RollingStd(self.lookback)
+        self.value = NAN
+
+    def update(self, close: Number) -> float:
+        """
+        Add one close and return the current annualized volatility.
+
+        Args:
+            close: Latest close
+
+        Returns:
+            Annualized volatility (e.g. 0.20 = 20%)
+        """
+        x = _f(close)
+        log_return = NAN if self._prev is None else float(np.log(x / self._prev))
+        self._prev = x
+        self.value = self._std.update(log_return) * self._annualize
+        return self.value
+
+    @property
+    def ready(self) -> bool:
+        return self._std.ready
+
+
+class _MonotonicWindow:
+    """Rolling extreme over a fixed window using a monotonic deque."""
+
+    def __init__(self, window: int, keep_max: bool):
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        self.window = window
+        self._keep_max = keep_max
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all state."""
+        self._deque: Deque[Tuple[int, float]] = deque()
+        self._index = 0
+        self.value = NAN
+
+    def update(self, value: Number) -> float:
+        """
+        Add one value and return the extreme of the last `window` values.
+
+        Args:
+            value: Latest value
+
+        Returns:
+            Rolling min/max, NaN until `window` values have been seen
+        """
+        x = _f(value)
+        d = self._deque
+        if self._keep_max:
+            while d and d[-1][1] <= x:
+                d.pop()
+        else:
+            while d and d[-1][1] >= x:
+                d.pop()
+        d.append((self._index, x))
+        if d[0][0] <= self._index - self.window:
+            d.popleft()
+        self._index += 1
+
+        self.value = d[0][1] if self._index >= self.window else NAN
+        return self.value
+
+    @property
+    def ready(self) -> bool:
+        return self._index >= self.window
+
+
+class RollingMax(_MonotonicWindow):
+    """Rolling maximum over a fixed window (amortized O(1) per update)."""
+
+    def __init__(self, window: int):
+        super().__init__(window, keep_max=True)
+
+
+class RollingMin(_MonotonicWindow):
+    """Rolling minimum over a fixed window (amortized O(1) per update)."""
+
+    def __init__(self, window: int):
+        super().__init__(window, keep_max=False)
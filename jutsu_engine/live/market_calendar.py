@@ -4,6 +4,9 @@ Market Calendar Module
 Purpose:
     Trading day validation using NYSE calendar.
     Identifies weekends, holidays, and market closures.
+    Session lookups delegate to the shared TradingCalendar
+    (jutsu_engine/utils/trading_calendar.py), so they are cheap enough
+    to call per bar.
 
 Dependencies:
     - pandas-market-calendars>=4.0.0
@@ -23,7 +26,7 @@ import logging
 from datetime import date, datetime, timezone
 from typing import Optional
 
-import pandas_market_calendars as mcal
+from jutsu_engine.utils.trading_calendar import get_trading_calendar
 
 logger = logging.getLogger('LIVE.MARKET_CALENDAR')
 
@@ -49,30 +52,12 @@ def is_trading_day(check_date: Optional[date] = None) -> bool:
     if check_date is None:
         check_date = datetime.now(timezone.utc).date()
 
-    logger.debug(f"Checking if {check_date} is a trading day")
-
-    # Load NYSE calendar
-    nyse = mcal.get_calendar('NYSE')
-
-    # Get trading days for the month containing check_date
-    # (Use month range to avoid edge cases)
-    start_date = check_date.replace(day=1)
-    if check_date.month == 12:
-        end_date = check_date.replace(year=check_date.year + 1, month=1, day=1)
-    else:
-        end_date = check_date.replace(month=check_date.month + 1, day=1)
-
-    # Get valid trading days
-    schedule = nyse.schedule(start_date=start_date, end_date=end_date)
-
-    # Check if check_date is in trading days
-    trading_dates = schedule.index.date
-    is_trading = check_date in trading_dates
+    is_trading = get_trading_calendar().is_trading_day(check_date)
 
     if is_trading:
-        logger.info(f"✅ {check_date} is a trading day")
+        logger.debug(f"✅ {check_date} is a trading day")
     else:
-        logger.info(f"❌ {check_date} is NOT a trading day (weekend/holiday)")
+        logger.debug(f"❌ {check_date} is NOT a trading day (weekend/holiday)")
 
     return is_trading
 
@@ -94,25 +79,8 @@ def get_next_trading_day(check_date: Optional[date] = None) -> date:
     if check_date is None:
         check_date = datetime.now(timezone.utc).date()
 
-    logger.debug(f"Finding next trading day after {check_date}")
-
-    nyse = mcal.get_calendar('NYSE')
-
-    # Get schedule for next 30 days
-    start_date = check_date
-    end_date = start_date + pd.Timedelta(days=30)
-
-    schedule = nyse.schedule(start_date=start_date, end_date=end_date)
-
-    # Find first trading day AFTER check_date
-    trading_dates = schedule.index.date
-    future_dates = [d for d in trading_dates if d > check_date]
-
-    if not future_dates:
-        raise ValueError(f"No trading day found in next 30 days after {check_date}")
-
-    next_trading = future_dates[0]
-    logger.info(f"Next trading day after {check_date}: {next_trading}")
+    next_trading = get_trading_calendar().next_trading_day(check_date)
+    logger.debug(f"Next trading day after {check_date}: {next_trading}")
 
     return next_trading
 
@@ -134,25 +102,8 @@ def get_previous_trading_day(check_date: Optional[date] = None) -> date:
     if check_date is None:
         check_date = datetime.now(timezone.utc).date()
 
-    logger.debug(f"Finding previous trading day before {check_date}")
-
-    nyse = mcal.get_calendar('NYSE')
-
-    # Get schedule for previous 30 days
-    end_date = check_date
-    start_date = end_date - pd.Timedelta(days=30)
-
-    schedule = nyse.schedule(start_date=start_date, end_date=end_date)
-
-    # Find last trading day BEFORE check_date
-    trading_dates = schedule.index.date
-    past_dates = [d for d in trading_dates if d < check_date]
-
-    if not past_dates:
-        raise ValueError(f"No trading day found in previous 30 days before {check_date}")
-
-    previous_trading = past_dates[-1]
-    logger.info(f"Previous trading day before {check_date}: {previous_trading}")
+    previous_trading = get_trading_calendar().previous_trading_day(check_date)
+    logger.debug(f"Previous trading day before {check_date}: {previous_trading}")
 
     return previous_trading
 
@@ -196,10 +147,6 @@ def is_market_open_now() -> bool:
     return is_open
 
 
-# Import pandas for Timedelta
-import pandas as pd
-
-
 def is_market_hours(check_datetime: Optional[datetime] = None) -> bool:
     """
     Check if given datetime is within US market hours (9:30-16:00 EST/EDT).
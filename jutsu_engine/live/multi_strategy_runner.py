@@ -10,24 +10,88 @@ Key Features:
 - Isolated state per strategy
 - Primary strategy protection (secondary failures don't affect primary)
 - Unified execution with timing metrics
+- Optional concurrent execution (settings.execution_mode): strategies share
+  read-only market data and only touch their own runner, so they can run in
+  a thread pool or, for the CPU-bound pure-Python signal code, in one
+  prewarmed worker process per strategy
 """
 
 import logging
+import multiprocessing
 import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from decimal import Decimal
 from pathlib import Path
-from typing import Dict, Optional, Any, List, Type
+from typing import Dict, Iterator, Optional, Any, List, Tuple, Type
 import pandas as pd
 import importlib
 
 from jutsu_engine.core.strategy_base import Strategy
-from jutsu_engine.live.strategy_registry import StrategyRegistry, StrategyConfig
+from jutsu_engine.live.strategy_registry import (
+    EXECUTION_MODES,
+    StrategyRegistry,
+    StrategyConfig,
+)
 from jutsu_engine.live.multi_state_manager import MultiStrategyStateManager
-from jutsu_engine.live.strategy_runner import LiveStrategyRunner
+from jutsu_engine.live.strategy_runner import DEFAULT_SNAPSHOT_DIR, LiveStrategyRunner
 
 logger = logging.getLogger('LIVE.MULTI_RUNNER')
 
+# Seconds a discarded worker process gets to exit after terminate()
+WORKER_TERMINATE_TIMEOUT = 5.0
+
+# Runner owned by a 'processes' mode worker (set by _init_worker)
+_worker_runner: Optional[LiveStrategyRunner] = None
+
+
+def _execute_runner(
+    runner: LiveStrategyRunner,
+    market_data: Dict[str, pd.DataFrame],
+    account_equity: Decimal
+) -> Tuple[Dict[str, Any], Dict[str, float], Dict[str, Any]]:
+    """Calculate signals, allocation and context for one runner."""
+    signals = runner.calculate_signals(market_data)
+    allocation = runner.determine_target_allocation(signals, account_equity)
+    context = runner.get_strategy_context()
+    return signals, allocation, context
+
+
+def _init_worker(
+    strategy_class: Type[Strategy],
+    config_path: Path,
+    snapshot_dir: Optional[Path]
+) -> None:
+    """Build the worker's runner once, when its process starts."""
+    global _worker_runner
+    _worker_runner = LiveStrategyRunner(
+        strategy_class=strategy_class,
+        config_path=config_path,
+        snapshot_dir=snapshot_dir
+    )
+
+
+def _warm_worker() -> bool:
+    """No-op task that forces the worker process to start."""
+    return _worker_runner is not None
+
+
+def _run_in_worker(
+    market_data: Dict[str, pd.DataFrame],
+    account_equity: Decimal
+) -> Tuple[Dict[str, Any], Dict[str, float], Dict[str, Any], Strategy, float]:
+    """
+    Run the worker's strategy.
+
+    Returns the strategy too, so the parent's runner reflects the new state.
+    """
+    start_time = time.time()
+    signals, allocation, context = _execute_runner(_worker_runner, market_data, account_equity)
+    execution_time = (time.time() - start_time) * 1000
+    return signals, allocation, context, _worker_runner.strategy, execution_time
+
 
 @dataclass
 class StrategyExecutionResult:
@@ -61,12 +125,14 @@ class MultiExecutionResult:
         results: Dictionary mapping strategy_id to StrategyExecutionResult
         primary_success: Whether primary strategy succeeded
         all_success: Whether all strategies succeeded
-        total_time_ms: Total execution time in milliseconds
+        total_time_ms: Total (wall clock) execution time in milliseconds
+        execution_mode: 'sequential', 'threads' or 'processes'
     """
     results: Dict[str, StrategyExecutionResult] = field(default_factory=dict)
     primary_success: bool = False
     all_success: bool = False
     total_time_ms: float = 0.0
+    execution_mode: str = 'sequential'
 
     def get_primary_result(self) -> Optional[StrategyExecutionResult]:
         """Get the primary strategy result."""
@@ -75,6 +141,13 @@ class MultiExecutionResult:
             pass
         return None
 
+    def get_timings(self) -> Dict[str, float]:
+        """Get execution time in milliseconds per strategy, in execution order."""
+        return {
+            strategy_id: result.execution_time_ms
+            for strategy_id, result in self.results.items()
+        }
+
     def get_failed_strategies(self) -> List[str]:
         """Get list of strategy IDs that failed."""
         return [
@@ -108,24 +181,44 @@ class MultiStrategyRunner:
 
     def __init__(
         self,
-        registry_path: Path = Path("config/strategies_registry.yaml")
+        registry_path: Path = Path("config/strategies_registry.yaml"),
+        execution_mode: Optional[str] = None
     ):
         """
         Initialize multi-strategy runner.
 
         Args:
             registry_path: Path to strategies_registry.yaml
+            execution_mode: Override settings.execution_mode
+                ('sequential', 'threads' or 'processes')
+
+        Raises:
+            ValueError: If execution_mode is invalid
         """
         self.registry = StrategyRegistry(registry_path)
         self.state_manager = MultiStrategyStateManager(self.registry)
         self._runners: Dict[str, LiveStrategyRunner] = {}
         self._strategy_classes: Dict[str, Type[Strategy]] = {}
 
+        self.execution_mode = execution_mode or self.registry.get_settings().execution_mode
+        if self.execution_mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"Invalid execution_mode '{self.execution_mode}', must be one of {EXECUTION_MODES}"
+            )
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._workers: Dict[str, ProcessPoolExecutor] = {}
+        # Latest run submitted to each worker (close() discards workers still busy with it)
+        self._last_runs: Dict[str, Future] = {}
+
         # Initialize runners for each active strategy
         self._initialize_runners()
 
+        if self.execution_mode == 'processes':
+            self._start_workers()
+
         logger.info(
-            f"MultiStrategyRunner initialized with {len(self._runners)} strategies"
+            f"MultiStrategyRunner initialized with {len(self._runners)} strategies "
+            f"({self.execution_mode})"
         )
 
     def _get_strategy_class(self, class_name: str) -> Type[Strategy]:
@@ -164,7 +257,8 @@ class MultiStrategyRunner:
 
                 runner = LiveStrategyRunner(
                     strategy_class=strategy_class,
-                    config_path=config_path
+                    config_path=config_path,
+                    snapshot_dir=DEFAULT_SNAPSHOT_DIR
                 )
                 self._runners[strategy.id] = runner
 
@@ -231,14 +325,7 @@ class MultiStrategyRunner:
         runner = self._runners[strategy_id]
 
         try:
-            # Calculate signals
-            signals = runner.calculate_signals(market_data)
-
-            # Determine allocation
-            allocation = runner.determine_target_allocation(signals, account_equity)
-
-            # Get strategy context
-            context = runner.get_strategy_context()
+            signals, allocation, context = _execute_runner(runner, market_data, account_equity)
 
             execution_time = (time.time() - start_time) * 1000
 
@@ -279,6 +366,16 @@ class MultiStrategyRunner:
         isolate_failures is False. Secondary strategy failures are
         logged but don't affect other strategies.
 
+        In 'threads' and 'processes' mode all strategies are started at
+        once; results are still processed in execution order, so a primary
+        failure without isolate_failures leaves the later strategies out of
+        the returned results and skips their state updates. Unlike in
+        'sequential' mode, those strategies have still run (or are still
+        running): their runner state has advanced and their signal
+        snapshots are written to the snapshot directory
+        (DEFAULT_SNAPSHOT_DIR). Strategies that exceed
+        settings.execution_timeout are reported as failed.
+
         Args:
             market_data: Market data for all symbols
             account_equity: Current account equity
@@ -290,19 +387,21 @@ class MultiStrategyRunner:
         results: Dict[str, StrategyExecutionResult] = {}
         settings = self.registry.get_settings()
 
-        logger.info(f"Running {len(self._runners)} strategies...")
+        logger.info(f"Running {len(self._runners)} strategies ({self.execution_mode})...")
 
+        strategies = []
         for strategy in self.registry.get_active_strategies():
             if strategy.id not in self._runners:
                 logger.warning(f"Skipping strategy without runner: {strategy.id}")
                 continue
+            strategies.append(strategy)
 
-            # Log timing if enabled
-            if settings.detailed_timing_logs:
-                logger.info(f"Starting strategy: {strategy.id}")
+        if self.execution_mode == 'sequential':
+            outcomes = self._run_sequentially(strategies, market_data, account_equity)
+        else:
+            outcomes = self._run_concurrently(strategies, market_data, account_equity)
 
-            # Run strategy
-            result = self.run_strategy(strategy.id, market_data, account_equity)
+        for strategy, result in zip(strategies, outcomes):
             results[strategy.id] = result
 
             # Handle failures
@@ -331,19 +430,230 @@ class MultiStrategyRunner:
 
         all_success = all(r.success for r in results.values())
 
+        multi_result = MultiExecutionResult(
+            results=results,
+            primary_success=primary_success,
+            all_success=all_success,
+            total_time_ms=total_time,
+            execution_mode=self.execution_mode
+        )
+
         logger.info(
             f"All strategies completed in {total_time:.1f}ms. "
             f"Primary: {'OK' if primary_success else 'FAILED'}, "
             f"All: {'OK' if all_success else 'PARTIAL'}"
         )
+        if settings.detailed_timing_logs:
+            timings = ", ".join(
+                f"{strategy_id}={ms:.1f}ms" for strategy_id, ms in multi_result.get_timings().items()
+            )
+            logger.info(f"Strategy timings: {timings}")
 
-        return MultiExecutionResult(
-            results=results,
-            primary_success=primary_success,
-            all_success=all_success,
-            total_time_ms=total_time
+        return multi_result
+
+    def _run_sequentially(
+        self,
+        strategies: List[StrategyConfig],
+        market_data: Dict[str, pd.DataFrame],
+        account_equity: Decimal
+    ) -> Iterator[StrategyExecutionResult]:
+        """Run strategies one at a time, lazily (stopping early skips the rest)."""
+        settings = self.registry.get_settings()
+        for strategy in strategies:
+            if settings.detailed_timing_logs:
+                logger.info(f"Starting strategy: {strategy.id}")
+            yield self.run_strategy(strategy.id, market_data, account_equity)
+
+    def _run_concurrently(
+        self,
+        strategies: List[StrategyConfig],
+        market_data: Dict[str, pd.DataFrame],
+        account_equity: Decimal
+    ) -> Iterator[StrategyExecutionResult]:
+        """
+        Start all strategies at once and yield their results in execution order.
+
+        A timed-out thread cannot be interrupted and keeps running in the
+        background; a timed-out worker process is abandoned and replaced on
+        the next run.
+        """
+        settings = self.registry.get_settings()
+        deadline = time.time() + settings.execution_timeout
+        submitted_at = time.time()
+
+        futures: Dict[str, Future] = {}
+        for strategy in strategies:
+            if settings.detailed_timing_logs:
+                logger.info(f"Starting strategy: {strategy.id}")
+            if self.execution_mode == 'threads':
+                futures[strategy.id] = self._get_thread_pool().submit(
+                    self.run_strategy, strategy.id, market_data, account_equity
+                )
+            else:
+                try:
+                    futures[strategy.id] = self._get_worker(strategy.id).submit(
+                        _run_in_worker, market_data, account_equity
+                    )
+                    self._last_runs[strategy.id] = futures[strategy.id]
+                except (BrokenProcessPool, RuntimeError) as e:
+                    failed: Future = Future()
+                    failed.set_exception(e)
+                    futures[strategy.id] = failed
+
+        for strategy in strategies:
+            yield self._collect_result(
+                strategy.id, futures[strategy.id], max(deadline - time.time(), 0), submitted_at
+            )
+
+    def _collect_result(
+        self,
+        strategy_id: str,
+        future: Future,
+        timeout: float,
+        submitted_at: float
+    ) -> StrategyExecutionResult:
+        """
+        Wait for one concurrently running strategy.
+
+        Args:
+            strategy_id: Strategy identifier
+            future: Future returned by the thread pool or worker
+            timeout: Seconds left before the execution timeout
+            submitted_at: When the strategy was submitted (for failure timing)
+
+        Returns:
+            StrategyExecutionResult
+        """
+        try:
+            outcome = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            execution_time = (time.time() - submitted_at) * 1000
+            logger.error(f"Strategy {strategy_id} timed out after {execution_time:.1f}ms")
+            if self.execution_mode == 'processes':
+                self._discard_worker(strategy_id)
+            return StrategyExecutionResult(
+                strategy_id=strategy_id,
+                success=False,
+                error=f"Execution timed out after {self.registry.get_settings().execution_timeout}s",
+                execution_time_ms=execution_time
+            )
+        except Exception as e:
+            execution_time = (time.time() - submitted_at) * 1000
+            logger.error(f"Strategy {strategy_id} failed: {e}")
+            if isinstance(e, BrokenProcessPool):
+                self._discard_worker(strategy_id)
+            return StrategyExecutionResult(
+                strategy_id=strategy_id,
+                success=False,
+                error=str(e) or type(e).__name__,
+                execution_time_ms=execution_time
+            )
+
+        if isinstance(outcome, StrategyExecutionResult):
+            return outcome
+
+        signals, allocation, context, strategy, execution_time = outcome
+        self._runners[strategy_id].strategy = strategy
+
+        logger.info(
+            f"Strategy {strategy_id} completed in {execution_time:.1f}ms: "
+            f"Cell {signals.get('current_cell')}"
         )
 
+        return StrategyExecutionResult(
+            strategy_id=strategy_id,
+            success=True,
+            signals=signals,
+            allocation=allocation,
+            context=context,
+            execution_time_ms=execution_time
+        )
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        """Thread pool for 'threads' mode (created on first use)."""
+        if self._thread_pool is None:
+            max_workers = self.registry.get_settings().max_workers or max(len(self._runners), 1)
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix='strategy'
+            )
+        return self._thread_pool
+
+    def _get_worker(self, strategy_id: str) -> ProcessPoolExecutor:
+        """
+        Single-process pool dedicated to one strategy (created on first use).
+
+        The worker builds its own LiveStrategyRunner once and keeps it (and
+        its in-memory signal snapshot) across runs.
+        """
+        worker = self._workers.get(strategy_id)
+        if worker is None:
+            runner = self._runners[strategy_id]
+            worker = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(runner.strategy_class, runner.config_path, runner.snapshot_dir)
+            )
+            self._workers[strategy_id] = worker
+        return worker
+
+    def _start_workers(self) -> None:
+        """Start every worker now, so spawn/import cost is paid outside the execution window."""
+        warmups = [self._get_worker(strategy_id).submit(_warm_worker) for strategy_id in self._runners]
+        for strategy_id, warmup in zip(list(self._runners), warmups):
+            try:
+                warmup.result(timeout=self.registry.get_settings().execution_timeout)
+            except Exception as e:
+                logger.warning(f"Worker for {strategy_id} failed to start: {e}")
+                self._discard_worker(strategy_id)
+
+    def _discard_worker(self, strategy_id: str) -> None:
+        """
+        Drop a broken or hung worker; a new one is started on the next run.
+
+        shutdown(wait=False) alone leaves a hung process running, so the
+        worker's processes are terminated (killed if they outlive
+        WORKER_TERMINATE_TIMEOUT) and joined.
+        """
+        self._last_runs.pop(strategy_id, None)
+        worker = self._workers.pop(strategy_id, None)
+        if worker is None:
+            return
+
+        processes = list((worker._processes or {}).values())
+        worker.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join(WORKER_TERMINATE_TIMEOUT)
+            if process.is_alive():
+                logger.warning(f"Worker process {process.pid} for {strategy_id} ignored terminate, killing it")
+                process.kill()
+                process.join()
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Shut down the thread pool and worker processes.
+
+        A worker whose last run has not finished (it timed out, or its result
+        was never collected after a primary failure) is discarded rather
+        than waited for, so a hung strategy cannot block reload_registry().
+
+        Args:
+            wait: Wait for running strategies (including timed-out threads) to finish
+        """
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=wait, cancel_futures=True)
+            self._thread_pool = None
+        for strategy_id in list(self._workers):
+            last_run = self._last_runs.get(strategy_id)
+            if last_run is not None and not last_run.done():
+                self._discard_worker(strategy_id)
+            else:
+                self._workers.pop(strategy_id).shutdown(wait=wait, cancel_futures=True)
+        self._last_runs.clear()
+
     def _update_strategy_state(
         self,
         strategy_id: str,
@@ -389,9 +699,12 @@ class MultiStrategyRunner:
         Useful for hot-reloading configuration changes.
         """
         logger.info("Reloading multi-strategy runner...")
+        self.close()
         self.registry.reload()
         self._runners.clear()
         self._initialize_runners()
+        if self.execution_mode == 'processes':
+            self._start_workers()
         logger.info("Multi-strategy runner reloaded")
 
     def __repr__(self) -> str:
@@ -14,6 +14,9 @@ import yaml
 
 logger = logging.getLogger('LIVE.REGISTRY')
 
+# Supported values of settings.execution_mode
+EXECUTION_MODES = ('sequential', 'threads', 'processes')
+
 
 @dataclass
 class StrategyConfig:
@@ -82,11 +85,16 @@ class RegistrySettings:
         execution_timeout: Maximum seconds for single strategy execution
         detailed_timing_logs: Enable detailed timing logs for each strategy
         shared_data_fetch: All strategies use same market data fetch
+        execution_mode: How strategies run: 'sequential', 'threads' or
+            'processes' (one prewarmed worker process per strategy)
+        max_workers: Thread pool size for 'threads' mode (0 = one per strategy)
     """
     isolate_failures: bool = True
     execution_timeout: int = 300
     detailed_timing_logs: bool = True
     shared_data_fetch: bool = True
+    execution_mode: str = 'sequential'
+    max_workers: int = 0
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'RegistrySettings':
@@ -95,7 +103,9 @@ class RegistrySettings:
             isolate_failures=data.get('isolate_failures', True),
             execution_timeout=data.get('execution_timeout', 300),
             detailed_timing_logs=data.get('detailed_timing_logs', True),
-            shared_data_fetch=data.get('shared_data_fetch', True)
+            shared_data_fetch=data.get('shared_data_fetch', True),
+            execution_mode=data.get('execution_mode', 'sequential'),
+            max_workers=data.get('max_workers', 0)
         )
 
 
@@ -227,6 +237,12 @@ class StrategyRegistry:
                     f"Found '{first_strategy_id}' first, but '{primary.id}' is primary."
                 )
 
+        if self._settings.execution_mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"Invalid execution_mode '{self._settings.execution_mode}', "
+                f"must be one of {EXECUTION_MODES}"
+            )
+
         logger.info("Registry validation: PASSED")
 
     def get_active_strategies(self) -> List[StrategyConfig]:
@@ -371,6 +387,7 @@ def main():
         print(f"  isolate_failures: {settings.isolate_failures}")
         print(f"  execution_timeout: {settings.execution_timeout}s")
         print(f"  shared_data_fetch: {settings.shared_data_fetch}")
+        print(f"  execution_mode: {settings.execution_mode}")
 
         # Load full config for primary
         primary = registry.get_primary_strategy()
@@ -4,13 +4,32 @@ Live Strategy Runner - Execute trading strategies on live market data.
 This module runs the Hierarchical Adaptive v3.5b strategy on live/synthetic data
 to generate trading signals and target allocations for automated execution.
 
+With a snapshot_dir, signal calculation is incremental: the strategy state
+after the completed bars of a run is persisted, and the next run resumes from
+it and applies only the bars that are new since (typically yesterday's close
+plus today's synthetic bar) instead of replaying the whole history. The
+snapshot is only used if its strategy/parameter fingerprint matches and the
+last bars it absorbed are unchanged in the new data; otherwise the runner
+falls back to a full replay. Every SNAPSHOT_VERIFY_EVERY resumed runs the
+incremental result is compared against a full replay, which replaces it (and
+the snapshot) if the two disagree. Bar history is trimmed to a multiple of
+the strategy's warmup before the state is pickled.
+
 Version: 2.0 (Flat Config - PRD v2.0.1 Compliant)
 """
 
+import hashlib
+import inspect
+import json
 import logging
+import os
+import pickle
+import tempfile
 import pandas as pd
+from dataclasses import dataclass, field
+from datetime import datetime
 from decimal import Decimal
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Tuple
 from pathlib import Path
 import yaml
 
@@ -21,9 +40,86 @@ from jutsu_engine.core.events import MarketDataEvent
 logger = logging.getLogger('LIVE.STRATEGY_RUNNER')
 
 
+def _bars_from_frame(symbol: str, df: Optional[pd.DataFrame]) -> List[MarketDataEvent]:
+    """
+    Convert a daily OHLCV DataFrame (date/open/high/low/close/volume) to bars.
+
+    Reads the frame column-wise once instead of materializing a row Series
+    per bar with .iloc, which dominated signal calculation on long histories.
+    """
+    if df is None:
+        return []
+    return [
+        MarketDataEvent(
+            symbol=symbol,
+            timestamp=date,
+            open=Decimal(str(open_)),
+            high=Decimal(str(high)),
+            low=Decimal(str(low)),
+            close=Decimal(str(close)),
+            volume=int(volume),
+            timeframe="1D"
+        )
+        for date, open_, high, low, close, volume in zip(
+            df['date'], df['open'], df['high'], df['low'], df['close'], df['volume']
+        )
+    ]
+
+
+def _frame_rows(df: Optional[pd.DataFrame], start: int, stop: int) -> List[Tuple]:
+    """Raw (date, open, high, low, close, volume) rows of a frame slice."""
+    if df is None:
+        return []
+    start = max(start, 0)
+    return list(zip(*(
+        df[column].iloc[start:stop].tolist()
+        for column in ('date', 'open', 'high', 'low', 'close', 'volume')
+    )))
+
+
+@dataclass
+class SignalSnapshot:
+    """
+    Strategy state after the completed bars of a calculate_signals() call.
+
+    Attributes:
+        state: Pickled strategy after absorbing every signal bar through last_timestamp
+        fingerprint: Strategy class source + parameters the state belongs to
+        last_timestamp: Date of the last absorbed signal bar
+        signal_tail: Last absorbed signal rows (consistency check)
+        treasury_tail: Treasury rows absorbed alongside signal_tail
+        resumes: Resumed runs since the state was last rebuilt by a full replay
+        created_at: When the snapshot was taken
+    """
+
+    state: bytes
+    fingerprint: str
+    last_timestamp: Any
+    signal_tail: List[Tuple]
+    treasury_tail: List[Tuple]
+    resumes: int = 0
+    created_at: datetime = field(default_factory=datetime.now)
+
+    def restore(self) -> Strategy:
+        """Independent copy of the snapshotted strategy."""
+        return pickle.loads(self.state)
+
+
 # Parameters that should be excluded from strategy __init__
 EXCLUDED_PARAMS = {'name', 'trade_logger'}
 
+# Absorbed bars re-checked against new data before resuming from a snapshot
+SNAPSHOT_TAIL_BARS = 5
+
+# Resumed runs between full-replay checks of the incremental signals
+SNAPSHOT_VERIFY_EVERY = 20
+
+# Per-symbol bars kept in a snapshot, as a multiple of the strategy warmup
+SNAPSHOT_HISTORY_WARMUPS = 2
+
+# Where the scheduler/API keep signal snapshots
+DEFAULT_SNAPSHOT_DIR = Path('state/signal_snapshots')
+
 # Required strategy parameters (must be present in config)
 REQUIRED_PARAMS = {
     'signal_symbol', 'leveraged_long_symbol', 'sma_fast', 'sma_slow'
@@ -47,7 +143,8 @@ class LiveStrategyRunner:
     def __init__(
         self,
         strategy_class: type[Strategy] = Hierarchical_Adaptive_v3_5b,
-        config_path: Path = Path('config/live_trading_config.yaml')
+        config_path: Path = Path('config/live_trading_config.yaml'),
+        snapshot_dir: Optional[Path] = None
     ):
         """
         Initialize strategy runner with configuration.
@@ -55,6 +152,9 @@ class LiveStrategyRunner:
         Args:
             strategy_class: Strategy class to instantiate (default: Hierarchical_Adaptive_v3_5b)
             config_path: Path to configuration file
+            snapshot_dir: Directory for persisted signal snapshots (e.g.
+                DEFAULT_SNAPSHOT_DIR). None disables incremental signal
+                calculation: every call replays the full history.
 
         Raises:
             FileNotFoundError: If config file doesn't exist
@@ -65,6 +165,15 @@ class LiveStrategyRunner:
         self.config = self._load_config()
         self.strategy = self._initialize_strategy()
 
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir is not None else None
+        self._snapshot: Optional[SignalSnapshot] = None
+        self._fingerprint: Optional[str] = None
+        self._base_state: Optional[bytes] = None
+        if self.snapshot_dir is not None:
+            # Fresh post-init() state that full replays start from
+            self._base_state = pickle.dumps(self.strategy, protocol=pickle.HIGHEST_PROTOCOL)
+            self._fingerprint = self._strategy_fingerprint()
+
         logger.info(f"Initialized {self.strategy_class.__name__} with config from {config_path}")
 
     def _load_config(self) -> Dict[str, Any]:
@@ -252,48 +361,245 @@ class LiveStrategyRunner:
         signal_df = market_data[signal_symbol]
         treasury_df = market_data.get(treasury_symbol)
 
-        # Feed bars to strategy (simulating backtest bar-by-bar processing)
-        # Must call _update_bar() before on_bar() to populate internal _bars list
-        for idx in range(len(signal_df)):
-            row = signal_df.iloc[idx]
-            bar = MarketDataEvent(
-                symbol=signal_symbol,
-                timestamp=row['date'],
-                open=Decimal(str(row['open'])),
-                high=Decimal(str(row['high'])),
-                low=Decimal(str(row['low'])),
-                close=Decimal(str(row['close'])),
-                volume=int(row['volume']),
-                timeframe="1D"
-            )
+        if self.snapshot_dir is None:
+            self._feed_bars(self.strategy, signal_symbol, signal_df, treasury_symbol, treasury_df,
+                            0, len(signal_df))
+        else:
+            self._calculate_incremental(signal_symbol, signal_df, treasury_symbol, treasury_df)
+
+        # Extract final signals from strategy state
+        signals = self.get_strategy_context()
+        signals['timestamp'] = signal_df.iloc[-1]['date']
+
+        logger.info(f"Signals calculated: Cell {signals['current_cell']}, Vol State {signals['vol_state']}")
+        return signals
+
+    def _feed_bars(
+        self,
+        strategy: Strategy,
+        signal_symbol: str,
+        signal_df: pd.DataFrame,
+        treasury_symbol: str,
+        treasury_df: Optional[pd.DataFrame],
+        start: int,
+        stop: int
+    ) -> None:
+        """
+        Feed signal bars [start, stop) (and same-index treasury bars) to a strategy.
+
+        Simulates backtest bar-by-bar processing: _update_bar() must be
+        called before on_bar() to populate the strategy's bar history.
+        """
+        signal_bars = _bars_from_frame(signal_symbol, signal_df.iloc[start:stop])
+        treasury_bars = []
+        if treasury_df is not None:
+            treasury_bars = _bars_from_frame(treasury_symbol, treasury_df.iloc[start:stop])
 
+        for idx, bar in enumerate(signal_bars):
             # Store bar in strategy's internal history (required for warmup check)
-            self.strategy._update_bar(bar)
+            strategy._update_bar(bar)
 
             # Also store treasury bar if available (strategy needs TLT for Treasury Overlay)
-            if treasury_df is not None and len(treasury_df) > idx:
-                treasury_row = treasury_df.iloc[idx]
-                treasury_bar = MarketDataEvent(
-                    symbol=treasury_symbol,
-                    timestamp=treasury_row['date'],
-                    open=Decimal(str(treasury_row['open'])),
-                    high=Decimal(str(treasury_row['high'])),
-                    low=Decimal(str(treasury_row['low'])),
-                    close=Decimal(str(treasury_row['close'])),
-                    volume=int(treasury_row['volume']),
-                    timeframe="1D"
-                )
-                self.strategy._update_bar(treasury_bar)
+            if idx < len(treasury_bars):
+                strategy._update_bar(treasury_bars[idx])
 
             # Process bar through strategy
-            self.strategy.on_bar(bar)
+            strategy.on_bar(bar)
 
-        # Extract final signals from strategy state
-        signals = self.get_strategy_context()
-        signals['timestamp'] = signal_df.iloc[-1]['date']
+    def _calculate_incremental(
+        self,
+        signal_symbol: str,
+        signal_df: pd.DataFrame,
+        treasury_symbol: str,
+        treasury_df: Optional[pd.DataFrame]
+    ) -> None:
+        """
+        Bring self.strategy up to the last bar, resuming from the snapshot if valid.
 
-        logger.info(f"Signals calculated: Cell {signals['current_cell']}, Vol State {signals['vol_state']}")
-        return signals
+        The last bar may be a synthetic intraday bar, so it is never baked
+        into the snapshot: the new snapshot is taken after the second-to-last
+        bar and the last bar is applied on a working copy.
+
+        Every SNAPSHOT_VERIFY_EVERY resumed runs the resumed state is checked
+        against a full replay; the full replay is kept (and re-snapshotted)
+        either way, and a mismatch is logged.
+        """
+        n_bars = len(signal_df)
+        start = self._resume_position(signal_df, treasury_df)
+        if start is None:
+            self.strategy = self._advance(
+                pickle.loads(self._base_state), signal_symbol, signal_df,
+                treasury_symbol, treasury_df, 0, resumes=0
+            )
+            logger.info(f"Signals replayed from full history ({n_bars} bars)")
+            return
+
+        resumes = self._snapshot.resumes + 1
+        verify = resumes >= SNAPSHOT_VERIFY_EVERY
+        resumed_at = self._snapshot.last_timestamp
+        strategy = self._advance(
+            self._snapshot.restore(), signal_symbol, signal_df,
+            treasury_symbol, treasury_df, start, resumes=None if verify else resumes
+        )
+
+        if verify:
+            replayed = self._advance(
+                pickle.loads(self._base_state), signal_symbol, signal_df,
+                treasury_symbol, treasury_df, 0, resumes=0
+            )
+            if self.get_strategy_context(strategy) != self.get_strategy_context(replayed):
+                logger.warning(
+                    f"Signals resumed from snapshot at {resumed_at} differ from a full "
+                    f"replay after {resumes} resumed runs, using the full replay"
+                )
+            else:
+                logger.info(f"Snapshot verified against a full replay after {resumes} resumed runs")
+            strategy = replayed
+
+        self.strategy = strategy
+        logger.info(
+            f"Signals resumed from snapshot at {resumed_at}: "
+            f"applied {n_bars - start} new bars"
+        )
+
+    def _advance(
+        self,
+        strategy: Strategy,
+        signal_symbol: str,
+        signal_df: pd.DataFrame,
+        treasury_symbol: str,
+        treasury_df: Optional[pd.DataFrame],
+        start: int,
+        resumes: Optional[int]
+    ) -> Strategy:
+        """
+        Feed bars [start, n) to a strategy, snapshotting after the completed bars.
+
+        Args:
+            resumes: Resume count to record in the new snapshot, or None to
+                skip snapshotting
+
+        Returns:
+            The strategy after every bar, including the last (possibly synthetic) one
+        """
+        n_bars = len(signal_df)
+        completed = max(n_bars - 1, start)
+        self._feed_bars(strategy, signal_symbol, signal_df, treasury_symbol, treasury_df,
+                        start, completed)
+        if resumes is not None and completed > 0 and (start == 0 or completed > start):
+            self._take_snapshot(strategy, signal_df, treasury_df, completed, resumes)
+        self._feed_bars(strategy, signal_symbol, signal_df, treasury_symbol, treasury_df,
+                        completed, n_bars)
+        return strategy
+
+    def _resume_position(
+        self,
+        signal_df: pd.DataFrame,
+        treasury_df: Optional[pd.DataFrame]
+    ) -> Optional[int]:
+        """
+        Index of the first bar the snapshot has not absorbed, or None to replay.
+
+        Consistency check: the snapshot must belong to this strategy and
+        parameters, its last bar must appear exactly once in the new data,
+        and the bars it absorbed last must be unchanged there.
+        """
+        snapshot = self._load_snapshot()
+        if snapshot is None:
+            return None
+
+        try:
+            matches = (signal_df['date'] == snapshot.last_timestamp).to_numpy().nonzero()[0]
+        except TypeError:  # tz-aware vs naive dates
+            matches = []
+        if len(matches) != 1:
+            logger.info(
+                f"Snapshot bar {snapshot.last_timestamp} not in market data, replaying full history"
+            )
+            return None
+        start = int(matches[0]) + 1
+
+        tail = min(len(snapshot.signal_tail), start)
+        signal_rows = _frame_rows(signal_df, start - tail, start)
+        treasury_rows = _frame_rows(treasury_df, start - tail, start)
+        if (
+            tail == 0
+            or signal_rows != snapshot.signal_tail[-tail:]
+            or treasury_rows != snapshot.treasury_tail[-tail:]
+        ):
+            logger.warning("Market data changed under the signal snapshot, replaying full history")
+            return None
+        return start
+
+    def _take_snapshot(
+        self,
+        strategy: Strategy,
+        signal_df: pd.DataFrame,
+        treasury_df: Optional[pd.DataFrame],
+        completed: int,
+        resumes: int = 0
+    ) -> None:
+        """
+        Record (and persist) the strategy state after bars [0, completed).
+
+        The strategy's bar history is trimmed first to SNAPSHOT_HISTORY_WARMUPS
+        times its warmup per symbol, so the pickle stays bounded however long
+        the history grows.
+        """
+        strategy._trim_history(SNAPSHOT_HISTORY_WARMUPS * strategy.get_required_warmup_bars())
+        self._snapshot = SignalSnapshot(
+            state=pickle.dumps(strategy, protocol=pickle.HIGHEST_PROTOCOL),
+            fingerprint=self._fingerprint,
+            last_timestamp=signal_df['date'].iloc[completed - 1],
+            signal_tail=_frame_rows(signal_df, completed - SNAPSHOT_TAIL_BARS, completed),
+            treasury_tail=_frame_rows(treasury_df, completed - SNAPSHOT_TAIL_BARS, completed),
+            resumes=resumes,
+        )
+
+        path = self._snapshot_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(self._snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.warning(f"Could not persist signal snapshot to {path}: {e}")
+
+    def _load_snapshot(self) -> Optional[SignalSnapshot]:
+        """In-memory snapshot, else the persisted one for this fingerprint."""
+        if self._snapshot is None:
+            path = self._snapshot_path()
+            if path.exists():
+                try:
+                    with open(path, 'rb') as f:
+                        self._snapshot = pickle.load(f)
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable signal snapshot {path}: {e}")
+        if self._snapshot is not None and self._snapshot.fingerprint != self._fingerprint:
+            self._snapshot = None
+        return self._snapshot
+
+    def _snapshot_path(self) -> Path:
+        name = self.config['strategy'].get('name', self.strategy_class.__name__)
+        return self.snapshot_dir / f"{name}_{self._fingerprint[:16]}.pkl"
+
+    def _strategy_fingerprint(self) -> str:
+        """Hash of the strategy class hierarchy source and configured parameters."""
+        digest = hashlib.sha256()
+        for cls in self.strategy_class.__mro__:
+            if cls.__module__ == 'builtins':
+                continue
+            digest.update(f"{cls.__module__}.{cls.__qualname__}".encode())
+            try:
+                with open(inspect.getsourcefile(cls), 'rb') as f:
+                    digest.update(f.read())
+            except (TypeError, OSError):
+                pass
+        digest.update(json.dumps(
+            self.config['strategy']['parameters'], sort_keys=True, default=str
+        ).encode())
+        return digest.hexdigest()
 
     def calculate_signal_stream(self, market_data: Dict[str, pd.DataFrame]) -> List[Dict[str, Any]]:
         """Replay bars chronologically, recording per-bar regime state (no portfolio).
@@ -314,33 +620,24 @@ class LiveStrategyRunner:
         treasury_df = market_data.get(treasury_symbol)
 
         stream: List[Dict[str, Any]] = []
-        for idx in range(len(signal_df)):
-            row = signal_df.iloc[idx]
-            bar = MarketDataEvent(
-                symbol=signal_symbol, timestamp=row['date'],
-                open=Decimal(str(row['open'])), high=Decimal(str(row['high'])),
-                low=Decimal(str(row['low'])), close=Decimal(str(row['close'])),
-                volume=int(row['volume']), timeframe="1D")
+        signal_bars = _bars_from_frame(signal_symbol, signal_df)
+        treasury_bars = _bars_from_frame(treasury_symbol, treasury_df)
+        for idx, bar in enumerate(signal_bars):
             self.strategy._update_bar(bar)
-            if treasury_df is not None and len(treasury_df) > idx:
-                trow = treasury_df.iloc[idx]
-                self.strategy._update_bar(MarketDataEvent(
-                    symbol=treasury_symbol, timestamp=trow['date'],
-                    open=Decimal(str(trow['open'])), high=Decimal(str(trow['high'])),
-                    low=Decimal(str(trow['low'])), close=Decimal(str(trow['close'])),
-                    volume=int(trow['volume']), timeframe="1D"))
+            if idx < len(treasury_bars):
+                self.strategy._update_bar(treasury_bars[idx])
             self.strategy.on_bar(bar)
             trend, vol, cell = self.strategy.get_current_regime()
             z = getattr(self.strategy, '_last_z_score', None)
             stream.append({
-                "date": row['date'],
+                "date": bar.timestamp,
                 "cell": cell,
                 "vol_state": vol,
                 "z_score": float(z) if z is not None else float("nan"),
             })
         return stream
 
-    def get_strategy_context(self) -> Dict[str, Any]:
+    def get_strategy_context(self, strategy: Optional[Strategy] = None) -> Dict[str, Any]:
         """
         Get current strategy context for trade logging.
 
@@ -351,27 +648,31 @@ class LiveStrategyRunner:
         - Indicator values (t_norm, z_score)
         - Decision tree indicators (SMA fast/slow, vol-crush, bond trend)
 
+        Args:
+            strategy: Strategy to read (default: self.strategy)
+
         Returns:
             Strategy context dictionary for trade recording
         """
+        strategy = self.strategy if strategy is None else strategy
         return {
-            'current_cell': getattr(self.strategy, 'cell_id', None),
-            'trend_state': getattr(self.strategy, 'trend_state', None),
-            'vol_state': getattr(self.strategy, 'vol_state', None),
-            't_norm': getattr(self.strategy, '_last_t_norm', None),
-            'z_score': getattr(self.strategy, '_last_z_score', None),
+            'current_cell': getattr(strategy, 'cell_id', None),
+            'trend_state': getattr(strategy, 'trend_state', None),
+            'vol_state': getattr(strategy, 'vol_state', None),
+            't_norm': getattr(strategy, '_last_t_norm', None),
+            'z_score': getattr(strategy, '_last_z_score', None),
 
             # Decision tree indicators
-            'sma_fast': getattr(self.strategy, '_last_sma_fast', None),
-            'sma_slow': getattr(self.strategy, '_last_sma_slow', None),
-            'vol_crush_triggered': getattr(self.strategy, '_last_vol_crush_triggered', False),
-            'bond_sma_fast': getattr(self.strategy, '_last_bond_sma_fast', None),
-            'bond_sma_slow': getattr(self.strategy, '_last_bond_sma_slow', None),
-            'bond_trend': getattr(self.strategy, '_last_bond_trend', None),
+            'sma_fast': getattr(strategy, '_last_sma_fast', None),
+            'sma_slow': getattr(strategy, '_last_sma_slow', None),
+            'vol_crush_triggered': getattr(strategy, '_last_vol_crush_triggered', False),
+            'bond_sma_fast': getattr(strategy, '_last_bond_sma_fast', None),
+            'bond_sma_slow': getattr(strategy, '_last_bond_sma_slow', None),
+            'bond_trend': getattr(strategy, '_last_bond_trend', None),
 
             # Keep existing attributes for compatibility
-            'equity_trend': getattr(self.strategy, 'trend_state', None),
-            'bond_trend_state': getattr(self.strategy, '_last_bond_trend', None),  # Use _last_bond_trend instead
+            'equity_trend': getattr(strategy, 'trend_state', None),
+            'bond_trend_state': getattr(strategy, '_last_bond_trend', None),  # Use _last_bond_trend instead
         }
 
     def determine_target_allocation(
@@ -4,6 +4,8 @@ Parameter Optimization Module for Jutsu Labs Backtesting Engine.
 This module provides tools for optimizing strategy parameters through various methods:
 - Grid Search: Exhaustive parameter space exploration
 - Genetic Algorithm: Heuristic optimization with crossover/mutation
+- Successive Halving: Prunes weak combinations on short backtests first
+- Bayesian Optimization: Gaussian-process guided search over continuous ranges
 - Walk-Forward Analysis: Rolling window out-of-sample validation
 
 Example:
@@ -35,6 +37,8 @@ Example:
 from jutsu_engine.optimization.base import Optimizer
 from jutsu_engine.optimization.grid_search import GridSearchOptimizer
 from jutsu_engine.optimization.genetic import GeneticOptimizer
+from jutsu_engine.optimization.successive_halving import SuccessiveHalvingOptimizer
+from jutsu_engine.optimization.bayesian import BayesianOptimizer
 from jutsu_engine.optimization.walk_forward import WalkForwardAnalyzer
 from jutsu_engine.optimization.results import OptimizationResults
 from jutsu_engine.optimization.visualizer import OptimizationVisualizer
@@ -44,6 +48,8 @@ __all__ = [
     'Optimizer',
     'GridSearchOptimizer',
     'GeneticOptimizer',
+    'SuccessiveHalvingOptimizer',
+    'BayesianOptimizer',
     'WalkForwardAnalyzer',
     'OptimizationResults',
     'OptimizationVisualizer',
@@ -5,9 +5,11 @@ Provides common interface and functionality for parameter optimization.
 All concrete optimizers (GridSearch, Genetic, etc.) inherit from this class.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple, Union
 from decimal import Decimal
 from datetime import datetime
+from pathlib import Path
+import importlib
 
 from jutsu_engine.core.strategy_base import Strategy
 from jutsu_engine.application.backtest_runner import BacktestRunner
@@ -82,6 +84,90 @@ class Optimizer(ABC):
             f"{self._count_combinations()} total combinations"
         )
 
+    @classmethod
+    def from_grid_config(
+        cls,
+        grid_config: Union[str, Path, Any],
+        symbol_set: Optional[str] = None,
+        **optimizer_kwargs
+    ) -> Tuple['Optimizer', Dict[str, Any]]:
+        """
+        Build an optimizer and its backtest arguments from a grid-search YAML.
+
+        Uses the same strategy lookup, symbol handling and parameter type
+        conversion as GridSearchRunner, so optimizers search the
+        grid-configs/ spaces with the same backtests.
+
+        Args:
+            grid_config: Path to a grid-search YAML or a loaded GridSearchConfig
+            symbol_set: Name of the symbol set to optimize (default: first)
+            **optimizer_kwargs: Optimizer arguments (objective, maximize, ...)
+
+        Returns:
+            (optimizer, backtest_kwargs) - pass backtest_kwargs to optimize()
+
+        Raises:
+            ValueError: If symbol_set is not in the config
+        """
+        from jutsu_engine.application.grid_search_runner import (
+            GridSearchRunner,
+            _build_strategy_params,
+            _get_strategy_class_from_module,
+            _parse_end_date,
+            _symbols_for_set,
+        )
+
+        if isinstance(grid_config, (str, Path)):
+            grid_config = GridSearchRunner.load_config(str(grid_config))
+
+        if symbol_set is None:
+            selected = grid_config.symbol_sets[0]
+            if len(grid_config.symbol_sets) > 1:
+                logger.warning(
+                    f"Grid config has {len(grid_config.symbol_sets)} symbol sets, "
+                    f"optimizing the first: {selected.name}"
+                )
+        else:
+            matches = [s for s in grid_config.symbol_sets if s.name == symbol_set]
+            if not matches:
+                raise ValueError(f"Symbol set not in grid config: {symbol_set}")
+            selected = matches[0]
+
+        module = importlib.import_module(f"jutsu_engine.strategies.{grid_config.strategy_name}")
+        strategy_class = _get_strategy_class_from_module(module)
+
+        # Convert each value the way GridSearchRunner does (e.g. float -> Decimal);
+        # parameters the strategy does not accept are dropped
+        parameter_space = {}
+        for name, values in grid_config.parameters.items():
+            converted = [_build_strategy_params(strategy_class, {}, {name: v}) for v in values]
+            if all(name in params for params in converted):
+                parameter_space[name] = [params[name] for params in converted]
+            else:
+                logger.debug(f"Ignoring grid parameter not accepted by strategy: {name}")
+
+        base_config = dict(grid_config.base_config)
+        start_date = base_config.pop('start_date')
+        if isinstance(start_date, str):
+            start_date = datetime.strptime(start_date, '%Y-%m-%d')
+        backtest_kwargs = {
+            'symbol': selected.signal_symbol,
+            'symbols': _symbols_for_set(selected),
+            'timeframe': base_config.pop('timeframe'),
+            'start_date': start_date,
+            'end_date': _parse_end_date(base_config.pop('end_date')),
+            'initial_capital': Decimal(str(base_config.pop('initial_capital'))),
+            'strategy_params': _build_strategy_params(strategy_class, selected, {}),
+            'backtest_config': {**base_config, 'strategy_name': grid_config.strategy_name},
+        }
+
+        optimizer = cls(
+            strategy_class=strategy_class,
+            parameter_space=parameter_space,
+            **optimizer_kwargs
+        )
+        return optimizer, backtest_kwargs
+
     def _count_combinations(self) -> int:
         """Count total number of parameter combinations."""
         count = 1
@@ -139,6 +225,16 @@ class Optimizer(ABC):
                 - start_date: datetime
                 - end_date: datetime
                 - initial_capital: Decimal
+                Optional keys:
+                - commission_per_share, slippage_percent: Decimal
+                - result_cache: str | BacktestResultCache | None - reuse
+                  results of identical earlier evaluations
+                - symbols: List[str] - all symbols to load (multi-symbol
+                  strategies; symbol is then just the primary)
+                - strategy_params: Dict - fixed constructor arguments,
+                  overridden by parameters
+                - backtest_config: Dict - extra BacktestRunner config
+                  entries (e.g. output_mode, database_url)
 
         Returns:
             Objective function value (e.g., Sharpe ratio)
@@ -148,24 +244,24 @@ class Optimizer(ABC):
         """
         try:
             # Create strategy instance with parameters
-            strategy = self.strategy_class(**parameters)
+            strategy = self.strategy_class(
+                **{**backtest_kwargs.get('strategy_params', {}), **parameters}
+            )
 
             # Configure backtest
             config = {
+                'commission_per_share': Decimal('0.01'),
+                'slippage_percent': Decimal('0.001'),
+                **backtest_kwargs.get('backtest_config', {}),
                 'symbol': backtest_kwargs['symbol'],
                 'timeframe': backtest_kwargs['timeframe'],
                 'start_date': backtest_kwargs['start_date'],
                 'end_date': backtest_kwargs['end_date'],
                 'initial_capital': backtest_kwargs['initial_capital'],
-                'commission_per_share': backtest_kwargs.get(
-                    'commission_per_share',
-                    Decimal('0.01')
-                ),
-                'slippage_percent': backtest_kwargs.get(
-                    'slippage_percent',
-                    Decimal('0.001')
-                ),
             }
+            for key in ('commission_per_share', 'slippage_percent', 'symbols', 'result_cache'):
+                if key in backtest_kwargs:
+                    config[key] = backtest_kwargs[key]
 
             # Run backtest
             runner = BacktestRunner(config)
@@ -0,0 +1,531 @@
+"""
+Bayesian optimizer (Gaussian-process surrogate with asynchronous batches).
+
+Instead of backtesting every grid point, a Gaussian process (Matern 5/2
+kernel, hyperparameters fitted by maximum marginal likelihood with SciPy) is
+fitted to the evaluations so far, and the next parameters are those with
+the highest expected improvement. Proposals are asynchronous: whenever a
+worker finishes a backtest the surrogate is refitted and that worker gets
+a new proposal immediately, so all cores stay busy. Proposals still
+running are treated as already evaluated with the worst observed value
+("constant liar"), which keeps concurrent proposals apart.
+
+Grid-config parameter lists map to search dimensions:
+- all ints: integer range [min, max]
+- numeric with floats/Decimals: continuous range [min, max] (Decimal
+  values are proposed as Decimals)
+- anything else (strings, bools, mixed) or names passed in categorical:
+  categorical choice among the listed values
+"""
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import partial
+import math
+import time
+
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+from scipy.optimize import minimize
+from scipy.stats import norm, qmc
+
+from jutsu_engine.optimization.base import Optimizer
+from jutsu_engine.optimization.parallel import ParallelExecutor, create_evaluation_task
+from jutsu_engine.optimization.results import OptimizationResults
+from jutsu_engine.utils.logging_config import setup_logger
+
+logger = setup_logger('APP.OPTIMIZATION.BAYESIAN')
+
+
+@dataclass
+class _Dimension:
+    """One search dimension inferred from a parameter's value list."""
+
+    name: str
+    kind: str  # 'int', 'float' or 'categorical'
+    values: List[Any]
+    low: float = 0.0
+    high: float = 0.0
+    decimals: int = 6
+    is_decimal: bool = False
+
+    @property
+    def width(self) -> int:
+        """Number of encoded columns."""
+        return len(self.values) if self.kind == 'categorical' else 1
+
+
+def _decimal_places(value: Any) -> int:
+    exponent = Decimal(str(value)).normalize().as_tuple().exponent
+    return max(0, -exponent) if isinstance(exponent, int) else 0
+
+
+def _infer_dimension(name: str, values: List[Any], categorical: bool = False) -> _Dimension:
+    """Map a grid-config value list to a search dimension."""
+    numeric = all(
+        isinstance(v, (int, float, Decimal)) and not isinstance(v, bool) for v in values
+    )
+    if categorical or not numeric or len(set(values)) < 2:
+        return _Dimension(name, 'categorical', list(dict.fromkeys(values)))
+
+    low, high = float(min(values)), float(max(values))
+    if all(isinstance(v, int) for v in values):
+        return _Dimension(name, 'int', list(values), low, high, decimals=0)
+
+    # Propose two more decimal places than the grid uses (at most 6)
+    decimals = min(max(_decimal_places(v) for v in values) + 2, 6)
+    is_decimal = any(isinstance(v, Decimal) for v in values)
+    return _Dimension(name, 'float', list(values), low, high, decimals, is_decimal)
+
+
+def _json_safe(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Parameters with Decimals as floats (OptimizationResults stores JSON)."""
+    return {k: float(v) if isinstance(v, Decimal) else v for k, v in parameters.items()}
+
+
+class _GaussianProcess:
+    """Matern 5/2 GP regression on [0, 1]^d with ARD length scales."""
+
+    def __init__(self):
+        self.log_params: Optional[np.ndarray] = None
+
+    @staticmethod
+    def _kernel(a: np.ndarray, b: np.ndarray, length_scales: np.ndarray, variance: float) -> np.ndarray:
+        diff = (a[:, None, :] - b[None, :, :]) / length_scales
+        r = np.sqrt(np.maximum((diff ** 2).sum(axis=-1), 0.0))
+        sqrt5_r = math.sqrt(5.0) * r
+        return variance * (1.0 + sqrt5_r + sqrt5_r ** 2 / 3.0) * np.exp(-sqrt5_r)
+
+    def _unpack(self, log_params: np.ndarray) -> Tuple[np.ndarray, float, float]:
+        params = np.exp(log_params)
+        return params[:-2], params[-2], params[-1]
+
+    def _neg_log_likelihood(self, log_params: np.ndarray, x: np.ndarray, y: np.ndarray) -> float:
+        length_scales, variance, noise = self._unpack(log_params)
+        k = self._kernel(x, x, length_scales, variance) + (noise + 1e-8) * np.eye(len(x))
+        try:
+            factor = cho_factor(k, lower=True)
+        except np.linalg.LinAlgError:
+            return 1e10
+        alpha = cho_solve(factor, y)
+        return float(0.5 * y @ alpha + np.log(np.diag(factor[0])).sum())
+
+    def fit(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Fit hyperparameters (warm-started from the previous fit) and cache the solve."""
+        n_dims = x.shape[1]
+        if self.log_params is None or len(self.log_params) != n_dims + 2:
+            self.log_params = np.log(np.r_[np.full(n_dims, 0.3), 1.0, 0.01])
+        # Length scales are capped at twice the unit range: longer ones let a
+        # sparse initial design declare an influential parameter irrelevant
+        bounds = [(math.log(0.01), math.log(2.0))] * n_dims + [
+            (math.log(0.05), math.log(20.0)), (math.log(1e-6), math.log(1.0))
+        ]
+        result = minimize(
+            self._neg_log_likelihood, self.log_params, args=(x, y),
+            method='L-BFGS-B', bounds=bounds, options={'maxiter': 50},
+        )
+        if np.all(np.isfinite(result.x)):
+            self.log_params = result.x
+
+        length_scales, variance, noise = self._unpack(self.log_params)
+        k = self._kernel(x, x, length_scales, variance) + (noise + 1e-8) * np.eye(len(x))
+        self._x = x
+        self._factor = cho_factor(k, lower=True)
+        self._alpha = cho_solve(self._factor, y)
+
+    def predict(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Posterior mean and standard deviation."""
+        length_scales, variance, _ = self._unpack(self.log_params)
+        k_star = self._kernel(x, self._x, length_scales, variance)
+        mean = k_star @ self._alpha
+        v = cho_solve(self._factor, k_star.T)
+        var = np.maximum(variance - (k_star * v.T).sum(axis=1), 1e-12)
+        return mean, np.sqrt(var)
+
+
+class BayesianOptimizer(Optimizer):
+    """
+    Gaussian-process Bayesian optimization with asynchronous batch proposals.
+
+    Suited to large grids over continuous parameters (e.g. upper_thresh_z,
+    leverage_scalar), where a few hundred guided evaluations replace
+    thousands of grid points.
+
+    Example:
+        >>> optimizer, backtest_kwargs = BayesianOptimizer.from_grid_config(
+        ...     'grid-configs/examples/grid_search_hierarchical_adaptive_v3_5b.yaml',
+        ...     objective='sharpe_ratio',
+        ...     n_iterations=200,
+        ...     results_store=OptimizationResults()
+        ... )
+        >>> results = optimizer.optimize(**backtest_kwargs)
+        >>>
+        >>> print(f"Best parameters: {results['parameters']}")
+        >>> print(f"Evaluations: {results['n_evaluated']}")
+    """
+
+    def __init__(
+        self,
+        *args,
+        n_iterations: int = 200,
+        n_initial: int = 20,
+        n_candidates: int = 2000,
+        xi: float = 0.01,
+        categorical: Iterable[str] = (),
+        random_state: Optional[int] = None,
+        results_store: Optional[OptimizationResults] = None,
+        **kwargs
+    ):
+        """
+        Initialize Bayesian optimizer.
+
+        Args:
+            *args: Arguments for Optimizer base class
+            n_iterations: Total number of backtests (including the initial design)
+            n_initial: Latin-hypercube points evaluated before the surrogate is used
+            n_candidates: Random candidates scored by expected improvement per proposal
+            xi: Exploration margin of expected improvement (in standardized units)
+            categorical: Parameter names to treat as categorical even if numeric
+            random_state: Seed for the initial design and candidate sampling
+            results_store: If given, the best result is stored there after optimize()
+            **kwargs: Additional arguments for Optimizer base class
+
+        Raises:
+            ValueError: If n_iterations < 1, n_initial < 1 or n_candidates < 1
+        """
+        if n_iterations < 1:
+            raise ValueError(f"n_iterations must be >= 1, got {n_iterations}")
+        if n_initial < 1:
+            raise ValueError(f"n_initial must be >= 1, got {n_initial}")
+        if n_candidates < 1:
+            raise ValueError(f"n_candidates must be >= 1, got {n_candidates}")
+
+        super().__init__(*args, **kwargs)
+
+        categorical = set(categorical)
+        self.dimensions = [
+            _infer_dimension(name, list(values), name in categorical)
+            for name, values in self.parameter_space.items()
+        ]
+        self.n_iterations = n_iterations
+        self.n_initial = n_initial
+        self.n_candidates = n_candidates
+        self.xi = xi
+        self.random_state = random_state
+        self.results_store = results_store
+
+        logger.info(
+            "Bayesian search space: " + ", ".join(
+                f"{d.name}={d.kind}" + (f"[{d.low:g}, {d.high:g}]" if d.kind != 'categorical'
+                                        else f"{{{len(d.values)}}}")
+                for d in self.dimensions
+            )
+        )
+
+    def __getstate__(self):
+        # Worker processes only need evaluate_parameters(); the results store
+        # holds a database session
+        state = self.__dict__.copy()
+        state.update(results_store=None, results=[], _surrogate=None)
+        return state
+
+    def optimize(
+        self,
+        parallel: bool = True,
+        n_jobs: int = -1,
+        **backtest_kwargs
+    ) -> Dict[str, Any]:
+        """
+        Run Bayesian optimization.
+
+        Args:
+            parallel: Whether to evaluate proposals in a process pool
+            n_jobs: Number of parallel jobs (-1 = all cores)
+            **backtest_kwargs: Arguments passed to BacktestRunner
+                Required keys:
+                - symbol: str
+                - timeframe: str
+                - start_date: datetime
+                - end_date: datetime
+                - initial_capital: Decimal
+
+        Returns:
+            Dictionary with:
+            - 'parameters': Dict of best parameter values
+            - 'objective_value': Best objective function value
+            - 'all_results': Every evaluation in completion order, with 'iteration'
+            - 'best_so_far': Best objective after each evaluation
+            - 'n_evaluated': Number of backtests run
+            - 'execution_mode': 'parallel' or 'sequential'
+            - 'result_id': OptimizationResults ID (only with results_store)
+
+        Raises:
+            ValueError: If backtest_kwargs are invalid
+            RuntimeError: If no evaluation succeeded
+        """
+        self._validate_backtest_kwargs(backtest_kwargs)
+
+        self._rng = np.random.default_rng(self.random_state)
+        self._surrogate = _GaussianProcess()
+        budget = min(self.n_iterations, self._space_size())
+        initial = self._initial_design(min(self.n_initial, budget))
+
+        executor = ParallelExecutor(n_jobs=n_jobs, show_progress=False)
+        use_parallel = parallel and executor.n_jobs > 1 and budget > 1
+
+        logger.info(
+            f"Bayesian optimization: {budget} evaluations "
+            f"({len(initial)} initial), {executor.n_jobs if use_parallel else 1} workers"
+        )
+
+        self.results = []
+        start = time.time()
+        if use_parallel:
+            self._run_async(initial, budget, executor.n_jobs, backtest_kwargs)
+        else:
+            self._run_sequential(initial, budget, backtest_kwargs)
+
+        successful = [r for r in self.results if r['success']]
+        if not successful:
+            raise RuntimeError("Bayesian optimization failed: no results obtained")
+
+        best_result = self._get_best_result(successful)
+        best_so_far, best = [], None
+        for result in self.results:
+            if result['success'] and (best is None or (result['objective'] > best) == self.maximize):
+                best = result['objective']
+            best_so_far.append(best)
+
+        logger.info(
+            f"Bayesian optimization complete: Best {self.objective} = "
+            f"{best_result['objective']:.4f} with parameters {best_result['parameters']} "
+            f"({len(self.results)} backtests in {time.time() - start:.1f}s)"
+        )
+
+        results = {
+            'parameters': best_result['parameters'],
+            'objective_value': best_result['objective'],
+            'all_results': self.results,
+            'best_so_far': best_so_far,
+            'n_evaluated': len(self.results),
+            'execution_mode': 'parallel' if use_parallel else 'sequential'
+        }
+        if self.results_store is not None:
+            results['result_id'] = self._store(best_result, backtest_kwargs)
+        return results
+
+    def _run_sequential(
+        self,
+        initial: List[Dict[str, Any]],
+        budget: int,
+        backtest_kwargs: Dict[str, Any]
+    ) -> None:
+        """Propose and evaluate one point at a time."""
+        while len(self.results) < budget:
+            params = initial.pop(0) if initial else self._propose([])
+            if params is None:
+                break
+            self._record(create_evaluation_task(params, self.evaluate_parameters, **backtest_kwargs))
+
+    def _run_async(
+        self,
+        initial: List[Dict[str, Any]],
+        budget: int,
+        n_workers: int,
+        backtest_kwargs: Dict[str, Any]
+    ) -> None:
+        """Keep n_workers backtests running, proposing a new one as each finishes."""
+        worker = partial(create_evaluation_task, evaluator=self.evaluate_parameters, **backtest_kwargs)
+        pending = {}
+        submitted = 0
+
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            while True:
+                while len(pending) < n_workers and submitted < budget:
+                    params = initial.pop(0) if initial else self._propose(list(pending.values()))
+                    if params is None:
+                        budget = submitted  # Discrete space exhausted
+                        break
+                    pending[pool.submit(worker, params)] = params
+                    submitted += 1
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    params = pending.pop(future)
+                    try:
+                        self._record(future.result())
+                    except Exception as e:
+                        logger.error(f"Task failed for {params}: {e}")
+                        self._record({'parameters': params, 'success': False, 'error': str(e)})
+
+    def _record(self, result: Dict[str, Any]) -> None:
+        """Append an evaluation result (failures get the worst objective)."""
+        objective = result.get('objective')
+        success = result.get('success', False) and objective is not None and math.isfinite(objective)
+        if not success:
+            objective = float('-inf') if self.maximize else float('inf')
+        self.results.append({
+            **result,
+            'objective': objective,
+            'success': success,
+            'iteration': len(self.results),
+        })
+        if success:
+            logger.info(
+                f"[{len(self.results)}] Evaluated {result['parameters']}: "
+                f"{self.objective}={objective:.4f}"
+            )
+
+    def _propose(self, pending: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Next parameters by expected improvement (None if nothing new is left).
+
+        Pending parameters are added to the training data with the worst
+        observed value so concurrent proposals do not coincide.
+        """
+        seen = {self._key(r['parameters']) for r in self.results} | {self._key(p) for p in pending}
+        observed = [r for r in self.results if r['success']]
+        if len(observed) < 2:
+            return self._random_unseen(seen)
+
+        sign = 1.0 if self.maximize else -1.0
+        y = np.array([sign * r['objective'] for r in observed])
+        worst = y.min()
+        failed = [r['parameters'] for r in self.results if not r['success']]
+        x = self._encode([r['parameters'] for r in observed] + failed + pending)
+        y = np.r_[y, np.full(len(failed) + len(pending), worst)]
+        scale = y.std() or 1.0
+        y = (y - y.mean()) / scale
+
+        try:
+            self._surrogate.fit(x, y)
+        except np.linalg.LinAlgError as e:
+            logger.warning(f"Surrogate fit failed ({e}), proposing a random point")
+            return self._random_unseen(seen)
+
+        candidates = [p for p in self._candidates(observed) if self._key(p) not in seen]
+        if not candidates:
+            return self._random_unseen(seen)
+
+        mean, std = self._surrogate.predict(self._encode(candidates))
+        best = y[:len(observed)].max()
+        z = (mean - best - self.xi) / std
+        expected_improvement = (mean - best - self.xi) * norm.cdf(z) + std * norm.pdf(z)
+        return candidates[int(np.argmax(expected_improvement))]
+
+    def _candidates(self, observed: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Uniform random points plus perturbations of the best observations."""
+        n_random = self.n_candidates // 2
+        points = [self._decode_row(row) for row in self._sample_unit(n_random)]
+
+        top = sorted(observed, key=lambda r: r['objective'], reverse=self.maximize)[:5]
+        per_point = (self.n_candidates - n_random) // max(len(top), 1)
+        for result in top:
+            center = self._encode([result['parameters']])[0]
+            noise = self._rng.normal(0.0, 0.1, size=(per_point, len(center)))
+            points.extend(self._decode_row(row) for row in np.clip(center + noise, 0.0, 1.0))
+        return points
+
+    def _initial_design(self, n: int) -> List[Dict[str, Any]]:
+        """Distinct Latin-hypercube points."""
+        sampler = qmc.LatinHypercube(d=len(self.dimensions), seed=self._rng)
+        design, seen = [], set()
+        for row in sampler.random(n):
+            params = self._decode_unit(row)
+            if self._key(params) not in seen:
+                seen.add(self._key(params))
+                design.append(params)
+        return design
+
+    def _random_unseen(self, seen: set) -> Optional[Dict[str, Any]]:
+        for row in self._sample_unit(200):
+            params = self._decode_row(row)
+            if self._key(params) not in seen:
+                return params
+        return None
+
+    def _sample_unit(self, n: int) -> np.ndarray:
+        """Random points in the encoded unit cube (one column per encoded feature)."""
+        return self._rng.random((n, sum(d.width for d in self.dimensions)))
+
+    def _decode_unit(self, row: np.ndarray) -> Dict[str, Any]:
+        """Parameters from one unit value per dimension (initial design)."""
+        params = {}
+        for dim, u in zip(self.dimensions, row):
+            if dim.kind == 'categorical':
+                params[dim.name] = dim.values[min(int(u * len(dim.values)), len(dim.values) - 1)]
+            else:
+                params[dim.name] = self._from_unit(dim, u)
+        return params
+
+    def _decode_row(self, row: np.ndarray) -> Dict[str, Any]:
+        """Parameters from an encoded row (categoricals take the largest column)."""
+        params, column = {}, 0
+        for dim in self.dimensions:
+            if dim.kind == 'categorical':
+                params[dim.name] = dim.values[int(np.argmax(row[column:column + dim.width]))]
+            else:
+                params[dim.name] = self._from_unit(dim, row[column])
+            column += dim.width
+        return params
+
+    def _from_unit(self, dim: _Dimension, u: float) -> Any:
+        value = dim.low + float(u) * (dim.high - dim.low)
+        if dim.kind == 'int':
+            return int(min(max(round(value), dim.low), dim.high))
+        value = round(value, dim.decimals)
+        return Decimal(str(value)) if dim.is_decimal else value
+
+    def _encode(self, parameter_sets: List[Dict[str, Any]]) -> np.ndarray:
+        """Encode parameters into the unit cube (one-hot categoricals)."""
+        rows = []
+        for params in parameter_sets:
+            row = []
+            for dim in self.dimensions:
+                value = params[dim.name]
+                if dim.kind == 'categorical':
+                    row.extend(1.0 if value == v else 0.0 for v in dim.values)
+                else:
+                    row.append((float(value) - dim.low) / (dim.high - dim.low))
+            rows.append(row)
+        return np.array(rows, dtype=float)
+
+    def _key(self, params: Dict[str, Any]) -> tuple:
+        return tuple(params[d.name] for d in self.dimensions)
+
+    def _space_size(self) -> float:
+        """Number of distinct points (inf with a continuous dimension)."""
+        size = 1
+        for dim in self.dimensions:
+            if dim.kind == 'float':
+                return float('inf')
+            size *= len(dim.values) if dim.kind == 'categorical' else int(dim.high - dim.low) + 1
+        return size
+
+    def _store(self, best_result: Dict[str, Any], backtest_kwargs: Dict[str, Any]) -> int:
+        """Persist the best result with OptimizationResults."""
+        top = sorted(
+            (r for r in self.results if r['success']),
+            key=lambda r: r['objective'], reverse=self.maximize
+        )[:10]
+        return self.results_store.store(
+            strategy_name=self.strategy_class.__name__,
+            optimizer_type='bayesian',
+            objective=self.objective,
+            objective_value=best_result['objective'],
+            parameters=_json_safe(best_result['parameters']),
+            symbol=backtest_kwargs['symbol'],
+            timeframe=backtest_kwargs['timeframe'],
+            start_date=backtest_kwargs['start_date'],
+            end_date=backtest_kwargs['end_date'],
+            metadata={
+                'n_evaluated': len(self.results),
+                'top_results': [
+                    {'parameters': _json_safe(r['parameters']), 'objective': r['objective']}
+                    for r in top
+                ],
+            }
+        )
@@ -3,11 +3,23 @@ Genetic algorithm optimizer using DEAP library.
 
 Heuristic optimization with crossover and mutation for large parameter spaces.
 More efficient than grid search for spaces with >1000 combinations.
+
+Fitness is memoized by parameter tuple: individuals that reappear across
+generations (common with small discrete grids) are not backtested again.
+Each generation's new genomes are evaluated in a process pool, and the memo
+can be persisted to disk so an interrupted or repeated run resumes without
+re-running finished backtests.
 """
-from typing import Dict, List, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 from decimal import Decimal
 from datetime import datetime
+from functools import partial
+from pathlib import Path
+import os
+import pickle
 import random
+import tempfile
+import time
 
 try:
     from deap import base, creator, tools, algorithms
@@ -16,7 +28,9 @@ try:
 except ImportError:
     DEAP_AVAILABLE = False
 
+from jutsu_engine.application.result_cache import BacktestResultCache, source_fingerprint
 from jutsu_engine.optimization.base import Optimizer
+from jutsu_engine.optimization.parallel import ParallelExecutor, create_evaluation_task
 from jutsu_engine.utils.logging_config import setup_logger
 
 logger = setup_logger('APP.OPTIMIZATION.GENETIC')
@@ -65,6 +79,7 @@ class GeneticOptimizer(Optimizer):
         *args,
         population_size: int = 50,
         generations: int = 100,
+        fitness_cache_dir: Optional[Union[str, Path]] = None,
         **kwargs
     ):
         """
@@ -74,6 +89,9 @@ class GeneticOptimizer(Optimizer):
             *args: Arguments for Optimizer base class
             population_size: Number of individuals in population
             generations: Maximum number of generations to evolve
+            fitness_cache_dir: Directory to persist the fitness memo in, so
+                restarted runs with the same strategy code, objective and
+                backtest arguments resume from it (None = in-memory only)
             **kwargs: Additional arguments for Optimizer base class
 
         Raises:
@@ -89,18 +107,36 @@ class GeneticOptimizer(Optimizer):
 
         self.population_size = population_size
         self.generations = generations
+        self.fitness_cache_dir = Path(fitness_cache_dir) if fitness_cache_dir else None
+
+        # (parameter tuple) -> fitness tuple, for the current backtest context
+        self._fitness_memo: Dict[tuple, tuple] = {}
+        self._memo_context: Optional[str] = None
+        self._generation_stats: List[Dict[str, Any]] = []
+        self._logbook = None
 
         logger.info(
             f"Genetic optimizer: population={population_size}, "
             f"generations={generations}"
         )
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Workers evaluating parameters only need the configuration."""
+        state = self.__dict__.copy()
+        state['_fitness_memo'] = {}
+        state['_generation_stats'] = []
+        state['_logbook'] = None
+        return state
+
     def optimize(
         self,
         crossover_prob: float = 0.7,
         mutation_prob: float = 0.2,
         tournament_size: int = 3,
         verbose: bool = True,
+        parallel: bool = True,
+        n_jobs: int = -1,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
         **backtest_kwargs
     ) -> Dict[str, Any]:
         """
@@ -111,6 +147,10 @@ class GeneticOptimizer(Optimizer):
             mutation_prob: Probability of mutation (0.0-1.0)
             tournament_size: Number of individuals in tournament selection
             verbose: Whether to print generation statistics
+            parallel: Whether to evaluate each generation in a process pool
+            n_jobs: Number of parallel jobs (-1 = all cores)
+            progress_callback: Optional callable(fraction, message), called as
+                each generation's individuals are evaluated
             **backtest_kwargs: Arguments passed to BacktestRunner
                 Required keys:
                 - symbol: str
@@ -126,6 +166,9 @@ class GeneticOptimizer(Optimizer):
             - 'convergence_history': Statistics for each generation
             - 'generations_run': Number of generations evolved
             - 'final_population': Final population parameters
+            - 'n_evaluated': Number of backtests actually run
+            - 'cache_hits': Fitness lookups served from the memo
+            - 'execution_mode': 'parallel' or 'sequential'
 
         Raises:
             ValueError: If backtest_kwargs are invalid
@@ -147,6 +190,19 @@ class GeneticOptimizer(Optimizer):
         # Create toolbox
         toolbox = self._create_toolbox(tournament_size, **backtest_kwargs)
 
+        # Evaluate each generation through the memo (and process pool)
+        executor = ParallelExecutor(n_jobs=n_jobs, show_progress=verbose)
+        use_parallel = parallel and executor.n_jobs > 1
+        self._load_fitness_memo(backtest_kwargs)
+        self._generation_stats = []
+        toolbox.register(
+            "map",
+            self._map_fitness,
+            executor=executor if use_parallel else None,
+            backtest_kwargs=backtest_kwargs,
+            progress_callback=progress_callback
+        )
+
         # Initialize population
         population = toolbox.population(n=self.population_size)
 
@@ -177,13 +233,18 @@ class GeneticOptimizer(Optimizer):
             verbose=verbose
         )
 
+        self._logbook = logbook
+
         # Extract best individual
         best_individual = hof[0]
         best_params = self._individual_to_params(best_individual)
 
+        n_evaluated = sum(g['backtests'] for g in self._generation_stats)
+        cache_hits = sum(g['cache_hits'] for g in self._generation_stats)
         logger.info(
             f"Genetic algorithm complete: Best {self.objective} = "
-            f"{best_individual.fitness.values[0]:.4f} with parameters {best_params}"
+            f"{best_individual.fitness.values[0]:.4f} with parameters {best_params} "
+            f"({n_evaluated} backtests, {cache_hits} memo hits)"
         )
 
         # Extract final population parameters
@@ -196,9 +257,151 @@ class GeneticOptimizer(Optimizer):
             'objective_value': best_individual.fitness.values[0],
             'convergence_history': logbook,
             'generations_run': len(logbook),
-            'final_population': final_population
+            'final_population': final_population,
+            'n_evaluated': n_evaluated,
+            'cache_hits': cache_hits,
+            'execution_mode': 'parallel' if use_parallel else 'sequential'
         }
 
+    def _map_fitness(
+        self,
+        evaluate,
+        individuals,
+        executor: Optional[ParallelExecutor] = None,
+        backtest_kwargs: Optional[Dict[str, Any]] = None,
+        progress_callback: Optional[Callable[[float, str], None]] = None
+    ) -> List[tuple]:
+        """
+        DEAP toolbox map: fitness for a generation's unevaluated individuals.
+
+        Only parameter tuples missing from the memo are backtested, each
+        once; the rest are memo hits. Records the generation's timing.
+
+        Args:
+            evaluate: Toolbox evaluate function (used for sequential runs)
+            individuals: Individuals needing fitness values
+            executor: ParallelExecutor for parallel runs, None for sequential
+            backtest_kwargs: Arguments for BacktestRunner
+            progress_callback: Optional callable(fraction, message) for the
+                whole run (the initial population plus every generation)
+
+        Returns:
+            Fitness tuples in the order of individuals
+        """
+        start_time = time.time()
+        keys = [tuple(individual) for individual in individuals]
+        pending = list(dict.fromkeys(key for key in keys if key not in self._fitness_memo))
+
+        generation = len(self._generation_stats)
+
+        def report(fraction: float) -> None:
+            if progress_callback is not None:
+                progress_callback(
+                    (generation + fraction) / (self.generations + 1),
+                    f"GA generation {generation}/{self.generations}"
+                )
+
+        failed = set()
+        if executor is not None and len(pending) > 1:
+            worker = partial(
+                create_evaluation_task,
+                evaluator=self.evaluate_parameters,
+                **backtest_kwargs
+            )
+            tasks = [self._individual_to_params(key) for key in pending]
+            results = executor.execute(
+                worker, tasks, task_description="GA generation",
+                progress_callback=lambda fraction, message: report(fraction)
+            )
+            for result in results:
+                if result.get('success', False):
+                    key = tuple(result['parameters'].values())
+                    self._fitness_memo[key] = (result['objective'],)
+            failed = {key for key in pending if key not in self._fitness_memo}
+        else:
+            for i, key in enumerate(pending):
+                params = self._individual_to_params(key)
+                try:
+                    objective_value = self.evaluate_parameters(params, **backtest_kwargs)
+                    self._fitness_memo[key] = (objective_value,)
+                except Exception as e:
+                    logger.error(f"Failed to evaluate individual {params}: {e}")
+                    failed.add(key)
+                report((i + 1) / len(pending))
+
+        if not pending:
+            report(1.0)
+
+        if pending:
+            self._save_fitness_memo()
+
+        worst = ((float('-inf') if self.maximize else float('inf')),)
+        fitnesses = [worst if key in failed else self._fitness_memo[key] for key in keys]
+
+        elapsed = time.time() - start_time
+        self._generation_stats.append({
+            'generation': len(self._generation_stats),
+            'requested': len(keys),
+            'backtests': len(pending),
+            'cache_hits': len(keys) - len(pending),
+            'failed': len(failed),
+            'elapsed_seconds': elapsed,
+            'backtests_per_second': len(pending) / elapsed if elapsed > 0 else 0.0,
+        })
+        logger.debug(
+            f"Generation {len(self._generation_stats) - 1}: {len(pending)} backtests, "
+            f"{len(keys) - len(pending)} memo hits in {elapsed:.2f}s"
+        )
+        return fitnesses
+
+    def _memo_path(self) -> Optional[Path]:
+        """Persisted memo file for the current context, if persistence is enabled."""
+        if self.fitness_cache_dir is None or self._memo_context is None:
+            return None
+        return self.fitness_cache_dir / f"{self.strategy_class.__name__}_{self._memo_context[:16]}.pkl"
+
+    def _load_fitness_memo(self, backtest_kwargs: Dict[str, Any]) -> None:
+        """
+        Select the memo for this strategy/objective/backtest context.
+
+        Fitness values are only reused if everything that determines them
+        (strategy source, objective, backtest arguments) is unchanged.
+        """
+        context = BacktestResultCache.make_key({
+            'strategy': f"{self.strategy_class.__module__}.{self.strategy_class.__qualname__}",
+            'source': source_fingerprint(self.strategy_class),
+            'parameter_names': list(self.parameter_space.keys()),
+            'objective': self.objective,
+            'backtest': {k: v for k, v in backtest_kwargs.items() if k != 'result_cache'},
+        })
+        if context == self._memo_context:
+            return
+
+        self._memo_context = context
+        self._fitness_memo = {}
+        path = self._memo_path()
+        if path is not None and path.exists():
+            try:
+                with open(path, 'rb') as f:
+                    self._fitness_memo = pickle.load(f)
+                logger.info(f"Resuming with {len(self._fitness_memo)} memoized fitness values from {path}")
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable fitness memo {path}: {e}")
+
+    def _save_fitness_memo(self) -> None:
+        """Persist the memo (atomically) if persistence is enabled."""
+        path = self._memo_path()
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(self._fitness_memo, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.warning(f"Could not persist fitness memo to {path}: {e}")
+
     def _setup_deap(self):
         """Setup DEAP creator classes."""
         # Clear any existing classes
@@ -339,15 +542,29 @@ class GeneticOptimizer(Optimizer):
         Get convergence statistics for plotting.
 
         Returns:
-            Dictionary with convergence data or None if not optimized yet
+            Dictionary of per-generation lists ('generation', 'avg', 'std',
+            'min', 'max', 'nevals' from the DEAP logbook, plus 'backtests',
+            'cache_hits', 'failed', 'elapsed_seconds' and
+            'backtests_per_second') and run totals ('total_backtests',
+            'total_cache_hits', 'total_seconds'), or None if not optimized yet
 
         Note:
             Must be called after optimize()
         """
-        # This would require storing logbook as instance variable
-        # Left as exercise or future enhancement
-        logger.warning(
-            "get_convergence_data() not fully implemented. "
-            "Use 'convergence_history' from optimize() return value."
-        )
-        return None
+        if self._logbook is None:
+            logger.warning("No convergence data available. Run optimize() first.")
+            return None
+
+        data: Dict[str, Any] = {
+            'generation': self._logbook.select('gen'),
+            'nevals': self._logbook.select('nevals'),
+        }
+        for stat in ('avg', 'std', 'min', 'max'):
+            data[stat] = [float(value) for value in self._logbook.select(stat)]
+        for stat in ('backtests', 'cache_hits', 'failed', 'elapsed_seconds', 'backtests_per_second'):
+            data[stat] = [g[stat] for g in self._generation_stats]
+
+        data['total_backtests'] = sum(data['backtests'])
+        data['total_cache_hits'] = sum(data['cache_hits'])
+        data['total_seconds'] = sum(data['elapsed_seconds'])
+        return data
@@ -4,7 +4,7 @@ Grid search optimizer for exhaustive parameter space exploration.
 Evaluates all possible combinations of parameters to find the optimal set.
 Supports parallel execution for efficiency.
 """
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, List, Optional
 import itertools
 from decimal import Decimal
 from datetime import datetime
@@ -56,6 +56,7 @@ class GridSearchOptimizer(Optimizer):
         self,
         parallel: bool = True,
         n_jobs: int = -1,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
         **backtest_kwargs
     ) -> Dict[str, Any]:
         """
@@ -64,6 +65,8 @@ class GridSearchOptimizer(Optimizer):
         Args:
             parallel: Whether to use parallel execution
             n_jobs: Number of parallel jobs (-1 = all cores)
+            progress_callback: Optional callable(fraction, message), called
+                after each parameter combination is evaluated
             **backtest_kwargs: Arguments passed to BacktestRunner
                 Required keys:
                 - symbol: str
@@ -103,6 +106,7 @@ class GridSearchOptimizer(Optimizer):
                 combinations,
                 param_names,
                 executor,
+                progress_callback=progress_callback,
                 **backtest_kwargs
             )
             execution_mode = 'parallel'
@@ -110,6 +114,7 @@ class GridSearchOptimizer(Optimizer):
             results = self._optimize_sequential(
                 combinations,
                 param_names,
+                progress_callback=progress_callback,
                 **backtest_kwargs
             )
             execution_mode = 'sequential'
@@ -141,6 +146,7 @@ class GridSearchOptimizer(Optimizer):
         combinations: List[tuple],
         param_names: List[str],
         executor: ParallelExecutor,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
         **backtest_kwargs
     ) -> List[Dict[str, Any]]:
         """
@@ -150,6 +156,7 @@ class GridSearchOptimizer(Optimizer):
             combinations: List of parameter value tuples
             param_names: List of parameter names
             executor: ParallelExecutor instance
+            progress_callback: Optional callable(fraction, message)
             **backtest_kwargs: Arguments for BacktestRunner
 
         Returns:
@@ -179,7 +186,8 @@ class GridSearchOptimizer(Optimizer):
         results = executor.execute(
             evaluate_combo,
             combinations,
-            task_description="Grid Search"
+            task_description="Grid Search",
+            progress_callback=progress_callback
         )
 
         # Filter out failed evaluations
@@ -196,6 +204,7 @@ class GridSearchOptimizer(Optimizer):
         self,
         combinations: List[tuple],
         param_names: List[str],
+        progress_callback: Optional[Callable[[float, str], None]] = None,
         **backtest_kwargs
     ) -> List[Dict[str, Any]]:
         """
@@ -204,6 +213,7 @@ class GridSearchOptimizer(Optimizer):
         Args:
             combinations: List of parameter value tuples
             param_names: List of parameter names
+            progress_callback: Optional callable(fraction, message)
             **backtest_kwargs: Arguments for BacktestRunner
 
         Returns:
@@ -231,6 +241,12 @@ class GridSearchOptimizer(Optimizer):
                 logger.error(f"Failed to evaluate {params}: {e}")
                 # Continue with next combination
 
+            if progress_callback is not None:
+                progress_callback(
+                    (i + 1) / len(combinations),
+                    f"Grid Search: {i + 1}/{len(combinations)}"
+                )
+
         return results
 
     def get_top_n_results(self, n: int = 10) -> List[Dict[str, Any]]:
@@ -50,7 +50,8 @@ class ParallelExecutor:
         self,
         func: Callable,
         tasks: List[Any],
-        task_description: str = "Processing"
+        task_description: str = "Processing",
+        progress_callback: Optional[Callable[[float, str], None]] = None
     ) -> List[Dict[str, Any]]:
         """
         Execute function on tasks in parallel.
@@ -59,6 +60,8 @@ class ParallelExecutor:
             func: Function to execute. Should take a task and return a result dict.
             tasks: List of tasks to process
             task_description: Description for progress bar
+            progress_callback: Optional callable(fraction, message), called
+                each time a task finishes (successfully or not)
 
         Returns:
             List of result dictionaries from successful executions
@@ -90,7 +93,7 @@ class ParallelExecutor:
             else:
                 progress = as_completed(futures)
 
-            for future in progress:
+            for completed, future in enumerate(progress, start=1):
                 task = futures[future]
                 try:
                     result = future.result()
@@ -98,6 +101,11 @@ class ParallelExecutor:
                 except Exception as e:
                     failed_count += 1
                     logger.error(f"Task failed for {task}: {e}")
+                if progress_callback is not None:
+                    progress_callback(
+                        completed / len(tasks),
+                        f"{task_description}: {completed}/{len(tasks)}"
+                    )
 
         logger.info(
             f"Parallel execution complete: "
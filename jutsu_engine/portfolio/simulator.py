@@ -19,12 +19,15 @@ Example:
     print(f"Portfolio Value: ${portfolio.get_portfolio_value()}")
 """
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 from datetime import datetime
 
 from jutsu_engine.core.events import OrderEvent, FillEvent, MarketDataEvent
 from jutsu_engine.utils.logging_config import get_portfolio_logger
 
+if TYPE_CHECKING:
+    from jutsu_engine.core.event_history import EventHistory
+
 logger = get_portfolio_logger()
 
 # Short selling margin requirement (150% of short value per regulatory standards)
@@ -83,9 +86,12 @@ class PortfolioSimulator:
         self.fills: List[FillEvent] = []
         self.portfolio_value_history: List[tuple[datetime, Decimal]] = []
 
-        # Daily portfolio snapshots for CSV export
+        # Daily portfolio snapshots for CSV export (see set_snapshot_history)
         self.daily_snapshots: List[Dict] = []
 
+        # End-of-day (timestamp, value) pairs, always complete (also filled by snapshots)
+        self.daily_values: List[tuple[datetime, Decimal]] = []
+
         # Latest prices for each symbol
         self._latest_prices: Dict[str, Decimal] = {}
 
@@ -1117,6 +1123,7 @@ class PortfolioSimulator:
             'indicators': indicators.copy() if indicators else {}
         }
         self.daily_snapshots.append(snapshot)
+        self.daily_values.append((timestamp, snapshot['total_value']))
         indicator_count = len(snapshot['indicators'])
         logger.debug(
             f"Daily snapshot recorded: {timestamp.date()}, "
@@ -1126,6 +1133,36 @@ class PortfolioSimulator:
             f"indicators={indicator_count}"
         )
 
+    def set_snapshot_history(self, history: 'EventHistory') -> None:
+        """
+        Replace the daily snapshot list with a bounded/spilling EventHistory.
+
+        Snapshots already recorded are carried over.
+
+        Args:
+            history: EventHistory that receives future snapshots
+
+        Example:
+            portfolio.set_snapshot_history(EventHistory(retention=250))
+        """
+        history.extend(self.daily_snapshots)
+        self.daily_snapshots = history
+
+    def record_daily_value(self, timestamp: datetime) -> None:
+        """
+        Record end-of-day portfolio value without a full snapshot.
+
+        Lightweight alternative to record_daily_snapshot() for metrics-only
+        backtests: no position/holdings copies, no indicators.
+
+        Args:
+            timestamp: End-of-day timestamp
+
+        Example:
+            portfolio.record_daily_value(bar.timestamp)
+        """
+        self.daily_values.append((timestamp, self.get_portfolio_value()))
+
     def get_daily_snapshots(self) -> List[Dict]:
         """
         Get all daily portfolio snapshots.
@@ -1150,7 +1187,7 @@ class PortfolioSimulator:
                 if snap['indicators']:
                     print(f"  T_norm: {snap['indicators'].get('T_norm', 'N/A')}")
         """
-        return self.daily_snapshots.copy()
+        return list(self.daily_snapshots)
 
     def get_total_return(self) -> Decimal:
         """
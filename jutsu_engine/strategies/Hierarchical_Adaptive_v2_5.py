@@ -467,7 +467,7 @@ class Hierarchical_Adaptive_v2_5(Strategy):
         for symbol, qty in self._positions.items():
             if qty > 0:
                 # Get latest price for this symbol
-                symbol_bars = [b for b in self._bars if b.symbol == symbol]
+                symbol_bars = self.get_bars(lookback=1, symbol=symbol)
                 if symbol_bars:
                     latest_price = symbol_bars[-1].close
                     portfolio_equity += Decimal(str(qty)) * latest_price
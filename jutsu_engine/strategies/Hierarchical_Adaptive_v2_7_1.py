@@ -354,7 +354,7 @@ class Hierarchical_Adaptive_v2_7_1(Strategy):
         portfolio_equity = self._cash
         for symbol, qty in self._positions.items():
             if qty > 0:
-                symbol_bars = [b for b in self._bars if b.symbol == symbol]
+                symbol_bars = self.get_bars(lookback=1, symbol=symbol)
                 if symbol_bars:
                     latest_price = symbol_bars[-1].close
                     portfolio_equity += Decimal(str(qty)) * latest_price
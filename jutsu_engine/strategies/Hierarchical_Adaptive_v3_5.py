@@ -792,7 +792,7 @@ class Hierarchical_Adaptive_v3_5(Strategy):
             portfolio_equity = self._cash
             for sym, qty in self._positions.items():
                 if qty > 0:
-                    symbol_bars = [b for b in self._bars if b.symbol == sym]
+                    symbol_bars = self.get_bars(lookback=1, symbol=sym)
                     if symbol_bars:
                         latest_price = symbol_bars[-1].close
                         portfolio_equity += Decimal(str(qty)) * latest_price
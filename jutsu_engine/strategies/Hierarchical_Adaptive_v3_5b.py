@@ -65,6 +65,104 @@ EXECUTION_TIMES = {
 }
 
 
+def regime_indicator_columns(
+    closes: pd.Series,
+    sma_fast: int,
+    sma_slow: int,
+    realized_vol_window: int,
+    vol_baseline_window: int,
+    vol_crush_lookback: int
+) -> pd.DataFrame:
+    """
+    Vectorized SMA and realized-vol baseline columns for the signal symbol.
+
+    Shared by the precompute() of every strategy in the v3.5b family so the
+    columns match the rolling windows their on_bar() evaluates live.
+
+    Args:
+        closes: Signal symbol closes over the whole backtest
+        sma_fast: Fast SMA period
+        sma_slow: Slow SMA period
+        realized_vol_window: Realized volatility lookback
+        vol_baseline_window: Window for the z-score baseline (μ_vol, σ_vol)
+        vol_crush_lookback: Lag used by the vol-crush override
+
+    Returns:
+        DataFrame with sma_fast, sma_slow, realized_vol, realized_vol_lagged,
+        vol_mean and vol_std columns, row-aligned with closes
+    """
+    realized_vol = annualized_volatility(closes, lookback=realized_vol_window)
+    vol_baseline = realized_vol.rolling(window=vol_baseline_window)
+    return pd.DataFrame({
+        'sma_fast': sma(closes, sma_fast),
+        'sma_slow': sma(closes, sma_slow),
+        'realized_vol': realized_vol,
+        'realized_vol_lagged': realized_vol.shift(vol_crush_lookback),
+        'vol_mean': vol_baseline.mean(),
+        'vol_std': vol_baseline.std(),
+    })
+
+
+def zscore_from_baseline(sigma_t: float, vol_mean: float, vol_std: float) -> Optional[Decimal]:
+    """
+    Volatility z-score from precomputed baseline statistics.
+
+    Args:
+        sigma_t: Current realized volatility
+        vol_mean: Rolling mean of realized volatility
+        vol_std: Rolling std of realized volatility
+
+    Returns:
+        z_score or None if the baseline is not yet complete
+    """
+    if pd.isna(vol_mean) or pd.isna(vol_std) or pd.isna(sigma_t):
+        return None
+
+    vol_std_val = Decimal(str(vol_std))
+    if vol_std_val == Decimal("0"):
+        return Decimal("0")
+
+    return (Decimal(str(sigma_t)) - Decimal(str(vol_mean))) / vol_std_val
+
+
+def detect_vol_crush(
+    sigma_t: float,
+    sigma_t_minus_N: float,
+    threshold: Decimal,
+    lookback: int
+) -> bool:
+    """
+    Vol-crush rule (V-shaped recovery): realized volatility fell sharply.
+
+    The caller applies the override (VolState forced to Low, BearStrong
+    treated as Sideways).
+
+    Args:
+        sigma_t: Current realized volatility
+        sigma_t_minus_N: Realized volatility `lookback` bars ago
+        threshold: Relative change that triggers the override (e.g. -0.20)
+        lookback: Bars between the two readings (for logging)
+
+    Returns:
+        True if vol-crush triggered, False otherwise (including missing data)
+    """
+    if pd.isna(sigma_t) or pd.isna(sigma_t_minus_N):
+        return False
+
+    sigma_t_minus_N_val = Decimal(str(sigma_t_minus_N))
+    if sigma_t_minus_N_val == Decimal("0"):
+        return False
+
+    vol_change = (Decimal(str(sigma_t)) - sigma_t_minus_N_val) / sigma_t_minus_N_val
+    if vol_change < threshold:
+        logger.info(
+            f"Vol-crush override triggered: vol drop {vol_change:.1%} in {lookback} days"
+        )
+        return True
+
+    return False
+
+
 class Hierarchical_Adaptive_v3_5b(Strategy):
     """
     Hierarchical Adaptive v3.5b: Binarized Regime Allocator with Intraday Execution Timing
@@ -569,7 +667,7 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
             - Pre-fetched data from database (no API calls during execution)
         """
         # DEBUG: Log entry
-        logger.info(
+        logger.debug(
             f"[INTRADAY_DEBUG] _get_current_intraday_price called: "
             f"symbol={symbol}, date={current_bar.timestamp.date()}, "
             f"execution_time={self.execution_time}"
@@ -579,14 +677,14 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
         cache_key = (symbol, current_bar.timestamp)
         if cache_key in self._intraday_price_cache:
             cached_price = self._intraday_price_cache[cache_key]
-            logger.info(
+            logger.debug(
                 f"[INTRADAY_DEBUG] CACHE HIT: "
                 f"symbol={symbol}, date={current_bar.timestamp.date()}, "
                 f"cached_price={cached_price}"
             )
             return cached_price
 
-        logger.info(
+        logger.debug(
             f"[INTRADAY_DEBUG] CACHE MISS: "
             f"symbol={symbol}, date={current_bar.timestamp.date()}, "
             f"fetching fresh data"
@@ -605,7 +703,7 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
             }
 
             target_time = execution_times.get(self.execution_time)
-            logger.info(
+            logger.debug(
                 f"[INTRADAY_DEBUG] Time mapping: "
                 f"execution_time={self.execution_time} → target_time={target_time}"
             )
@@ -615,7 +713,7 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
                 return current_bar.close
 
             # DEBUG: Log fetch parameters
-            logger.info(
+            logger.debug(
                 f"[INTRADAY_DEBUG] Fetching bars: "
                 f"symbol={symbol}, date={current_bar.timestamp.date()}, "
                 f"start_time={target_time}, end_time={target_time}, interval=15m"
@@ -631,7 +729,7 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
             )
 
             # DEBUG: Log fetch results
-            logger.info(
+            logger.debug(
                 f"[INTRADAY_DEBUG] Fetch returned {len(intraday_bars) if intraday_bars else 0} bars"
             )
 
@@ -644,7 +742,7 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
 
             # DEBUG: Log full bar details
             bar = intraday_bars[0]
-            logger.info(
+            logger.debug(
                 f"[INTRADAY_DEBUG] Bar details: "
                 f"timestamp={bar.timestamp}, "
                 f"open={bar.open}, high={bar.high}, low={bar.low}, close={bar.close}, "
@@ -663,7 +761,7 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
             # Cache and return
             self._intraday_price_cache[cache_key] = intraday_price
 
-            logger.info(
+            logger.debug(
                 f"[INTRADAY_DEBUG] RETURNING: "
                 f"symbol={symbol}, date={current_bar.timestamp.date()}, "
                 f"execution_time={self.execution_time}, target_time={target_time}, "
@@ -731,6 +829,47 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
         # Return last lookback values
         return combined.iloc[-lookback:]
 
+    def precompute(self, frames: Dict[str, pd.DataFrame]) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Vectorized SMA, realized-vol baseline and bond SMA columns for the whole backtest.
+
+        Produces the same rolling windows on_bar() evaluates over its lookback
+        slice, so regime classification is unchanged (values agree to float
+        rounding). The Kalman filter stays incremental.
+
+        Declined for intraday execution_time, where the current bar's close is
+        replaced by an intraday price that is not known in advance.
+
+        Args:
+            frames: symbol -> OHLCV DataFrame (see Strategy.precompute)
+
+        Returns:
+            Indicator columns for signal_symbol (and treasury_trend_symbol when
+            the Treasury Overlay is enabled), or None
+        """
+        if self.execution_time != "close" or self.signal_symbol not in frames:
+            return None
+
+        columns = {
+            self.signal_symbol: regime_indicator_columns(
+                frames[self.signal_symbol]['close'],
+                self.sma_fast,
+                self.sma_slow,
+                self.realized_vol_window,
+                self.vol_baseline_window,
+                self.vol_crush_lookback,
+            )
+        }
+
+        if self.allow_treasury and self.treasury_trend_symbol in frames:
+            tlt_closes = frames[self.treasury_trend_symbol]['close']
+            columns[self.treasury_trend_symbol] = pd.DataFrame({
+                'bond_sma_fast': tlt_closes.rolling(window=self.bond_sma_fast).mean(),
+                'bond_sma_slow': tlt_closes.rolling(window=self.bond_sma_slow).mean(),
+            })
+
+        return columns
+
     def on_bar(self, bar: MarketDataEvent) -> None:
         """
         Process each bar through v3.5b binarized regime allocator.
@@ -797,24 +936,35 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
         vol_lookback = self.vol_baseline_window + self.realized_vol_window
         required_lookback = max(sma_lookback, vol_lookback)
 
-        # Get closes for indicator calculation (historical EOD + current intraday)
-        closes = self._get_closes_for_indicator_calculation(
-            lookback=required_lookback,
-            symbol=self.signal_symbol,
-            current_bar=bar
-        )
-        sma_fast_series = sma(closes, self.sma_fast)
-        sma_slow_series = sma(closes, self.sma_slow)
+        # Precomputed indicator row (see precompute()), None when computing live
+        row = self.get_precomputed_row(self.signal_symbol)
+
+        if row is not None:
+            sma_fast_raw, sma_slow_raw = row['sma_fast'], row['sma_slow']
+        else:
+            # Get closes for indicator calculation (historical EOD + current intraday)
+            closes = self._get_closes_for_indicator_calculation(
+                lookback=required_lookback,
+                symbol=self.signal_symbol,
+                current_bar=bar
+            )
+            sma_fast_raw = sma(closes, self.sma_fast).iloc[-1]
+            sma_slow_raw = sma(closes, self.sma_slow).iloc[-1]
 
-        if pd.isna(sma_fast_series.iloc[-1]) or pd.isna(sma_slow_series.iloc[-1]):
+        if pd.isna(sma_fast_raw) or pd.isna(sma_slow_raw):
             logger.debug("SMA calculation incomplete - accumulating data")
             return
 
-        sma_fast_val = Decimal(str(sma_fast_series.iloc[-1]))
-        sma_slow_val = Decimal(str(sma_slow_series.iloc[-1]))
+        sma_fast_val = Decimal(str(sma_fast_raw))
+        sma_slow_val = Decimal(str(sma_slow_raw))
 
         # 3. Calculate volatility z-score
-        z_score = self._calculate_volatility_zscore(closes)
+        if row is not None:
+            z_score = self._zscore_from_baseline(
+                row['realized_vol'], row['vol_mean'], row['vol_std']
+            )
+        else:
+            z_score = self._calculate_volatility_zscore(closes)
 
         if z_score is None:
             logger.debug("Volatility z-score pending - accumulating data")
@@ -824,7 +974,15 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
         self._apply_hysteresis(z_score)
 
         # 5. Check vol-crush override
-        vol_crush_triggered = self._check_vol_crush_override(closes)
+        if row is not None:
+            vol_crush_triggered = detect_vol_crush(
+                row['realized_vol'], row['realized_vol_lagged'],
+                self.vol_crush_threshold, self.vol_crush_lookback
+            )
+            if vol_crush_triggered:
+                self.vol_state = "Low"
+        else:
+            vol_crush_triggered = self._check_vol_crush_override(closes)
 
         # 6. Classify trend regime
         trend_state = self._classify_trend_regime(T_norm, sma_fast_val, sma_slow_val)
@@ -852,7 +1010,17 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
 
         # 8.4. Always compute bond SMAs for display (even when not in defensive cells)
         # This enables the dashboard to show treasury overlay values regardless of regime
+        tlt_row = None
         if self.allow_treasury:
+            tlt_row = self.get_precomputed_row(self.treasury_trend_symbol)
+
+        if tlt_row is not None:
+            bond_sma_fast, bond_sma_slow = tlt_row['bond_sma_fast'], tlt_row['bond_sma_slow']
+            if not pd.isna(bond_sma_fast) and not pd.isna(bond_sma_slow):
+                self._last_bond_sma_fast = Decimal(str(bond_sma_fast))
+                self._last_bond_sma_slow = Decimal(str(bond_sma_slow))
+                self._last_bond_trend = "Bull" if bond_sma_fast > bond_sma_slow else "Bear"
+        elif self.allow_treasury:
             try:
                 tlt_closes_for_display = self._get_closes_for_indicator_calculation(
                     lookback=self.bond_sma_slow + 10,
@@ -875,22 +1043,23 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
 
         if self.allow_treasury and cell_id in [4, 5, 6]:
             # Get TLT price history for bond trend detection
-            try:
-                # Get TLT closes for indicator calculation (historical EOD + current intraday)
-                tlt_closes = self._get_closes_for_indicator_calculation(
-                    lookback=self.bond_sma_slow + 10,
-                    symbol=self.treasury_trend_symbol,
-                    current_bar=bar
-                )
-            except (ValueError, KeyError) as e:
-                logger.warning(f"Could not retrieve TLT data: {e}, falling back to Cash")
-                tlt_closes = None
+            tlt_closes = None
+            if tlt_row is None:
+                try:
+                    # Get TLT closes for indicator calculation (historical EOD + current intraday)
+                    tlt_closes = self._get_closes_for_indicator_calculation(
+                        lookback=self.bond_sma_slow + 10,
+                        symbol=self.treasury_trend_symbol,
+                        current_bar=bar
+                    )
+                except (ValueError, KeyError) as e:
+                    logger.warning(f"Could not retrieve TLT data: {e}, falling back to Cash")
 
             # Determine defensive portion based on cell
             if cell_id == 4:
                 # Cell 4 (Chop): Was 100% Cash, now use Safe Haven
                 defensive_weight = Decimal("1.0")
-                safe_haven = self.get_safe_haven_allocation(tlt_closes, defensive_weight)
+                safe_haven = self._get_safe_haven(tlt_closes, tlt_row, defensive_weight)
 
                 # Override cash with safe haven allocation
                 w_cash = safe_haven.get("CASH", Decimal("0"))
@@ -900,7 +1069,7 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
             elif cell_id == 5:
                 # Cell 5 (Grind): Was 50% QQQ + 50% Cash, now 50% QQQ + Safe Haven
                 defensive_weight = Decimal("0.5")
-                safe_haven = self.get_safe_haven_allocation(tlt_closes, defensive_weight)
+                safe_haven = self._get_safe_haven(tlt_closes, tlt_row, defensive_weight)
 
                 # QQQ stays at 50%, override cash portion with safe haven
                 w_cash = safe_haven.get("CASH", Decimal("0"))
@@ -915,7 +1084,7 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
                 else:
                     # No PSQ: Use Safe Haven instead of 100% Cash
                     defensive_weight = Decimal("1.0")
-                    safe_haven = self.get_safe_haven_allocation(tlt_closes, defensive_weight)
+                    safe_haven = self._get_safe_haven(tlt_closes, tlt_row, defensive_weight)
 
                     # Override cash with safe haven allocation
                     w_cash = safe_haven.get("CASH", Decimal("0"))
@@ -1115,6 +1284,28 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
 
         return z_score
 
+    def _zscore_from_baseline(
+        self,
+        sigma_t: float,
+        vol_mean: float,
+        vol_std: float
+    ) -> Optional[Decimal]:
+        """
+        Volatility z-score from precomputed baseline statistics.
+
+        Same formula as _calculate_volatility_zscore(), with μ_vol and σ_vol
+        taken from the rolling vol_baseline_window columns built in precompute().
+
+        Args:
+            sigma_t: Current realized volatility
+            vol_mean: Rolling mean of realized volatility
+            vol_std: Rolling std of realized volatility
+
+        Returns:
+            z_score or None if the baseline is not yet complete
+        """
+        return zscore_from_baseline(sigma_t, vol_mean, vol_std)
+
     def _apply_hysteresis(self, z_score: Decimal) -> None:
         """
         Apply hysteresis state machine to volatility state.
@@ -1177,22 +1368,12 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
         if len(vol_series) < self.vol_crush_lookback + 1:
             return False
 
-        # Current and historical volatility
-        sigma_t = Decimal(str(vol_series.iloc[-1]))
-        sigma_t_minus_N = Decimal(str(vol_series.iloc[-(self.vol_crush_lookback + 1)]))
-
-        if sigma_t_minus_N == Decimal("0"):
-            return False
-
-        # Calculate percentage change
-        vol_change = (sigma_t - sigma_t_minus_N) / sigma_t_minus_N
-
-        # Check if vol-crush threshold breached
-        if vol_change < self.vol_crush_threshold:
-            logger.info(
-                f"Vol-crush override triggered: "
-                f"vol drop {vol_change:.1%} in {self.vol_crush_lookback} days"
-            )
+        if detect_vol_crush(
+            vol_series.iloc[-1],
+            vol_series.iloc[-(self.vol_crush_lookback + 1)],
+            self.vol_crush_threshold,
+            self.vol_crush_lookback
+        ):
             # Force VolState to Low
             self.vol_state = "Low"
             return True
@@ -1350,6 +1531,50 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
         sma_fast = tlt_history_series.rolling(window=self.bond_sma_fast).mean().iloc[-1]
         sma_slow = tlt_history_series.rolling(window=self.bond_sma_slow).mean().iloc[-1]
 
+        return self._safe_haven_from_bond_smas(sma_fast, sma_slow, current_defensive_weight_decimal)
+
+    def _get_safe_haven(
+        self,
+        tlt_closes: Optional[pd.Series],
+        tlt_row: Optional[Dict[str, float]],
+        current_defensive_weight_decimal: Decimal
+    ) -> dict[str, Decimal]:
+        """
+        Safe haven allocation from a precomputed bond SMA row, or TLT closes if none.
+
+        Args:
+            tlt_closes: TLT close history (used when tlt_row is None)
+            tlt_row: Precomputed bond_sma_fast/bond_sma_slow row, or None
+            current_defensive_weight_decimal: Defensive portion of the portfolio
+
+        Returns:
+            dict: Target weights {Ticker: Decimal} (see get_safe_haven_allocation)
+        """
+        if tlt_row is None:
+            return self.get_safe_haven_allocation(tlt_closes, current_defensive_weight_decimal)
+        return self._safe_haven_from_bond_smas(
+            tlt_row['bond_sma_fast'],
+            tlt_row['bond_sma_slow'],
+            current_defensive_weight_decimal
+        )
+
+    def _safe_haven_from_bond_smas(
+        self,
+        sma_fast: float,
+        sma_slow: float,
+        current_defensive_weight_decimal: Decimal
+    ) -> dict[str, Decimal]:
+        """
+        Select TMF/TMV and size the bond sleeve from the bond SMA pair.
+
+        Args:
+            sma_fast: TLT fast SMA (NaN if not yet available)
+            sma_slow: TLT slow SMA (NaN if not yet available)
+            current_defensive_weight_decimal: Defensive portion of the portfolio
+
+        Returns:
+            dict: Target weights {Ticker: Decimal} (see get_safe_haven_allocation)
+        """
         # Check for NaN
         if pd.isna(sma_fast) or pd.isna(sma_slow):
             logger.warning("Bond SMA calculation returned NaN, falling back to Cash")
@@ -1474,7 +1699,7 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
             portfolio_equity = self._cash
             for sym, qty in self._positions.items():
                 if qty > 0:
-                    symbol_bars = [b for b in self._bars if b.symbol == sym]
+                    symbol_bars = self.get_bars(lookback=1, symbol=sym)
                     if symbol_bars:
                         latest_price = symbol_bars[-1].close
                         portfolio_equity += Decimal(str(qty)) * latest_price
@@ -59,6 +59,13 @@ class Hierarchical_Adaptive_v3_5b_VolInput(Hierarchical_Adaptive_v3_5b):
             out[d] = float(r["value"])
         return out
 
+    def precompute(self, frames):
+        """Decline vectorized precompute: the vol-z blend lives in _calculate_volatility_zscore.
+
+        Keeps every bar on the live path so the identity guarantee holds bit-for-bit.
+        """
+        return None
+
     def _calculate_volatility_zscore(self, closes: pd.Series) -> Optional[Decimal]:
         """Engine-truth vol_z, then blend the injected series value for the bar's date.
 
@@ -517,7 +517,7 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
             - Pre-fetched data from database (no API calls during execution)
         """
         # DEBUG: Log entry
-        logger.info(
+        logger.debug(
             f"[INTRADAY_DEBUG] _get_current_intraday_price called: "
             f"symbol={symbol}, date={current_bar.timestamp.date()}, "
             f"execution_time={self.execution_time}"
@@ -527,14 +527,14 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
         cache_key = (symbol, current_bar.timestamp)
         if cache_key in self._intraday_price_cache:
             cached_price = self._intraday_price_cache[cache_key]
-            logger.info(
+            logger.debug(
                 f"[INTRADAY_DEBUG] CACHE HIT: "
                 f"symbol={symbol}, date={current_bar.timestamp.date()}, "
                 f"cached_price={cached_price}"
             )
             return cached_price
 
-        logger.info(
+        logger.debug(
             f"[INTRADAY_DEBUG] CACHE MISS: "
             f"symbol={symbol}, date={current_bar.timestamp.date()}, "
             f"fetching fresh data"
@@ -553,7 +553,7 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
             }
 
             target_time = execution_times.get(self.execution_time)
-            logger.info(
+            logger.debug(
                 f"[INTRADAY_DEBUG] Time mapping: "
                 f"execution_time={self.execution_time} → target_time={target_time}"
             )
@@ -563,7 +563,7 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
                 return current_bar.close
 
             # DEBUG: Log fetch parameters
-            logger.info(
+            logger.debug(
                 f"[INTRADAY_DEBUG] Fetching bars: "
                 f"symbol={symbol}, date={current_bar.timestamp.date()}, "
                 f"start_time={target_time}, end_time={target_time}, interval=15m"
@@ -579,7 +579,7 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
             )
 
             # DEBUG: Log fetch results
-            logger.info(
+            logger.debug(
                 f"[INTRADAY_DEBUG] Fetch returned {len(intraday_bars) if intraday_bars else 0} bars"
             )
 
@@ -592,7 +592,7 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
 
             # DEBUG: Log full bar details
             bar = intraday_bars[0]
-            logger.info(
+            logger.debug(
                 f"[INTRADAY_DEBUG] Bar details: "
                 f"timestamp={bar.timestamp}, "
                 f"open={bar.open}, high={bar.high}, low={bar.low}, close={bar.close}, "
@@ -611,7 +611,7 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
             # Cache and return
             self._intraday_price_cache[cache_key] = intraday_price
 
-            logger.info(
+            logger.debug(
                 f"[INTRADAY_DEBUG] RETURNING: "
                 f"symbol={symbol}, date={current_bar.timestamp.date()}, "
                 f"execution_time={self.execution_time}, target_time={target_time}, "
@@ -1320,7 +1320,7 @@ class Hierarchical_Adaptive_v3_5b(Strategy):
             portfolio_equity = self._cash
             for sym, qty in self._positions.items():
                 if qty > 0:
-                    symbol_bars = [b for b in self._bars if b.symbol == sym]
+                    symbol_bars = self.get_bars(lookback=1, symbol=sym)
                     if symbol_bars:
                         latest_price = symbol_bars[-1].close
                         portfolio_equity += Decimal(str(qty)) * latest_price
@@ -326,6 +326,18 @@ class Hierarchical_Adaptive_v4_0(Hierarchical_Adaptive_v3_5b):
 
         return required_warmup
 
+    def precompute(self, frames: Dict[str, pd.DataFrame]) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Decline vectorized precompute.
+
+        v4.0 overrides on_bar() and computes its indicators live, so the v3.5b
+        precomputed columns would never be read.
+
+        Returns:
+            None
+        """
+        return None
+
     def _calculate_macro_bias(self, symbol: str, lookback: int) -> str:
         """
         Determine Bull Bias vs Bear Bias using SMA(macro_trend_lookback).
@@ -730,7 +742,7 @@ class Hierarchical_Adaptive_v4_0(Hierarchical_Adaptive_v3_5b):
 
         # Warmup period check (count bars for signal_symbol only, not total bars across all symbols)
         min_warmup = self.get_required_warmup_bars()
-        signal_bars = [b for b in self._bars if b.symbol == self.signal_symbol]
+        signal_bars = self.get_bars(lookback=min_warmup, symbol=self.signal_symbol)
         if len(signal_bars) < min_warmup:
             logger.debug(f"Warmup: {len(signal_bars)}/{min_warmup} bars for {self.signal_symbol}")
             return
@@ -47,6 +47,11 @@ from jutsu_engine.core.events import MarketDataEvent
 from jutsu_engine.indicators.kalman import AdaptiveKalmanFilter, KalmanFilterModel
 from jutsu_engine.indicators.technical import sma, annualized_volatility
 from jutsu_engine.performance.trade_logger import TradeLogger
+from jutsu_engine.strategies.Hierarchical_Adaptive_v3_5b import (
+    detect_vol_crush,
+    regime_indicator_columns,
+    zscore_from_baseline,
+)
 from jutsu_engine.utils.logging_config import setup_logger
 
 logger = setup_logger('STRATEGY.HIERARCHICAL_ADAPTIVE_V5_0')
@@ -861,16 +866,13 @@ class Hierarchical_Adaptive_v5_0(Strategy):
         if len(vol_series) < self.vol_crush_lookback + 1:
             return False
 
-        sigma_t = Decimal(str(vol_series.iloc[-1]))
-        sigma_t_minus_N = Decimal(str(vol_series.iloc[-(self.vol_crush_lookback + 1)]))
-
-        if sigma_t_minus_N == Decimal("0"):
-            return False
-
-        vol_change = (sigma_t - sigma_t_minus_N) / sigma_t_minus_N
-
-        if vol_change < self.vol_crush_threshold:
-            logger.info(f"Vol-crush override triggered: vol drop {vol_change:.1%}")
+        if detect_vol_crush(
+            vol_series.iloc[-1],
+            vol_series.iloc[-(self.vol_crush_lookback + 1)],
+            self.vol_crush_threshold,
+            self.vol_crush_lookback
+        ):
+            # Force VolState to Low
             self.vol_state = "Low"
             return True
 
@@ -1060,6 +1062,38 @@ class Hierarchical_Adaptive_v5_0(Strategy):
 
         return {selected_ticker: bond_weight, "CASH": cash_weight}
 
+    def precompute(self, frames: Dict[str, pd.DataFrame]) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Vectorized SMA and realized-vol baseline columns for the signal symbol.
+
+        Built with the v3.5b column builder, so the regime inputs match what
+        on_bar() computes over its lookback slice (to float rounding). The
+        Kalman filter stays incremental. Hedge preference and commodity
+        (GLD/SLV) lookbacks are still computed live.
+
+        Declined for intraday execution_time, where the current bar's close is
+        replaced by an intraday price that is not known in advance.
+
+        Args:
+            frames: symbol -> OHLCV DataFrame (see Strategy.precompute)
+
+        Returns:
+            Indicator columns for signal_symbol, or None
+        """
+        if self.execution_time != "close" or self.signal_symbol not in frames:
+            return None
+
+        return {
+            self.signal_symbol: regime_indicator_columns(
+                frames[self.signal_symbol]['close'],
+                self.sma_fast,
+                self.sma_slow,
+                self.realized_vol_window,
+                self.vol_baseline_window,
+                self.vol_crush_lookback,
+            )
+        }
+
     def on_bar(self, bar: MarketDataEvent) -> None:
         """
         Process each bar through v5.0 tri-asset regime allocator.
@@ -1105,23 +1139,32 @@ class Hierarchical_Adaptive_v5_0(Strategy):
         vol_lookback = self.vol_baseline_window + self.realized_vol_window
         required_lookback = max(sma_lookback, vol_lookback)
 
-        closes = self._get_closes_for_indicator_calculation(
-            lookback=required_lookback,
-            symbol=self.signal_symbol,
-            current_bar=bar
-        )
-        sma_fast_series = sma(closes, self.sma_fast)
-        sma_slow_series = sma(closes, self.sma_slow)
+        # Precomputed indicator row (see precompute()), None when computing live
+        row = self.get_precomputed_row(self.signal_symbol)
 
-        if pd.isna(sma_fast_series.iloc[-1]) or pd.isna(sma_slow_series.iloc[-1]):
+        if row is not None:
+            sma_fast_raw, sma_slow_raw = row['sma_fast'], row['sma_slow']
+        else:
+            closes = self._get_closes_for_indicator_calculation(
+                lookback=required_lookback,
+                symbol=self.signal_symbol,
+                current_bar=bar
+            )
+            sma_fast_raw = sma(closes, self.sma_fast).iloc[-1]
+            sma_slow_raw = sma(closes, self.sma_slow).iloc[-1]
+
+        if pd.isna(sma_fast_raw) or pd.isna(sma_slow_raw):
             logger.warning("SMA calculation returned NaN")
             return
 
-        sma_fast_val = Decimal(str(sma_fast_series.iloc[-1]))
-        sma_slow_val = Decimal(str(sma_slow_series.iloc[-1]))
+        sma_fast_val = Decimal(str(sma_fast_raw))
+        sma_slow_val = Decimal(str(sma_slow_raw))
 
         # 3. Calculate volatility z-score
-        z_score = self._calculate_volatility_zscore(closes)
+        if row is not None:
+            z_score = zscore_from_baseline(row['realized_vol'], row['vol_mean'], row['vol_std'])
+        else:
+            z_score = self._calculate_volatility_zscore(closes)
 
         if z_score is None:
             logger.error("Volatility z-score calculation failed")
@@ -1131,7 +1174,15 @@ class Hierarchical_Adaptive_v5_0(Strategy):
         self._apply_hysteresis(z_score)
 
         # 5. Check vol-crush override
-        vol_crush_triggered = self._check_vol_crush_override(closes)
+        if row is not None:
+            vol_crush_triggered = detect_vol_crush(
+                row['realized_vol'], row['realized_vol_lagged'],
+                self.vol_crush_threshold, self.vol_crush_lookback
+            )
+            if vol_crush_triggered:
+                self.vol_state = "Low"
+        else:
+            vol_crush_triggered = self._check_vol_crush_override(closes)
 
         # 6. Classify trend regime
         trend_state = self._classify_trend_regime(T_norm, sma_fast_val, sma_slow_val)
@@ -1282,7 +1333,7 @@ class Hierarchical_Adaptive_v5_0(Strategy):
             portfolio_equity = self._cash
             for sym, qty in self._positions.items():
                 if qty > 0:
-                    symbol_bars = [b for b in self._bars if b.symbol == sym]
+                    symbol_bars = self.get_bars(lookback=1, symbol=sym)
                     if symbol_bars:
                         latest_price = symbol_bars[-1].close
                         portfolio_equity += Decimal(str(qty)) * latest_price
@@ -174,7 +174,7 @@ class MACD_Trend(Strategy):
             return
 
         # Get latest VIX value (from last VIX bar)
-        vix_bars = [b for b in self._bars if b.symbol == self.vix_symbol]
+        vix_bars = self.get_bars(lookback=1, symbol=self.vix_symbol)
         if not vix_bars:
             self.log("WARNING: No VIX data available, cannot evaluate kill switch")
             return
@@ -337,7 +337,7 @@ class MACD_Trend(Strategy):
         state_desc = "IN: Price > EMA AND MACD bullish AND VIX calm"
 
         # Calculate ATR on TQQQ (trade vehicle, not signal asset)
-        trade_bars = [b for b in self._bars if b.symbol == trade_symbol]
+        trade_bars = self.get_bars(lookback=self.atr_period + 1, symbol=trade_symbol)
         if len(trade_bars) < self.atr_period:
             self.log(
                 f"WARNING: Insufficient {trade_symbol} bars for ATR calculation "
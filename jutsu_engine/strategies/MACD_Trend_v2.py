@@ -190,7 +190,7 @@ class MACD_Trend_v2(Strategy):
             return
 
         # Get latest VIX value (from last VIX bar)
-        vix_bars = [b for b in self._bars if b.symbol == self.vix_symbol]
+        vix_bars = self.get_bars(lookback=1, symbol=self.vix_symbol)
         if not vix_bars:
             self.log("WARNING: No VIX data available, cannot evaluate kill switch")
             return
@@ -433,7 +433,7 @@ class MACD_Trend_v2(Strategy):
         regime_desc = "STRONG BULL: Price > EMA AND MACD_Line > Signal_Line"
 
         # Calculate ATR on TQQQ (trade vehicle)
-        trade_bars = [b for b in self._bars if b.symbol == trade_symbol]
+        trade_bars = self.get_bars(lookback=self.atr_period + 1, symbol=trade_symbol)
         if len(trade_bars) < self.atr_period:
             self.log(
                 f"WARNING: Insufficient {trade_symbol} bars for ATR calculation "
@@ -504,7 +504,7 @@ class MACD_Trend_v2(Strategy):
         regime_desc = "WEAK BULL/PAUSE: Price > EMA AND MACD_Line < Signal_Line"
 
         # Get current price of QQQ (last bar)
-        trade_bars = [b for b in self._bars if b.symbol == trade_symbol]
+        trade_bars = self.get_bars(lookback=self.atr_period + 1, symbol=trade_symbol)
         current_price = trade_bars[-1].close
 
         # Track which regime opened this QQQ position
@@ -549,7 +549,7 @@ class MACD_Trend_v2(Strategy):
         regime_desc = "STRONG BEAR: Price < EMA AND MACD_Line < 0"
 
         # Calculate ATR on SQQQ (trade vehicle)
-        trade_bars = [b for b in self._bars if b.symbol == trade_symbol]
+        trade_bars = self.get_bars(lookback=self.atr_period + 1, symbol=trade_symbol)
         if len(trade_bars) < self.atr_period:
             self.log(
                 f"WARNING: Insufficient {trade_symbol} bars for ATR calculation "
@@ -375,7 +375,7 @@ class MACD_Trend_v4(Strategy):
         regime_desc = "RISK-ON (STRONG): Price > EMA AND MACD_Line > Signal_Line"
 
         # Calculate ATR on TQQQ (trade vehicle)
-        trade_bars = [b for b in self._bars if b.symbol == trade_symbol]
+        trade_bars = self.get_bars(lookback=self.atr_period + 1, symbol=trade_symbol)
         if len(trade_bars) < self.atr_period:
             self.log(
                 f"WARNING: Insufficient {trade_symbol} bars for ATR calculation "
@@ -446,7 +446,7 @@ class MACD_Trend_v4(Strategy):
         regime_desc = "RISK-ON (PAUSE): Price > EMA AND MACD_Line <= Signal_Line"
 
         # Get current price of QQQ (last bar)
-        trade_bars = [b for b in self._bars if b.symbol == trade_symbol]
+        trade_bars = self.get_bars(lookback=self.atr_period + 1, symbol=trade_symbol)
         current_price = trade_bars[-1].close
 
         # Track current position symbol
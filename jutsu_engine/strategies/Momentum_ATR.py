@@ -170,7 +170,7 @@ class Momentum_ATR(Strategy):
             return
 
         # Get latest VIX value (from last VIX bar)
-        vix_bars = [b for b in self._bars if b.symbol == self.vix_symbol]
+        vix_bars = self.get_bars(lookback=1, symbol=self.vix_symbol)
         if not vix_bars:
             self.log("WARNING: No VIX data available, cannot evaluate kill switch")
             return
@@ -372,7 +372,7 @@ class Momentum_ATR(Strategy):
 
         # Calculate ATR on the trade vehicle (TQQQ or SQQQ)
         # Need to get TQQQ/SQQQ bars for ATR calculation
-        trade_bars = [b for b in self._bars if b.symbol == trade_symbol]
+        trade_bars = self.get_bars(lookback=self.atr_period + 1, symbol=trade_symbol)
         if len(trade_bars) < self.atr_period:
             self.log(f"WARNING: Insufficient {trade_symbol} bars for ATR calculation ({len(trade_bars)} < {self.atr_period})")
             return
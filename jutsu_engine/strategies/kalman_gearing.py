@@ -576,7 +576,7 @@ class KalmanGearing(Strategy):
 
                     # Get current bar for vehicle to approximate entry
                     # (In production, we'd track actual fill price)
-                    vehicle_bars = [b for b in self._bars if b.symbol == self.current_vehicle]
+                    vehicle_bars = self.get_bars(lookback=1, symbol=self.current_vehicle)
                     if vehicle_bars:
                         latest_bar = vehicle_bars[-1]
                         self.leveraged_stop_price = latest_bar.close - dollar_risk
@@ -589,7 +589,7 @@ class KalmanGearing(Strategy):
         # Check if stop-loss hit using vehicle's low price
         if self.leveraged_stop_price:
             # Get latest bar for current vehicle
-            vehicle_bars = [b for b in self._bars if b.symbol == self.current_vehicle]
+            vehicle_bars = self.get_bars(lookback=1, symbol=self.current_vehicle)
             if vehicle_bars:
                 latest_vehicle_bar = vehicle_bars[-1]
 
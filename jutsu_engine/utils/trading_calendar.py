@@ -6,6 +6,13 @@ Purpose:
     Provides timezone-aware trading day validation, market close times, and
     half-day detection using pandas_market_calendars.
 
+    TradingCalendar is the shared session service behind every calendar
+    helper in the engine (this module, jutsu_engine/live/market_calendar.py,
+    DataSync's holiday filter and the database handlers). It builds the NYSE
+    schedule once for a year range (sorted session dates with close times and
+    early-close flags) and answers lookups by bisection instead of building a
+    pandas_market_calendars schedule per call.
+
 Dependencies:
     - pandas-market-calendars>=4.0.0
     - zoneinfo (Python 3.9+ standard library)
@@ -16,6 +23,7 @@ Usage:
         get_market_close_time,
         get_eod_trigger_time,
         get_trading_days_between,
+        get_trading_calendar,
     )
 
     # Check if today is a trading day
@@ -26,12 +34,18 @@ Usage:
     # Get trading days for backfill
     days = get_trading_days_between(start_date, end_date)
 
+    # Shared calendar service
+    calendar = get_trading_calendar()
+    calendar.previous_trading_day(date(2025, 11, 28))  # date(2025, 11, 26)
+
 Note:
     This module is specifically for EOD daily performance calculations.
     For live trading market hours, see jutsu_engine/live/market_calendar.py
 """
 
 import logging
+import threading
+from bisect import bisect_left, bisect_right
 from datetime import date, datetime, time, timedelta
 from typing import List, Optional
 
@@ -44,9 +58,6 @@ logger = logging.getLogger('UTILS.TRADING_CALENDAR')
 ET = ZoneInfo("America/New_York")
 UTC = ZoneInfo("UTC")
 
-# Cache NYSE calendar at module level for efficiency
-_NYSE_CALENDAR = mcal.get_calendar('NYSE')
-
 # Normal market close time (4:00 PM ET)
 NORMAL_CLOSE_TIME = time(16, 0)
 
@@ -56,6 +67,188 @@ HALF_DAY_CLOSE_TIME = time(13, 0)
 # EOD job delay after market close (minutes)
 EOD_DELAY_MINUTES = 15
 
+# Default precomputed range: first year of stored history through next year
+DEFAULT_START_YEAR = 2000
+# Years added on each side when a lookup falls outside the precomputed range
+EXTEND_YEARS = 5
+
+
+def _as_date(value: date) -> date:
+    """Accept date or datetime (datetime subclasses date; use its calendar date)."""
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+class TradingCalendar:
+    """
+    Precomputed NYSE session calendar with O(log n) lookups.
+
+    Sessions for [start_year, end_year] are loaded from pandas_market_calendars
+    once into sorted parallel lists (session date, close time in ET, early-close
+    flag). Lookups outside that range extend it by EXTEND_YEARS and rebuild,
+    so answers never depend on the configured range.
+
+    Thread-safe: the arrays are replaced atomically under a lock.
+
+    Attributes:
+        start_year: First calendar year covered
+        end_year: Last calendar year covered
+    """
+
+    def __init__(
+        self,
+        start_year: int = DEFAULT_START_YEAR,
+        end_year: Optional[int] = None,
+        exchange: str = 'NYSE',
+    ):
+        """
+        Initialize and precompute the session arrays.
+
+        Args:
+            start_year: First calendar year to precompute (default: 2000)
+            end_year: Last calendar year to precompute (default: next year)
+            exchange: pandas_market_calendars calendar name (default: NYSE)
+
+        Raises:
+            ValueError: If start_year > end_year
+        """
+        if end_year is None:
+            end_year = datetime.now(ET).year + 1
+        if start_year > end_year:
+            raise ValueError(f"start_year ({start_year}) must be <= end_year ({end_year})")
+
+        self.exchange = exchange
+        self._lock = threading.Lock()
+        # (sessions, closes, early_close) - replaced as one tuple so readers
+        # never see arrays from different builds
+        self._table = self._load(start_year, end_year)
+        self.start_year = start_year
+        self.end_year = end_year
+
+    def _load(self, start_year: int, end_year: int):
+        """Load the schedule for [start_year, end_year] as parallel sorted lists."""
+        schedule = mcal.get_calendar(self.exchange).schedule(
+            start_date=date(start_year, 1, 1),
+            end_date=date(end_year, 12, 31),
+        )
+        sessions = list(schedule.index.date)
+        closes = [ts.to_pydatetime().astimezone(ET) for ts in schedule['market_close']]
+        early_close = [close.time() < NORMAL_CLOSE_TIME for close in closes]
+        logger.debug(
+            f"TradingCalendar built: {len(sessions)} {self.exchange} sessions "
+            f"{start_year}-{end_year}"
+        )
+        return sessions, closes, early_close
+
+    def _table_for(self, *days: date):
+        """
+        Session arrays covering the given dates (plus a year of slack on each side).
+
+        Extends the precomputed range by EXTEND_YEARS when a date falls outside it.
+        """
+        low = min(day.year for day in days) - 1
+        high = max(day.year for day in days) + 1
+        if low < self.start_year or high > self.end_year:
+            with self._lock:
+                start_year = self.start_year if low >= self.start_year else low - EXTEND_YEARS
+                end_year = self.end_year if high <= self.end_year else high + EXTEND_YEARS
+                if (start_year, end_year) != (self.start_year, self.end_year):
+                    self._table = self._load(start_year, end_year)
+                    self.start_year, self.end_year = start_year, end_year
+        return self._table
+
+    def is_trading_day(self, day: date) -> bool:
+        """True if the exchange has a session on day."""
+        day = _as_date(day)
+        sessions = self._table_for(day)[0]
+        i = bisect_left(sessions, day)
+        return i < len(sessions) and sessions[i] == day
+
+    def previous_trading_day(self, day: date) -> date:
+        """Last session strictly before day."""
+        day = _as_date(day)
+        sessions = self._table_for(day)[0]
+        return sessions[bisect_left(sessions, day) - 1]
+
+    def next_trading_day(self, day: date) -> date:
+        """First session strictly after day."""
+        day = _as_date(day)
+        sessions = self._table_for(day)[0]
+        return sessions[bisect_right(sessions, day)]
+
+    def count_trading_days(self, start: date, end: date) -> int:
+        """Number of sessions in [start, end] (0 if start > end)."""
+        start, end = _as_date(start), _as_date(end)
+        if start > end:
+            return 0
+        sessions = self._table_for(start, end)[0]
+        return bisect_right(sessions, end) - bisect_left(sessions, start)
+
+    def sessions_in_range(self, start: date, end: date) -> List[date]:
+        """Session dates in [start, end], ascending."""
+        start, end = _as_date(start), _as_date(end)
+        if start > end:
+            return []
+        sessions = self._table_for(start, end)[0]
+        return sessions[bisect_left(sessions, start):bisect_right(sessions, end)]
+
+    def market_close(self, day: date) -> Optional[datetime]:
+        """Session close time in ET, or None if day is not a session."""
+        day = _as_date(day)
+        sessions, closes, _ = self._table_for(day)
+        i = bisect_left(sessions, day)
+        if i < len(sessions) and sessions[i] == day:
+            return closes[i]
+        return None
+
+    def is_early_close(self, day: date) -> bool:
+        """True if day is a session that closes before 4:00 PM ET."""
+        day = _as_date(day)
+        sessions, _, early_close = self._table_for(day)
+        i = bisect_left(sessions, day)
+        return i < len(sessions) and sessions[i] == day and early_close[i]
+
+
+_calendar: Optional[TradingCalendar] = None
+_calendar_lock = threading.Lock()
+
+
+def get_trading_calendar() -> TradingCalendar:
+    """
+    Get the shared NYSE TradingCalendar (built on first use).
+
+    Returns:
+        Process-wide TradingCalendar instance
+    """
+    global _calendar
+    if _calendar is None:
+        with _calendar_lock:
+            if _calendar is None:
+                _calendar = TradingCalendar()
+    return _calendar
+
+
+def configure_trading_calendar(
+    start_year: int = DEFAULT_START_YEAR,
+    end_year: Optional[int] = None,
+) -> TradingCalendar:
+    """
+    Replace the shared calendar with one precomputed for a different year range.
+
+    Args:
+        start_year: First calendar year to precompute
+        end_year: Last calendar year to precompute (default: next year)
+
+    Returns:
+        The new shared TradingCalendar
+    """
+    global _calendar
+    calendar = TradingCalendar(start_year=start_year, end_year=end_year)
+    with _calendar_lock:
+        _calendar = calendar
+    return calendar
+
 
 def is_trading_day(target_date: Optional[date] = None) -> bool:
     """
@@ -78,11 +271,7 @@ def is_trading_day(target_date: Optional[date] = None) -> bool:
     if target_date is None:
         target_date = get_trading_date()
 
-    schedule = _NYSE_CALENDAR.schedule(
-        start_date=target_date,
-        end_date=target_date
-    )
-    is_trading = len(schedule) > 0
+    is_trading = get_trading_calendar().is_trading_day(target_date)
 
     logger.debug(f"is_trading_day({target_date}): {is_trading}")
     return is_trading
@@ -110,24 +299,12 @@ def get_market_close_time(target_date: date) -> Optional[datetime]:
         >>> get_market_close_time(date(2025, 11, 27))  # Thanksgiving (closed)
         None
     """
-    schedule = _NYSE_CALENDAR.schedule(
-        start_date=target_date,
-        end_date=target_date
-    )
+    close_et = get_trading_calendar().market_close(target_date)
 
-    if len(schedule) == 0:
+    if close_et is None:
         logger.debug(f"get_market_close_time({target_date}): Not a trading day")
         return None
 
-    # market_close is a pandas Timestamp with timezone info
-    market_close = schedule.iloc[0]['market_close']
-
-    # Convert to datetime and ensure ET timezone
-    close_dt = market_close.to_pydatetime()
-
-    # The schedule returns UTC times, convert to ET
-    close_et = close_dt.astimezone(ET)
-
     logger.debug(f"get_market_close_time({target_date}): {close_et.strftime('%H:%M')} ET")
     return close_et
 
@@ -147,15 +324,10 @@ def is_half_day(target_date: date) -> bool:
     Returns:
         True if half-day, False otherwise
     """
-    close_time = get_market_close_time(target_date)
-
-    if close_time is None:
-        return False
-
-    # Half-day if close is before normal 4 PM
-    is_early = close_time.time() < NORMAL_CLOSE_TIME
+    is_early = get_trading_calendar().is_early_close(target_date)
 
     if is_early:
+        close_time = get_trading_calendar().market_close(target_date)
         logger.info(f"Half-day detected: {target_date} closes at {close_time.strftime('%H:%M')} ET")
 
     return is_early
@@ -224,9 +396,7 @@ def get_trading_days_between(start: date, end: date) -> List[date]:
         [date(2025, 11, 24), date(2025, 11, 25), date(2025, 11, 26), date(2025, 11, 28)]
         # Note: Nov 27 (Thanksgiving) is excluded
     """
-    schedule = _NYSE_CALENDAR.schedule(start_date=start, end_date=end)
-
-    trading_days = [d.date() for d in schedule.index]
+    trading_days = get_trading_calendar().sessions_in_range(start, end)
 
     logger.debug(
         f"get_trading_days_between({start}, {end}): {len(trading_days)} trading days"
@@ -244,9 +414,6 @@ def get_previous_trading_day(check_date: Optional[date] = None) -> date:
     Returns:
         Previous trading day
 
-    Raises:
-        ValueError: If no trading day found in previous 30 days
-
     Examples:
         >>> get_previous_trading_day(date(2025, 11, 28))  # Day after Thanksgiving
         date(2025, 11, 26)  # Wednesday (Thursday was Thanksgiving)
@@ -254,17 +421,7 @@ def get_previous_trading_day(check_date: Optional[date] = None) -> date:
     if check_date is None:
         check_date = get_trading_date()
 
-    # Search previous 30 days
-    start_date = check_date - timedelta(days=30)
-    end_date = check_date - timedelta(days=1)
-
-    schedule = _NYSE_CALENDAR.schedule(start_date=start_date, end_date=end_date)
-
-    if len(schedule) == 0:
-        raise ValueError(f"No trading day found in 30 days before {check_date}")
-
-    # Get the last trading day in the range
-    previous = schedule.index[-1].date()
+    previous = get_trading_calendar().previous_trading_day(check_date)
 
     logger.debug(f"get_previous_trading_day({check_date}): {previous}")
     return previous
@@ -280,9 +437,6 @@ def get_next_trading_day(check_date: Optional[date] = None) -> date:
     Returns:
         Next trading day
 
-    Raises:
-        ValueError: If no trading day found in next 30 days
-
     Examples:
         >>> get_next_trading_day(date(2025, 11, 26))  # Wednesday before Thanksgiving
         date(2025, 11, 28)  # Friday (Thursday is Thanksgiving)
@@ -290,17 +444,7 @@ def get_next_trading_day(check_date: Optional[date] = None) -> date:
     if check_date is None:
         check_date = get_trading_date()
 
-    # Search next 30 days
-    start_date = check_date + timedelta(days=1)
-    end_date = check_date + timedelta(days=30)
-
-    schedule = _NYSE_CALENDAR.schedule(start_date=start_date, end_date=end_date)
-
-    if len(schedule) == 0:
-        raise ValueError(f"No trading day found in 30 days after {check_date}")
-
-    # Get the first trading day in the range
-    next_day = schedule.index[0].date()
+    next_day = get_trading_calendar().next_trading_day(check_date)
 
     logger.debug(f"get_next_trading_day({check_date}): {next_day}")
     return next_day
@@ -321,7 +465,7 @@ def count_trading_days_between(start: date, end: date) -> int:
         >>> count_trading_days_between(date(2025, 11, 24), date(2025, 11, 28))
         4  # Mon, Tue, Wed, Fri (Thu is Thanksgiving)
     """
-    return len(get_trading_days_between(start, end))
+    return get_trading_calendar().count_trading_days(start, end)
 
 
 def get_trading_days_in_year(year: int) -> List[date]: